@@ -266,6 +266,13 @@ if sys.platform == 'win32':
 # External dependencies
 import pyperclip  # For clipboard operations in Superlookup
 from modules.superlookup import SuperlookupEngine  # Superlookup engine
+from modules.term_matcher import TermMatcher, TermRef  # In-memory termbase index
+from modules.termbase_hits import collect_termbase_hits, restore_termbase_hits  # Saved termbase matches
+from modules.term_qa import TermQAChecker, FORBIDDEN_TERM, MISSING_TERM  # Terminology QA
+from modules.llm_dispatcher import BatchDispatcher, estimate_request_tokens, limits_for_provider  # Concurrent LLM batches
+from modules.response_cache import configure_response_cache, get_response_cache  # LLM/MT response cache
+from modules.batch_planner import BatchPlanner, estimate_tokens, token_limits  # Token-budgeted LLM batches
+from modules.batch_response_parser import NumberedResponseParser  # Streamed numbered batch responses
 from modules.voice_dictation_lite import QuickDictationThread  # Voice dictation
 from modules.voice_commands import VoiceCommandManager, VoiceCommand, ContinuousVoiceListener  # Voice commands (Talon-style)
 from modules.statuses import (
@@ -1348,6 +1355,7 @@ class Project:
     # Scratchpad for private translator notes (stored only in .svproj, never exported to CAT tools)
     scratchpad_notes: str = ""
     import_engine: str = ""  # "okapi" or "" (standard/built-in)
+    termbase_hits: Dict[str, Any] = None  # Saved per-segment termbase matches (see modules/termbase_hits.py)
 
     def __post_init__(self):
         if self.segments is None:
@@ -1457,6 +1465,10 @@ class Project:
         if self.import_engine:
             result['import_engine'] = self.import_engine
 
+        # Add termbase matches found so far (reused when the project is reopened)
+        if self.termbase_hits:
+            result['termbase_hits'] = self.termbase_hits
+
         # Add segments LAST (so they appear at the end of the file)
         result['segments'] = [seg.to_dict() for seg in self.segments]
         
@@ -1541,6 +1553,9 @@ class Project:
         # Store import engine indicator (for Okapi round-trip export)
         if 'import_engine' in data:
             project.import_engine = data['import_engine']
+        # Store saved termbase matches if they exist
+        if 'termbase_hits' in data:
+            project.termbase_hits = data['termbase_hits']
         return project
 
 
@@ -6580,7 +6595,8 @@ class TMSearchWorker(QThread):
 
     Runs expensive SequenceMatcher-based fuzzy matching off the main thread
     to prevent UI freezes, especially with large TMs (1M+ entries).
-    Uses its own SQLite connection since connections can't be shared across threads.
+    Leases a read connection from the connection pool (SQLite connections
+    can't be used by two threads at once).
     """
 
     # Signal: segment_id, list of match dicts
@@ -6606,61 +6622,49 @@ class TMSearchWorker(QThread):
         self._cancelled = True
 
     def run(self):
-        """Run TM search in background thread with thread-local SQLite connection."""
-        import sqlite3
+        """Run TM search in background thread on a pooled read connection."""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=15)
-            conn.row_factory = sqlite3.Row
-            conn.execute("PRAGMA journal_mode=WAL")
-
             from modules.database_manager import DatabaseManager
 
-            # Create a lightweight DatabaseManager that uses our thread-local connection
-            db = DatabaseManager.__new__(DatabaseManager)
-            db.connection = conn
-            db.cursor = conn.cursor()
-            db.log = lambda msg: None  # Suppress logging in worker thread
-            db.db_path = self.db_path
+            # Lease a read connection from the pool (returned when the block exits,
+            # also on cancellation and errors)
+            with DatabaseManager.lease_reader(self.db_path) as db:
+                if self._cancelled:
+                    return
 
-            if self._cancelled:
-                conn.close()
-                return
+                # First try exact match (fast, hash-based)
+                exact_match = db.get_exact_match(
+                    source=self.source_text,
+                    tm_ids=self.tm_ids,
+                    source_lang=self.source_lang,
+                    target_lang=self.target_lang
+                )
 
-            # First try exact match (fast, hash-based)
-            exact_match = db.get_exact_match(
-                source=self.source_text,
-                tm_ids=self.tm_ids,
-                source_lang=self.source_lang,
-                target_lang=self.target_lang
-            )
-
-            if exact_match:
-                results = [{
-                    'source': exact_match['source_text'],
-                    'target': exact_match['target_text'],
-                    'similarity': 1.0,
-                    'match_pct': 100,
-                    'tm_name': self.tm_metadata.get(exact_match['tm_id'], {}).get('name', exact_match['tm_id']),
-                    'tm_id': exact_match['tm_id']
-                }]
-                if not self._cancelled:
-                    self.results_ready.emit(self.segment_id, results)
-                conn.close()
-                return
+                if exact_match:
+                    results = [{
+                        'source': exact_match['source_text'],
+                        'target': exact_match['target_text'],
+                        'similarity': 1.0,
+                        'match_pct': 100,
+                        'tm_name': self.tm_metadata.get(exact_match['tm_id'], {}).get('name', exact_match['tm_id']),
+                        'tm_id': exact_match['tm_id']
+                    }]
+                    if not self._cancelled:
+                        self.results_ready.emit(self.segment_id, results)
+                    return
 
-            if self._cancelled:
-                conn.close()
-                return
+                if self._cancelled:
+                    return
 
-            # Fuzzy matches (expensive - SequenceMatcher on many candidates)
-            fuzzy_matches = db.search_fuzzy_matches(
-                source=self.source_text,
-                tm_ids=self.tm_ids,
-                threshold=self.fuzzy_threshold,
-                max_results=self.max_matches,
-                source_lang=self.source_lang,
-                target_lang=self.target_lang
-            )
+                # Fuzzy matches (expensive - SequenceMatcher on many candidates)
+                fuzzy_matches = db.search_fuzzy_matches(
+                    source=self.source_text,
+                    tm_ids=self.tm_ids,
+                    threshold=self.fuzzy_threshold,
+                    max_results=self.max_matches,
+                    source_lang=self.source_lang,
+                    target_lang=self.target_lang
+                )
 
             results = []
             for match in fuzzy_matches:
@@ -6676,13 +6680,7 @@ class TMSearchWorker(QThread):
             if not self._cancelled:
                 self.results_ready.emit(self.segment_id, results)
 
-            conn.close()
-
         except Exception as e:
-            try:
-                conn.close()
-            except:
-                pass
             if not self._cancelled:
                 self.results_ready.emit(self.segment_id, [])
 
@@ -6716,26 +6714,32 @@ class PreTranslationWorker(QThread):
         self.glossary_terms = glossary_terms or []  # Pre-fetched from main thread (SQLite is not thread-safe)
         self.success_count = 0
         self.error_count = 0
+        self.batch_planner = None  # Token-budgeted batch planner (LLM only, see run())
+        self.expansion_pair = None  # "source>target" key of the learned expansion ratio
+        self.stream_batches = False  # Apply segments while the batch response streams in (LLM only)
+        self._applied = set()  # Positions already translated and reported (streamed segments arrive early)
+        self._applied_lock = threading.Lock()  # Streamed segments are reported from dispatcher threads
     
     def run(self):
         """Main translation loop - runs in background thread."""
         import time
         import re
         
-        # For TM provider, create thread-local database connection
+        # For TM provider, lease a pooled read connection for the whole run
         # SQLite connections can't be shared across threads
-        self._thread_local_db = None
+        from contextlib import ExitStack
+        self._db_leases = ExitStack()
+        self._thread_local_tm = None
         if self.provider_type == 'TM' and hasattr(self.parent_app, 'tm_database') and self.parent_app.tm_database:
             try:
-                import sqlite3
-                db_path = self.parent_app.tm_database.db_path
-                self._thread_local_db = sqlite3.connect(db_path, timeout=15)
-                self._thread_local_db.row_factory = sqlite3.Row
-                self._thread_local_db.execute("PRAGMA journal_mode=WAL")
-                print(f"✓ Created thread-local database connection for TM pre-translation")
+                from modules.database_manager import DatabaseManager
+                db_path = self.parent_app.tm_database.db.db_path
+                self._thread_local_tm = self._db_leases.enter_context(
+                    DatabaseManager.lease_reader(db_path, log_callback=print))
+                print(f"✓ Leased pooled database connection for TM pre-translation")
             except Exception as e:
-                print(f"❌ Failed to create thread-local DB connection: {e}")
-                self._thread_local_db = None
+                print(f"❌ Failed to lease pooled DB connection: {e}")
+                self._thread_local_tm = None
         
         try:
             # For TM and MT, process segments individually
@@ -6775,61 +6779,91 @@ class PreTranslationWorker(QThread):
                         self.progress_update.emit(idx + 1, len(self.segments), message, False, 0)
                         self.error_count += 1
         
-            # For LLM, process in batches
+            # For LLM, process in batches, several in flight at once
             else:
-                # Get batch size from settings
+                # Get batch settings
                 general_prefs = self.parent_app.load_general_settings()
                 batch_size = general_prefs.get('batch_size', 20)
                 
-                # Split segments into batches
-                total_batches = (len(self.segments) + batch_size - 1) // batch_size
-                
-                for batch_num in range(total_batches):
-                    if self._cancelled:
-                        break
-                    
-                    start_idx = batch_num * batch_size
-                    end_idx = min((batch_num + 1) * batch_size, len(self.segments))
-                    batch_segments = self.segments[start_idx:end_idx]
+                limits = limits_for_provider(self.provider_name, general_prefs)
+                self._llm_request = self._prepare_llm_request()
+                self.batch_planner = self._create_batch_planner(general_prefs)
+                self.stream_batches = general_prefs.get('stream_batch_translation', True)
+                dispatcher = BatchDispatcher(
+                    send=self._send_batch_prompt,
+                    limits=limits,
+                    estimate_tokens=lambda request: estimate_request_tokens(request[0]),
+                    log=print
+                )
+                if self.batch_planner:
+                    print(f"🚀 Pre-translating {len(self.segments)} segments in token-budgeted batches "
+                          f"(expansion ratio {self.batch_planner.expansion_ratio:.2f}, {limits.max_in_flight} in flight)")
+                else:
+                    print(f"🚀 Pre-translating {len(self.segments)} segments in batches of {batch_size} "
+                          f"({limits.max_in_flight} in flight)")
+                retry_batches = []
+                
+                def on_batch_done(batch_num, positions, response, error):
+                    """Apply one batch's translations (called in batch order)"""
+                    batch_segments = [self.segments[pos] for pos in positions]
+                    if error is not None:
+                        print(f"❌ Batch {batch_num + 1} failed: {type(error).__name__}: {error}")
+                        # Mark entire batch as failed (apart from segments that streamed in before the error)
+                        for absolute_idx in positions:
+                            if absolute_idx in self._applied:
+                                continue
+                            message = f"[{absolute_idx+1}/{len(self.segments)}] ✗ BATCH ERROR: {str(error)}"
+                            self.progress_update.emit(absolute_idx + 1, len(self.segments), message, False, 0)
+                            self.error_count += 1
+                        return
                     
-                    try:
-                        start_time = time.time()
+                    result, elapsed, streamed = response
+                    if streamed is not None:
+                        # Parsed while streaming; most segments were applied already
+                        batch_translations = [streamed.get(seg.id) for _, seg in batch_segments]
+                    else:
+                        batch_translations = self._parse_batch_response(result, batch_segments)
                     
-                        # Translate entire batch
-                        batch_translations = self._translate_batch_with_llm(batch_segments)
+                    # Incomplete parse (usually a truncated response): send the missing
+                    # segments again in smaller batches instead of failing them
+                    missing = [pos for pos, translation in zip(positions, batch_translations) if not translation]
+                    resend = set()
+                    if missing and len(positions) > 1 and not self._cancelled:
+                        arrived = [i for i, translation in enumerate(batch_translations) if translation]
+                        if not batch_translations[-1] and arrived and positions[arrived[-1]] not in self._applied:
+                            # Cut off at the output limit: the last line that did arrive is probably incomplete
+                            batch_translations[arrived[-1]] = None
+                            missing = sorted(missing + [positions[arrived[-1]]])
+                        retry_batches.extend(BatchPlanner.split(missing) if len(missing) == len(positions)
+                                             else [missing])
+                        resend = set(missing)
+                        print(f"✂️ Batch {batch_num + 1}: {len(missing)} of {len(positions)} translations missing, "
+                              f"re-sending them in smaller batches")
                     
-                        elapsed = time.time() - start_time
+                    if self.batch_planner:
+                        self.batch_planner.observe([seg.source for _, seg in batch_segments], batch_translations)
                     
-                        # Process results
-                        for (row_index, segment), translation in zip(batch_segments, batch_translations):
-                            absolute_idx = start_idx + batch_segments.index((row_index, segment))
-                            
-                            if translation:
-                                segment.target = translation
-                                segment.status = "draft"
-                                
-                                preview = segment.source[:50] + ("..." if len(segment.source) > 50 else "")
-                                message = f"[{absolute_idx+1}/{len(self.segments)}] ✓ {preview}"
-                                self.progress_update.emit(absolute_idx + 1, len(self.segments), message, True, elapsed / len(batch_segments))
-                                self.success_count += 1
-                            else:
-                                preview = segment.source[:50] + ("..." if len(segment.source) > 50 else "")
-                                message = f"[{absolute_idx+1}/{len(self.segments)}] ⊘ No translation: {preview}"
-                                self.progress_update.emit(absolute_idx + 1, len(self.segments), message, False, elapsed / len(batch_segments))
-                                self.error_count += 1
-                
-                    except Exception as e:
-                        import traceback
-                        error_details = traceback.format_exc()
-                        print(f"❌ Batch processing error: {e}")
-                        print(f"❌ Full traceback:\n{error_details}")
-                        # Mark entire batch as failed
-                        for row_index, segment in batch_segments:
-                            absolute_idx = start_idx + batch_segments.index((row_index, segment))
+                    # Process results
+                    for absolute_idx, (row_index, segment), translation in zip(positions, batch_segments, batch_translations):
+                        if translation:
+                            self._apply_translation(absolute_idx, translation, elapsed / len(batch_segments))
+                        elif absolute_idx not in resend:
                             preview = segment.source[:50] + ("..." if len(segment.source) > 50 else "")
-                            message = f"[{absolute_idx+1}/{len(self.segments)}] ✗ BATCH ERROR: {str(e)}"
-                            self.progress_update.emit(absolute_idx + 1, len(self.segments), message, False, 0)
+                            message = f"[{absolute_idx+1}/{len(self.segments)}] ⊘ No translation: {preview}"
+                            self.progress_update.emit(absolute_idx + 1, len(self.segments), message, False, elapsed / len(batch_segments))
                             self.error_count += 1
+                
+                batches = self._plan_batches(batch_size)
+                while batches and not self._cancelled:
+                    dispatcher.run(batches, on_batch_done,
+                                   prepare=lambda positions: (self._build_batch_prompt(
+                                       [self.segments[pos] for pos in positions]), positions),
+                                   cancelled=lambda: self._cancelled)
+                    stats = dispatcher.stats
+                    if stats['retries']:
+                        print(f"⏳ {stats['retries']} batch retries ({stats['rate_limited']} rate limited)")
+                    batches = list(retry_batches)
+                    retry_batches.clear()
         
             # Check if retry is needed (for LLM mode with retry option enabled)
             if self.retry_enabled and self.provider_type == 'LLM' and self.retry_pass < self.max_retries:
@@ -6850,13 +6884,12 @@ class PreTranslationWorker(QThread):
             self.translation_complete.emit(self.success_count, self.error_count)
         
         finally:
-            # Clean up thread-local database connection
-            if self._thread_local_db:
-                try:
-                    self._thread_local_db.close()
-                    print(f"✓ Closed thread-local database connection")
-                except:
-                    pass
+            # Return the leased database connection to the pool
+            try:
+                self._db_leases.close()
+            except Exception:
+                pass
+            self._thread_local_tm = None
     
     def cancel(self):
         """Request cancellation of translation job."""
@@ -6865,30 +6898,19 @@ class PreTranslationWorker(QThread):
     def _translate_from_tm(self, segment):
         """Translate a single segment using TM.
         
-        Uses thread-local database connection to avoid SQLite threading errors.
+        Uses the pooled connection leased in run() to avoid SQLite threading errors.
         """
         try:
             print(f"🔍 TM PRE-TRANSLATE: Searching for: '{segment.source[:50]}...'")
             print(f"🔍 TM PRE-TRANSLATE: Using tm_ids: {self.tm_ids}")
             print(f"🔍 TM PRE-TRANSLATE: Exact only: {self.tm_exact_only}")
             
-            # Use thread-local database connection
-            if not self._thread_local_db:
-                print(f"❌ TM PRE-TRANSLATE: No thread-local database connection!")
+            # Use the DatabaseManager bound to the leased connection
+            thread_local_tm = self._thread_local_tm
+            if not thread_local_tm:
+                print(f"❌ TM PRE-TRANSLATE: No pooled database connection!")
                 return None
             
-            # Create a thread-local DatabaseManager for TM operations
-            # This avoids SQLite threading errors
-            from modules.database_manager import DatabaseManager
-            
-            # Get db_path from parent_app's tm_database
-            db_path = self.parent_app.tm_database.db_path
-            
-            # Create a thread-local DatabaseManager
-            thread_local_tm = DatabaseManager(db_path=db_path, log_callback=print)
-            thread_local_tm.connection = self._thread_local_db
-            thread_local_tm.cursor = self._thread_local_db.cursor()
-            
             if self.tm_exact_only:
                 # Exact matches only - use hash lookup
                 match = thread_local_tm.get_exact_match(segment.source, tm_ids=self.tm_ids)
@@ -6993,12 +7015,13 @@ class PreTranslationWorker(QThread):
                 http_proxy=self.http_proxy
             )
 
-            # Translate with custom prompt
+            # Translate with custom prompt (re-runs of unchanged segments come from the response cache)
             result = client.translate(
                 text=segment.source,
                 source_lang=source_lang,
                 target_lang=target_lang,
-                custom_prompt=custom_prompt
+                custom_prompt=custom_prompt,
+                use_cache=True
             )
             
             return result
@@ -7006,136 +7029,245 @@ class PreTranslationWorker(QThread):
             print(f"LLM translation error: {e}")
             return None
     
-    def _translate_batch_with_llm(self, batch_segments):
-        """Translate multiple segments in one LLM call (batch mode)."""
-        try:
-            from modules.llm_clients import LLMClient
-            import re
-            import traceback
-            
-            print(f"🚀 _translate_batch_with_llm: Starting batch of {len(batch_segments)} segments")
+    def _prepare_llm_request(self):
+        """Languages and API key for the batch requests (resolved once per run)."""
+        # Get source/target languages
+        source_lang = getattr(self.parent_app.current_project, 'source_lang', 'en')
+        target_lang = getattr(self.parent_app.current_project, 'target_lang', 'nl')
+        print(f"🚀 Languages: {source_lang} → {target_lang}")
 
-            # Get source/target languages
-            source_lang = getattr(self.parent_app.current_project, 'source_lang', 'en')
-            target_lang = getattr(self.parent_app.current_project, 'target_lang', 'nl')
-            print(f"🚀 Languages: {source_lang} → {target_lang}")
+        # Load API keys
+        api_keys = self.parent_app.load_api_keys()
+        api_key = api_keys.get(self.provider_name) or (api_keys.get('google') if self.provider_name == 'gemini' else None)
+        if self.provider_name == 'custom_openai':
+            # Profile API key takes priority over api_keys.txt
+            if self.custom_api_key:
+                api_key = self.custom_api_key
+            elif not api_key:
+                api_key = api_keys.get('custom_openai', '') or 'not-needed'
 
-            # Load API keys
-            api_keys = self.parent_app.load_api_keys()
-            api_key = api_keys.get(self.provider_name) or (api_keys.get('google') if self.provider_name == 'gemini' else None)
-            if self.provider_name == 'custom_openai':
-                # Profile API key takes priority over api_keys.txt
-                if self.custom_api_key:
-                    api_key = self.custom_api_key
-                elif not api_key:
-                    api_key = api_keys.get('custom_openai', '') or 'not-needed'
+        return {'source_lang': source_lang, 'target_lang': target_lang, 'api_key': api_key}
 
-            # Build batch prompt
-            batch_prompt_parts = []
-            
-            # Get base prompt from prompt library
-            base_prompt = None
-            if self.prompt_manager and batch_segments:
-                try:
-                    first_segment = batch_segments[0][1]
-                    # Use pre-fetched glossary terms (SQLite is not thread-safe)
-                    full_prompt = self.prompt_manager.build_final_prompt(
-                        source_text=first_segment.source,
-                        source_lang=source_lang,
-                        target_lang=target_lang,
-                        mode="single",
-                        glossary_terms=self.glossary_terms,
-                        target_text=first_segment.target or ""
-                    )
-                    # Extract just the instruction part
-                    if "**SOURCE TEXT:**" in full_prompt:
-                        base_prompt = full_prompt.split("**SOURCE TEXT:**")[0].strip()
-                    elif "Translate the following" in full_prompt:
-                        base_prompt = full_prompt.split("Translate the following")[0].strip()
-                    else:
-                        base_prompt = full_prompt
-                except Exception:
-                    base_prompt = None
-            
-            if base_prompt:
-                batch_prompt_parts.append(base_prompt)
-            else:
-                batch_prompt_parts.append(f"Translate the following text segments from {source_lang} to {target_lang}.")
-            
-            # Add batch instructions
-            batch_prompt_parts.append(f"\n**SEGMENTS TO TRANSLATE ({len(batch_segments)} segments):**")
-            batch_prompt_parts.append("\n⚠️ CRITICAL INSTRUCTIONS:")
-            batch_prompt_parts.append(f"1. You must provide EXACTLY one translation per segment")
-            batch_prompt_parts.append(f"2. You MUST translate ALL {len(batch_segments)} segments")
-            batch_prompt_parts.append("3. Format: Each translation MUST start with its segment number, a period, then the translation")
-            batch_prompt_parts.append("4. Line breaks: If the source segment contains line breaks, preserve them in your translation.")
-            batch_prompt_parts.append("   The number label (e.g. '40.') appears only ONCE at the start; continuation lines have no number.")
-            batch_prompt_parts.append("5. NO explanations, NO commentary, ONLY the numbered translations\n")
-            
-            batch_prompt_parts.append("**SEGMENTS TO TRANSLATE:**\n")
-            
-            # Add all segments
-            for row_index, seg in batch_segments:
-                batch_prompt_parts.append(f"{seg.id}. {seg.source}")
-            
-            batch_prompt_parts.append("\n**YOUR TRANSLATIONS (numbered list):**")
-            batch_prompt_parts.append("Begin your translations now:")
-            
-            batch_prompt = "\n".join(batch_prompt_parts)
-            
-            # Create client
-            client = LLMClient(
-                api_key=api_key,
-                provider=self.provider_name,
-                model=self.model,
-                base_url=self.base_url,
-                http_proxy=self.http_proxy
-            )
+    def _create_batch_planner(self, general_prefs):
+        """Token-budgeted batch planner, or None when adaptive batch size is off."""
+        if not general_prefs.get('adaptive_batch_size', True):
+            return None
+        context_tokens, output_tokens = token_limits(self.provider_name, self.model)
+        self.expansion_pair = f"{self._llm_request['source_lang']}>{self._llm_request['target_lang']}"
+        learned_ratio = (general_prefs.get('llm_expansion_ratios') or {}).get(self.expansion_pair)
+        planner = BatchPlanner(context_tokens, output_tokens, expansion_ratio=learned_ratio)
+        if self.segments:
+            # Instructions and glossary are sent with every batch
+            first_source = self.segments[0][1].source
+            planner.prompt_tokens = (estimate_tokens(self._build_batch_prompt(self.segments[:1]))
+                                     - estimate_tokens(first_source))
+        return planner
+
+    def _plan_batches(self, batch_size):
+        """Batches as lists of positions in self.segments (lazy when token-budgeted)."""
+        if self.batch_planner is None:
+            return [list(range(start, min(start + batch_size, len(self.segments))))
+                    for start in range(0, len(self.segments), batch_size)]
+        sources = [segment.source for _, segment in self.segments]
+        return (list(range(start, end)) for start, end in self.batch_planner.plan(sources))
+
+    def _build_batch_prompt(self, batch_segments):
+        """Build the numbered-list prompt for one batch (runs on the worker thread)."""
+        source_lang = self._llm_request['source_lang']
+        target_lang = self._llm_request['target_lang']
+
+        # Build batch prompt
+        batch_prompt_parts = []
+        
+        # Get base prompt from prompt library
+        base_prompt = None
+        if self.prompt_manager and batch_segments:
+            try:
+                first_segment = batch_segments[0][1]
+                # Use pre-fetched glossary terms (SQLite is not thread-safe)
+                full_prompt = self.prompt_manager.build_final_prompt(
+                    source_text=first_segment.source,
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                    mode="single",
+                    glossary_terms=self.glossary_terms,
+                    target_text=first_segment.target or ""
+                )
+                # Extract just the instruction part
+                if "**SOURCE TEXT:**" in full_prompt:
+                    base_prompt = full_prompt.split("**SOURCE TEXT:**")[0].strip()
+                elif "Translate the following" in full_prompt:
+                    base_prompt = full_prompt.split("Translate the following")[0].strip()
+                else:
+                    base_prompt = full_prompt
+            except Exception:
+                base_prompt = None
+        
+        if base_prompt:
+            batch_prompt_parts.append(base_prompt)
+        else:
+            batch_prompt_parts.append(f"Translate the following text segments from {source_lang} to {target_lang}.")
+        
+        # Add batch instructions
+        batch_prompt_parts.append(f"\n**SEGMENTS TO TRANSLATE ({len(batch_segments)} segments):**")
+        batch_prompt_parts.append("\n⚠️ CRITICAL INSTRUCTIONS:")
+        batch_prompt_parts.append(f"1. You must provide EXACTLY one translation per segment")
+        batch_prompt_parts.append(f"2. You MUST translate ALL {len(batch_segments)} segments")
+        batch_prompt_parts.append("3. Format: Each translation MUST start with its segment number, a period, then the translation")
+        batch_prompt_parts.append("4. Line breaks: If the source segment contains line breaks, preserve them in your translation.")
+        batch_prompt_parts.append("   The number label (e.g. '40.') appears only ONCE at the start; continuation lines have no number.")
+        batch_prompt_parts.append("5. NO explanations, NO commentary, ONLY the numbered translations\n")
+        
+        batch_prompt_parts.append("**SEGMENTS TO TRANSLATE:**\n")
+        
+        # Add all segments
+        for row_index, seg in batch_segments:
+            batch_prompt_parts.append(f"{seg.id}. {seg.source}")
+        
+        batch_prompt_parts.append("\n**YOUR TRANSLATIONS (numbered list):**")
+        batch_prompt_parts.append("Begin your translations now:")
+        
+        return "\n".join(batch_prompt_parts)
 
-            # Call LLM with batch prompt (no custom_prompt parameter - it's all in the text)
-            result = client.translate(
-                text=batch_prompt,
-                source_lang=source_lang,
-                target_lang=target_lang,
-                custom_prompt=None  # We built the full prompt already
-            )
-            
-            # Parse the numbered response
-            translations = []
-            if result:
-                lines = result.split('\n')
-                translation_map = {}
-                current_id = None
+    def _send_batch_prompt(self, request):
+        """
+        Send one batch prompt (runs on a dispatcher thread; errors propagate so
+        rate limits can be retried).
 
-                for line in lines:
-                    # Match "123. Translation text"
-                    match = re.match(r'^(\d+)\.\s*(.*)', line)
-                    if match:
-                        current_id = int(match.group(1))
-                        translation = match.group(2)
-                        translation_map[current_id] = translation
-                    elif current_id is not None:
-                        # Continuation line for a multi-line translation
-                        translation_map[current_id] += '\n' + line
-                
-                # Extract translations in order
-                for row_index, seg in batch_segments:
-                    translation = translation_map.get(seg.id, None)
-                    translations.append(translation)
-            else:
-                # No result - all segments failed
-                translations = [None] * len(batch_segments)
-            
-            return translations
-            
-        except Exception as e:
-            import traceback
-            error_details = traceback.format_exc()
-            print(f"❌ Batch LLM translation error: {e}")
-            print(f"❌ Full traceback:\n{error_details}")
-            # Return list of None for all segments
+        Args:
+            request: (prompt, positions) - prompt from _build_batch_prompt
+
+        Returns:
+            (response text, elapsed seconds, translations by segment ID when
+            streamed, else None)
+        """
+        from modules.llm_clients import LLMClient
+        import time
+
+        prompt, positions = request
+        print(f"🚀 Sending batch of {len(positions)} segments")
+        start_time = time.time()
+        parser = self._create_stream_parser(positions, start_time) if self.stream_batches else None
+
+        # Create client
+        client = LLMClient(
+            api_key=self._llm_request['api_key'],
+            provider=self.provider_name,
+            model=self.model,
+            base_url=self.base_url,
+            http_proxy=self.http_proxy
+        )
+
+        # Call LLM with batch prompt (no custom_prompt parameter - it's all in the text)
+        result = client.translate(
+            text=prompt,
+            source_lang=self._llm_request['source_lang'],
+            target_lang=self._llm_request['target_lang'],
+            custom_prompt=None,  # We built the full prompt already
+            use_cache=True,
+            stream_callback=parser.feed if parser else None
+        )
+        streamed = parser.close() if parser else None
+        return result, time.time() - start_time, streamed
+
+    def _create_stream_parser(self, positions, start_time):
+        """
+        Parser for a streamed batch response that applies each segment as soon
+        as its numbered line is complete, instead of when the whole batch is.
+        The last segment of the batch is left to on_batch_done, which knows
+        whether the response was cut off.
+        """
+        import time
+
+        position_by_id = {self.segments[pos][1].id: pos for pos in positions}
+        last_time = [start_time]
+
+        def on_segment(seg_id, translation):
+            if self._cancelled:
+                return
+            now = time.time()
+            self._apply_translation(position_by_id[seg_id], translation, now - last_time[0])
+            last_time[0] = now
+
+        return NumberedResponseParser(position_by_id, on_segment=on_segment)
+
+    def _apply_translation(self, position, translation, elapsed):
+        """
+        Store one translation and report it to the UI, once per segment
+        (called from the worker thread and, while streaming, dispatcher threads;
+        Qt queues the signal to the UI thread).
+        """
+        with self._applied_lock:
+            if position in self._applied:
+                return
+            self._applied.add(position)
+            row_index, segment = self.segments[position]
+            segment.target = translation
+            segment.status = "draft"
+
+            preview = segment.source[:50] + ("..." if len(segment.source) > 50 else "")
+            message = f"[{position+1}/{len(self.segments)}] ✓ {preview}"
+            self.progress_update.emit(position + 1, len(self.segments), message, True, elapsed)
+            self.success_count += 1
+
+    @staticmethod
+    def _parse_batch_response(result, batch_segments):
+        """
+        Parse a numbered batch response into one translation per segment
+        (the same parse streamed responses get, see modules/batch_response_parser.py).
+
+        Returns:
+            List of translations in batch order (None where a segment is missing)
+        """
+        if not result:
+            # No result - all segments failed
             return [None] * len(batch_segments)
 
+        translation_map = NumberedResponseParser.parse(result, [seg.id for _, seg in batch_segments])
+        return [translation_map.get(seg.id, None) for row_index, seg in batch_segments]
+
+
+class TermQAWorker(QThread):
+    """Background worker for the terminology QA check (modules/term_qa.py).
+
+    Loads the active termbases on a pooled read connection, compiles them and
+    checks every segment, reporting progress per block of segments.
+    """
+
+    progress_update = pyqtSignal(int, int, str)  # done, total, status_message
+    finished_check = pyqtSignal(object, str)  # TermQAReport (None on error), error_message
+
+    def __init__(self, db_path: str, project_id, segments):
+        super().__init__()
+        self.db_path = db_path
+        self.project_id = project_id
+        # Copy of the list: segments added or removed during the check are ignored
+        self.segments = list(segments)
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        try:
+            from modules.database_manager import DatabaseManager
+
+            total = len(self.segments)
+            self.progress_update.emit(0, total, "Loading termbases...")
+            with DatabaseManager.lease_reader(self.db_path) as db:
+                terms = db.get_termbase_qa_terms(self.project_id)
+            checker = TermQAChecker(terms)
+            del terms
+            self.progress_update.emit(0, total, f"Checking {total:,} segments against {checker.term_count:,} terms...")
+            report = checker.check(
+                self.segments,
+                progress_callback=lambda done, count: self.progress_update.emit(
+                    done, count, f"Checked {done:,} of {count:,} segments..."),
+                cancel_check=lambda: self._cancelled)
+            self.finished_check.emit(report, "")
+        except Exception as e:
+            self.finished_check.emit(None, str(e))
+
 
 class ProofreadWorker(QThread):
     """Background worker thread for proofreading translations."""
@@ -7573,9 +7705,12 @@ class SupervertalerQt(QMainWindow):
 
         # In-memory termbase index for instant lookups (v1.9.182)
         # Loaded once on project load, contains ALL terms from activated termbases
-        # Structure: list of term dicts with pre-compiled regex patterns
-        self.termbase_index = []
+        # Structure: TermMatcher over TermRef ids (single-pass multi-term search);
+        # term text and metadata are fetched from SQLite when a term matches
+        self.termbase_index = TermMatcher()
         self.termbase_index_lock = threading.Lock()
+        # termbase_watermark() taken before the index was built (saved with the termbase hits)
+        self.termbase_index_watermark = None
         
         # TM/MT/LLM prefetch cache for instant segment switching (like memoQ)
         # Maps segment ID → {"TM": [...], "MT": [...], "LLM": [...]}
@@ -7649,7 +7784,8 @@ class SupervertalerQt(QMainWindow):
         # Database Manager for Termbases
         self.db_manager = DatabaseManager(
             db_path=str(self.user_data_path / "resources" / "supervertaler.db"),
-            log_callback=self.log
+            log_callback=self.log,
+            termbase_trigram_index=self._load_general_settings_from_file().get('termbase_trigram_index', True)
         )
         # Only connect if we're not showing the dialog (which will create the folder)
         # If dialog is needed, we'll connect after user chooses location
@@ -7748,6 +7884,9 @@ class SupervertalerQt(QMainWindow):
         
         # Load general settings (including auto-propagation)
         self.load_general_settings()
+
+        # LLM/MT response cache (re-runs of unchanged segments cost nothing)
+        self._configure_response_cache()
         
         # Load language settings
         self.load_language_settings()
@@ -7916,6 +8055,17 @@ class SupervertalerQt(QMainWindow):
             import traceback
             traceback.print_exc()
     
+    def _configure_response_cache(self, settings: Optional[Dict[str, Any]] = None):
+        """Point the LLM/MT response cache at the user data folder and apply its settings"""
+        if settings is None:
+            settings = self._load_general_settings_from_file()
+        configure_response_cache(
+            str(self.user_data_path / "cache" / "responses.db"),
+            ttl_days=settings.get('response_cache_ttl_days', 30),
+            max_size_mb=settings.get('response_cache_max_mb', 200),
+            enabled=settings.get('response_cache_enabled', True)
+        )
+
     def _reinitialize_with_new_data_path(self):
         """Re-initialize managers after user changes data path."""
         try:
@@ -7930,7 +8080,8 @@ class SupervertalerQt(QMainWindow):
             from modules.database_manager import DatabaseManager
             self.db_manager = DatabaseManager(
                 db_path=str(self.user_data_path / "resources" / "supervertaler.db"),
-                log_callback=self.log
+                log_callback=self.log,
+                termbase_trigram_index=self._load_general_settings_from_file().get('termbase_trigram_index', True)
             )
             self.db_manager.connect()
             
@@ -7963,6 +8114,9 @@ class SupervertalerQt(QMainWindow):
             
             # Update recent projects file path
             self.recent_projects_file = self.user_data_path / "settings" / "recent_projects.json"
+
+            # Move the response cache to the new data path
+            self._configure_response_cache()
             
             self.log(f"✅ Re-initialized all managers with new data path")
             
@@ -9672,6 +9826,11 @@ class SupervertalerQt(QMainWindow):
         proofread_action.triggered.connect(self.show_proofread_dialog)
         bulk_menu.addAction(proofread_action)
 
+        term_qa_action = QAction("📖 Check &Terminology...", self)
+        term_qa_action.setToolTip("Check all targets for missing term translations and forbidden terms")
+        term_qa_action.triggered.connect(self.run_terminology_qa)
+        bulk_menu.addAction(term_qa_action)
+
         edit_menu.addSeparator()
         
         # Superlookup
@@ -10664,6 +10823,7 @@ class SupervertalerQt(QMainWindow):
             imported_list.name = new_name
             self.nt_manager.lists[new_name] = imported_list
             self.nt_manager.active_lists.append(new_name)
+            self.nt_manager.invalidate_matcher()
             self.nt_manager.save_list(imported_list)
             
             refresh_list_combo()
@@ -13981,15 +14141,10 @@ class SupervertalerQt(QMainWindow):
                 )
                 
                 if reply2 == QMessageBox.StandardButton.Yes and self.tm_database:
-                    # Clear TM entries
-                    import sqlite3
-                    db_path = self.user_data_path / "resources" / "supervertaler.db"
-                    conn = sqlite3.connect(str(db_path), timeout=15)
-                    conn.execute("PRAGMA journal_mode=WAL")
-                    cursor = conn.cursor()
-                    cursor.execute("DELETE FROM translation_units")
-                    conn.commit()
-                    conn.close()
+                    # Clear TM entries (pooled writer connection, commits on exit)
+                    with self.tm_database.db.pool.write() as conn:
+                        self.tm_database.db.delete_translation_units("1=1", connection=conn)
+                    self.tm_database.db.invalidate_exact_match_cache()
                     
                     self.log("All translation memory entries cleared")
                     QMessageBox.information(self, "TM Cleared", "All translation memory entries have been deleted.")
@@ -14451,6 +14606,7 @@ class SupervertalerQt(QMainWindow):
         success_count = 0
         duplicate_count = 0
         error_count = 0
+        added_term_ids = []
         for tb in active_termbases:
             if tb['id'] not in selected_termbase_ids:
                 continue  # Skip unselected termbases
@@ -14472,6 +14628,7 @@ class SupervertalerQt(QMainWindow):
                 
                 if term_id:
                     success_count += 1
+                    added_term_ids.append(term_id)
                     self.log(f"✓ Added term to termbase '{tb['name']}': {source_text} → {target_text}")
                     
                     # Add source synonyms if any
@@ -14529,11 +14686,9 @@ class SupervertalerQt(QMainWindow):
             
             # Keep in-memory termbase search/index in sync with DB so new term appears immediately
             try:
-                with self.termbase_cache_lock:
-                    self.termbase_cache.clear()
-                self._build_termbase_index()
+                self._update_termbase_index(term_ids=added_term_ids)
             except Exception as e:
-                self.log(f"WARNING: Failed to rebuild termbase index after add: {e}")
+                self.log(f"WARNING: Failed to update termbase index after add: {e}")
 
 # Refresh termbase display (NOT TM - that would be wasteful)
             self._refresh_termbase_display_for_current_segment()
@@ -14623,6 +14778,7 @@ class SupervertalerQt(QMainWindow):
         success_count = 0
         duplicate_count = 0
         error_count = 0
+        added_term_ids = []
         for target_termbase in target_termbases:
             try:
                 term_id = self.termbase_mgr.add_term(
@@ -14640,6 +14796,7 @@ class SupervertalerQt(QMainWindow):
                 
                 if term_id:
                     success_count += 1
+                    added_term_ids.append(term_id)
                     self.log(f"✓ Quick-added term to '{target_termbase['name']}': {source_text} → {target_text}")
                 else:
                     duplicate_count += 1
@@ -14658,11 +14815,9 @@ class SupervertalerQt(QMainWindow):
             
             # Keep in-memory termbase search/index in sync with DB so new term appears immediately
             try:
-                with self.termbase_cache_lock:
-                    self.termbase_cache.clear()
-                self._build_termbase_index()
+                self._update_termbase_index(term_ids=added_term_ids)
             except Exception as e:
-                self.log(f"WARNING: Failed to rebuild termbase index after quick add: {e}")
+                self.log(f"WARNING: Failed to update termbase index after quick add: {e}")
 
             # Refresh termbase display (NOT TM - that would be wasteful)
             self._refresh_termbase_display_for_current_segment()
@@ -14836,38 +14991,6 @@ class SupervertalerQt(QMainWindow):
                                     cached[term_id] = new_match
                                     self.log(f"⚡ Added term directly to cache (instant update)")
 
-                                # v1.9.182: Also add to in-memory termbase index for future lookups
-                                import re
-                                source_lower = source_text.lower().strip()
-                                try:
-                                    if any(c in source_lower for c in '.%,/-'):
-                                        pattern = re.compile(r'(?<!\w)' + re.escape(source_lower) + r'(?!\w)')
-                                    else:
-                                        pattern = re.compile(r'\b' + re.escape(source_lower) + r'\b')
-                                except re.error:
-                                    pattern = None
-
-                                index_entry = {
-                                    'term_id': term_id,
-                                    'source_term': source_text,
-                                    'source_term_lower': source_lower,
-                                    'target_term': target_text,
-                                    'termbase_id': target_termbase['id'],
-                                    'domain': '',
-                                    'notes': '',
-                                    'project': '',
-                                    'client': '',
-                                    'forbidden': False,
-                                    'is_project_termbase': is_project,
-                                    'termbase_name': target_termbase['name'],
-                                    'ranking': glossary_rank,
-                                    'pattern': pattern,
-                                }
-                                with self.termbase_index_lock:
-                                    self.termbase_index.append(index_entry)
-                                    # Re-sort by length (longest first) for proper phrase matching
-                                    self.termbase_index.sort(key=lambda x: len(x['source_term_lower']), reverse=True)
-                                
                                 # Update TermLens widget with the new term
                                 if (hasattr(self, 'termlens_widget') and self.termlens_widget) or (hasattr(self, 'termlens_widget_match') and self.termlens_widget_match):
                                     # Get current matches from cache
@@ -14904,23 +15027,9 @@ class SupervertalerQt(QMainWindow):
                                 self.highlight_source_with_termbase(current_row, segment.source, cached_matches)
                                 self.log(f"✅ Source highlighting updated with new term")
 
-                                # Invalidate stale cache entries for ALL OTHER segments.
-                                # The batch worker pre-populated these before the new term existed,
-                                # so they may be missing the new term. Clear them now so the next
-                                # navigation triggers a fresh lookup (or the batch worker refills them).
-                                with self.termbase_cache_lock:
-                                    stale_tb = [k for k in self.termbase_cache if k != segment_id]
-                                    for k in stale_tb:
-                                        del self.termbase_cache[k]
-                                with self.translation_matches_cache_lock:
-                                    stale_tm = [k for k in self.translation_matches_cache if k != segment_id]
-                                    for k in stale_tm:
-                                        del self.translation_matches_cache[k]
-
-                                # Re-start the batch worker to re-populate all segments with the new
-                                # term included (fast: ~0.3s for 659 segments in background).
-                                self._start_termbase_batch_worker()
-                                self.log(f"🔄 Cache invalidated for other segments; batch worker re-started")
+                                # Add the term to the in-memory termbase index and refresh
+                                # only the other segments whose source text contains it
+                                self._update_termbase_index(term_ids=[term_id], exclude_segment_id=segment_id)
 
                         except Exception as e:
                             self.log(f"⚠️  Quick cache update failed, falling back to full search: {e}")
@@ -15081,6 +15190,7 @@ class SupervertalerQt(QMainWindow):
                 notes=f"Added from grid selection"
             )
             lst.entries.append(new_entry)
+            self.nt_manager.invalidate_matcher()
             
             # Save the list
             if self.nt_manager.save_list(lst):
@@ -15411,38 +15521,18 @@ class SupervertalerQt(QMainWindow):
                 
                 # Build query with optional filter
                 if filter_text:
-                    # Count filtered results
-                    self.db_manager.cursor.execute(
-                        """SELECT COUNT(*) FROM termbase_terms 
-                           WHERE termbase_id = CAST(? AS TEXT) 
-                           AND (LOWER(source_term) LIKE ? OR LOWER(target_term) LIKE ?)""",
-                        (tb_id, f'%{filter_text}%', f'%{filter_text}%')
-                    )
-                    terms_total_count[0] = self.db_manager.cursor.fetchone()[0]
+                    # Substring match (trigram index, or a LIKE scan for short filters)
+                    terms_total_count[0] = self.db_manager.count_termbase_terms(filter_text, [tb_id])
                     
                     # Get filtered page
-                    if page_size > 0:
-                        self.db_manager.cursor.execute(
-                            """SELECT id, source_term, target_term, domain, notes, project, client, forbidden 
-                               FROM termbase_terms 
-                               WHERE termbase_id = CAST(? AS TEXT) 
-                               AND (LOWER(source_term) LIKE ? OR LOWER(target_term) LIKE ?)
-                               ORDER BY source_term LIMIT ? OFFSET ?""",
-                            (tb_id, f'%{filter_text}%', f'%{filter_text}%', page_size, offset)
-                        )
-                    else:  # All
-                        self.db_manager.cursor.execute(
-                            """SELECT id, source_term, target_term, domain, notes, project, client, forbidden 
-                               FROM termbase_terms 
-                               WHERE termbase_id = CAST(? AS TEXT) 
-                               AND (LOWER(source_term) LIKE ? OR LOWER(target_term) LIKE ?)
-                               ORDER BY source_term""",
-                            (tb_id, f'%{filter_text}%', f'%{filter_text}%')
-                        )
+                    filtered = self.db_manager.search_termbase_terms(
+                        filter_text, [tb_id], limit=page_size if page_size > 0 else None, offset=offset)
+                    term_columns = ('id', 'source_term', 'target_term', 'domain', 'notes', 'project', 'client', 'forbidden')
+                    terms = [tuple(term[c] for c in term_columns) for term in filtered]
                 else:
                     # Count all results
                     self.db_manager.cursor.execute(
-                        "SELECT COUNT(*) FROM termbase_terms WHERE termbase_id = CAST(? AS TEXT)",
+                        "SELECT COUNT(*) FROM termbase_terms WHERE termbase_id = ?",
                         (tb_id,)
                     )
                     terms_total_count[0] = self.db_manager.cursor.fetchone()[0]
@@ -15451,18 +15541,18 @@ class SupervertalerQt(QMainWindow):
                     if page_size > 0:
                         self.db_manager.cursor.execute(
                             """SELECT id, source_term, target_term, domain, notes, project, client, forbidden 
-                               FROM termbase_terms WHERE termbase_id = CAST(? AS TEXT) 
+                               FROM termbase_terms WHERE termbase_id = ? 
                                ORDER BY source_term LIMIT ? OFFSET ?""",
                             (tb_id, page_size, offset)
                         )
                     else:  # All
                         self.db_manager.cursor.execute(
                             """SELECT id, source_term, target_term, domain, notes, project, client, forbidden 
-                               FROM termbase_terms WHERE termbase_id = CAST(? AS TEXT) ORDER BY source_term""",
+                               FROM termbase_terms WHERE termbase_id = ? ORDER BY source_term""",
                             (tb_id,)
                         )
+                    terms = self.db_manager.cursor.fetchall()
                 
-                terms = self.db_manager.cursor.fetchall()
                 terms_table.setRowCount(len(terms))
                 
                 for row, term in enumerate(terms):
@@ -15574,9 +15664,8 @@ class SupervertalerQt(QMainWindow):
                     (1 if forbidden else 0, term_id)
                 )
                 self.db_manager.connection.commit()
-                # Clear termbase cache
-                with self.termbase_cache_lock:
-                    self.termbase_cache.clear()
+                # Refresh the in-memory index and the segments showing this term
+                self._update_termbase_index(term_ids=[term_id])
             except Exception as e:
                 self.log(f"⚠️ Error saving forbidden state: {e}")
         
@@ -15602,9 +15691,8 @@ class SupervertalerQt(QMainWindow):
                                 break
                     # Also refresh termbase list to update term count
                     refresh_termbase_list()
-                    # Clear termbase cache
-                    with self.termbase_cache_lock:
-                        self.termbase_cache.clear()
+                    # Drop the term from the in-memory index and the segments showing it
+                    self._update_termbase_index(term_ids=[term_id])
                 except Exception as e:
                     QMessageBox.warning(self, "Error", f"Failed to delete term: {e}")
         
@@ -15640,9 +15728,8 @@ class SupervertalerQt(QMainWindow):
                     (source, target, domain, notes, project, client, term_id)
                 )
                 self.db_manager.connection.commit()
-                # Clear termbase cache
-                with self.termbase_cache_lock:
-                    self.termbase_cache.clear()
+                # Refresh the in-memory index and the segments showing this term
+                self._update_termbase_index(term_ids=[term_id])
             except Exception as e:
                 self.log(f"⚠️ Error saving term: {e}")
         
@@ -15756,7 +15843,7 @@ class SupervertalerQt(QMainWindow):
                 
                 # Term count
                 try:
-                    self.db_manager.cursor.execute("SELECT COUNT(*) FROM termbase_terms WHERE termbase_id = CAST(? AS TEXT)", (tb['id'],))
+                    self.db_manager.cursor.execute("SELECT COUNT(*) FROM termbase_terms WHERE termbase_id = ?", (tb['id'],))
                     live_count = self.db_manager.cursor.fetchone()[0]
                 except Exception as e:
                     live_count = tb.get('term_count', 0)
@@ -15777,10 +15864,8 @@ class SupervertalerQt(QMainWindow):
                     else:
                         termbase_mgr.deactivate_termbase(tb_id, curr_proj_id)
 
-                    # Clear cache and rebuild in-memory index (v1.9.182)
-                    with self.termbase_cache_lock:
-                        self.termbase_cache.clear()
-                    self._build_termbase_index()  # Rebuild index with new activation state
+                    # Add/remove this termbase's terms in the in-memory index (v1.9.182)
+                    self._update_termbase_index(termbase_ids=[tb_id])
                     refresh_termbase_list()
                 
                 read_checkbox.toggled.connect(on_read_toggle)
@@ -15829,6 +15914,7 @@ class SupervertalerQt(QMainWindow):
                             self.log(f"✅ Set termbase {tb_id} as {label}")
 
                             # Update all rows: uncheck others if this was checked (exclusive)
+                            changed_tb_ids = [tb_id]
                             for r in range(termbase_table.rowCount()):
                                 type_widget = termbase_table.cellWidget(r, 0)
                                 proj_widget = termbase_table.cellWidget(r, 6)
@@ -15841,6 +15927,8 @@ class SupervertalerQt(QMainWindow):
                                     proj_widget.setChecked(checked)
                                 elif checked:
                                     # Exclusive: uncheck all other rows
+                                    if proj_widget.isChecked() and name_item:
+                                        changed_tb_ids.append(name_item.data(Qt.ItemDataRole.UserRole))
                                     proj_widget.setChecked(False)
                                 is_proj = proj_widget.isChecked()
                                 proj_widget.blockSignals(False)
@@ -15857,9 +15945,8 @@ class SupervertalerQt(QMainWindow):
                                     if name_item:
                                         name_item.setForeground(QColor("#000"))
 
-                            # Clear cache for termbase matching
-                            with self.termbase_cache_lock:
-                                self.termbase_cache.clear()
+                            # Re-rank the terms of the termbases that changed type
+                            self._update_termbase_index(termbase_ids=changed_tb_ids)
 
                     project_checkbox.toggled.connect(on_project_toggle)
                     termbase_table.setCellWidget(row, 6, project_checkbox)
@@ -16315,9 +16402,8 @@ class SupervertalerQt(QMainWindow):
                 f"Project termbase '{name}' created with {added} terms!"
             )
             
-            # Clear cache and refresh
-            with self.termbase_cache_lock:
-                self.termbase_cache.clear()
+            # Index the new project termbase and refresh
+            self._update_termbase_index(termbase_ids=[tb_id])
             refresh_callback()
             dialog.accept()
         
@@ -16384,9 +16470,8 @@ class SupervertalerQt(QMainWindow):
                 if termbase_mgr.rename_termbase(termbase_id, new_name):
                     self.log(f"✓ Renamed glossary '{current_name}' to '{new_name}'")
                     QMessageBox.information(self, "Success", f"Glossary renamed to '{new_name}'")
-                    # Clear cache and refresh
-                    with self.termbase_cache_lock:
-                        self.termbase_cache.clear()
+                    # Update the termbase name in the index and cached matches, then refresh
+                    self._update_termbase_index(termbase_ids=[termbase_id])
                     refresh_callback()
                 else:
                     QMessageBox.critical(self, "Error", "Failed to rename glossary")
@@ -16434,9 +16519,8 @@ class SupervertalerQt(QMainWindow):
                     self.log(f"✓ Deleted glossary: {tb_name}")
                     QMessageBox.information(self, "Success", f"Glossary '{tb_name}' has been deleted")
                     
-                    # Clear cache and refresh
-                    with self.termbase_cache_lock:
-                        self.termbase_cache.clear()
+                    # Drop its terms from the index and cached matches, then refresh
+                    self._update_termbase_index(termbase_ids=[termbase_id])
                     refresh_callback()
                 except Exception as e:
                     QMessageBox.critical(self, "Error", f"Failed to delete glossary: {str(e)}")
@@ -16456,7 +16540,7 @@ class SupervertalerQt(QMainWindow):
                 if tb_id:
                     try:
                         self.db_manager.cursor.execute(
-                            "SELECT COUNT(*) FROM termbase_terms WHERE termbase_id = CAST(? AS TEXT)", 
+                            "SELECT COUNT(*) FROM termbase_terms WHERE termbase_id = ?", 
                             (tb_id,)
                         )
                         term_count = self.db_manager.cursor.fetchone()[0]
@@ -16492,7 +16576,7 @@ class SupervertalerQt(QMainWindow):
             self,
             "Import Glossary",
             "",
-            "TSV Files (*.tsv *.txt);;All Files (*.*)"
+            "Glossary Files (*.tsv *.txt *.csv *.tbx);;TSV Files (*.tsv *.txt);;CSV Files (*.csv);;TBX Files (*.tbx);;All Files (*.*)"
         )
         
         if not filepath:
@@ -16607,11 +16691,11 @@ class SupervertalerQt(QMainWindow):
         import_stats = {'imported': 0, 'skipped': 0, 'errors': 0}
         
         def progress_callback(current, total, message):
-            """Update progress dialog with import progress"""
+            """Update progress dialog with import progress (current/total = bytes read)"""
             if total > 0:
                 percent = int((current / total) * 100)
                 progress_bar.setValue(percent)
-                progress_bar.setFormat(f"{current}/{total} ({percent}%)")
+                progress_bar.setFormat(f"{percent}%")
             
             # Update stats from message
             if message.startswith("✅"):
@@ -16640,7 +16724,7 @@ class SupervertalerQt(QMainWindow):
         
         self.log(f"📥 Importing termbase from {filepath}...")
         
-        result = importer.import_tsv(
+        result = importer.import_file(
             filepath=filepath,
             termbase_id=termbase_id,
             skip_duplicates=skip_radio.isChecked(),
@@ -16680,8 +16764,8 @@ class SupervertalerQt(QMainWindow):
         # Log and clear cache
         if result.success:
             self.log(f"✓ {result.message}")
-            with self.termbase_cache_lock:
-                self.termbase_cache.clear()
+            # Reload the imported termbase into the index (new and updated terms)
+            self._update_termbase_index(termbase_ids=[termbase_id])
             
             # Refresh the termbase table to show updated term counts
             self._refresh_termbase_table(termbase_table, termbase_mgr)
@@ -18499,6 +18583,74 @@ class SupervertalerQt(QMainWindow):
         batch_size_info.setStyleSheet("font-size: 9pt; color: #666; padding-left: 20px;")
         prefs_layout.addWidget(batch_size_info)
 
+        adaptive_batch_cb = CheckmarkCheckBox("Adaptive batch size (pack segments by token budget)")
+        adaptive_batch_cb.setChecked(general_prefs.get('adaptive_batch_size', True))
+        adaptive_batch_cb.setToolTip("Size each batch of pre-translation to the model's output limit instead of a fixed\n"
+                                     "number of segments: fewer segments for long paragraphs, more for short strings.\n"
+                                     "The expected translation length is learned per language pair.")
+        batch_size_spin.setEnabled(not adaptive_batch_cb.isChecked())
+        adaptive_batch_cb.toggled.connect(lambda checked: batch_size_spin.setEnabled(not checked))
+        prefs_layout.addWidget(adaptive_batch_cb)
+
+        stream_batch_cb = CheckmarkCheckBox("Stream batch translations (fill the grid as segments arrive)")
+        stream_batch_cb.setChecked(general_prefs.get('stream_batch_translation', True))
+        stream_batch_cb.setToolTip("Show each translated segment of a batch as soon as the AI has written it,\n"
+                                   "instead of waiting for the whole batch. Turn off if your endpoint does not\n"
+                                   "support streaming responses.")
+        prefs_layout.addWidget(stream_batch_cb)
+
+        concurrent_layout = QHBoxLayout()
+        concurrent_layout.addWidget(QLabel("Parallel requests:"))
+        concurrent_batches_spin = QSpinBox()
+        concurrent_batches_spin.setMinimum(0)
+        concurrent_batches_spin.setMaximum(16)
+        concurrent_batches_spin.setSpecialValueText("Auto")
+        concurrent_batches_spin.setValue(int(general_prefs.get('llm_concurrent_batches') or 0))
+        concurrent_batches_spin.setToolTip("Batches sent at the same time during batch pre-translation.\n"
+                                           "Auto = per provider (4 for OpenAI/Claude/Gemini, 1 for Ollama)")
+        concurrent_layout.addWidget(concurrent_batches_spin)
+        concurrent_layout.addWidget(QLabel("batches in flight"))
+        concurrent_layout.addStretch()
+        prefs_layout.addLayout(concurrent_layout)
+        concurrent_info = QLabel("  ⓘ Rate limits (429) are retried automatically with backoff. Default: Auto")
+        concurrent_info.setStyleSheet("font-size: 9pt; color: #666; padding-left: 20px;")
+        prefs_layout.addWidget(concurrent_info)
+
+        response_cache_layout = QHBoxLayout()
+        response_cache_cb = CheckmarkCheckBox("Cache AI and MT responses")
+        response_cache_cb.setChecked(general_prefs.get('response_cache_enabled', True))
+        response_cache_cb.setToolTip("Identical batch pre-translation, Leaderboard and MT requests (same provider,\n"
+                                     "model, prompt and text) are answered from a local cache instead of calling the API again")
+        response_cache_layout.addWidget(response_cache_cb)
+        clear_cache_btn = QPushButton("Clear Cache")
+        clear_cache_btn.setToolTip("Delete all cached AI and MT responses")
+        response_cache_layout.addWidget(clear_cache_btn)
+        response_cache_layout.addStretch()
+        prefs_layout.addLayout(response_cache_layout)
+        response_cache_info = QLabel()
+        response_cache_info.setStyleSheet("font-size: 9pt; color: #666; padding-left: 20px;")
+        prefs_layout.addWidget(response_cache_info)
+
+        def update_response_cache_info():
+            cache = get_response_cache(include_disabled=True)
+            stats = cache.stats() if cache else None
+            if not stats:
+                response_cache_info.setText("  ⓘ Re-runs of unchanged segments are answered instantly at no API cost")
+                return
+            response_cache_info.setText(
+                f"  ⓘ {stats['entries']:,} cached responses ({stats['size_bytes'] / 1048576:.1f} MB), "
+                f"hit rate this session: {stats['hit_rate']:.0%} ({stats['hits']:,} of {stats['hits'] + stats['misses']:,})")
+
+        def clear_response_cache():
+            cache = get_response_cache(include_disabled=True)
+            if cache:
+                cache.clear()
+                self.log("🗑️ Response cache cleared")
+            update_response_cache_info()
+
+        clear_cache_btn.clicked.connect(clear_response_cache)
+        update_response_cache_info()
+
         prefs_layout.addSpacing(5)
 
         full_context_cb = CheckmarkCheckBox("Include surrounding context in batch translation")
@@ -18697,7 +18849,11 @@ class SupervertalerQt(QMainWindow):
             quickmenu_context_slider,
             custom_radio=custom_radio, custom_endpoint_input=custom_endpoint_input,
             custom_model_input=custom_model_input, custom_enable_cb=custom_enable_cb,
-            custom_profile_combo=custom_profile_combo, custom_key_input=custom_key_input
+            custom_profile_combo=custom_profile_combo, custom_key_input=custom_key_input,
+            concurrent_batches_spin=concurrent_batches_spin,
+            response_cache_cb=response_cache_cb,
+            adaptive_batch_cb=adaptive_batch_cb,
+            stream_batch_cb=stream_batch_cb
         ))
         layout.addWidget(save_btn)
         
@@ -19652,6 +19808,17 @@ class SupervertalerQt(QMainWindow):
         )
         tm_termbase_layout.addWidget(tb_hide_shorter_cb)
 
+        # Glossary trigram index checkbox
+        tb_trigram_cb = CheckmarkCheckBox("Fast glossary substring search (trigram index)")
+        tb_trigram_cb.setChecked(general_settings.get('termbase_trigram_index', True))
+        tb_trigram_cb.setToolTip(
+            "When enabled, glossary searches (Superlookup, glossary editor filter) use a trigram index\n"
+            "instead of scanning every term. The index takes about three times the space of the\n"
+            "word index and needs SQLite 3.34 or newer.\n\n"
+            "Disable to save disk space; searches then fall back to a slower full scan."
+        )
+        tm_termbase_layout.addWidget(tb_trigram_cb)
+
         self.tm_matching_checkbox = tm_matching_cb  # Store reference for updates
         self.auto_propagate_checkbox = auto_propagate_cb  # Store reference for updates
         self.auto_insert_100_checkbox = auto_insert_100_cb  # Store reference for updates
@@ -19889,7 +20056,8 @@ class SupervertalerQt(QMainWindow):
             auto_confirm_overwrite_cb=auto_confirm_overwrite_cb,
             sound_effects_cb=sound_effects_cb,
             sound_event_combos=sound_event_combos,
-            disable_cache_cb=disable_cache_cb
+            disable_cache_cb=disable_cache_cb,
+            tb_trigram_cb=tb_trigram_cb
         ))
         layout.addWidget(save_btn)
         
@@ -22461,7 +22629,9 @@ class SupervertalerQt(QMainWindow):
                                    quickmenu_context_slider,
                                    custom_radio=None, custom_endpoint_input=None,
                                    custom_model_input=None, custom_enable_cb=None,
-                                   custom_profile_combo=None, custom_key_input=None):
+                                   custom_profile_combo=None, custom_key_input=None,
+                                   concurrent_batches_spin=None, response_cache_cb=None,
+                                   adaptive_batch_cb=None, stream_batch_cb=None):
         """Save all AI settings from the unified AI Settings tab"""
         # Determine selected provider
         if openai_radio.isChecked():
@@ -22555,6 +22725,14 @@ class SupervertalerQt(QMainWindow):
         general_prefs['enable_llm_matching'] = llm_matching_cb.isChecked()
         general_prefs['auto_generate_markdown'] = auto_markdown_cb.isChecked()
         general_prefs['auto_check_models'] = self.auto_check_models_cb.isChecked()
+        if concurrent_batches_spin is not None:
+            general_prefs['llm_concurrent_batches'] = concurrent_batches_spin.value()
+        if response_cache_cb is not None:
+            general_prefs['response_cache_enabled'] = response_cache_cb.isChecked()
+        if adaptive_batch_cb is not None:
+            general_prefs['adaptive_batch_size'] = adaptive_batch_cb.isChecked()
+        if stream_batch_cb is not None:
+            general_prefs['stream_batch_translation'] = stream_batch_cb.isChecked()
         
         # Update LLM match limits
         if 'match_limits' not in general_prefs:
@@ -22562,6 +22740,7 @@ class SupervertalerQt(QMainWindow):
         general_prefs['match_limits']['LLM'] = llm_spin.value()
         
         self.save_general_settings(general_prefs)
+        self._configure_response_cache(general_prefs)
         
         # Handle Ollama keep-warm timer
         if ollama_keepwarm_cb.isChecked():
@@ -22638,7 +22817,7 @@ class SupervertalerQt(QMainWindow):
                                        tb_hide_shorter_cb=None, smart_selection_cb=None,
                                        ahk_path_edit=None, auto_center_cb=None, auto_confirm_100_cb=None,
                                        auto_confirm_overwrite_cb=None, sound_effects_cb=None, sound_event_combos=None,
-                                       disable_cache_cb=None):
+                                       disable_cache_cb=None, tb_trigram_cb=None):
         """Save general settings from UI (non-AI settings only)"""
         self.allow_replace_in_source = allow_replace_cb.isChecked()
         self.update_warning_banner()
@@ -22697,7 +22876,8 @@ class SupervertalerQt(QMainWindow):
             'results_compare_font_size': 9,
             'autohotkey_path': ahk_path_edit.text().strip() if ahk_path_edit is not None else existing_settings.get('autohotkey_path', ''),
             'enable_sound_effects': sound_effects_cb.isChecked() if sound_effects_cb is not None else existing_settings.get('enable_sound_effects', False),
-            'disable_all_caches': disable_cache_cb.isChecked() if disable_cache_cb is not None else existing_settings.get('disable_all_caches', False)
+            'disable_all_caches': disable_cache_cb.isChecked() if disable_cache_cb is not None else existing_settings.get('disable_all_caches', False),
+            'termbase_trigram_index': tb_trigram_cb.isChecked() if tb_trigram_cb is not None else existing_settings.get('termbase_trigram_index', True)
         }
 
         # Keep a fast-access instance value
@@ -22716,6 +22896,15 @@ class SupervertalerQt(QMainWindow):
             else:
                 self.log("✓ Caches enabled (normal mode)")
 
+        # Build or drop the glossary trigram index
+        if tb_trigram_cb is not None:
+            self.termbase_trigram_index = tb_trigram_cb.isChecked()
+            if getattr(self, 'db_manager', None) is not None and self.db_manager.connection is not None:
+                try:
+                    self.db_manager.set_termbase_trigram_index(self.termbase_trigram_index)
+                except Exception as e:
+                    self.log(f"⚠️ Termbase trigram index setting not applied: {e}")
+
         # Persist per-event sound mapping
         existing_map = existing_settings.get('sound_effects_map', {}) if isinstance(existing_settings, dict) else {}
         new_map = dict(existing_map) if isinstance(existing_map, dict) else {}
@@ -25247,6 +25436,16 @@ class SupervertalerQt(QMainWindow):
         except Exception as e:
             print(f"[Superlookup] Error during hotkey cleanup: {e}")
 
+        # Close pooled LLM/MT HTTP connections
+        try:
+            from modules.llm_clients import close_http_clients
+            close_http_clients()
+        except Exception as e:
+            print(f"[LLM] Error closing HTTP clients: {e}")
+        cache = get_response_cache(include_disabled=True)
+        if cache:
+            cache.close()
+
         # Accept the close event
         event.accept()
     
@@ -25651,7 +25850,9 @@ class SupervertalerQt(QMainWindow):
 
             
             # Start background batch processing of termbase matches for all segments
-            # This pre-fills the cache while user works on the project
+            # This pre-fills the cache while user works on the project; segments
+            # with valid matches saved in the project file are skipped
+            self._restore_termbase_hits()
             self._start_termbase_batch_worker()
             
             # Start prefetch worker for first 50 segments (instant switching like memoQ)
@@ -25679,99 +25880,244 @@ class SupervertalerQt(QMainWindow):
 
         This is called ONCE on project load and replaces thousands of per-word
         database queries with a single bulk load + fast in-memory lookups.
+        Later term edits and activation changes patch the index through
+        _update_termbase_index() instead of rebuilding it.
 
         Performance: Reduces 349-segment termbase search from 365 seconds to <1 second.
         """
-        import re
         import time
         start_time = time.time()
 
         if not self.current_project or not hasattr(self, 'db_manager') or not self.db_manager:
             return
 
+        try:
+            # Changes after this point are picked up when saved hits are reused
+            watermark = self.db_manager.termbase_watermark()
+
+            # Multi-term matcher: one pass per segment instead of one check per term
+            new_index = TermMatcher()
+            for term, ref in self._load_termbase_index_entries():
+                new_index.add(ref, term)
+
+            # Thread-safe update of the index
+            with self.termbase_index_lock:
+                self.termbase_index = new_index
+                self.termbase_index_watermark = watermark
+
+            elapsed = time.time() - start_time
+            usage = new_index.memory_usage()
+            self.log(f"✅ Built termbase index: {len(new_index)} terms in {elapsed:.2f}s "
+                     f"({usage['bytes'] / 1048576:.1f} MB, {usage['bytes_per_term']} bytes/term)")
+
+        except Exception as e:
+            self.log(f"❌ Failed to build termbase index: {e}")
+            import traceback
+            self.log(traceback.format_exc())
+
+    def _load_termbase_index_entries(self, term_ids=None, termbase_ids=None) -> list:
+        """
+        Load termbase index entries for the terms of all activated termbases.
+
+        Only the ids and the lowercased source term are kept in memory; the
+        rest of a term is fetched by db_manager.get_termbase_match_details()
+        when it matches a segment.
+
+        Args:
+            term_ids: Only load these terms (None = no restriction)
+            termbase_ids: Only load the terms of these termbases (None = all)
+
+        Returns:
+            List of (source_term_lower, TermRef) pairs for the TermMatcher
+        """
         project_id = self.current_project.id if hasattr(self.current_project, 'id') else None
 
         # Query ALL terms from activated termbases in ONE query
         # This replaces ~17,500 individual queries (349 segments × 50 words each)
         query = """
-            SELECT
-                t.id, t.source_term, t.target_term, t.termbase_id,
-                t.domain, t.notes, t.project, t.client, t.forbidden,
-                tb.is_project_termbase, tb.name as termbase_name,
-                CASE WHEN COALESCE(ta.priority, 0) = 1 OR tb.is_project_termbase = 1 THEN 1 ELSE 0 END as ranking
+            SELECT t.id, t.source_term, t.termbase_id
             FROM termbase_terms t
-            LEFT JOIN termbases tb ON CAST(t.termbase_id AS INTEGER) = tb.id
+            LEFT JOIN termbases tb ON t.termbase_id = tb.id
             LEFT JOIN termbase_activation ta ON ta.termbase_id = tb.id
                 AND ta.project_id = ? AND ta.is_active = 1
             WHERE (ta.is_active = 1 OR tb.is_project_termbase = 1)
         """
-
-        new_index = []
-        try:
-            self.db_manager.cursor.execute(query, [project_id or 0])
+        params = [project_id or 0]
+        if termbase_ids is not None:
+            termbase_ids = list(termbase_ids)
+            query += f" AND t.termbase_id IN ({','.join('?' * len(termbase_ids))})"
+            params.extend(termbase_ids)
+
+        if term_ids is None:
+            self.db_manager.cursor.execute(query, params)
             rows = self.db_manager.cursor.fetchall()
+        else:
+            rows = []
+            term_ids = list(term_ids)
+            for i in range(0, len(term_ids), 500):
+                chunk = term_ids[i:i + 500]
+                self.db_manager.cursor.execute(
+                    query + f" AND t.id IN ({','.join('?' * len(chunk))})", params + chunk)
+                rows.extend(self.db_manager.cursor.fetchall())
 
-            for row in rows:
-                source_term = row[1]  # source_term
-                if not source_term:
-                    continue
+        entries = []
+        termbase_id_objects = {}  # One int object per termbase id
+        for term_id, source_term, termbase_id in rows:
+            if not source_term:
+                continue
 
-                source_term_lower = source_term.lower().strip()
-                if len(source_term_lower) < 2:
-                    continue
+            source_term_lower = source_term.lower().strip()
+            if len(source_term_lower) < 2:
+                continue
 
-                # Pre-compile regex pattern for word-boundary matching
-                # This avoids recompiling the same pattern thousands of times
-                try:
-                    # Handle terms with punctuation differently
-                    if any(c in source_term_lower for c in '.%,/-'):
-                        pattern = re.compile(r'(?<!\w)' + re.escape(source_term_lower) + r'(?!\w)')
-                    else:
-                        pattern = re.compile(r'\b' + re.escape(source_term_lower) + r'\b')
-                except re.error:
-                    # If regex fails, use simple substring matching
-                    pattern = None
-
-                new_index.append({
-                    'term_id': row[0],
-                    'source_term': source_term,
-                    'source_term_lower': source_term_lower,
-                    'target_term': row[2],
-                    'termbase_id': row[3],
-                    'domain': row[4],
-                    'notes': row[5],
-                    'project': row[6],
-                    'client': row[7],
-                    'forbidden': row[8],
-                    'is_project_termbase': row[9],
-                    'termbase_name': row[10],
-                    'ranking': row[11],
-                    'pattern': pattern,  # Pre-compiled regex
-                })
+            # Word-boundary rules are applied by the TermMatcher
+            termbase_id = termbase_id_objects.setdefault(termbase_id, termbase_id)
+            entries.append((source_term_lower, TermRef(term_id, termbase_id)))
+        return entries
 
-            # Sort by term length (longest first) for better phrase matching
-            new_index.sort(key=lambda x: len(x['source_term_lower']), reverse=True)
+    def _termbase_index_termbase_ids(self) -> list:
+        """Ids of the termbases whose terms _load_termbase_index_entries() loads"""
+        project_id = self.current_project.id if hasattr(self.current_project, 'id') else None
+        self.db_manager.cursor.execute("""
+            SELECT tb.id
+            FROM termbases tb
+            LEFT JOIN termbase_activation ta ON ta.termbase_id = tb.id
+                AND ta.project_id = ? AND ta.is_active = 1
+            WHERE (ta.is_active = 1 OR tb.is_project_termbase = 1)
+        """, (project_id or 0,))
+        return [row[0] for row in self.db_manager.cursor.fetchall()]
 
-            # Thread-safe update of the index
-            with self.termbase_index_lock:
-                self.termbase_index = new_index
+    def _collect_termbase_hits(self):
+        """
+        Termbase matches of the cached segments, to be saved with the project.
 
-            elapsed = time.time() - start_time
-            self.log(f"✅ Built termbase index: {len(new_index)} terms in {elapsed:.2f}s")
+        Returns:
+            The project's 'termbase_hits' block, or None without a termbase index
+        """
+        if not self.current_project or not getattr(self, 'db_manager', None) \
+                or self.termbase_index_watermark is None:
+            return None
+        with self.termbase_cache_lock:
+            cache = dict(self.termbase_cache)
+        return collect_termbase_hits(self.current_project.segments, cache, self.termbase_index_watermark,
+                                     self._termbase_index_termbase_ids(), self.db_manager.db_path)
 
+    def _restore_termbase_hits(self):
+        """
+        Fill the termbase cache from the matches saved with the project.
+
+        Segments whose source or matching terms changed since the save are left
+        out; the batch worker recomputes them.
+        """
+        saved = self.current_project.termbase_hits if self.current_project else None
+        if not saved or not getattr(self, 'db_manager', None) or getattr(self, 'disable_all_caches', False):
+            return
+        # Only needed once; the next save collects the hits from the cache
+        self.current_project.termbase_hits = None
+
+        start_time = time.time()
+        try:
+            project_id = self.current_project.id if hasattr(self.current_project, 'id') else None
+            restored = restore_termbase_hits(saved, self.current_project.segments, self.db_manager,
+                                             self._termbase_index_termbase_ids(),
+                                             self._load_termbase_index_entries, project_id)
         except Exception as e:
-            self.log(f"❌ Failed to build termbase index: {e}")
-            import traceback
-            self.log(traceback.format_exc())
+            self.log(f"⚠️ Could not reuse saved termbase matches: {e}")
+            return
 
-    def _search_termbase_in_memory(self, source_text: str) -> dict:
+        with self.termbase_cache_lock:
+            for segment_id, matches in restored.items():
+                self.termbase_cache.setdefault(segment_id, matches)
+        total = len(self.current_project.segments)
+        self.log(f"⚡ Reused saved termbase matches for {len(restored)} of {total} segments "
+                 f"in {time.time() - start_time:.2f}s ({total - len(restored)} to compute)")
+
+    def _update_termbase_index(self, term_ids=None, termbase_ids=None, exclude_segment_id=None):
+        """
+        Patch the in-memory termbase index after a change and refresh the
+        cached matches of the segments it affects.
+
+        Entries for the changed terms are removed and reloaded from the
+        database (so deleted terms and terms of deactivated termbases simply
+        don't come back). Only segments that had a removed term in their
+        cached matches, or whose source text contains one of the reloaded
+        terms, are invalidated; the batch worker then recomputes just those.
+
+        Args:
+            term_ids: Terms that were added, edited or deleted
+            termbase_ids: Termbases that were (de)activated, renamed, deleted or
+                changed type/priority
+            exclude_segment_id: Segment whose cache the caller already updated
+        """
+        if not self.current_project or not hasattr(self, 'db_manager') or not self.db_manager:
+            return
+        if not term_ids and not termbase_ids:
+            return
+
+        # Keep the batch worker from writing matches computed with the old index
+        self.stop_termbase_batch_worker()
+
+        try:
+            if term_ids:
+                term_ids = set(term_ids)
+                changed = lambda term_id, termbase_id: term_id in term_ids
+                new_entries = self._load_termbase_index_entries(term_ids=term_ids)
+            else:
+                termbase_ids = set(termbase_ids)
+                changed = lambda term_id, termbase_id: termbase_id in termbase_ids
+                new_entries = self._load_termbase_index_entries(termbase_ids=termbase_ids)
+        except Exception as e:
+            self.log(f"WARNING: Failed to update termbase index, rebuilding: {e}")
+            with self.termbase_cache_lock:
+                self.termbase_cache.clear()
+            self._start_termbase_batch_worker()
+            return
+
+        with self.termbase_index_lock:
+            index = self.termbase_index
+        removed = index.remove_where(lambda ref: changed(ref.term_id, ref.termbase_id))
+        new_terms = TermMatcher()
+        for term, ref in new_entries:
+            index.add(ref, term)
+            new_terms.add(ref, term)
+
+        # Segments that showed a changed term, or can show one now
+        affected = []
+        with self.termbase_cache_lock:
+            for segment in self.current_project.segments:
+                if segment.id == exclude_segment_id:
+                    continue
+                cached = self.termbase_cache.get(segment.id)
+                if cached is None:
+                    continue  # Not looked up yet - the batch worker will
+                if any(changed(match.get('term_id'), match.get('termbase_id'))
+                       for match in cached.values() if isinstance(match, dict)) or \
+                        (new_terms and new_terms.search(segment.source)):
+                    del self.termbase_cache[segment.id]
+                    affected.append(segment.id)
+        if affected:
+            with self.translation_matches_cache_lock:
+                for segment_id in affected:
+                    self.translation_matches_cache.pop(segment_id, None)
+
+        self.log(f"⚡ Termbase index updated: -{len(removed)} +{len(new_entries)} terms, "
+                 f"{len(affected)} segments to refresh")
+        self._start_termbase_batch_worker(rebuild_index=False)
+
+    def _search_termbase_in_memory(self, source_text: str, db=None) -> dict:
         """
         Search termbase using in-memory index (v1.9.182).
 
         This replaces _search_termbases_thread_safe() for batch operations.
-        Instead of N database queries (one per word), we do:
-        - 1 pass through the index (typically ~1000 terms)
-        - Fast string 'in' check + pre-compiled regex validation
+        Instead of N database queries (one per word), the TermMatcher finds
+        all terms in a single pass over the segment's tokens and then applies
+        the word-boundary rules, so the cost doesn't grow with termbase size.
+        The matched terms are then read from the database in one query.
+
+        Args:
+            source_text: Segment source text
+            db: DatabaseManager for the term details (worker threads pass a
+                leased reader; default: self.db_manager)
 
         Performance: <1ms per segment vs 1+ second per segment.
         """
@@ -25783,52 +26129,32 @@ class SupervertalerQt(QMainWindow):
                 return {}
             index = self.termbase_index  # Local reference for thread safety
 
-        source_lower = source_text.lower()
-        matches = {}
-
-        for term in index:
-            term_lower = term['source_term_lower']
-
-            # Quick substring check first (very fast, implemented in C)
-            if term_lower not in source_lower:
-                continue
-
-            # Word boundary validation using pre-compiled pattern
-            pattern = term.get('pattern')
-            if pattern:
-                if not pattern.search(source_lower):
-                    continue
-
-            # Term matches! Add to results
-            term_id = term['term_id']
-            matches[term_id] = {
-                'source': term['source_term'],
-                'translation': term['target_term'],
-                'term_id': term_id,
-                'termbase_id': term['termbase_id'],
-                'termbase_name': term['termbase_name'],
-                'ranking': term['ranking'],
-                'is_project_termbase': term['is_project_termbase'],
-                'forbidden': term['forbidden'],
-                'domain': term['domain'],
-                'notes': term['notes'],
-                'project': term['project'],
-                'client': term['client'],
-            }
+        term_ids = [ref.term_id for ref in index.search(source_text)]
+        if not term_ids:
+            return {}
 
-        return matches
+        # Keep the index order (longest term first)
+        project_id = self.current_project.id if hasattr(self.current_project, 'id') else None
+        details = (db or self.db_manager).get_termbase_match_details(term_ids, project_id)
+        return {term_id: details[term_id] for term_id in term_ids if term_id in details}
 
-    def _start_termbase_batch_worker(self):
+    def _start_termbase_batch_worker(self, rebuild_index=True):
         """
         Start background thread to batch-process termbase matches for all segments.
         This pre-fills the cache while the user works on the project.
+
+        Args:
+            rebuild_index: Rebuild the in-memory termbase index first. Pass False
+                after an incremental index update; segments that are still
+                cached are skipped, so only invalidated segments are recomputed.
         """
         if not self.current_project or len(self.current_project.segments) == 0:
             return
 
         # Build in-memory termbase index FIRST (v1.9.182)
         # This is the key optimization: load all terms once, then do fast in-memory lookups
-        self._build_termbase_index()
+        if rebuild_index:
+            self._build_termbase_index()
 
         # 🧪 EXPERIMENTAL: Skip batch worker if cache kill switch is enabled
         if getattr(self, 'disable_all_caches', False):
@@ -25854,7 +26180,7 @@ class SupervertalerQt(QMainWindow):
             daemon=True  # Daemon thread - won't prevent program exit
         )
         self.termbase_batch_worker_thread.start()
-    
+
     def _termbase_batch_worker_run(self, segments):
         """
         Background worker thread: process all segments and populate termbase cache.
@@ -25873,35 +26199,39 @@ class SupervertalerQt(QMainWindow):
             with_matches = 0
             start_time = time.time()
 
-            for segment in segments:
-                # Check if stop event was signaled (user closed project or started new one)
-                if self.termbase_batch_stop_event.is_set():
-                    self.log(f"⏹️  Termbase batch worker stopped by user (processed {processed} segments)")
-                    break
+            # Term details are read by id; SQLite connections can't be shared
+            # across threads, so lease a pooled reader for the whole run
+            from modules.database_manager import DatabaseManager
+            with DatabaseManager.lease_reader(self.db_manager.db_path) as db:
+                for segment in segments:
+                    # Check if stop event was signaled (user closed project or started new one)
+                    if self.termbase_batch_stop_event.is_set():
+                        self.log(f"⏹️  Termbase batch worker stopped by user (processed {processed} segments)")
+                        break
 
-                segment_id = segment.id
+                    segment_id = segment.id
 
-                # Skip if already in cache (thread-safe check)
-                with self.termbase_cache_lock:
-                    if segment_id in self.termbase_cache:
-                        cached += 1
-                        continue
+                    # Skip if already in cache (thread-safe check)
+                    with self.termbase_cache_lock:
+                        if segment_id in self.termbase_cache:
+                            cached += 1
+                            continue
 
-                # v1.9.182: Use in-memory index for instant lookup (no database queries!)
-                try:
-                    matches = self._search_termbase_in_memory(segment.source)
+                    # v1.9.182: Use in-memory index for instant lookup (one query for the matched terms)
+                    try:
+                        matches = self._search_termbase_in_memory(segment.source, db)
 
-                    # Store in cache (thread-safe) - even empty results to avoid re-lookup
-                    with self.termbase_cache_lock:
-                        self.termbase_cache[segment_id] = matches
+                        # Store in cache (thread-safe) - even empty results to avoid re-lookup
+                        with self.termbase_cache_lock:
+                            self.termbase_cache[segment_id] = matches
 
-                    processed += 1
-                    if matches:
-                        with_matches += 1
+                        processed += 1
+                        if matches:
+                            with_matches += 1
 
-                except Exception as e:
-                    self.log(f"❌ Error processing segment {segment_id} in batch worker: {e}")
-                    continue
+                    except Exception as e:
+                        self.log(f"❌ Error processing segment {segment_id} in batch worker: {e}")
+                        continue
 
             elapsed = time.time() - start_time
             total_cached = len(self.termbase_cache)
@@ -25967,7 +26297,7 @@ class SupervertalerQt(QMainWindow):
                                 CASE WHEN COALESCE(ta.priority, 0) = 1 OR tb.is_project_termbase = 1 THEN 1 ELSE 0 END as ranking,
                                 'source' as match_direction
                             FROM termbase_terms t
-                            LEFT JOIN termbases tb ON CAST(t.termbase_id AS INTEGER) = tb.id
+                            LEFT JOIN termbases tb ON t.termbase_id = tb.id
                             LEFT JOIN termbase_activation ta ON ta.termbase_id = tb.id AND ta.project_id = ? AND ta.is_active = 1
                             WHERE LOWER(t.source_term) LIKE ?
                             AND (ta.is_active = 1 OR tb.is_project_termbase = 1)
@@ -25994,7 +26324,7 @@ class SupervertalerQt(QMainWindow):
                                 CASE WHEN COALESCE(ta.priority, 0) = 1 OR tb.is_project_termbase = 1 THEN 1 ELSE 0 END as ranking,
                                 'target' as match_direction
                             FROM termbase_terms t
-                            LEFT JOIN termbases tb ON CAST(t.termbase_id AS INTEGER) = tb.id
+                            LEFT JOIN termbases tb ON t.termbase_id = tb.id
                             LEFT JOIN termbase_activation ta ON ta.termbase_id = tb.id AND ta.project_id = ? AND ta.is_active = 1
                             WHERE LOWER(t.target_term) LIKE ?
                             AND (ta.is_active = 1 OR tb.is_project_termbase = 1)
@@ -26181,23 +26511,21 @@ class SupervertalerQt(QMainWindow):
         Background worker: prefetch TM/MT/LLM matches for given segments.
         Runs in separate thread to avoid blocking UI.
         
-        Creates its own database connection for thread-safe termbase lookups.
+        Leases a pooled read connection for thread-safe termbase lookups.
         Also emits signal to apply proactive highlighting on the main thread.
         """
-        import sqlite3
         import json
+        from contextlib import ExitStack
         
-        # Create thread-local database connection for termbase searches
+        # Lease a pooled read connection for termbase searches
+        db_leases = ExitStack()
         thread_db_cursor = None
-        thread_db_connection = None
         try:
             if hasattr(self, 'db_manager') and self.db_manager and hasattr(self.db_manager, 'db_path'):
-                thread_db_connection = sqlite3.connect(self.db_manager.db_path, timeout=15)
-                thread_db_connection.row_factory = sqlite3.Row
-                thread_db_connection.execute("PRAGMA journal_mode=WAL")
+                thread_db_connection = db_leases.enter_context(self.db_manager.pool.read())
                 thread_db_cursor = thread_db_connection.cursor()
         except Exception:
-            pass  # Continue without thread-local connection - will use cache only
+            pass  # Continue without a database connection - will use cache only
         
         try:
             for idx, segment_id in enumerate(segment_ids):
@@ -26257,17 +26585,16 @@ class SupervertalerQt(QMainWindow):
             self.log(f"Error in prefetch worker: {e}")
         
         finally:
-            # Close thread-local database connection
+            # Return the leased database connection to the pool
             if thread_db_cursor:
                 try:
                     thread_db_cursor.close()
                 except:
                     pass
-            if thread_db_connection:
-                try:
-                    thread_db_connection.close()
-                except:
-                    pass
+            try:
+                db_leases.close()
+            except Exception:
+                pass
     
     def _fetch_all_matches_for_segment(self, segment, thread_db_cursor=None):
         """
@@ -26645,6 +26972,12 @@ class SupervertalerQt(QMainWindow):
                             termbase_priorities[str(tb_id)] = priority
                     self.current_project.termbase_settings['termbase_priorities'] = termbase_priorities
             
+            # Save the termbase matches found so far (reused when the project is reopened)
+            try:
+                self.current_project.termbase_hits = self._collect_termbase_hits()
+            except Exception as e:
+                self.log(f"⚠️ Termbase matches not saved: {e}")
+            
             # Save spellcheck settings to project (spellcheck_settings is now properly initialized in dataclass)
             self.current_project.spellcheck_settings['enabled'] = self.spellcheck_enabled
             if hasattr(self, 'target_language'):
@@ -26697,6 +27030,9 @@ class SupervertalerQt(QMainWindow):
             self.project_modified = False
             self.update_window_title()
             self.log(f"✓ Saved project: {Path(file_path).name}")
+
+            # Write buffered TM usage counts along with the project
+            self._flush_tm_usage_counts()
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save project:\n{str(e)}")
@@ -36809,6 +37145,25 @@ class SupervertalerQt(QMainWindow):
         self.auto_generate_markdown = settings.get('auto_generate_markdown', False)
         # Load TM save mode
         self.tm_save_mode = settings.get('tm_save_mode', 'latest')
+        # Load TM usage count write-back mode (default: deferred, written in batches)
+        self.defer_tm_usage_counts = settings.get('defer_tm_usage_counts', True)
+        if getattr(self, 'tm_database', None):
+            self.tm_database.db.set_deferred_usage_counts(self.defer_tm_usage_counts)
+        # Load SQLite performance profile ('default', 'low_memory' or 'legacy')
+        self.db_performance_profile = settings.get('db_performance_profile', 'default')
+        for db in (getattr(self, 'db_manager', None), getattr(getattr(self, 'tm_database', None), 'db', None)):
+            if db is not None:
+                try:
+                    db.set_performance_profile(self.db_performance_profile)
+                except Exception as e:
+                    self.log(f"⚠️ {e} - keeping the current database profile")
+        # Load termbase trigram index setting (substring/fuzzy termbase search, ~3x index size)
+        self.termbase_trigram_index = settings.get('termbase_trigram_index', True)
+        if getattr(self, 'db_manager', None) is not None and self.db_manager.connection is not None:
+            try:
+                self.db_manager.set_termbase_trigram_index(self.termbase_trigram_index)
+            except Exception as e:
+                self.log(f"⚠️ Termbase trigram index setting not applied: {e}")
         # Load debug mode settings
         self.debug_mode_enabled = settings.get('debug_mode_enabled', False)
         self.debug_auto_export = settings.get('debug_auto_export', False)
@@ -39162,6 +39517,165 @@ class SupervertalerQt(QMainWindow):
         worker.start()
         progress_dialog.exec()
     
+    def run_terminology_qa(self):
+        """Check all segment targets against the active termbases in a background thread"""
+        if not self.current_project or not self.current_project.segments:
+            QMessageBox.information(self, "No Project", "Please open or create a project first.")
+            return
+        if not hasattr(self, 'db_manager') or not self.db_manager:
+            QMessageBox.warning(self, "No Database", "The termbase database is not available.")
+            return
+
+        segments = self.current_project.segments
+        progress_dialog = QDialog(self)
+        progress_dialog.setWindowTitle("Checking Terminology")
+        progress_dialog.setModal(True)
+        progress_dialog.setMinimumWidth(450)
+
+        dialog_layout = QVBoxLayout(progress_dialog)
+        dialog_layout.setContentsMargins(12, 12, 12, 12)
+        dialog_layout.setSpacing(8)
+
+        current_label = QLabel("Initializing...")
+        dialog_layout.addWidget(current_label)
+
+        progress_bar = QProgressBar()
+        progress_bar.setMaximum(len(segments))
+        progress_bar.setValue(0)
+        dialog_layout.addWidget(progress_bar)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        cancel_btn = QPushButton("Cancel")
+        button_layout.addWidget(cancel_btn)
+        dialog_layout.addLayout(button_layout)
+
+        project_id = self.current_project.id if hasattr(self.current_project, 'id') else None
+        worker = TermQAWorker(self.db_manager.db_path, project_id, segments)
+        self._term_qa_worker = worker  # Keep reference to prevent GC
+
+        def on_cancel():
+            worker.cancel()
+            cancel_btn.setEnabled(False)
+            current_label.setText("Cancelling...")
+
+        cancel_btn.clicked.connect(on_cancel)
+        progress_dialog.rejected.connect(worker.cancel)
+
+        def on_progress(done, total, message):
+            progress_bar.setMaximum(max(total, 1))
+            progress_bar.setValue(done)
+            current_label.setText(message)
+
+        def on_finished(report, error):
+            self._term_qa_worker = None
+            progress_dialog.accept()
+            if report is None:
+                self.log(f"❌ Terminology check failed: {error}")
+                QMessageBox.warning(self, "Terminology Check", f"The terminology check failed:\n\n{error}")
+                return
+            self.log(f"📖 Terminology check{' (cancelled)' if report.cancelled else ''}: "
+                     f"{report.segments_checked:,} segments, {report.terms:,} terms in {report.elapsed:.1f}s - "
+                     f"{report.count(MISSING_TERM):,} missing, {report.count(FORBIDDEN_TERM):,} forbidden")
+            self._show_terminology_qa_report(report)
+
+        worker.progress_update.connect(on_progress)
+        worker.finished_check.connect(on_finished)
+        worker.start()
+        progress_dialog.exec()
+
+    def _show_terminology_qa_report(self, report):
+        """Show the issues of a terminology check, with TSV/HTML export"""
+        segments = self.current_project.segments
+        dialog = QDialog(self)
+        dialog.setWindowTitle("📖 Terminology Check")
+        dialog.setModal(False)
+        dialog.setMinimumWidth(900)
+        dialog.setMinimumHeight(600)
+
+        layout = QVBoxLayout(dialog)
+        header = QLabel(
+            f"<h3>{len(report.issues):,} issue{'s' if len(report.issues) != 1 else ''} in "
+            f"{len(report.segment_ids()):,} segment{'s' if len(report.segment_ids()) != 1 else ''}</h3>")
+        layout.addWidget(header)
+
+        info_text = (f"{report.segments_checked:,} translated segments checked against {report.terms:,} terms "
+                     f"({report.count(MISSING_TERM):,} missing, {report.count(FORBIDDEN_TERM):,} forbidden). "
+                     f"Double-click a row to go to the segment.")
+        if report.cancelled:
+            info_text = "⚠️ Check cancelled - results are incomplete. " + info_text
+        info_label = QLabel(info_text)
+        info_label.setWordWrap(True)
+        info_label.setStyleSheet("color: #666; padding: 5px 0;")
+        layout.addWidget(info_label)
+
+        table = QTableWidget()
+        table.setColumnCount(5)
+        table.setHorizontalHeaderLabels(["Seg #", "Issue", "Source term", "Target terms", "Termbase"])
+        table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.horizontalHeader().setStretchLastSection(True)
+        table.setColumnWidth(0, 60)
+        table.setColumnWidth(1, 170)
+        table.setColumnWidth(2, 200)
+        table.setColumnWidth(3, 250)
+        table.setRowCount(len(report.issues))
+        for row, issue in enumerate(report.issues):
+            table.setItem(row, 0, QTableWidgetItem(str(issue.segment_id)))
+            label_item = QTableWidgetItem(issue.label)
+            if issue.kind == FORBIDDEN_TERM:
+                label_item.setForeground(QColor("#c0392b"))
+            table.setItem(row, 1, label_item)
+            table.setItem(row, 2, QTableWidgetItem(issue.source_term))
+            table.setItem(row, 3, QTableWidgetItem(" | ".join(issue.target_terms)))
+            table.setItem(row, 4, QTableWidgetItem(issue.termbase_name))
+            table.item(row, 0).setToolTip(issue.message)
+
+        def on_row_double_clicked(row):
+            self._navigate_to_segment_in_grid(report.issues[row].segment_id)
+            dialog.lower()  # Send dialog to back so grid is visible
+
+        table.cellDoubleClicked.connect(lambda row, col: on_row_double_clicked(row))
+        layout.addWidget(table)
+
+        def export_report():
+            default_name = (self.current_project.name or "project").replace(" ", "_") + "_terminology_qa.html"
+            file_path, selected_filter = QFileDialog.getSaveFileName(
+                dialog,
+                "Export Terminology Check",
+                default_name,
+                "HTML Files (*.html);;Tab-separated Files (*.tsv);;All Files (*.*)"
+            )
+            if not file_path:
+                return
+            try:
+                if file_path.lower().endswith('.tsv') or ('tsv' in selected_filter and
+                                                           not file_path.lower().endswith(('.html', '.htm'))):
+                    if not file_path.lower().endswith('.tsv'):
+                        file_path += '.tsv'
+                    report.export_tsv(file_path, segments)
+                else:
+                    if not file_path.lower().endswith(('.html', '.htm')):
+                        file_path += '.html'
+                    report.export_html(file_path, segments, title=self.current_project.name or '')
+                self.log(f"💾 Terminology check exported to {file_path}")
+            except Exception as e:
+                QMessageBox.warning(dialog, "Export Failed", f"Could not export the report:\n\n{e}")
+
+        button_layout = QHBoxLayout()
+        export_btn = QPushButton("💾 Export...")
+        export_btn.setEnabled(bool(report.issues))
+        export_btn.clicked.connect(export_report)
+        button_layout.addWidget(export_btn)
+        button_layout.addStretch()
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(dialog.accept)
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+
+        self._term_qa_report_dialog = dialog  # Keep reference (non-modal)
+        dialog.show()
+
     def show_proofreading_results_dialog(self):
         """Show dialog with all proofreading results (from proofreading_notes dict)."""
         if not self.current_project:
@@ -47837,11 +48351,13 @@ class SupervertalerQt(QMainWindow):
             if reply == QMessageBox.StandardButton.Save:
                 self.save_project()
                 self._stop_okapi_sidecar()
+                self._flush_tm_usage_counts()
                 self._cleanup_web_views()
                 self._close_detached_log_windows()
                 event.accept()
             elif reply == QMessageBox.StandardButton.Discard:
                 self._stop_okapi_sidecar()
+                self._flush_tm_usage_counts()
                 self._cleanup_web_views()
                 self._close_detached_log_windows()
                 event.accept()
@@ -47849,10 +48365,19 @@ class SupervertalerQt(QMainWindow):
                 event.ignore()
         else:
             self._stop_okapi_sidecar()
+            self._flush_tm_usage_counts()
             self._cleanup_web_views()
             self._close_detached_log_windows()
             event.accept()
 
+    def _flush_tm_usage_counts(self):
+        """Write buffered TM usage counts to the database"""
+        try:
+            if getattr(self, 'tm_database', None):
+                self.tm_database.db.flush_usage_counts()
+        except Exception as e:
+            self.log(f"⚠️ Could not write TM usage counts: {e}")
+
     def _cleanup_web_views(self):
         """Clean up WebEngine views - DISABLED to prevent crash"""
         # WebEngine cleanup has been disabled because it was causing Python crashes
@@ -49421,7 +49946,8 @@ class SupervertalerQt(QMainWindow):
             else:
                 error_count += 1
             dialog.add_console_line(message, success)
-            dialog.update_progress(current, total, elapsed_time, success_count, error_count)
+            # Batches can finish out of order (split re-sends, streamed segments), so show the count done
+            dialog.update_progress(success_count + error_count, total, elapsed_time, success_count, error_count)
             
             # Update grid immediately for successful translations
             if success and current <= len(segments_needing_translation):
@@ -49440,6 +49966,13 @@ class SupervertalerQt(QMainWindow):
         
         def handle_translation_complete(final_success_count, final_error_count):
             dialog.show_completion_message(final_success_count, final_error_count)
+
+            # Remember the learned expansion ratio for this language pair
+            planner = worker.batch_planner
+            if planner and planner.batches_observed:
+                prefs = self.load_general_settings()
+                prefs.setdefault('llm_expansion_ratios', {})[worker.expansion_pair] = round(planner.expansion_ratio, 3)
+                self.save_general_settings(prefs)
             self.project_modified = True
             self.update_window_title()
             self.auto_resize_rows()
@@ -50052,7 +50585,8 @@ class SupervertalerQt(QMainWindow):
                         source_lang=source_lang,
                         target_lang=target_lang,
                         custom_prompt=batch_prompt,
-                        images=batch_images
+                        images=batch_images,
+                        use_cache=True
                     )
 
                     import re
@@ -54992,7 +55526,8 @@ class SuperlookupTab(QWidget):
             
             text_lower = text.lower()
             
-            # Search each selected termbase
+            # Select the termbases that match the language filters
+            termbases_by_id = {}
             for termbase in termbases_to_search:
                 termbase_id = termbase['id']
                 
@@ -55015,71 +55550,64 @@ class SuperlookupTab(QWidget):
                         print(f"[DEBUG search_termbases] Skipping '{termbase['name']}' - target lang mismatch: '{tb_target_norm}' not in {target_langs_norm}")
                         continue
                 
-                print(f"[DEBUG search_termbases] Searching in '{termbase['name']}'")
-                terms = self.termbase_mgr.get_terms(termbase_id)
+                termbases_by_id[termbase_id] = termbase
+            
+            if not termbases_by_id:
+                return results
+            print(f"[DEBUG search_termbases] Searching in {len(termbases_by_id)} termbases")
+            
+            # Terms containing the search text (FTS5 index) and terms occurring
+            # in it (normalized-term index), instead of scanning every term
+            search_source = direction != 'target'
+            search_target = direction != 'source'
+            terms = self.db_manager.search_termbase_terms(
+                text, termbases_by_id.keys(), search_source, search_target, limit=None)
+            terms += self.db_manager.search_termbase_terms_in_text(
+                text, termbases_by_id.keys(), search_source, search_target)
+            
+            # Minimum length to avoid spurious single-char matches
+            # If search text is longer than 3 chars, require term to be at least 3 chars
+            min_term_len = 3 if len(text_lower) > 3 else 1
+            
+            for term in terms:
+                target_term_original = term.get('target_term') or ''
+                source_term_original = term.get('source_term') or ''
+                
+                # Also check term-level language if available (normalize for comparison)
+                term_source_lang = term.get('source_lang', '')
+                term_target_lang = term.get('target_lang', '')
+                term_source_norm = self._normalize_language_code(term_source_lang) if term_source_lang else ''
+                term_target_norm = self._normalize_language_code(term_target_lang) if term_target_lang else ''
+                
+                # Check if term-level languages match any of the filter variants
+                if source_langs_norm and term_source_norm and term_source_norm not in source_langs_norm:
+                    continue
+                if target_langs_norm and term_target_norm and term_target_norm not in target_langs_norm:
+                    continue
                 
-                for term in terms:
-                    source_term = term.get('source_term', '').lower()
-                    target_term = term.get('target_term', '').lower()
-                    target_term_original = term.get('target_term', '')
-                    source_term_original = term.get('source_term', '')
-                    
-                    # Also check term-level language if available (normalize for comparison)
-                    term_source_lang = term.get('source_lang', '')
-                    term_target_lang = term.get('target_lang', '')
-                    term_source_norm = self._normalize_language_code(term_source_lang) if term_source_lang else ''
-                    term_target_norm = self._normalize_language_code(term_target_lang) if term_target_lang else ''
-                    
-                    # Check if term-level languages match any of the filter variants
-                    if source_langs_norm and term_source_norm and term_source_norm not in source_langs_norm:
-                        continue
-                    if target_langs_norm and term_target_norm and term_target_norm not in target_langs_norm:
-                        continue
-                    
-                    match_found = False
-                    
-                    # Minimum length for substring matching to avoid spurious single-char matches
-                    # If search text is longer than 3 chars, require term to be at least 3 chars for substring match
-                    min_term_len = 3 if len(text_lower) > 3 else 1
-                    
-                    # Check based on search direction
-                    if direction == 'source':
-                        # Search source only
-                        if source_term and len(source_term) >= min_term_len:
-                            if source_term in text_lower or text_lower in source_term:
-                                match_found = True
-                    elif direction == 'target':
-                        # Search target only
-                        if target_term and len(target_term) >= min_term_len:
-                            if target_term in text_lower or text_lower in target_term:
-                                match_found = True
-                    else:
-                        # Both directions (bidirectional)
-                        if source_term and len(source_term) >= min_term_len:
-                            if source_term in text_lower or text_lower in source_term:
-                                match_found = True
-                        if target_term and len(target_term) >= min_term_len:
-                            if target_term in text_lower or text_lower in target_term:
-                                match_found = True
-                    
-                    if match_found:
-                        # Create LookupResult with full metadata
-                        from modules.superlookup import LookupResult
-                        results.append(LookupResult(
-                            source=source_term_original,
-                            target=target_term_original,
-                            match_percent=100,
-                            source_type='termbase',
-                            metadata={
-                                'termbase': termbase['name'],
-                                'termbase_id': termbase_id,
-                                'domain': term.get('domain', ''),
-                                'notes': term.get('notes', ''),
-                                'project': term.get('project', ''),
-                                'client': term.get('client', ''),
-                                'forbidden': term.get('forbidden', False)
-                            }
-                        ))
+                searched_terms = ([source_term_original] if search_source else []) + \
+                                 ([target_term_original] if search_target else [])
+                if max(len(t) for t in searched_terms) < min_term_len:
+                    continue
+                
+                # Create LookupResult with full metadata
+                from modules.superlookup import LookupResult
+                termbase = termbases_by_id[term['termbase_id']]
+                results.append(LookupResult(
+                    source=source_term_original,
+                    target=target_term_original,
+                    match_percent=100,
+                    source_type='termbase',
+                    metadata={
+                        'termbase': termbase['name'],
+                        'termbase_id': termbase['id'],
+                        'domain': term.get('domain') or '',
+                        'notes': term.get('notes') or '',
+                        'project': term.get('project') or '',
+                        'client': term.get('client') or '',
+                        'forbidden': term.get('forbidden', False)
+                    }
+                ))
             
             # Remove duplicates
             seen = set()
@@ -57608,6 +58136,10 @@ def main():
 
 
 if __name__ == '__main__':
+    # Frozen builds: let batch fuzzy-matching worker processes start without launching the UI
+    import multiprocessing
+    multiprocessing.freeze_support()
+
     # Wrap main() in crash handler for macOS Finder launches (stdout/stderr go nowhere)
     if getattr(sys, 'frozen', False) and sys.platform == 'darwin':
         try:
@@ -0,0 +1,168 @@
+"""
+Batch Planner Module
+
+Packs segments into LLM batch requests by estimated token count instead of a
+fixed number of segments per request. A batch is closed when the expected
+output (source tokens x expansion ratio) would no longer fit comfortably in
+the model's output limit, or the whole request in its context window, so
+long legal paragraphs are not truncated and short UI strings share one
+round trip.
+
+The expansion ratio (output tokens per source token) starts from a default
+or a previously learned value for the language pair and is updated from
+every completed batch. Batches are planned lazily, so later batches use what
+earlier ones taught. A batch is only split when its response parse comes
+back incomplete.
+
+Usage:
+    from modules.batch_planner import BatchPlanner, token_limits
+
+    context_tokens, output_tokens = token_limits("claude", "claude-sonnet-4-6")
+    planner = BatchPlanner(context_tokens, output_tokens, expansion_ratio=1.4)
+    for start, end in planner.plan(sources):
+        translations = translate_batch(sources[start:end])
+        planner.observe(sources[start:end], translations)
+"""
+
+import re
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+DEFAULT_EXPANSION_RATIO = 1.5   # Output tokens per source token (most pairs land between 1.0 and 1.5)
+MIN_EXPANSION_RATIO = 0.3
+MAX_EXPANSION_RATIO = 4.0
+MAX_SEGMENTS_PER_BATCH = 100    # Even for tiny strings: keeps a failed batch cheap to redo
+SEGMENT_OVERHEAD_TOKENS = 4     # "123. " label and line break, in the prompt and the response
+OUTPUT_FILL = 0.7               # Fraction of the output limit a batch is planned to use
+
+# Context window per provider (tokens); Ollama's is the num_ctx most local setups run with
+CONTEXT_WINDOWS = {
+    "openai": 128000,
+    "claude": 200000,
+    "gemini": 1000000,
+    "ollama": 8192,
+    "custom_openai": 32000,
+}
+
+_WIDE_CHARS = re.compile(r'[\u2e80-\u9fff\uac00-\ud7af\uf900-\ufaff\uff00-\uffef]')  # CJK, Hangul, full-width
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token count: about four characters per token, but one per
+    character for CJK scripts (which tokenize much more densely).
+    """
+    if not text:
+        return 0
+    wide = len(_WIDE_CHARS.findall(text))
+    return int((len(text) - wide) / 4 + wide) + 1
+
+
+def token_limits(provider: str, model: Optional[str] = None, max_tokens: int = 16384) -> Tuple[int, int]:
+    """
+    Context window and usable output tokens for a batch request.
+
+    Args:
+        provider: "openai", "claude", "gemini", "ollama" or "custom_openai"
+        model: Model name (reasoning models spend part of the output on thinking)
+        max_tokens: max_tokens LLMClient requests by default
+
+    Returns:
+        (context_tokens, output_tokens)
+    """
+    context_tokens = CONTEXT_WINDOWS.get(provider, 32000)
+    output_tokens = max_tokens
+    model_lower = (model or "").lower()
+    if provider in ("openai", "custom_openai") and any(x in model_lower for x in ["gpt-5", "o1", "o3"]):
+        # LLMClient requests 32K for reasoning models; assume half goes to reasoning
+        output_tokens = 32768 // 2
+    elif provider == "gemini":
+        output_tokens = 8192
+    elif provider == "ollama":
+        output_tokens = min(max_tokens, 8192, context_tokens // 2)
+    return context_tokens, output_tokens
+
+
+class BatchPlanner:
+    """Packs segments into token-budgeted batches and learns the expansion ratio"""
+
+    def __init__(self, context_tokens: int, output_tokens: int,
+                 expansion_ratio: Optional[float] = None, max_segments: int = MAX_SEGMENTS_PER_BATCH,
+                 prompt_tokens: int = 1000):
+        """
+        Args:
+            context_tokens: Model context window
+            output_tokens: Output tokens available per request
+            expansion_ratio: Starting ratio (e.g. learned earlier for this language pair)
+            max_segments: Upper limit on segments per batch
+            prompt_tokens: Instructions, glossary etc. sent with every batch
+        """
+        self.context_tokens = context_tokens
+        self.output_tokens = output_tokens
+        self.expansion_ratio = expansion_ratio or DEFAULT_EXPANSION_RATIO
+        self.max_segments = max(1, max_segments)
+        self.prompt_tokens = prompt_tokens
+        self.batches_observed = 0
+
+    def _costs(self, source: str) -> Tuple[int, int]:
+        """(prompt tokens, expected response tokens) one segment adds"""
+        tokens = estimate_tokens(source)
+        return tokens + SEGMENT_OVERHEAD_TOKENS, int(tokens * self.expansion_ratio) + SEGMENT_OVERHEAD_TOKENS
+
+    def batch_end(self, sources: Sequence[str], start: int) -> int:
+        """
+        Index one past the last segment of the batch starting at start.
+        A batch always holds at least one segment.
+        """
+        output_budget = self.output_tokens * OUTPUT_FILL
+        input_tokens, output_tokens = self.prompt_tokens, 0
+        end = start
+        while end < len(sources) and end - start < self.max_segments:
+            seg_in, seg_out = self._costs(sources[end])
+            too_big = (output_tokens + seg_out > output_budget
+                       or input_tokens + seg_in + output_tokens + seg_out > self.context_tokens)
+            if too_big and end > start:
+                break
+            input_tokens += seg_in
+            output_tokens += seg_out
+            end += 1
+        return end
+
+    def plan(self, sources: Sequence[str], start: int = 0) -> Iterator[Tuple[int, int]]:
+        """
+        Yield (start, end) index ranges covering sources. Lazy: each batch is
+        planned with the expansion ratio learned so far.
+        """
+        while start < len(sources):
+            end = self.batch_end(sources, start)
+            yield start, end
+            start = end
+
+    def observe(self, sources: Sequence[str], translations: Sequence[Optional[str]]):
+        """
+        Learn from a completed batch.
+
+        Args:
+            sources: Source texts of the batch
+            translations: Parsed translations (None for missing segments, which are ignored)
+        """
+        source_tokens = output_tokens = 0
+        for source, translation in zip(sources, translations):
+            if translation:
+                source_tokens += estimate_tokens(source)
+                output_tokens += estimate_tokens(translation)
+        if source_tokens < 20:
+            return  # Too little text to say anything
+        observed = output_tokens / source_tokens
+        # Moving average; the first batches move the starting guess the most
+        weight = max(0.25, 1 / (self.batches_observed + 2))
+        ratio = (1 - weight) * self.expansion_ratio + weight * observed
+        self.expansion_ratio = min(MAX_EXPANSION_RATIO, max(MIN_EXPANSION_RATIO, ratio))
+        self.batches_observed += 1
+
+    @staticmethod
+    def split(items: List) -> List[List]:
+        """Halve an incompletely answered batch (single segments are not split)"""
+        if len(items) < 2:
+            return [items] if items else []
+        middle = len(items) // 2
+        return [items[:middle], items[middle:]]
@@ -0,0 +1,102 @@
+"""
+Batch Response Parser Module
+
+Parses numbered batch translation responses ("123. translated text"), as
+requested by the PreTranslationWorker batch prompts, either in one go or
+incrementally while the response streams in.
+
+Streaming: feed() the text as it arrives. A segment is reported through
+on_segment as soon as its line closes, i.e. when the next segment's number
+line starts. The last segment of a response is only known to be complete
+when the whole response is, so close() returns it with the rest but does not
+report it.
+
+Multi-line translations: lines without a number are continuation lines of
+the segment before them. A numbered line only starts a new segment if its
+number is one of the batch's segment IDs not seen yet, so numbered list
+items inside a translation ("1. Remove the cover") stay part of it.
+
+Usage:
+    from modules.batch_response_parser import NumberedResponseParser
+
+    parser = NumberedResponseParser([12, 13, 14], on_segment=lambda seg_id, text: print(seg_id, text))
+    for chunk in stream:
+        parser.feed(chunk)
+    translations = parser.close()   # {12: "...", 13: "...", 14: "..."}
+"""
+
+import re
+from typing import Callable, Dict, Iterable, List, Optional
+
+_NUMBERED_LINE = re.compile(r'^(\d+)\.\s*(.*)')
+
+
+class NumberedResponseParser:
+    """Incremental parser for numbered batch responses"""
+
+    def __init__(self, segment_ids: Iterable[int], on_segment: Optional[Callable[[int, str], None]] = None):
+        """
+        Args:
+            segment_ids: IDs of the segments in the batch
+            on_segment: Called as (segment_id, translation) when a segment's line closes
+        """
+        self.expected = set(segment_ids)
+        self.on_segment = on_segment
+        self.translations: Dict[int, str] = {}
+        self._buffer = ""
+        self._current_id: Optional[int] = None
+        self._current_lines: List[str] = []
+
+    def feed(self, text: str):
+        """Add the next piece of the response (any size, may end mid-line)"""
+        self._buffer += text
+        if '\n' not in text:
+            return
+        *lines, self._buffer = self._buffer.split('\n')
+        for line in lines:
+            self._add_line(line.rstrip('\r'))
+
+    def close(self) -> Dict[int, str]:
+        """
+        End of response.
+
+        Returns:
+            Dict of segment ID -> translation for every segment found
+        """
+        if self._buffer:
+            self._add_line(self._buffer.rstrip('\r'))
+            self._buffer = ""
+        self._finish_segment(report=False)
+        return self.translations
+
+    def _add_line(self, line: str):
+        match = _NUMBERED_LINE.match(line)
+        if match:
+            seg_id = int(match.group(1))
+            if seg_id in self.expected and seg_id not in self.translations and seg_id != self._current_id:
+                self._finish_segment(report=True)
+                self._current_id = seg_id
+                self._current_lines = [match.group(2)]
+                return
+        if self._current_id is not None:
+            # Continuation line of a multi-line translation
+            self._current_lines.append(line)
+
+    def _finish_segment(self, report: bool):
+        if self._current_id is None:
+            return
+        lines = self._current_lines
+        while len(lines) > 1 and not lines[-1].strip():
+            lines.pop()  # Blank separator lines between numbered items
+        seg_id, text = self._current_id, '\n'.join(lines)
+        self.translations[seg_id] = text
+        self._current_id, self._current_lines = None, []
+        if report and self.on_segment and text.strip():
+            self.on_segment(seg_id, text)
+
+    @classmethod
+    def parse(cls, text: str, segment_ids: Iterable[int]) -> Dict[int, str]:
+        """Parse a complete response"""
+        parser = cls(segment_ids)
+        parser.feed(text or "")
+        return parser.close()
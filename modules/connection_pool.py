@@ -0,0 +1,358 @@
+"""
+Connection Pool - Pooled SQLite connections for background threads
+
+TM search workers, pre-translation and the prefetch worker used to open a new
+sqlite3 connection (and re-issue the WAL pragma) every time they ran, and a
+cancelled worker could leave its connection open. They now lease connections
+from a process-wide pool per database file:
+
+- Read connections: opened once with the performance profile's pragmas (mmap,
+  page cache, temp store - see db_performance.py) and PRAGMA query_only,
+  then reused. A lease gives one
+  thread exclusive use of a connection; nested leases on the same thread get
+  the same connection. Returned connections are kept idle for the next lease
+  (up to MAX_IDLE_READERS) or closed.
+- Writer connection: one connection shared by all threads, serialized by a
+  lock. A write lease commits on success and rolls back on error.
+  DatabaseManager uses the same connection as its main connection
+  (open_writer), so the application has a single writer. Any statement that
+  opens a transaction on it keeps the lock on its thread until commit() or
+  rollback(), so a write lease never commits or rolls back another thread's
+  half-done transaction.
+
+Usage:
+    pool = get_connection_pool(db_path)
+    with pool.read() as conn:
+        rows = conn.execute("SELECT ...").fetchall()
+    with pool.write() as conn:
+        conn.execute("UPDATE ...")
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Union
+
+from modules.db_performance import apply_performance_pragmas, resolve_profile
+
+
+DEFAULT_TIMEOUT = 15.0            # seconds (busy timeout)
+MAX_IDLE_READERS = 4
+
+
+def _writer_busy() -> sqlite3.OperationalError:
+    return sqlite3.OperationalError("database is locked (writer connection busy)")
+
+
+class _SerializedCursor(sqlite3.Cursor):
+    """Cursor of a SerializedConnection: statements run under the write lock"""
+
+    def execute(self, *args, **kwargs):
+        with self.connection._statement():
+            return super().execute(*args, **kwargs)
+
+    def executemany(self, *args, **kwargs):
+        with self.connection._statement():
+            return super().executemany(*args, **kwargs)
+
+    def executescript(self, *args, **kwargs):
+        with self.connection._statement():
+            return super().executescript(*args, **kwargs)
+
+
+class SerializedConnection(sqlite3.Connection):
+    """
+    The pool's writer connection, usable from any thread.
+
+    Each statement takes write_lock. A statement that leaves a transaction
+    open keeps the lock until commit() or rollback() on that thread, so
+    other threads wait for the transaction instead of joining it.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.write_lock = threading.RLock()
+        self.lock_timeout = kwargs.get('timeout', DEFAULT_TIMEOUT)
+        self._holds_transaction = False
+
+    def _acquire(self):
+        if not self.write_lock.acquire(timeout=self.lock_timeout):
+            raise _writer_busy()
+
+    def _settle(self):
+        """Keep one extra lock level while a transaction is open, drop it after"""
+        if self.in_transaction and not self._holds_transaction:
+            self._holds_transaction = True
+            self.write_lock.acquire()
+        elif not self.in_transaction and self._holds_transaction:
+            self._holds_transaction = False
+            self.write_lock.release()
+
+    @contextmanager
+    def _statement(self):
+        self._acquire()
+        try:
+            yield
+        finally:
+            try:
+                self._settle()
+            finally:
+                self.write_lock.release()
+
+    def cursor(self, factory=None):
+        return super().cursor(factory or _SerializedCursor)
+
+    def execute(self, *args, **kwargs):
+        return self.cursor().execute(*args, **kwargs)
+
+    def executemany(self, *args, **kwargs):
+        return self.cursor().executemany(*args, **kwargs)
+
+    def executescript(self, *args, **kwargs):
+        return self.cursor().executescript(*args, **kwargs)
+
+    def commit(self):
+        with self._statement():
+            super().commit()
+
+    def rollback(self):
+        with self._statement():
+            super().rollback()
+
+
+class ConnectionPool:
+    """Read connections leased per thread plus one serialized writer for a database file"""
+
+    def __init__(self, db_path: str, timeout: float = DEFAULT_TIMEOUT,
+                 profile: Union[str, Dict, None] = None,
+                 max_idle_readers: int = MAX_IDLE_READERS):
+        self.db_path = db_path
+        self.timeout = timeout
+        self.profile = resolve_profile(profile)
+        self.max_idle_readers = max_idle_readers
+
+        self._lock = threading.Lock()
+        self._idle: List[sqlite3.Connection] = []
+        # Per-thread lease: (connection, nesting depth)
+        self._local = threading.local()
+
+        self._writer: Optional[SerializedConnection] = None
+        # DatabaseManager instances using the writer as their main connection
+        self._writer_users = 0
+        self._writer_lock = threading.Lock()
+
+        self.readers_opened = 0
+        self.readers_closed = 0
+        self.read_leases = 0
+        self.read_reuses = 0
+        self.active_read_leases = 0
+        self.write_leases = 0
+        self.write_failures = 0
+        self.write_wait_time = 0.0
+
+    def _connect(self, factory=sqlite3.Connection) -> sqlite3.Connection:
+        # check_same_thread=False: a connection may serve leases on different
+        # threads over its lifetime, but only one thread holds it at a time
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout, check_same_thread=False,
+                               factory=factory)
+        conn.row_factory = sqlite3.Row
+        apply_performance_pragmas(conn, self.profile)
+        return conn
+
+    def configure(self, profile: Union[str, Dict, None]):
+        """
+        Switch performance profile. New connections use it right away; idle
+        readers are closed so they reopen with it, and the writer gets the
+        new pragmas in place.
+        """
+        self.profile = resolve_profile(profile)
+        self.close()
+        with self._writer_lock:
+            writer = self._writer
+        if writer is not None:
+            apply_performance_pragmas(writer, self.profile)
+
+    def _get_writer(self) -> SerializedConnection:
+        """The writer connection, opened on first use (caller holds _writer_lock)"""
+        if self._writer is None:
+            self._writer = self._connect(factory=SerializedConnection)
+            self._writer.execute("PRAGMA journal_mode=WAL")
+            self._writer.execute("PRAGMA foreign_keys = ON")
+        return self._writer
+
+    def open_writer(self) -> SerializedConnection:
+        """
+        The writer connection for use as a long-lived main connection
+        (DatabaseManager.connect). Pair with release_writer().
+        """
+        with self._writer_lock:
+            writer = self._get_writer()
+            self._writer_users += 1
+            return writer
+
+    def release_writer(self, conn: sqlite3.Connection):
+        """Give back a connection from open_writer(); the last user closes it"""
+        with self._writer_lock:
+            if conn is not self._writer:
+                return
+            self._writer_users = max(0, self._writer_users - 1)
+            if self._writer_users:
+                return
+            self._writer = None
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def _open_reader(self) -> sqlite3.Connection:
+        conn = self._connect()
+        conn.execute("PRAGMA query_only = ON")
+        with self._lock:
+            self.readers_opened += 1
+        return conn
+
+    @contextmanager
+    def read(self) -> Iterator[sqlite3.Connection]:
+        """Lease a read-only connection for the current thread"""
+        lease = getattr(self._local, 'lease', None)
+        if lease is not None:
+            # Nested lease on this thread: share the outer connection
+            conn, depth = lease
+            self._local.lease = (conn, depth + 1)
+            try:
+                yield conn
+            finally:
+                self._local.lease = (conn, depth)
+            return
+
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+            self.read_leases += 1
+            self.active_read_leases += 1
+            if conn is not None:
+                self.read_reuses += 1
+        if conn is None:
+            try:
+                conn = self._open_reader()
+            except Exception:
+                with self._lock:
+                    self.active_read_leases -= 1
+                raise
+
+        self._local.lease = (conn, 1)
+        try:
+            yield conn
+        finally:
+            self._local.lease = None
+            self._release_reader(conn)
+
+    def _release_reader(self, conn: sqlite3.Connection):
+        """Return a leased connection to the idle list (or close it)"""
+        try:
+            # End any read transaction left open so WAL checkpoints aren't held back
+            if conn.in_transaction:
+                conn.rollback()
+            keep = True
+        except sqlite3.Error:
+            keep = False
+        with self._lock:
+            self.active_read_leases -= 1
+            if keep and len(self._idle) < self.max_idle_readers:
+                self._idle.append(conn)
+                return
+            self.readers_closed += 1
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        """
+        Lease the writer connection (one thread at a time).
+
+        Commits when the block completes, rolls back if it raises.
+        """
+        with self._writer_lock:
+            conn = self._get_writer()
+        start = time.perf_counter()
+        if not conn.write_lock.acquire(timeout=self.timeout):
+            with self._lock:
+                self.write_failures += 1
+            raise _writer_busy()
+        try:
+            with self._lock:
+                self.write_wait_time += time.perf_counter() - start
+                self.write_leases += 1
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                with self._lock:
+                    self.write_failures += 1
+                try:
+                    conn.rollback()
+                except sqlite3.Error:
+                    pass
+                raise
+        finally:
+            conn.write_lock.release()
+
+    def close(self):
+        """
+        Close idle read connections, and the writer unless a DatabaseManager
+        still uses it (active leases are left alone)
+        """
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self.readers_closed += len(idle)
+        for conn in idle:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        with self._writer_lock:
+            if self._writer is None or self._writer_users:
+                return
+            writer, self._writer = self._writer, None
+        if not writer.write_lock.acquire(timeout=self.timeout):
+            return  # A write lease is still running; it keeps the connection
+        try:
+            writer.close()
+        except sqlite3.Error:
+            pass
+        finally:
+            writer.write_lock.release()
+
+    def stats(self) -> Dict:
+        """Pool statistics"""
+        with self._lock:
+            return {
+                'readers_open': self.readers_opened - self.readers_closed,
+                'readers_idle': len(self._idle),
+                'readers_opened': self.readers_opened,
+                'read_leases': self.read_leases,
+                'read_reuses': self.read_reuses,
+                'active_read_leases': self.active_read_leases,
+                'writer_open': self._writer is not None,
+                'writer_users': self._writer_users,
+                'write_leases': self.write_leases,
+                'write_failures': self.write_failures,
+                'write_wait_time': self.write_wait_time,
+            }
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_connection_pool(db_path: str) -> ConnectionPool:
+    """Return the process-wide connection pool for a database file"""
+    key = os.path.normcase(os.path.abspath(db_path))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ConnectionPool(db_path)
+        return pool
@@ -17,12 +17,184 @@ import sqlite3
 import os
 import json
 import hashlib
+import threading
+import time
 import unicodedata
 import re
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Tuple
 from pathlib import Path
-from difflib import SequenceMatcher
+from concurrent.futures.process import BrokenProcessPool
+
+from modules.connection_pool import ConnectionPool, get_connection_pool
+from modules.db_performance import ANALYZE_MIN_ROWS, resolve_profile
+from modules.exact_match_cache import ExactMatchCache, get_exact_match_cache
+from modules.similarity import get_backend as get_similarity_backend, normalize_for_similarity
+from modules.term_matcher import QUOTE_CHARS, TERMLENS_STRIP_CHARS, TermMatcher
+from modules.usage_stats import UsageStatsAccumulator, get_usage_accumulator
+
+
+# Changes that can alter which terms a text matches bump termbase_state.generation,
+# which makes get_termbase_matcher() update its in-memory matchers
+TERMBASE_GENERATION_TRIGGERS = [
+    ('tb_gen_terms_insert', "AFTER INSERT ON termbase_terms"),
+    ('tb_gen_terms_delete', "AFTER DELETE ON termbase_terms"),
+    ('tb_gen_terms_update', "AFTER UPDATE OF source_term, target_term, source_lang, target_lang, "
+                            "termbase_id, project_id ON termbase_terms"),
+    ('tb_gen_termbases_update', "AFTER UPDATE OF source_lang, target_lang, is_project_termbase ON termbases"),
+    ('tb_gen_termbases_delete', "AFTER DELETE ON termbases"),
+    ('tb_gen_activation_insert', "AFTER INSERT ON termbase_activation"),
+    ('tb_gen_activation_delete', "AFTER DELETE ON termbase_activation"),
+    ('tb_gen_activation_update', "AFTER UPDATE OF termbase_id, project_id, is_active ON termbase_activation"),
+]
+
+# Persistent fuzzy index format (tm_fuzzy_state.version); older indexes are rebuilt
+FUZZY_INDEX_VERSION = 2
+
+# Units per transaction when building the fuzzy index
+FUZZY_INDEX_CHUNK_SIZE = 5000
+
+# Background build: wait this long (doubling up to the maximum) before
+# retrying a chunk while another write holds the database
+FUZZY_INDEX_RETRY_DELAY = 0.5
+FUZZY_INDEX_RETRY_MAX_DELAY = 10.0
+
+# Background fuzzy index builds per database file (see start_fuzzy_index_build)
+_fuzzy_builds: Dict[str, threading.Thread] = {}
+_fuzzy_builds_lock = threading.Lock()
+
+# Number of (language pair, project) termbase matchers kept in memory
+TERMBASE_MATCHER_CACHE_SIZE = 4
+
+# Trailing punctuation ignored when comparing terms ("ca." matches "ca")
+TERMBASE_TRIM_CHARS = '.!?,;:'
+
+# Word suffixes are indexed for spaces within the first N characters of a term
+TERMBASE_SUFFIX_MAX_CHARS = 500
+
+# Fills termbase_term_suffixes from termbase_suffixes() (one row per space in
+# the term): {row} is the termbase_terms row, {tables} the FROM list providing
+# it, {where} extra conditions
+TERMBASE_SUFFIX_INSERT_SQL = """
+                INSERT OR IGNORE INTO termbase_term_suffixes (side, suffix, term_id)
+                SELECT 0, s.value, {row}.id FROM {tables}json_each(termbase_suffixes({row}.source_term)) s{where}
+                UNION ALL
+                SELECT 1, s.value, {row}.id FROM {tables}json_each(termbase_suffixes({row}.target_term)) s{where}"""
+# For the inserted/updated row (triggers)
+TERMBASE_SUFFIX_TRIGGER_SQL = TERMBASE_SUFFIX_INSERT_SQL.format(row='new', tables='', where='')
+# For every term with id > ? (bulk import, migration; pass the id twice)
+TERMBASE_SUFFIX_BULK_SQL = TERMBASE_SUFFIX_INSERT_SQL.format(
+    row='t', tables='termbase_terms t, ', where=' WHERE t.id > ?')
+
+# Fills the normalized term columns of the inserted/updated row (triggers)
+TERMBASE_NORM_TRIGGER_SQL = """
+                UPDATE termbase_terms
+                SET source_term_norm = termbase_norm(new.source_term),
+                    target_term_norm = termbase_norm(new.target_term)
+                WHERE id = new.id"""
+
+# FTS5 indexes for termbase search: (fts table, content table, indexed columns).
+# External content, kept in sync by the triggers from _fts_sync_triggers()
+TERMBASE_FTS_TABLES = [
+    ('termbase_terms_fts', 'termbase_terms', ('source_term', 'target_term')),
+    ('termbase_synonyms_fts', 'termbase_synonyms', ('synonym_text',)),
+]
+# Word tokens, with prefix indexes for 2 and 3 character prefix queries
+TERMBASE_FTS_OPTIONS = "prefix='2 3'"
+
+# Trigram indexes for substring and fuzzy term lookups, built by default
+# (set_termbase_trigram_index turns them off); they take about three times
+# the space of the word indexes and need SQLite 3.34+ (trigram tokenizer)
+TERMBASE_TRIGRAM_MIN_SQLITE = (3, 34, 0)
+TERMBASE_TRIGRAM_TABLES = [
+    ('termbase_terms_trigram', 'termbase_terms', ('source_term', 'target_term')),
+    ('termbase_synonyms_trigram', 'termbase_synonyms', ('synonym_text',)),
+]
+TERMBASE_TRIGRAM_OPTIONS = "tokenize='trigram'"
+
+# Default maximum number of terms returned by search_termbase_terms()
+TERMBASE_SEARCH_MAX_RESULTS = 1000
+
+# Longest term (in words) found by search_termbase_terms_in_text()
+TERMBASE_TEXT_MAX_WORDS = 8
+
+# Characters stripped from the ends of text n-grams before term lookup
+TERMBASE_NGRAM_STRIP_CHARS = ' \'"()[]{}<>«»“”‘’„'
+
+
+def _fts_sync_triggers(fts_table: str, content_table: str, columns: Tuple[str, ...]) -> List[Tuple[str, str]]:
+    """(name, CREATE TRIGGER statement) keeping an external-content FTS5 table in sync"""
+    column_list = ', '.join(columns)
+    delete_sql = (f"INSERT INTO {fts_table}({fts_table}, rowid, {column_list}) "
+                  f"VALUES ('delete', old.id, {', '.join(f'old.{c}' for c in columns)});")
+    insert_sql = (f"INSERT INTO {fts_table}(rowid, {column_list}) "
+                  f"VALUES (new.id, {', '.join(f'new.{c}' for c in columns)});")
+    return [
+        (f"{fts_table}_insert", f"CREATE TRIGGER IF NOT EXISTS {fts_table}_insert "
+                                f"AFTER INSERT ON {content_table} BEGIN {insert_sql} END"),
+        (f"{fts_table}_delete", f"CREATE TRIGGER IF NOT EXISTS {fts_table}_delete "
+                                f"AFTER DELETE ON {content_table} BEGIN {delete_sql} END"),
+        (f"{fts_table}_update", f"CREATE TRIGGER IF NOT EXISTS {fts_table}_update "
+                                f"AFTER UPDATE OF id, {column_list} ON {content_table} "
+                                f"BEGIN {delete_sql} {insert_sql} END"),
+    ]
+
+
+def _fts_phrase(text: str) -> str:
+    """Quote text as an FTS5 string (no query syntax inside)"""
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _fts_words(text: str) -> List[str]:
+    """Words as the unicode61 tokenizer splits them (letters and digits)"""
+    return re.findall(r'[^\W_]+', text)
+
+
+# Bulk termbase imports adding at least this many terms (and at least a quarter
+# of the table) drop the termbase_terms indexes and the suffix and FTS5 insert
+# triggers, then rebuild them once at the end instead of updating them row by row
+TERMBASE_BULK_DEFER_MIN_ROWS = 10000
+
+# Staged rows per executemany() call during a bulk termbase import
+TERMBASE_BULK_CHUNK_SIZE = 5000
+
+# Columns an import may overwrite on existing terms (update_duplicates)
+TERMBASE_BULK_UPDATE_COLUMNS = ('target_term', 'domain', 'notes', 'project', 'client', 'forbidden')
+
+
+# Random version 4 UUID (same format as str(uuid.uuid4())), evaluated per row
+SQL_UUID4 = ("LOWER(HEX(RANDOMBLOB(4))) || '-' || LOWER(HEX(RANDOMBLOB(2))) || '-4' || "
+             "SUBSTR(LOWER(HEX(RANDOMBLOB(2))), 2) || '-' || SUBSTR('89ab', 1 + ABS(RANDOM()) % 4, 1) || "
+             "SUBSTR(LOWER(HEX(RANDOMBLOB(2))), 2) || '-' || LOWER(HEX(RANDOMBLOB(6)))")
+
+
+def _unicode_lower(text):
+    """str.lower() for SQL (SQLite's LOWER() only folds ASCII letters)"""
+    return text.lower() if isinstance(text, str) else text
+
+
+def _termbase_norm(text):
+    """Normalized term (casefolded, trailing TERMBASE_TRIM_CHARS removed), termbase_norm() in SQL"""
+    return text.casefold().rstrip(TERMBASE_TRIM_CHARS) if isinstance(text, str) else text
+
+
+def _termbase_suffixes(text) -> str:
+    """JSON list of the casefolded text after each space (within TERMBASE_SUFFIX_MAX_CHARS), termbase_suffixes() in SQL"""
+    suffixes = []
+    if isinstance(text, str):
+        pos = text.find(' ', 0, TERMBASE_SUFFIX_MAX_CHARS)
+        while pos != -1:
+            if pos + 1 < len(text):
+                suffixes.append(text[pos + 1:].casefold())
+            pos = text.find(' ', pos + 1, TERMBASE_SUFFIX_MAX_CHARS)
+    return json.dumps(suffixes, ensure_ascii=False)
+
+
+def register_termbase_functions(connection: sqlite3.Connection):
+    """Register the SQL functions the termbase_terms triggers call (termbase_norm, termbase_suffixes)"""
+    connection.create_function('termbase_norm', 1, _termbase_norm, deterministic=True)
+    connection.create_function('termbase_suffixes', 1, _termbase_suffixes, deterministic=True)
 
 
 def _normalize_for_matching(text: str) -> str:
@@ -49,18 +221,47 @@ def _normalize_for_matching(text: str) -> str:
     return text
 
 
+def _match_hash(text: str) -> str:
+    """Hash stored in source_hash/target_hash (MD5 of the normalized text)"""
+    return hashlib.md5(_normalize_for_matching(text).encode('utf-8')).hexdigest()
+
+
+def _exact_match_hashes(source: str) -> Tuple[str, str, str, str]:
+    """
+    Hash variants tried for exact matching:
+    1. Original source hash
+    2. Normalized source hash (handles whitespace, Unicode)
+    3. Tag-stripped hash (handles TM entries stored with/without tags)
+    4. Tag-stripped + normalized hash
+    """
+    source_hash = hashlib.md5(source.encode('utf-8')).hexdigest()
+    normalized_hash = _match_hash(source)
+
+    # Also try with HTML/XML tags stripped (handles structural tags like <p>, <li-o>)
+    source_no_tags = re.sub(r'<[^>]+>', '', source)
+    source_no_tags_hash = hashlib.md5(source_no_tags.encode('utf-8')).hexdigest()
+    normalized_no_tags_hash = _match_hash(source_no_tags)
+    return source_hash, normalized_hash, source_no_tags_hash, normalized_no_tags_hash
+
+
 class DatabaseManager:
     """Manages SQLite database for translation resources"""
     
-    def __init__(self, db_path: str = None, log_callback=None):
+    def __init__(self, db_path: str = None, log_callback=None, performance_profile=None,
+                 termbase_trigram_index: bool = True):
         """
         Initialize database manager
         
         Args:
             db_path: Path to SQLite database file (default: user_data/supervertaler.db)
             log_callback: Optional logging function
+            performance_profile: SQLite performance profile name or dict of
+                                 overrides (see modules/db_performance.py)
+            termbase_trigram_index: Build the termbase trigram indexes on
+                                    connect() (see set_termbase_trigram_index)
         """
         self.log = log_callback if log_callback else print
+        self.performance_profile = resolve_profile(performance_profile)
         
         # Set default database path if not provided
         if db_path is None:
@@ -71,6 +272,11 @@ class DatabaseManager:
         
         self.connection = None
         self.cursor = None
+        # True for managers bound to a leased pool connection (see lease_reader)
+        self.read_only = False
+        self.termbase_trigram_index = termbase_trigram_index
+        # (langs, project, min_length, bidirectional) -> (generation, watermark, termbase scope, matcher)
+        self._termbase_matchers: Dict[tuple, Tuple[int, Dict, tuple, TermMatcher]] = {}
     
     def connect(self):
         """Connect to database and create tables if needed"""
@@ -78,17 +284,18 @@ class DatabaseManager:
             # Create directory if it doesn't exist
             os.makedirs(os.path.dirname(self.db_path) if os.path.dirname(self.db_path) else ".", exist_ok=True)
             
-            # Connect to database with busy timeout to handle concurrent access
-            self.connection = sqlite3.connect(self.db_path, timeout=15)
-            self.connection.row_factory = sqlite3.Row  # Access columns by name
-            self.cursor = self.connection.cursor()
-
-            # Enable WAL mode for better concurrent read/write performance
-            # WAL allows readers to proceed while a writer is active
-            self.cursor.execute("PRAGMA journal_mode=WAL")
+            # Page cache, mmap, synchronous level (see set_performance_profile)
+            if self.pool.profile != self.performance_profile:
+                self.pool.configure(self.performance_profile)
 
-            # Enable foreign keys
-            self.cursor.execute("PRAGMA foreign_keys = ON")
+            # The pool's writer is our main connection, so every write in the
+            # process (ours and pool.write() leases from worker threads) goes
+            # through one serialized connection. It is opened with a busy
+            # timeout, WAL mode (readers proceed while a write is active),
+            # foreign keys and sqlite3.Row rows (access columns by name).
+            self.connection = self.pool.open_writer()
+            self.cursor = self.connection.cursor()
+            register_termbase_functions(self.connection)
             
             # Create tables
             self._create_tables()
@@ -112,6 +319,24 @@ class DatabaseManager:
                     self.rebuild_fts_index()
             except Exception as e:
                 self.log(f"[WARNING] FTS5 index check failed: {e}")
+
+            # Termbase FTS5 indexes: create (or upgrade) them, then sync if needed
+            try:
+                self._create_termbase_fts_tables()
+                self.set_termbase_trigram_index(self.termbase_trigram_index)
+                fts_status = self.check_termbase_fts_index()
+                if not fts_status.get('in_sync', True):
+                    self.log(f"[Termbase] FTS5 index out of sync ({fts_status.get('fts_count', 0)} vs "
+                             f"{fts_status.get('main_count', 0)}), rebuilding...")
+                    self.rebuild_termbase_fts_index()
+            except Exception as e:
+                self.log(f"[WARNING] Termbase FTS5 index check failed: {e}")
+
+            # Check and build the persistent fuzzy index in the background
+            try:
+                self.start_fuzzy_index_build()
+            except Exception as e:
+                self.log(f"[WARNING] Fuzzy index check failed: {e}")
             
             self.log(f"[OK] Database connected: {os.path.basename(self.db_path)}")
             return True
@@ -138,12 +363,17 @@ class DatabaseManager:
                 tm_id TEXT NOT NULL,
                 project_id TEXT,
                 
+                -- Normalized base language ('nl-BE', 'Dutch' -> 'nl') for indexed filtering
+                source_lang_base TEXT,
+                target_lang_base TEXT,
+                
                 -- Context for better matching
                 context_before TEXT,
                 context_after TEXT,
                 
-                -- Fast exact matching
+                -- Fast exact matching (target_hash: reverse-direction lookups)
                 source_hash TEXT NOT NULL,
+                target_hash TEXT,
                 
                 -- Metadata
                 created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -211,6 +441,62 @@ class DatabaseManager:
             END
         """)
         
+        # Persistent fuzzy-match index (word postings per TM unit).
+        # Rows are added by DatabaseManager on insert/update (tokenizing needs
+        # Python) and removed by delete_translation_units(); the delete trigger
+        # below catches any other delete path.
+        # clean_len is the length of the comparison form (normalize_for_similarity)
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS tm_fuzzy_units (
+                unit_id INTEGER PRIMARY KEY,
+                clean_len INTEGER NOT NULL,
+                word_count INTEGER NOT NULL
+            )
+        """)
+        
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS tm_fuzzy_postings (
+                token TEXT NOT NULL,
+                unit_id INTEGER NOT NULL,
+                PRIMARY KEY (token, unit_id)
+            ) WITHOUT ROWID
+        """)
+        
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tm_fuzzy_postings_unit 
+            ON tm_fuzzy_postings(unit_id)
+        """)
+        
+        # Index format version and whether the (background) build finished;
+        # lookups fall back to FTS5 until version = FUZZY_INDEX_VERSION and complete = 1
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS tm_fuzzy_state (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                version INTEGER NOT NULL DEFAULT 0,
+                complete INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        self.cursor.execute("INSERT OR IGNORE INTO tm_fuzzy_state (id, version, complete) VALUES (1, 0, 0)")
+        
+        # Document frequency per token (used to probe the rarest words first).
+        # Kept in bulk per indexed chunk and per delete (see
+        # delete_translation_units), not by a trigger on every posting
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS tm_fuzzy_tokens (
+                token TEXT PRIMARY KEY,
+                df INTEGER NOT NULL DEFAULT 0
+            ) WITHOUT ROWID
+        """)
+        self.cursor.execute("DROP TRIGGER IF EXISTS tm_fuzzy_postings_insert")
+        self.cursor.execute("DROP TRIGGER IF EXISTS tm_fuzzy_postings_delete")
+        
+        self.cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS tu_fuzzy_delete AFTER DELETE ON translation_units BEGIN
+                DELETE FROM tm_fuzzy_postings WHERE unit_id = old.id;
+                DELETE FROM tm_fuzzy_units WHERE unit_id = old.id;
+            END
+        """)
+        
         # ============================================
         # TRANSLATION MEMORY METADATA
         # ============================================
@@ -399,7 +685,7 @@ class DatabaseManager:
                 target_term TEXT NOT NULL,
                 source_lang TEXT DEFAULT 'unknown',
                 target_lang TEXT DEFAULT 'unknown',
-                termbase_id TEXT NOT NULL,
+                termbase_id INTEGER NOT NULL REFERENCES termbases(id) ON DELETE CASCADE,
                 priority INTEGER DEFAULT 99,
                 project_id TEXT,
                 
@@ -426,6 +712,10 @@ class DatabaseManager:
                 client TEXT,
                 term_uuid TEXT,
                 
+                -- termbase_norm() of the terms, kept by triggers (see migration 8)
+                source_term_norm TEXT,
+                target_term_norm TEXT,
+                
                 FOREIGN KEY (tm_source_id) REFERENCES translation_units(id) ON DELETE SET NULL
             )
         """)
@@ -451,18 +741,98 @@ class DatabaseManager:
             ON termbase_terms(domain)
         """)
         
-        # Full-text search for termbase
+        # Normalized terms (source_term_norm / target_term_norm) and their
+        # covering indexes for search_termbases() come from migration 8
+        # (database_migrations.migrate_termbase_norm_columns).
+        # Word suffixes of each term (casefolded text after every space), so
+        # "term contains the search as a later word" is an index search too.
+        # Both are maintained by triggers calling termbase_norm() and
+        # termbase_suffixes() (register_termbase_functions()).
         self.cursor.execute("""
-            CREATE VIRTUAL TABLE IF NOT EXISTS termbase_terms_fts 
-            USING fts5(
-                source_term,
-                target_term,
-                definition,
-                content=termbase_terms,
-                content_rowid=id
+            CREATE TABLE IF NOT EXISTS termbase_term_suffixes (
+                side INTEGER NOT NULL,  -- 0 = source_term, 1 = target_term
+                suffix TEXT NOT NULL,
+                term_id INTEGER NOT NULL,
+                PRIMARY KEY (side, suffix, term_id)
+            ) WITHOUT ROWID
+        """)
+        
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_termbase_suffixes_term 
+            ON termbase_term_suffixes(term_id)
+        """)
+        
+        # Replaced by tb_term_norm_* (suffixes from a 1..N positions table)
+        for old_trigger in ('tb_suffix_insert', 'tb_suffix_update'):
+            self.cursor.execute(f"DROP TRIGGER IF EXISTS {old_trigger}")
+        self.cursor.execute("DROP TABLE IF EXISTS termbase_word_positions")
+        
+        self.cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS tb_term_norm_insert AFTER INSERT ON termbase_terms BEGIN
+                {TERMBASE_NORM_TRIGGER_SQL};
+                {TERMBASE_SUFFIX_TRIGGER_SQL};
+            END
+        """)
+        
+        self.cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS tb_suffix_delete AFTER DELETE ON termbase_terms BEGIN
+                DELETE FROM termbase_term_suffixes WHERE term_id = old.id;
+            END
+        """)
+        
+        self.cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS tb_term_norm_update AFTER UPDATE OF id, source_term, target_term ON termbase_terms BEGIN
+                DELETE FROM termbase_term_suffixes WHERE term_id = old.id;
+                {TERMBASE_NORM_TRIGGER_SQL};
+                {TERMBASE_SUFFIX_TRIGGER_SQL};
+            END
+        """)
+        
+        # Full-text search for termbase: see _create_termbase_fts_tables() (runs
+        # after the migrations, which create termbase_synonyms)
+
+        # Termbase generation counter (see TERMBASE_GENERATION_TRIGGERS)
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS termbase_state (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                generation INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        self.cursor.execute("INSERT OR IGNORE INTO termbase_state (id, generation) VALUES (1, 0)")
+        
+        for trigger_name, trigger_event in TERMBASE_GENERATION_TRIGGERS:
+            self.cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {trigger_name} {trigger_event} BEGIN
+                    UPDATE termbase_state SET generation = generation + 1 WHERE id = 1;
+                END
+            """)
+        
+        # Generation at which each term's matching data last changed (same
+        # columns as tb_gen_terms_update; see get_termbase_terms_changed_since(),
+        # new terms are found by id)
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS termbase_term_changes (
+                term_id INTEGER PRIMARY KEY,
+                generation INTEGER NOT NULL
             )
         """)
         
+        # Replaced by tb_term_changes_update (only covered source_term and termbase_id)
+        self.cursor.execute("DROP TRIGGER IF EXISTS tb_changes_update")
+        self.cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS tb_term_changes_update AFTER UPDATE OF source_term, target_term,
+                source_lang, target_lang, termbase_id, project_id ON termbase_terms BEGIN
+                INSERT OR REPLACE INTO termbase_term_changes (term_id, generation)
+                SELECT new.id, generation FROM termbase_state WHERE id = 1;
+            END
+        """)
+        
+        self.cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS tb_changes_delete AFTER DELETE ON termbase_terms BEGIN
+                DELETE FROM termbase_term_changes WHERE term_id = old.id;
+            END
+        """)
+        
         # ============================================
         # NON-TRANSLATABLES
         # ============================================
@@ -675,12 +1045,146 @@ class DatabaseManager:
             raise
     
     def close(self):
-        """Close database connection"""
+        """Close database connection (pending usage counts are written first)"""
+        if self.read_only:
+            return  # Leased connections go back to the pool (see lease_reader)
         if self.connection:
-            self.connection.close()
+            self.usage_stats.flush(self.connection)
+            if self.performance_profile['optimize_on_close']:
+                try:
+                    # Refreshes planner statistics that are stale (cheap, recommended on close)
+                    self.connection.execute("PRAGMA optimize")
+                except sqlite3.Error:
+                    pass
+            self.cursor.close()
+            self.pool.release_writer(self.connection)
             self.connection = None
             self.cursor = None
     
+    # ============================================
+    # EXACT MATCH CACHE
+    # ============================================
+
+    @property
+    def exact_match_cache(self) -> ExactMatchCache:
+        """Process-wide exact-match cache for this database file"""
+        return get_exact_match_cache(self.db_path)
+
+    def get_exact_match_cache_stats(self) -> Dict:
+        """Exact-match cache statistics (entries, hits, misses, hit_rate, ...)"""
+        return self.exact_match_cache.stats()
+
+    def invalidate_exact_match_cache(self, units: List[Tuple[str, str]] = None):
+        """
+        Drop cached exact-match lookups after TM changes.
+
+        Args:
+            units: (source_text, target_text) of changed units, or None to
+                   clear the whole cache (bulk deletes, external changes)
+        """
+        if units is None:
+            self.exact_match_cache.clear()
+            return
+        self.exact_match_cache.invalidate_units(
+            (_match_hash(source), _match_hash(target)) for source, target in units
+        )
+
+    # ============================================
+    # USAGE COUNT WRITE-BACK
+    # ============================================
+
+    @property
+    def usage_stats(self) -> UsageStatsAccumulator:
+        """Process-wide usage_count accumulator for this database file"""
+        return get_usage_accumulator(self.db_path)
+
+    def _record_usage(self, unit_ids: List[int]):
+        """Count TM hits (buffered, or written immediately if deferral is off)"""
+        accumulator = self.usage_stats
+        if accumulator.deferred:
+            accumulator.record(unit_ids)
+            return
+        if self.read_only:
+            # Leased read connections can't write - go through the pool's writer
+            try:
+                with self.pool.write() as conn:
+                    self._write_usage(conn, unit_ids)
+            except Exception:
+                pass
+            return
+        self._write_usage(self.connection, unit_ids)
+        self.connection.commit()
+
+    def _write_usage(self, connection: sqlite3.Connection, unit_ids: List[int]):
+        """Increment usage_count for the given units (caller commits)"""
+        unit_ids = list(set(unit_ids))
+        for i in range(0, len(unit_ids), 900):
+            chunk = unit_ids[i:i + 900]
+            placeholders = ','.join('?' * len(chunk))
+            try:
+                connection.execute(
+                    f"UPDATE translation_units SET usage_count = usage_count + 1 WHERE id IN ({placeholders})",
+                    chunk
+                )
+            except Exception:
+                pass
+
+    def flush_usage_counts(self) -> int:
+        """
+        Write buffered usage counts now (e.g. on project save).
+
+        Returns: Number of units updated
+        """
+        return self.usage_stats.flush()
+
+    def set_deferred_usage_counts(self, deferred: bool):
+        """Enable/disable deferred usage_count write-back (enabled by default)"""
+        self.usage_stats.set_deferred(deferred)
+
+    def get_usage_stats(self) -> Dict:
+        """Usage write-back statistics (pending_units, flushes, rows_written, ...)"""
+        return self.usage_stats.stats()
+
+    # ============================================
+    # CONNECTION POOL (background threads)
+    # ============================================
+
+    @property
+    def pool(self) -> ConnectionPool:
+        """Process-wide connection pool for this database file"""
+        return get_connection_pool(self.db_path)
+
+    @classmethod
+    @contextmanager
+    def lease_reader(cls, db_path: str, log_callback=None) -> Iterator['DatabaseManager']:
+        """
+        Lease a pooled read-only connection wrapped in a DatabaseManager.
+
+        For worker threads: the connection is reused across leases instead of
+        being opened per search, and returned to the pool when the block exits
+        (also on errors and cancellation). Usage counts go through the
+        accumulator or the pool's writer connection.
+
+        Usage:
+            with DatabaseManager.lease_reader(db_path) as db:
+                match = db.get_exact_match(source, tm_ids)
+        """
+        with get_connection_pool(db_path).read() as conn:
+            db = cls(db_path, log_callback=log_callback or (lambda msg: None))
+            db.connection = conn
+            db.cursor = conn.cursor()
+            db.read_only = True
+            try:
+                yield db
+            finally:
+                db.cursor.close()
+                db.connection = None
+                db.cursor = None
+
+    def get_connection_pool_stats(self) -> Dict:
+        """Connection pool statistics (open readers, leases, reuses, writer, ...)"""
+        return self.pool.stats()
+
     # ============================================
     # TRANSLATION MEMORY METHODS
     # ============================================
@@ -708,33 +1212,44 @@ class DatabaseManager:
 
         Returns: ID of inserted/updated entry
         """
+        from modules.tmx_generator import get_base_lang_code
+
         # Generate hash from NORMALIZED source for consistent exact matching
         # This handles invisible differences like Unicode normalization, whitespace variations
-        normalized_source = _normalize_for_matching(source)
-        source_hash = hashlib.md5(normalized_source.encode('utf-8')).hexdigest()
+        source_hash = _match_hash(source)
+        target_hash = _match_hash(target)
+        written = [(source_hash, target_hash)]  # for exact-match cache invalidation
 
         try:
             # If overwrite mode, delete ALL existing entries with same source_hash and tm_id
             # This ensures only the latest translation is kept
             if overwrite:
                 self.cursor.execute("""
-                    DELETE FROM translation_units
+                    SELECT source_hash, target_hash FROM translation_units
                     WHERE source_hash = ? AND tm_id = ?
                 """, (source_hash, tm_id))
+                written.extend(tuple(row) for row in self.cursor.fetchall())
+                self.delete_translation_units("source_hash = ? AND tm_id = ?", (source_hash, tm_id))
 
             self.cursor.execute("""
                 INSERT INTO translation_units
                 (source_text, target_text, source_lang, target_lang, tm_id,
-                 project_id, context_before, context_after, source_hash, notes)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                 project_id, context_before, context_after, source_hash, target_hash,
+                 notes, source_lang_base, target_lang_base)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ON CONFLICT(source_hash, target_text, tm_id) DO UPDATE SET
                     usage_count = usage_count + 1,
                     modified_date = CURRENT_TIMESTAMP
             """, (source, target, source_lang, target_lang, tm_id,
-                  project_id, context_before, context_after, source_hash, notes))
+                  project_id, context_before, context_after, source_hash, target_hash,
+                  notes, get_base_lang_code(source_lang), get_base_lang_code(target_lang)))
+            entry_id = self.cursor.lastrowid
+
+            self._index_unindexed_units("u.source_hash = ? AND u.tm_id = ?", (source_hash, tm_id))
 
             self.connection.commit()
-            return self.cursor.lastrowid
+            self.exact_match_cache.invalidate_units(written)
+            return entry_id
 
         except Exception as e:
             self.log(f"Error adding translation unit: {e}")
@@ -759,35 +1274,86 @@ class DatabaseManager:
         if not entries:
             return 0
 
+        from modules.tmx_generator import get_base_lang_code
+        src_base = get_base_lang_code(source_lang)
+        tgt_base = get_base_lang_code(target_lang)
+
         inserted = 0
+        written = []  # (source_hash, target_hash) for exact-match cache invalidation
+        self.cursor.execute("SELECT COALESCE(MAX(id), 0) FROM translation_units")
+        last_id = self.cursor.fetchone()[0]
         try:
             for source, target in entries:
-                normalized_source = _normalize_for_matching(source)
-                source_hash = hashlib.md5(normalized_source.encode('utf-8')).hexdigest()
+                source_hash = _match_hash(source)
+                target_hash = _match_hash(target)
+                written.append((source_hash, target_hash))
 
                 self.cursor.execute("""
                     INSERT INTO translation_units
                     (source_text, target_text, source_lang, target_lang, tm_id,
-                     project_id, context_before, context_after, source_hash, notes)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                     project_id, context_before, context_after, source_hash, target_hash,
+                     notes, source_lang_base, target_lang_base)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     ON CONFLICT(source_hash, target_text, tm_id) DO UPDATE SET
                         usage_count = usage_count + 1,
                         modified_date = CURRENT_TIMESTAMP
                 """, (source, target, source_lang, target_lang, tm_id,
-                      None, None, None, source_hash, None))
+                      None, None, None, source_hash, target_hash, None, src_base, tgt_base))
                 inserted += 1
 
+            # New rows get higher ids (AUTOINCREMENT); updated rows are already indexed
+            self._index_unindexed_units("u.id > ?", (last_id,))
+
             self.connection.commit()
+            self.exact_match_cache.invalidate_units(written)
+
+            if self.performance_profile['analyze_after_import'] and inserted >= ANALYZE_MIN_ROWS:
+                self.analyze()
             return inserted
 
         except Exception as e:
             self.log(f"Error in batch insert: {e}")
             try:
+                self._index_unindexed_units("u.id > ?", (last_id,))
                 self.connection.commit()  # Commit what we have so far
             except:
                 pass
+            self.exact_match_cache.invalidate_units(written)
             return inserted
 
+    def _lang_filter_sql(self, source_lang: str = None, target_lang: str = None,
+                         alias: str = '', reverse: bool = False) -> Tuple[str, list]:
+        """
+        Build the language filter for translation_units queries.
+
+        Uses the normalized base-language columns, so 'nl', 'nl-BE', 'NL_nl'
+        and 'Dutch' all match 'nl' with a plain (indexable) equality.
+
+        Args:
+            source_lang: Our source language (None = any)
+            target_lang: Our target language (None = any)
+            alias: Table alias prefix, e.g. 'tu.'
+            reverse: Match units stored in the opposite direction
+
+        Returns: (" AND ..." SQL fragment, params)
+        """
+        from modules.tmx_generator import get_base_lang_code
+
+        src_col = f"{alias}source_lang_base"
+        tgt_col = f"{alias}target_lang_base"
+        if reverse:
+            src_col, tgt_col = tgt_col, src_col
+
+        sql = ""
+        params = []
+        if source_lang:
+            sql += f" AND {src_col} = ?"
+            params.append(get_base_lang_code(source_lang))
+        if target_lang:
+            sql += f" AND {tgt_col} = ?"
+            params.append(get_base_lang_code(target_lang))
+        return sql, params
+
     def get_exact_match(self, source: str, tm_ids: List[str] = None,
                        source_lang: str = None, target_lang: str = None,
                        bidirectional: bool = True) -> Optional[Dict]:
@@ -802,24 +1368,34 @@ class DatabaseManager:
             bidirectional: If True, search both directions (nl→en AND en→nl)
 
         Returns: Dictionary with match data or None
+
+        Results (including "no match") are served from the process-wide
+        exact-match cache when possible, so revisiting a segment runs no SQL.
         """
+        cache = self.exact_match_cache
+        key = (source, tuple(sorted(tm_ids)) if tm_ids else None,
+               source_lang, target_lang, bidirectional)
+        cached = cache.get(key)
+        if cached is not ExactMatchCache.MISS:
+            if cached is not None:
+                self._record_usage([cached['id']])
+            return cached
+
+        generation = cache.generation
+        hashes = _exact_match_hashes(source)
+        result = self._lookup_exact_match(source, hashes, tm_ids, source_lang,
+                                          target_lang, bidirectional)
+        reverse_hashes = hashes if bidirectional and source_lang and target_lang else ()
+        cache.put(key, result, hashes, reverse_hashes, generation)
+        return result
+
+    def _lookup_exact_match(self, source: str, hashes: Tuple[str, str, str, str],
+                            tm_ids: List[str], source_lang: str, target_lang: str,
+                            bidirectional: bool) -> Optional[Dict]:
+        """Run the exact-match SQL lookup (see get_exact_match)"""
         from modules.tmx_generator import get_base_lang_code
-        import re
 
-        # Try multiple hash variants for robust matching:
-        # 1. Original source hash
-        # 2. Normalized source hash (handles whitespace, Unicode)
-        # 3. Tag-stripped hash (handles TM entries stored with/without tags)
-        # 4. Tag-stripped + normalized hash
-        source_hash = hashlib.md5(source.encode('utf-8')).hexdigest()
-        normalized_source = _normalize_for_matching(source)
-        normalized_hash = hashlib.md5(normalized_source.encode('utf-8')).hexdigest()
-
-        # Also try with HTML/XML tags stripped (handles structural tags like <p>, <li-o>)
-        source_no_tags = re.sub(r'<[^>]+>', '', source)
-        source_no_tags_hash = hashlib.md5(source_no_tags.encode('utf-8')).hexdigest()
-        normalized_no_tags = _normalize_for_matching(source_no_tags)
-        normalized_no_tags_hash = hashlib.md5(normalized_no_tags.encode('utf-8')).hexdigest()
+        source_hash, normalized_hash, source_no_tags_hash, normalized_no_tags_hash = hashes
 
         # Get base language codes for comparison
         src_base = get_base_lang_code(source_lang) if source_lang else None
@@ -828,7 +1404,7 @@ class DatabaseManager:
         # Search using all hash variants
         query = """
             SELECT * FROM translation_units
-            WHERE (source_hash = ? OR source_hash = ? OR source_hash = ? OR source_hash = ?)
+            WHERE source_hash IN (?, ?, ?, ?)
         """
         params = [source_hash, normalized_hash, source_no_tags_hash, normalized_no_tags_hash]
         
@@ -837,27 +1413,10 @@ class DatabaseManager:
             query += f" AND tm_id IN ({placeholders})"
             params.extend(tm_ids)
         
-        # Use flexible language matching (matches 'nl', 'nl-NL', 'Dutch', etc.)
-        from modules.tmx_generator import get_lang_match_variants
-        if src_base:
-            src_variants = get_lang_match_variants(source_lang)
-            src_conditions = []
-            for variant in src_variants:
-                src_conditions.append("source_lang = ?")
-                params.append(variant)
-                src_conditions.append("source_lang LIKE ?")
-                params.append(f"{variant}-%")
-            query += f" AND ({' OR '.join(src_conditions)})"
-        
-        if tgt_base:
-            tgt_variants = get_lang_match_variants(target_lang)
-            tgt_conditions = []
-            for variant in tgt_variants:
-                tgt_conditions.append("target_lang = ?")
-                params.append(variant)
-                tgt_conditions.append("target_lang LIKE ?")
-                params.append(f"{variant}-%")
-            query += f" AND ({' OR '.join(tgt_conditions)})"
+        # Base-language matching ('nl', 'nl-NL', 'Dutch' all match 'nl')
+        lang_sql, lang_params = self._lang_filter_sql(source_lang, target_lang)
+        query += lang_sql
+        params.extend(lang_params)
         
         query += " ORDER BY usage_count DESC, modified_date DESC LIMIT 1"
         
@@ -865,50 +1424,28 @@ class DatabaseManager:
         row = self.cursor.fetchone()
         
         if row:
-            # Update usage count
-            self.cursor.execute("""
-                UPDATE translation_units 
-                SET usage_count = usage_count + 1 
-                WHERE id = ?
-            """, (row['id'],))
-            self.connection.commit()
-            
+            self._record_usage([row['id']])
             return dict(row)
         
         # If bidirectional and no forward match, try reverse direction
         if bidirectional and src_base and tgt_base:
-            # Search where our source text is in the target field (reverse direction)
+            # Search where our source text is in the target field (reverse direction),
+            # using the same hash variants against the indexed target_hash
             query = """
-                SELECT * FROM translation_units 
-                WHERE target_text = ?
+                SELECT * FROM translation_units
+                WHERE target_hash IN (?, ?, ?, ?)
             """
-            params = [source]
+            params = list(hashes)
             
             if tm_ids:
                 placeholders = ','.join('?' * len(tm_ids))
                 query += f" AND tm_id IN ({placeholders})"
                 params.extend(tm_ids)
             
-            # Reversed: search where TM source_lang matches our target_lang (flexible matching)
-            # Note: for reverse, we swap - TM source_lang should match our target_lang
-            tgt_variants = get_lang_match_variants(target_lang)
-            src_variants = get_lang_match_variants(source_lang)
-            
-            src_conditions = []
-            for variant in tgt_variants:  # TM source_lang = our target_lang
-                src_conditions.append("source_lang = ?")
-                params.append(variant)
-                src_conditions.append("source_lang LIKE ?")
-                params.append(f"{variant}-%")
-            
-            tgt_conditions = []
-            for variant in src_variants:  # TM target_lang = our source_lang
-                tgt_conditions.append("target_lang = ?")
-                params.append(variant)
-                tgt_conditions.append("target_lang LIKE ?")
-                params.append(f"{variant}-%")
-            
-            query += f" AND ({' OR '.join(src_conditions)}) AND ({' OR '.join(tgt_conditions)})"
+            # Reversed: TM source_lang matches our target_lang and vice versa
+            lang_sql, lang_params = self._lang_filter_sql(source_lang, target_lang, reverse=True)
+            query += lang_sql
+            params.extend(lang_params)
             
             query += " ORDER BY usage_count DESC, modified_date DESC LIMIT 1"
             
@@ -916,14 +1453,8 @@ class DatabaseManager:
             row = self.cursor.fetchone()
             
             if row:
-                # Update usage count
-                self.cursor.execute("""
-                    UPDATE translation_units 
-                    SET usage_count = usage_count + 1 
-                    WHERE id = ?
-                """, (row['id'],))
-                self.connection.commit()
-                
+                self._record_usage([row['id']])
+
                 # Swap source/target since this is a reverse match
                 result = dict(row)
                 result['source_text'], result['target_text'] = result['target_text'], result['source_text']
@@ -934,91 +1465,50 @@ class DatabaseManager:
         return None
 
     def get_exact_matches_batch(self, sources: List[str], tm_ids: List[str] = None,
-                                source_lang: str = None, target_lang: str = None) -> Dict[str, Dict]:
+                                source_lang: str = None, target_lang: str = None,
+                                bidirectional: bool = True) -> Dict[str, Dict]:
         """
         Batch exact match lookup for multiple source texts in a single operation.
 
         Strategy: compute all hashes upfront, query per-hash-variant in bulk using
         a single SQL query per chunk. Uses only the source_hash index for speed.
+        Sources without a forward match are then looked up in reverse (stored as
+        a TM target, languages swapped) through the target_hash index.
 
         Args:
             sources: List of source texts to match
             tm_ids: List of TM IDs to search (None = all)
             source_lang: Filter by source language
             target_lang: Filter by target language
+            bidirectional: Also search the reverse direction (needs both languages)
 
         Returns:
-            Dict mapping source_text -> match dict (only for sources that had matches)
+            Dict mapping source_text -> match dict (only for sources that had matches);
+            reverse matches have source/target swapped and 'reverse_match': True
         """
         if not sources:
             return {}
 
-        from modules.tmx_generator import get_base_lang_code, get_lang_match_variants
-
-        # Pre-compute language filters ONCE (not per segment)
-        src_base = get_base_lang_code(source_lang) if source_lang else None
-        tgt_base = get_base_lang_code(target_lang) if target_lang else None
-        src_variants = get_lang_match_variants(source_lang) if src_base else []
-        tgt_variants = get_lang_match_variants(target_lang) if tgt_base else []
-
-        # Build the language filter SQL once (reused for every chunk)
-        lang_sql = ""
-        lang_params = []
+        # Build the TM and language filter SQL once (reused for every chunk)
+        tm_sql = ""
+        tm_params = []
 
         if tm_ids:
             tm_placeholders = ','.join('?' * len(tm_ids))
-            lang_sql += f" AND tm_id IN ({tm_placeholders})"
-            lang_params.extend(tm_ids)
+            tm_sql += f" AND tm_id IN ({tm_placeholders})"
+            tm_params.extend(tm_ids)
 
-        if src_base and src_variants:
-            src_conditions = []
-            for variant in src_variants:
-                src_conditions.append("source_lang = ?")
-                lang_params.append(variant)
-                src_conditions.append("source_lang LIKE ?")
-                lang_params.append(f"{variant}-%")
-            lang_sql += f" AND ({' OR '.join(src_conditions)})"
-
-        if tgt_base and tgt_variants:
-            tgt_conditions = []
-            for variant in tgt_variants:
-                tgt_conditions.append("target_lang = ?")
-                lang_params.append(variant)
-                tgt_conditions.append("target_lang LIKE ?")
-                lang_params.append(f"{variant}-%")
-            lang_sql += f" AND ({' OR '.join(tgt_conditions)})"
-
-        # Pre-compile tag-stripping regex
-        tag_re = re.compile(r'<[^>]+>')
-
-        # Pre-compute all hash variants for all sources
-        # For efficiency: try the simplest hash first (original text), only compute
-        # more expensive variants (normalized, tag-stripped) if not all matched.
+        base_sql, base_params = self._lang_filter_sql(source_lang, target_lang)
+        lang_sql = tm_sql + base_sql
+        lang_params = tm_params + base_params
+
+        # Pre-compute all hash variants for all sources (duplicates removed).
         # Group by hash for reverse lookup.
         source_to_hashes = {}  # source_text -> [hash1, hash2, ...]
         hash_to_sources = {}   # hash -> [source_text, ...]
 
         for source in sources:
-            hashes = []
-            # Variant 1: original text hash
-            h1 = hashlib.md5(source.encode('utf-8')).hexdigest()
-            hashes.append(h1)
-            # Variant 2: normalized hash
-            normalized = _normalize_for_matching(source)
-            h2 = hashlib.md5(normalized.encode('utf-8')).hexdigest()
-            if h2 != h1:
-                hashes.append(h2)
-            # Variant 3: tag-stripped hash
-            no_tags = tag_re.sub('', source)
-            h3 = hashlib.md5(no_tags.encode('utf-8')).hexdigest()
-            if h3 != h1 and h3 != h2:
-                hashes.append(h3)
-            # Variant 4: tag-stripped + normalized hash
-            norm_no_tags = _normalize_for_matching(no_tags)
-            h4 = hashlib.md5(norm_no_tags.encode('utf-8')).hexdigest()
-            if h4 != h1 and h4 != h2 and h4 != h3:
-                hashes.append(h4)
-
+            hashes = list(dict.fromkeys(_exact_match_hashes(source)))
             source_to_hashes[source] = hashes
             for h in hashes:
                 hash_to_sources.setdefault(h, []).append(source)
@@ -1034,73 +1524,90 @@ class DatabaseManager:
         if max_hash_params < 50:
             max_hash_params = 50  # Safety floor
 
-        results = {}
-        matched_ids = []
+        def best_rows_by_hash(hash_column: str, hash_values: List[str],
+                              filter_sql: str, filter_params: list) -> Dict[str, Dict]:
+            """Highest-usage row per value of hash_column (source_hash or target_hash)"""
+            rows_by_hash = {}
+            for i in range(0, len(hash_values), max_hash_params):
+                chunk = hash_values[i:i + max_hash_params]
 
-        for i in range(0, len(all_hashes_list), max_hash_params):
-            chunk = all_hashes_list[i:i + max_hash_params]
+                placeholders = ','.join('?' * len(chunk))
+                query = (
+                    f"SELECT id, source_text, target_text, source_lang, target_lang, "
+                    f"tm_id, source_hash, target_hash, usage_count "
+                    f"FROM translation_units "
+                    f"WHERE {hash_column} IN ({placeholders})"
+                    f"{filter_sql}"
+                )
+                params = list(chunk) + filter_params
 
-            placeholders = ','.join('?' * len(chunk))
-            query = (
-                f"SELECT id, source_text, target_text, source_lang, target_lang, "
-                f"tm_id, source_hash, usage_count "
-                f"FROM translation_units "
-                f"WHERE source_hash IN ({placeholders})"
-                f"{lang_sql}"
-            )
-            params = list(chunk) + lang_params
+                try:
+                    self.cursor.execute(query, params)
+                    rows = self.cursor.fetchall()
+                except Exception as e:
+                    print(f"[DEBUG] get_exact_matches_batch: SQL ERROR: {e}")
+                    continue
 
-            try:
-                self.cursor.execute(query, params)
-                rows = self.cursor.fetchall()
-            except Exception as e:
-                print(f"[DEBUG] get_exact_matches_batch: SQL ERROR: {e}")
-                continue
+                for row in rows:
+                    row_dict = dict(row)
+                    h = row_dict[hash_column]
+                    # Keep the row with highest usage_count per hash
+                    if h not in rows_by_hash or row_dict.get('usage_count', 0) > rows_by_hash[h].get('usage_count', 0):
+                        rows_by_hash[h] = row_dict
+            return rows_by_hash
 
-            # Group rows by hash for efficient lookup
-            rows_by_hash = {}
-            for row in rows:
-                row_dict = dict(row)
-                h = row_dict['source_hash']
-                # Keep the row with highest usage_count per hash
-                if h not in rows_by_hash or row_dict.get('usage_count', 0) > rows_by_hash[h].get('usage_count', 0):
-                    rows_by_hash[h] = row_dict
-
-            # Map results back to original source texts
-            for h, row_dict in rows_by_hash.items():
+        results = {}
+        matched_ids = []
+
+        # Forward: our source against source_hash
+        for h, row_dict in best_rows_by_hash('source_hash', all_hashes_list, lang_sql, lang_params).items():
+            matched_ids.append(row_dict['id'])
+            for original_source in hash_to_sources[h]:
+                if original_source not in results:
+                    results[original_source] = row_dict
+
+        # Reverse: unmatched sources against target_hash, languages swapped
+        if bidirectional and source_lang and target_lang:
+            unmatched_hashes = list(dict.fromkeys(
+                h for source in source_to_hashes if source not in results
+                for h in source_to_hashes[source]
+            ))
+            reverse_sql, reverse_params = self._lang_filter_sql(source_lang, target_lang, reverse=True)
+            reverse_rows = best_rows_by_hash('target_hash', unmatched_hashes,
+                                             tm_sql + reverse_sql, tm_params + reverse_params)
+            for h, row_dict in reverse_rows.items():
                 matched_ids.append(row_dict['id'])
-                if h in hash_to_sources:
-                    for original_source in hash_to_sources[h]:
-                        if original_source not in results:
-                            results[original_source] = row_dict
+                # Swap source/target since this is a reverse match
+                result = dict(row_dict)
+                result['source_text'], result['target_text'] = result['target_text'], result['source_text']
+                result['source_lang'], result['target_lang'] = result['target_lang'], result['source_lang']
+                result['reverse_match'] = True
+                for original_source in hash_to_sources[h]:
+                    if original_source not in results:
+                        results[original_source] = result
 
-        # Batch update usage counts in a single operation
+        # Count usage once per matched unit (buffered write-back)
         if matched_ids:
-            unique_ids = list(set(matched_ids))
-            for i in range(0, len(unique_ids), 900):
-                chunk = unique_ids[i:i + 900]
-                placeholders = ','.join('?' * len(chunk))
-                try:
-                    self.cursor.execute(
-                        f"UPDATE translation_units SET usage_count = usage_count + 1 WHERE id IN ({placeholders})",
-                        chunk
-                    )
-                except Exception:
-                    pass
-            self.connection.commit()
+            self._record_usage(list(set(matched_ids)))
 
         return results
 
     def search_fuzzy_matches_batch(self, sources: List[str], tm_ids: List[str] = None,
                                     threshold: float = 0.75,
                                     source_lang: str = None, target_lang: str = None,
-                                    progress_callback=None) -> Dict[str, Dict]:
+                                    progress_callback=None, workers: int = None) -> Dict[str, Dict]:
         """
         Batch fuzzy match lookup for multiple source texts.
 
-        Loads all TM candidates into memory once, then compares each source
-        against candidates using word-overlap pre-filtering + SequenceMatcher.
-        This eliminates per-segment SQL overhead which dominates with large TMs.
+        Loads the TM source texts for the language pair into a FuzzyMatchIndex
+        (inverted word index) once, then looks up each source using prefix
+        filtering and length bands, so every query only scores the handful of
+        candidates that can pass the word-overlap pre-filter. Scoring and
+        tie-breaking are identical to a full sequential scan.
+
+        Large batches are scored in a process pool (one index per worker,
+        sources sharded across workers); results are identical to the serial
+        path.
 
         Args:
             sources: List of source texts to match (should exclude already exact-matched)
@@ -1108,7 +1615,9 @@ class DatabaseManager:
             threshold: Minimum similarity (0.0-1.0)
             source_lang: Filter by source language
             target_lang: Filter by target language
-            progress_callback: Optional callback(current, total) called every N segments
+            progress_callback: Optional callback(current, total) called every N segments.
+                               May raise (e.g. InterruptedError) to cancel.
+            workers: Worker processes for scoring (None = automatic, 1 = serial)
 
         Returns:
             Dict mapping source_text -> best match dict (with 'similarity' and 'match_pct')
@@ -1116,17 +1625,14 @@ class DatabaseManager:
         if not sources:
             return {}
 
-        from modules.tmx_generator import get_base_lang_code, get_lang_match_variants
-
-        # Pre-compute language filters ONCE
-        src_base = get_base_lang_code(source_lang) if source_lang else None
-        tgt_base = get_base_lang_code(target_lang) if target_lang else None
-        src_variants = get_lang_match_variants(source_lang) if src_base else []
-        tgt_variants = get_lang_match_variants(target_lang) if tgt_base else []
+        from modules.fuzzy_match_engine import (
+            FuzzyMatchIndex, PARALLEL_MIN_SOURCES, best_matches_parallel, default_worker_count
+        )
 
-        tag_re = re.compile(r'<[^>]+>')
+        if workers is None:
+            workers = default_worker_count() if len(sources) >= PARALLEL_MIN_SOURCES else 1
 
-        # Build language filter SQL (for single bulk query)
+        # Build TM and language filter SQL (for single bulk query)
         lang_sql = ""
         lang_params = []
 
@@ -1135,155 +1641,101 @@ class DatabaseManager:
             lang_sql += f" AND tm_id IN ({tm_placeholders})"
             lang_params.extend(tm_ids)
 
-        if src_base and src_variants:
-            src_conditions = []
-            for variant in src_variants:
-                src_conditions.append("source_lang = ?")
-                lang_params.append(variant)
-                src_conditions.append("source_lang LIKE ?")
-                lang_params.append(f"{variant}-%")
-            lang_sql += f" AND ({' OR '.join(src_conditions)})"
-
-        if tgt_base and tgt_variants:
-            tgt_conditions = []
-            for variant in tgt_variants:
-                tgt_conditions.append("target_lang = ?")
-                lang_params.append(variant)
-                tgt_conditions.append("target_lang LIKE ?")
-                lang_params.append(f"{variant}-%")
-            lang_sql += f" AND ({' OR '.join(tgt_conditions)})"
-
-        # === PHASE A: Load all TM candidates into memory (single query) ===
+        base_sql, base_params = self._lang_filter_sql(source_lang, target_lang)
+        lang_sql += base_sql
+        lang_params.extend(base_params)
+
+        # === PHASE A: Index TM source texts (single streaming query) ===
+        # Only id + source_text are held in memory; targets are fetched for
+        # the winning units at the end.
         query = f"""
-            SELECT id, source_text, target_text, tm_id, usage_count
+            SELECT id, source_text
             FROM translation_units
             WHERE 1=1 {lang_sql}
+            ORDER BY id
         """
         try:
             self.cursor.execute(query, lang_params)
-            all_rows = self.cursor.fetchall()
+            if workers > 1:
+                # Plain tuples: rows are pickled to the worker processes
+                rows = [(row[0], row[1]) for row in self.cursor]
+            else:
+                index = FuzzyMatchIndex.from_rows(self.cursor)
         except Exception:
             return {}
 
-        if not all_rows:
+        # === PHASE B: Best match per source via the inverted index ===
+        if workers > 1:
+            if not rows:
+                return {}
+            try:
+                hits = best_matches_parallel(rows, sources, threshold, workers=workers,
+                                             progress_callback=progress_callback)
+                return self._build_fuzzy_batch_results(hits)
+            except InterruptedError:
+                raise
+            except (OSError, BrokenProcessPool) as e:
+                # No usable process pool (sandboxed/frozen environments): go serial
+                self.log(f"⚠️ Parallel fuzzy matching unavailable ({e}), using single process")
+                index = FuzzyMatchIndex.from_rows(rows)
+                del rows
+
+        if not len(index):
             return {}
 
-        # Pre-compute cleaned text + word sets for all TM candidates
-        candidates = []
-        for row in all_rows:
-            source_text = row['source_text']
-            clean = tag_re.sub('', source_text).lower()
-            words = set(clean.split())
-            candidates.append({
+        hits = index.best_matches(sources, threshold, progress_callback=progress_callback)
+
+        return self._build_fuzzy_batch_results(hits)
+
+    def _build_fuzzy_batch_results(self, hits: Dict) -> Dict[str, Dict]:
+        """Fetch unit rows for batch fuzzy hits ({source: (unit_id, similarity)})"""
+        if not hits:
+            return {}
+
+        unit_ids = list({unit_id for unit_id, _ in hits.values()})
+        rows_by_id = {}
+        for i in range(0, len(unit_ids), 900):
+            chunk = unit_ids[i:i + 900]
+            placeholders = ','.join('?' * len(chunk))
+            self.cursor.execute(f"""
+                SELECT id, source_text, target_text, tm_id, usage_count
+                FROM translation_units WHERE id IN ({placeholders})
+            """, chunk)
+            for row in self.cursor.fetchall():
+                rows_by_id[row['id']] = row
+
+        results = {}
+        for source, (unit_id, similarity) in hits.items():
+            row = rows_by_id.get(unit_id)
+            if row is None:
+                continue
+            results[source] = {
                 'id': row['id'],
-                'source_text': source_text,
+                'source_text': row['source_text'],
                 'target_text': row['target_text'],
                 'tm_id': row['tm_id'],
                 'usage_count': row['usage_count'],
-                'clean': clean,
-                'clean_len': len(clean),
-                'words': words,
-            })
+                'similarity': similarity,
+                'match_pct': int(similarity * 100)
+            }
+        return results
 
-        # Pre-compute cleaned texts and word sets for all sources
-        source_data = []
-        for source in sources:
-            clean = tag_re.sub('', source).lower()
-            words = set(clean.split())
-            source_data.append({
-                'source': source,
-                'clean': clean,
-                'clean_len': len(clean),
-                'words': words,
-            })
+    def calculate_similarity(self, text1: str, text2: str) -> float:
+        """
+        Calculate similarity ratio between two texts using the active
+        similarity backend (rapidfuzz if installed, else SequenceMatcher).
+        Tags and line breaks are normalised before comparison so that segments
+        that differ only by an inline line break (e.g. a Trados <lb/> heading
+        prefix like "Door stops↵\n") still score well against the body text.
 
-        # === PHASE B: For each source, find best match using pre-filters ===
-        results = {}
-        total = len(sources)
-
-        for idx, sd in enumerate(source_data):
-            # Report progress every 10 segments
-            if progress_callback and idx % 10 == 0:
-                progress_callback(idx, total)
-
-            source = sd['source']
-            source_clean = sd['clean']
-            source_len = sd['clean_len']
-            source_words = sd['words']
-
-            if source_len == 0:
-                continue
-
-            best_match = None
-            best_similarity = 0.0
-
-            for cand in candidates:
-                cand_len = cand['clean_len']
-                if cand_len == 0:
-                    continue
-
-                # Pre-filter 1: Length ratio (very cheap)
-                len_ratio = min(source_len, cand_len) / max(source_len, cand_len)
-                if len_ratio < threshold:
-                    continue
-
-                # Pre-filter 2: Word overlap (cheap set intersection)
-                # If word overlap is too low, SequenceMatcher won't hit threshold
-                if source_words and cand['words']:
-                    overlap = len(source_words & cand['words'])
-                    max_words = max(len(source_words), len(cand['words']))
-                    if max_words > 0 and overlap / max_words < threshold * 0.5:
-                        continue
-
-                # Pre-filter 3: quick_ratio (O(n) upper bound)
-                sm = SequenceMatcher(None, source_clean, cand['clean'])
-                if sm.quick_ratio() <= best_similarity:
-                    continue
-
-                # Full similarity (O(n²) but only for promising candidates)
-                similarity = sm.ratio()
-
-                if similarity >= threshold and similarity > best_similarity:
-                    best_similarity = similarity
-                    best_match = {
-                        'id': cand['id'],
-                        'source_text': cand['source_text'],
-                        'target_text': cand['target_text'],
-                        'tm_id': cand['tm_id'],
-                        'usage_count': cand['usage_count'],
-                        'similarity': similarity,
-                        'match_pct': int(similarity * 100)
-                    }
-
-                    # Early exit on perfect match
-                    if similarity >= 0.999:
-                        break
-
-            if best_match:
-                results[source] = best_match
-
-        return results
-
-    def calculate_similarity(self, text1: str, text2: str) -> float:
-        """
-        Calculate similarity ratio between two texts using SequenceMatcher.
-        Tags and line breaks are normalised before comparison so that segments
-        that differ only by an inline line break (e.g. a Trados <lb/> heading
-        prefix like "Door stops↵\n") still score well against the body text.
-
-        Returns: Similarity score from 0.0 to 1.0
-        """
-        import re
-        # Strip HTML/XML tags for comparison
-        clean1 = re.sub(r'<[^>]+>', '', text1).lower()
-        clean2 = re.sub(r'<[^>]+>', '', text2).lower()
-        # Normalise line breaks and surrounding whitespace to a single space,
-        # matching the behaviour of _normalize_for_matching() used for exact match.
-        # This prevents segments that differ only by a heading line or an inline
-        # line break from scoring very low in fuzzy matching.
-        clean1 = re.sub(r'\s*\n\s*', ' ', clean1).strip()
-        clean2 = re.sub(r'\s*\n\s*', ' ', clean2).strip()
-        return SequenceMatcher(None, clean1, clean2).ratio()
+        Returns: Similarity score from 0.0 to 1.0
+        """
+        # Line breaks are collapsed to a single space, matching the behaviour of
+        # _normalize_for_matching() used for exact match. This prevents segments
+        # that differ only by a heading line or an inline line break from
+        # scoring very low in fuzzy matching.
+        return get_similarity_backend().ratio(normalize_for_similarity(text1),
+                                              normalize_for_similarity(text2))
 
     def search_fuzzy_matches(self, source: str, tm_ids: List[str] = None,
                             threshold: float = 0.75, max_results: int = 5,
@@ -1304,7 +1756,7 @@ class DatabaseManager:
         # For better FTS5 matching, tokenize the query and escape special chars
         # FTS5 special characters: " ( ) - : , . ! ? 
         import re
-        from modules.tmx_generator import get_base_lang_code, get_lang_match_variants
+        from modules.tmx_generator import get_base_lang_code
         
         # Strip HTML/XML tags from source for clean text search
         text_without_tags = re.sub(r'<[^>]+>', '', source)
@@ -1328,24 +1780,30 @@ class DatabaseManager:
         # This helps find similar long segments more reliably
         search_terms_for_query = all_search_terms[:20]
         
+        # Get base language codes for comparison
+        src_base = get_base_lang_code(source_lang) if source_lang else None
+        tgt_base = get_base_lang_code(target_lang) if target_lang else None
+        
         if not search_terms_for_query:
             # If no valid terms, return empty results
             return []
         
+        # Forward direction, part 1: the persistent fuzzy index finds units with
+        # enough words in common even when BM25 ranks them below the FTS5
+        # candidate limit (None = index not built yet)
+        all_results = self._search_fuzzy_indexed(source, tm_ids, threshold, source_lang, target_lang) or []
+        
+        # Part 2: FTS5 (and the reverse direction). Its candidates need no
+        # word overlap, so merging keeps every match it finds (e.g. inflected
+        # forms); duplicates are removed below
         # Quote each term to prevent FTS5 syntax errors
         fts_query = ' OR '.join(f'"{term}"' for term in search_terms_for_query)
         
-        # Get base language codes for comparison
-        src_base = get_base_lang_code(source_lang) if source_lang else None
-        tgt_base = get_base_lang_code(target_lang) if target_lang else None
-        
         # MULTI-TM FIX: Search each TM separately to avoid BM25 ranking issues
         # When a large TM is combined with a small TM, the large TM's many keyword matches
         # push down genuinely similar sentences from the small TM
         tms_to_search = tm_ids if tm_ids else [None]  # None means search all TMs together
         
-        all_results = []
-        
         for tm_id in tms_to_search:
             # Search this specific TM (or all if tm_id is None)
             tm_results = self._search_single_tm_fuzzy(
@@ -1376,8 +1834,62 @@ class DatabaseManager:
                                  source_lang: str, target_lang: str,
                                  bidirectional: bool) -> List[Dict]:
         """Search a single TM (or all TMs if tm_ids is None) for fuzzy matches"""
-        from modules.tmx_generator import get_lang_match_variants
+        results = self._search_single_tm_fuzzy_forward(
+            source, fts_query, tm_ids, threshold, max_results,
+            src_base, tgt_base, source_lang, target_lang
+        )
+        
+        # If bidirectional, also search reverse direction
+        if bidirectional and src_base and tgt_base:
+            query = """
+                SELECT tu.*, 
+                       bm25(translation_units_fts) as relevance
+                FROM translation_units tu
+                JOIN translation_units_fts ON tu.id = translation_units_fts.rowid
+                WHERE translation_units_fts MATCH ?
+            """
+            params = [fts_query]
+            
+            if tm_ids and tm_ids[0] is not None:
+                placeholders = ','.join('?' * len(tm_ids))
+                query += f" AND tu.tm_id IN ({placeholders})"
+                params.extend(tm_ids)
+            
+            # Reversed language filters: TM target_lang = our source_lang and vice versa
+            lang_sql, lang_params = self._lang_filter_sql(source_lang, target_lang,
+                                                          alias='tu.', reverse=True)
+            query += lang_sql
+            params.extend(lang_params)
+            
+            query += f" ORDER BY relevance DESC LIMIT {max_results * 5}"
+            
+            try:
+                self.cursor.execute(query, params)
+                
+                for row in self.cursor.fetchall():
+                    match_dict = dict(row)
+                    # Calculate similarity against target_text (since we're reversing)
+                    similarity = self.calculate_similarity(source, match_dict['target_text'])
+                    
+                    # Only include matches above threshold
+                    if similarity >= threshold:
+                        # Swap source/target for reverse match
+                        match_dict['source_text'], match_dict['target_text'] = match_dict['target_text'], match_dict['source_text']
+                        match_dict['source_lang'], match_dict['target_lang'] = match_dict['target_lang'], match_dict['source_lang']
+                        match_dict['similarity'] = similarity
+                        match_dict['match_pct'] = int(similarity * 100)
+                        match_dict['reverse_match'] = True
+                        results.append(match_dict)
+            except Exception as e:
+                print(f"[DEBUG] _search_single_tm_fuzzy (reverse): SQL ERROR: {e}")
         
+        return results
+    
+    def _search_single_tm_fuzzy_forward(self, source: str, fts_query: str, tm_ids: List[str],
+                                         threshold: float, max_results: int,
+                                         src_base: str, tgt_base: str,
+                                         source_lang: str, target_lang: str) -> List[Dict]:
+        """FTS5 candidate search on the source side (the 500 best BM25 candidates)"""
         # Build query for this TM
         query = """
             SELECT tu.*, 
@@ -1393,26 +1905,10 @@ class DatabaseManager:
             query += f" AND tu.tm_id IN ({placeholders})"
             params.extend(tm_ids)
         
-        # Use flexible language matching (matches 'nl', 'nl-NL', 'Dutch', etc.)
-        if src_base:
-            src_variants = get_lang_match_variants(source_lang)
-            src_conditions = []
-            for variant in src_variants:
-                src_conditions.append("tu.source_lang = ?")
-                params.append(variant)
-                src_conditions.append("tu.source_lang LIKE ?")
-                params.append(f"{variant}-%")
-            query += f" AND ({' OR '.join(src_conditions)})"
-        
-        if tgt_base:
-            tgt_variants = get_lang_match_variants(target_lang)
-            tgt_conditions = []
-            for variant in tgt_variants:
-                tgt_conditions.append("tu.target_lang = ?")
-                params.append(variant)
-                tgt_conditions.append("tu.target_lang LIKE ?")
-                params.append(f"{variant}-%")
-            query += f" AND ({' OR '.join(tgt_conditions)})"
+        # Base-language matching ('nl', 'nl-NL', 'Dutch' all match 'nl')
+        lang_sql, lang_params = self._lang_filter_sql(source_lang, target_lang, alias='tu.')
+        query += lang_sql
+        params.extend(lang_params)
         
         # Per-TM candidate limit - INCREASED to catch more potential fuzzy matches
         # When multiple TMs are searched, BM25 ranking can push genuinely similar
@@ -1430,7 +1926,7 @@ class DatabaseManager:
         
         for row in all_rows:
             match_dict = dict(row)
-            # Calculate actual similarity using SequenceMatcher
+            # Calculate actual similarity with the similarity backend
             similarity = self.calculate_similarity(source, match_dict['source_text'])
             
             # Only include matches above threshold
@@ -1439,66 +1935,122 @@ class DatabaseManager:
                 match_dict['match_pct'] = int(similarity * 100)
                 results.append(match_dict)
         
-        # If bidirectional, also search reverse direction
-        if bidirectional and src_base and tgt_base:
-            query = """
-                SELECT tu.*, 
-                       bm25(translation_units_fts) as relevance
-                FROM translation_units tu
-                JOIN translation_units_fts ON tu.id = translation_units_fts.rowid
-                WHERE translation_units_fts MATCH ?
-            """
-            params = [fts_query]
-            
-            if tm_ids and tm_ids[0] is not None:
-                placeholders = ','.join('?' * len(tm_ids))
-                query += f" AND tu.tm_id IN ({placeholders})"
-                params.extend(tm_ids)
-            
-            # Reversed language filters with flexible matching
-            src_variants = get_lang_match_variants(source_lang)
-            tgt_variants = get_lang_match_variants(target_lang)
-            
-            # TM target_lang = our source_lang
-            tgt_conditions = []
-            for variant in src_variants:
-                tgt_conditions.append("tu.target_lang = ?")
-                params.append(variant)
-                tgt_conditions.append("tu.target_lang LIKE ?")
-                params.append(f"{variant}-%")
-            query += f" AND ({' OR '.join(tgt_conditions)})"
-            
-            # TM source_lang = our target_lang  
-            src_conditions = []
-            for variant in tgt_variants:
-                src_conditions.append("tu.source_lang = ?")
-                params.append(variant)
-                src_conditions.append("tu.source_lang LIKE ?")
-                params.append(f"{variant}-%")
-            query += f" AND ({' OR '.join(src_conditions)})"
-            
-            query += f" ORDER BY relevance DESC LIMIT {max_results * 5}"
-            
-            try:
-                self.cursor.execute(query, params)
-                
-                for row in self.cursor.fetchall():
-                    match_dict = dict(row)
-                    # Calculate similarity against target_text (since we're reversing)
-                    similarity = self.calculate_similarity(source, match_dict['target_text'])
-                    
-                    # Only include matches above threshold
-                    if similarity >= threshold:
-                        # Swap source/target for reverse match
-                        match_dict['source_text'], match_dict['target_text'] = match_dict['target_text'], match_dict['source_text']
-                        match_dict['source_lang'], match_dict['target_lang'] = match_dict['target_lang'], match_dict['source_lang']
-                        match_dict['similarity'] = similarity
-                        match_dict['match_pct'] = int(similarity * 100)
-                        match_dict['reverse_match'] = True
-                        results.append(match_dict)
-            except Exception as e:
-                print(f"[DEBUG] _search_single_tm_fuzzy (reverse): SQL ERROR: {e}")
-        
+        return results
+    
+    def _search_fuzzy_indexed(self, source: str, tm_ids: List[str], threshold: float,
+                              source_lang: str = None, target_lang: str = None) -> Optional[List[Dict]]:
+        """
+        Forward fuzzy search driven by the persistent word index.
+
+        Probes the postings of the rarest query words (see
+        fuzzy_match_engine.select_prefix_words), restricts candidates to a
+        length band, then scores them with calculate_similarity(). The word
+        filter is the batch scan's, so search_fuzzy_matches() merges these
+        results with the FTS5 search instead of replacing it.
+
+        Returns: List of matches above threshold, or None if the index can't be
+                 used (not built yet, or no word filter applies)
+        """
+        from modules.fuzzy_match_engine import clean_for_fuzzy, select_prefix_words
+
+        if not self.fuzzy_index_ready():
+            return None
+
+        source_clean = clean_for_fuzzy(source)
+        source_norm = normalize_for_similarity(source)
+        source_words = frozenset(source_clean.split())
+        if not source_norm or not source_words:
+            return None
+
+        # Document frequencies for the query words
+        word_list = list(source_words)
+        df = {}
+        for i in range(0, len(word_list), 900):
+            chunk = word_list[i:i + 900]
+            placeholders = ','.join('?' * len(chunk))
+            self.cursor.execute(
+                f"SELECT token, df FROM tm_fuzzy_tokens WHERE token IN ({placeholders})", chunk
+            )
+            for row in self.cursor.fetchall():
+                df[row[0]] = row[1]
+
+        prefix = select_prefix_words(source_words, threshold, lambda w: df.get(w, 0))
+        if prefix is None:
+            return None
+        # Words no unit contains can't produce candidates
+        prefix = [w for w in prefix if df.get(w, 0) > 0]
+        if not prefix:
+            return []
+
+        tau = threshold * 0.5
+        # Both similarity backends score 2 * matches / (len1 + len2), which is
+        # at most 2 * min / (min + max): units whose comparison-form length
+        # ratio is below threshold / (2 - threshold) can't reach the threshold
+        band = threshold / (2 - threshold)
+        min_len = int(len(source_norm) * band)
+        max_len = int(len(source_norm) / band) + 1 if band > 0 else 2 ** 31
+        max_words = int(len(source_words) / tau) + 1
+
+        placeholders = ','.join('?' * len(prefix))
+        query = f"""
+            SELECT tu.id, tu.source_text
+            FROM tm_fuzzy_postings p
+            CROSS JOIN tm_fuzzy_units f ON f.unit_id = p.unit_id
+            CROSS JOIN translation_units tu ON tu.id = p.unit_id
+            WHERE p.token IN ({placeholders})
+            AND f.clean_len BETWEEN ? AND ?
+            AND f.word_count <= ?
+        """
+        params = list(prefix) + [min_len, max_len, max_words]
+
+        if tm_ids:
+            tm_placeholders = ','.join('?' * len(tm_ids))
+            query += f" AND tu.tm_id IN ({tm_placeholders})"
+            params.extend(tm_ids)
+
+        # Base-language matching ('nl', 'nl-NL', 'Dutch' all match 'nl')
+        lang_sql, lang_params = self._lang_filter_sql(source_lang, target_lang, alias='tu.')
+        query += lang_sql
+        params.extend(lang_params)
+
+        # CROSS JOIN pins the postings as the outer loop (never scan the TM)
+        query += " GROUP BY tu.id"
+
+        try:
+            self.cursor.execute(query, params)
+            candidates = self.cursor.fetchall()
+        except Exception as e:
+            print(f"[DEBUG] _search_fuzzy_indexed: SQL ERROR: {e}")
+            return None
+
+        pool_ids = []
+        pool_texts = []
+        for unit_id, cand_source in candidates:
+            cand_words = set(clean_for_fuzzy(cand_source).split())
+            if cand_words:
+                overlap = len(source_words & cand_words)
+                if overlap / max(len(source_words), len(cand_words)) < tau:
+                    continue
+            pool_ids.append(unit_id)
+            pool_texts.append(normalize_for_similarity(cand_source))
+
+        # Score all surviving candidates in one backend call
+        scores = get_similarity_backend().ratio_batch(source_norm, pool_texts, score_cutoff=threshold)
+        hits = {unit_id: similarity for unit_id, similarity in zip(pool_ids, scores)
+                if similarity >= threshold}
+
+        results = []
+        hit_ids = list(hits)
+        for i in range(0, len(hit_ids), 900):
+            chunk = hit_ids[i:i + 900]
+            placeholders = ','.join('?' * len(chunk))
+            self.cursor.execute(f"SELECT * FROM translation_units WHERE id IN ({placeholders})", chunk)
+            for row in self.cursor.fetchall():
+                match_dict = dict(row)
+                similarity = hits[match_dict['id']]
+                match_dict['similarity'] = similarity
+                match_dict['match_pct'] = int(similarity * 100)
+                results.append(match_dict)
         return results
     
     def search_all(self, source: str, tm_ids: List[str] = None, enabled_only: bool = True,
@@ -1571,16 +2123,15 @@ class DatabaseManager:
     
     def clear_tm(self, tm_id: str):
         """Clear all entries from a TM"""
-        self.cursor.execute("""
-            DELETE FROM translation_units WHERE tm_id = ?
-        """, (tm_id,))
+        self.delete_translation_units("tm_id = ?", (tm_id,))
         self.connection.commit()
+        self.exact_match_cache.clear()
     
     def delete_entry(self, tm_id: str, source: str, target: str):
         """Delete a specific entry from a TM"""
         # Get the ID first
         self.cursor.execute("""
-            SELECT id FROM translation_units 
+            SELECT id, source_hash, target_hash FROM translation_units 
             WHERE tm_id = ? AND source_text = ? AND target_text = ?
         """, (tm_id, source, target))
         
@@ -1589,6 +2140,7 @@ class DatabaseManager:
             return  # Entry not found
         
         entry_id = result['id']
+        source_hash = result['source_hash']
         
         # Delete from FTS5 index first
         try:
@@ -1598,13 +2150,11 @@ class DatabaseManager:
         except Exception:
             pass  # FTS5 table might not exist
         
-        # Delete from main table
-        self.cursor.execute("""
-            DELETE FROM translation_units 
-            WHERE id = ?
-        """, (entry_id,))
+        # Delete from main table (and the fuzzy index)
+        self.delete_translation_units("id = ?", (entry_id,))
         
         self.connection.commit()
+        self.exact_match_cache.invalidate_units([(source_hash, result['target_hash'])])
 
     def update_entry(self, tm_id: str, old_source: str, old_target: str,
                      new_source: str, new_target: str) -> bool:
@@ -1616,8 +2166,8 @@ class DatabaseManager:
         import hashlib
 
         self.cursor.execute("""
-            SELECT id, source_lang, target_lang, context_before, context_after, notes,
-                   usage_count, created_by, created_date
+            SELECT id, source_hash, target_hash, source_lang, target_lang, context_before,
+                   context_after, notes, usage_count, created_by, created_date
             FROM translation_units
             WHERE tm_id = ? AND source_text = ? AND target_text = ?
         """, (tm_id, old_source, old_target))
@@ -1630,6 +2180,7 @@ class DatabaseManager:
         new_source_stripped = new_source.strip()
         new_target_stripped = new_target.strip()
         new_hash = hashlib.md5(new_source_stripped.lower().encode('utf-8')).hexdigest()
+        new_target_hash = _match_hash(new_target_stripped)
 
         # Update FTS5 index
         try:
@@ -1643,12 +2194,18 @@ class DatabaseManager:
         # Update main table
         self.cursor.execute("""
             UPDATE translation_units
-            SET source_text = ?, target_text = ?, source_hash = ?,
+            SET source_text = ?, target_text = ?, source_hash = ?, target_hash = ?,
                 modified_date = CURRENT_TIMESTAMP
             WHERE id = ?
-        """, (new_source_stripped, new_target_stripped, new_hash, entry_id))
+        """, (new_source_stripped, new_target_stripped, new_hash, new_target_hash, entry_id))
+
+        # Re-index the new source text in the fuzzy index
+        self._drop_fuzzy_units("id = ?", (entry_id,))
+        self._index_unindexed_units("u.id = ?", (entry_id,))
 
         self.connection.commit()
+        self.exact_match_cache.invalidate_units([(row['source_hash'], row['target_hash']),
+                                                 (new_hash, new_target_hash)])
         return True
 
     def concordance_search(self, query: str, tm_ids: List[str] = None, direction: str = 'both',
@@ -1717,9 +2274,23 @@ class DatabaseManager:
                 fts_sql += f" AND tu.tm_id IN ({placeholders})"
                 params.extend(tm_ids)
             
-            # DON'T filter by language when smart search active
-            # (we need to search all TMs and figure out which column has our language)
-            if not use_smart_search:
+            # Smart search: pre-filter on base languages in EITHER column so the
+            # LIMIT only counts rows that can pass the exact checks below
+            if use_smart_search:
+                from modules.tmx_generator import get_base_lang_code
+                src_bases = sorted({get_base_lang_code(l) for l in source_langs}) if source_langs else []
+                tgt_bases = sorted({get_base_lang_code(l) for l in target_langs}) if target_langs else []
+                src_in = ','.join('?' * len(src_bases))
+                tgt_in = ','.join('?' * len(tgt_bases))
+                if src_bases and tgt_bases:
+                    fts_sql += (f" AND ((tu.source_lang_base IN ({src_in}) AND tu.target_lang_base IN ({tgt_in}))"
+                                f" OR (tu.source_lang_base IN ({tgt_in}) AND tu.target_lang_base IN ({src_in})))")
+                    params.extend(src_bases + tgt_bases + tgt_bases + src_bases)
+                else:
+                    bases, bases_in = (src_bases, src_in) if src_bases else (tgt_bases, tgt_in)
+                    fts_sql += f" AND (tu.source_lang_base IN ({bases_in}) OR tu.target_lang_base IN ({bases_in}))"
+                    params.extend(bases + bases)
+            else:
                 # Traditional filtering when no language filters
                 if source_langs:
                     placeholders = ','.join('?' * len(source_langs))
@@ -1879,7 +2450,7 @@ class DatabaseManager:
                 SELECT id, source_text, target_text FROM translation_units
             """)
             
-            self.conn.commit()
+            self.connection.commit()
             
             # Get count
             self.cursor.execute("SELECT COUNT(*) FROM translation_units_fts")
@@ -1912,186 +2483,653 @@ class DatabaseManager:
         except Exception as e:
             return {'main_count': 0, 'fts_count': 0, 'in_sync': False, 'error': str(e)}
 
-    # ============================================
-    # termbase METHODS (Placeholder for Phase 3)
-    # ============================================
-    
-    def add_termbase_term(self, source_term: str, target_term: str,
-                         source_lang: str, target_lang: str,
-                         termbase_id: str = 'main', **kwargs) -> int:
-        """Add term to termbase (Phase 3)"""
-        # TODO: Implement in Phase 3
-        pass
-    
-    def search_termbases(self, search_term: str, source_lang: str = None,
-                        target_lang: str = None, project_id: str = None,
-                        min_length: int = 0, bidirectional: bool = True) -> List[Dict]:
+    def _create_fts_table(self, fts_table: str, content_table: str, columns: Tuple[str, ...],
+                          options: str) -> bool:
         """
-        Search termbases for matching terms (bidirectional by default)
-
-        Args:
-            search_term: Term to search for
-            source_lang: Filter by source language (optional)
-            target_lang: Filter by target language (optional)
-            project_id: Filter by project (optional)
-            min_length: Minimum term length to return
-            bidirectional: If True, also search target_term and swap results (default True)
+        Create an external-content FTS5 table and its sync triggers. A table
+        with another definition is dropped and recreated (empty - rebuild it).
 
-        Returns:
-            List of termbase hits
-            Each result includes 'match_direction' ('source' or 'target') indicating
-            which column matched. For 'target' matches, source_term and target_term
-            are swapped so results are always oriented correctly for the current project.
+        Returns: False if the content table doesn't exist
         """
-        # Build query with filters - include termbase name and ranking via JOIN
-        # Note: termbase_id is stored as TEXT in termbase_terms but INTEGER in termbases
-        # Use CAST to ensure proper comparison
-        # IMPORTANT: Join with termbase_activation to get the ACTUAL priority for this project
-        # CRITICAL FIX: Also match when search_term starts with the glossary term
-        # This handles cases like searching for "ca." when glossary has "ca."
-        # AND searching for "ca" when glossary has "ca."
-        # We also strip trailing punctuation from glossary terms for comparison
+        self.cursor.execute("SELECT name, sql FROM sqlite_master WHERE name IN (?, ?)",
+                            (fts_table, content_table))
+        existing = {row[0]: row[1] for row in self.cursor.fetchall()}
+        if content_table not in existing:
+            return False
+        create_sql = (f"CREATE VIRTUAL TABLE {fts_table} USING fts5({', '.join(columns)}, "
+                      f"content={content_table}, content_rowid=id, {options})")
+        triggers = _fts_sync_triggers(fts_table, content_table, columns)
+        if existing.get(fts_table) not in (None, create_sql):
+            self._drop_fts_table(fts_table, content_table, columns)
+            existing.pop(fts_table)
+        if fts_table not in existing:
+            self.cursor.execute(create_sql)
+        for _, trigger_sql in triggers:
+            self.cursor.execute(trigger_sql)
+        return True
 
-        # Build matching conditions for a given column
-        def build_match_conditions(column: str) -> str:
-            return f"""(
-                LOWER(t.{column}) = LOWER(?) OR
-                LOWER(t.{column}) LIKE LOWER(?) OR
-                LOWER(t.{column}) LIKE LOWER(?) OR
-                LOWER(t.{column}) LIKE LOWER(?) OR
-                LOWER(RTRIM(t.{column}, '.!?,;:')) = LOWER(?) OR
-                LOWER(?) LIKE LOWER(t.{column}) || '%' OR
-                LOWER(?) = LOWER(RTRIM(t.{column}, '.!?,;:'))
-            )"""
+    def _drop_fts_table(self, fts_table: str, content_table: str, columns: Tuple[str, ...]):
+        """Drop an FTS5 table created by _create_fts_table() and its triggers"""
+        for trigger_name, _ in _fts_sync_triggers(fts_table, content_table, columns):
+            self.cursor.execute(f"DROP TRIGGER IF EXISTS {trigger_name}")
+        self.cursor.execute(f"DROP TABLE IF EXISTS {fts_table}")
 
-        # Build match params for one direction
-        def build_match_params() -> list:
-            return [
-                search_term,
-                f"{search_term} %",
-                f"% {search_term}",
-                f"% {search_term} %",
-                search_term,  # For RTRIM comparison
-                search_term,  # For reverse LIKE
-                search_term   # For reverse RTRIM comparison
-            ]
-
-        # Matching patterns:
-        # 1. Exact match: column = search_term
-        # 2. Glossary term starts with search: column LIKE "search_term %"
-        # 3. Glossary term ends with search: column LIKE "% search_term"
-        # 4. Glossary term contains search: column LIKE "% search_term %"
-        # 5. Glossary term (stripped) = search_term: RTRIM(column) = search_term (handles "ca." = "ca")
-        # 6. Search starts with glossary term: search_term LIKE column || '%'
-        # 7. Search = glossary term stripped: search_term = RTRIM(column)
+    def _create_termbase_fts_tables(self):
+        """
+        Create the termbase FTS5 indexes (TERMBASE_FTS_TABLES) with their sync
+        triggers. Older versions created termbase_terms_fts without triggers,
+        so it was never filled: it is recreated with the current definition
+        and connect() rebuilds it.
+        """
+        for fts_table, content_table, columns in TERMBASE_FTS_TABLES:
+            self._create_fts_table(fts_table, content_table, columns, TERMBASE_FTS_OPTIONS)
+        self.connection.commit()
 
-        # Base SELECT for forward matches (source_term matches)
-        base_select_forward = """
-            SELECT
-                t.id, t.source_term, t.target_term, t.termbase_id,
-                t.forbidden, t.source_lang, t.target_lang, t.definition, t.domain,
-                t.notes, t.project, t.client,
-                tb.name as termbase_name,
-                tb.source_lang as termbase_source_lang,
-                tb.target_lang as termbase_target_lang,
-                tb.is_project_termbase,
-                CASE WHEN COALESCE(ta.priority, 0) = 1 OR tb.is_project_termbase = 1 THEN 1 ELSE 0 END as ranking,
-                'source' as match_direction
-            FROM termbase_terms t
-            LEFT JOIN termbases tb ON CAST(t.termbase_id AS INTEGER) = tb.id
-            LEFT JOIN termbase_activation ta ON ta.termbase_id = tb.id AND ta.project_id = ? AND ta.is_active = 1
-            WHERE {match_conditions}
-            AND (ta.is_active = 1 OR tb.is_project_termbase = 1)
-        """.format(match_conditions=build_match_conditions('source_term'))
+    def _termbase_fts_specs(self) -> List[Tuple[str, str, Tuple[str, ...]]]:
+        """(fts table, content table, columns) of the termbase FTS5 indexes in this database"""
+        existing = set(self._fts5_tables())
+        return [spec for spec in TERMBASE_FTS_TABLES + TERMBASE_TRIGRAM_TABLES if spec[0] in existing]
 
-        # Base SELECT for reverse matches (target_term matches) - swap source/target in output
-        base_select_reverse = """
-            SELECT
-                t.id, t.target_term as source_term, t.source_term as target_term,
-                t.termbase_id,
-                t.forbidden, t.target_lang as source_lang, t.source_lang as target_lang,
-                t.definition, t.domain,
-                t.notes, t.project, t.client,
-                tb.name as termbase_name,
-                tb.target_lang as termbase_source_lang,
-                tb.source_lang as termbase_target_lang,
-                tb.is_project_termbase,
-                CASE WHEN COALESCE(ta.priority, 0) = 1 OR tb.is_project_termbase = 1 THEN 1 ELSE 0 END as ranking,
-                'target' as match_direction
-            FROM termbase_terms t
-            LEFT JOIN termbases tb ON CAST(t.termbase_id AS INTEGER) = tb.id
-            LEFT JOIN termbase_activation ta ON ta.termbase_id = tb.id AND ta.project_id = ? AND ta.is_active = 1
-            WHERE {match_conditions}
-            AND (ta.is_active = 1 OR tb.is_project_termbase = 1)
-        """.format(match_conditions=build_match_conditions('target_term'))
+    @staticmethod
+    def termbase_trigram_supported() -> bool:
+        """True if this SQLite has the trigram tokenizer (3.34+)"""
+        return sqlite3.sqlite_version_info >= TERMBASE_TRIGRAM_MIN_SQLITE
 
-        # Build params
-        project_param = project_id if project_id else 0
-        forward_params = [project_param] + build_match_params()
-        reverse_params = [project_param] + build_match_params()
+    def has_termbase_trigram_index(self) -> bool:
+        """True if the trigram indexes for termbase search exist"""
+        self.cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                            (TERMBASE_TRIGRAM_TABLES[0][0],))
+        return self.cursor.fetchone() is not None
 
-        # Build language filter conditions
-        lang_conditions_forward = ""
-        lang_conditions_reverse = ""
-        lang_params_forward = []
-        lang_params_reverse = []
+    def set_termbase_trigram_index(self, enabled: bool) -> bool:
+        """
+        Create (and fill) or drop the trigram indexes used for substring and
+        fuzzy termbase search. connect() creates them unless the manager was
+        created with termbase_trigram_index=False. Needs SQLite 3.34+
+        (trigram tokenizer); with an older SQLite, and for queries under 3
+        characters, substring search uses a LIKE scan.
 
-        if source_lang:
-            # For forward: filter on source_lang
-            lang_conditions_forward += """ AND (
-                t.source_lang = ? OR
-                (t.source_lang IS NULL AND tb.source_lang = ?) OR
-                (t.source_lang IS NULL AND tb.source_lang IS NULL)
-            )"""
-            lang_params_forward.extend([source_lang, source_lang])
-            # For reverse: source_lang becomes target_lang (swapped)
-            lang_conditions_reverse += """ AND (
-                t.target_lang = ? OR
-                (t.target_lang IS NULL AND tb.target_lang = ?) OR
-                (t.target_lang IS NULL AND tb.target_lang IS NULL)
-            )"""
-            lang_params_reverse.extend([source_lang, source_lang])
+        Args:
+            enabled: True to create the indexes, False to drop them
 
-        if target_lang:
-            # For forward: filter on target_lang
-            lang_conditions_forward += """ AND (
-                t.target_lang = ? OR
-                (t.target_lang IS NULL AND tb.target_lang = ?) OR
-                (t.target_lang IS NULL AND tb.target_lang IS NULL)
-            )"""
-            lang_params_forward.extend([target_lang, target_lang])
-            # For reverse: target_lang becomes source_lang (swapped)
-            lang_conditions_reverse += """ AND (
-                t.source_lang = ? OR
-                (t.source_lang IS NULL AND tb.source_lang = ?) OR
-                (t.source_lang IS NULL AND tb.source_lang IS NULL)
-            )"""
-            lang_params_reverse.extend([target_lang, target_lang])
+        Returns:
+            Whether the trigram indexes exist now
+        """
+        self.termbase_trigram_index = bool(enabled)
+        if bool(enabled) == self.has_termbase_trigram_index():
+            return bool(enabled)
+        if enabled and not self.termbase_trigram_supported():
+            self.log(f"⚠️ Termbase trigram index needs SQLite 3.34+ (have {sqlite3.sqlite_version}), "
+                     f"substring search uses LIKE scans")
+            return False
+        if enabled:
+            self.log("[Termbase] Building the trigram index for substring search...")
+        try:
+            for fts_table, content_table, columns in TERMBASE_TRIGRAM_TABLES:
+                if not enabled:
+                    self._drop_fts_table(fts_table, content_table, columns)
+                elif self._create_fts_table(fts_table, content_table, columns, TERMBASE_TRIGRAM_OPTIONS):
+                    self.cursor.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES('rebuild')")
+            self.connection.commit()
+            self.log(f"✓ Termbase trigram index {'created' if enabled else 'removed'}")
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            self.log(f"⚠️ Termbase trigram index not available: {e}")
+        return self.has_termbase_trigram_index()
 
-        # Project filter conditions
-        project_conditions = ""
-        project_params = []
-        if project_id:
-            project_conditions = " AND (t.project_id = ? OR t.project_id IS NULL)"
-            project_params = [project_id]
+    def rebuild_termbase_fts_index(self) -> int:
+        """
+        Rebuild the termbase FTS5 indexes (and the trigram indexes, if enabled)
+        from scratch.
+
+        Returns:
+            Number of terms indexed
+        """
+        try:
+            for fts_table, _, _ in self._termbase_fts_specs():
+                self.cursor.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES('rebuild')")
+            self.connection.commit()
+
+            self.cursor.execute(f"SELECT COUNT(*) FROM {TERMBASE_FTS_TABLES[0][0]}_docsize")
+            count = self.cursor.fetchone()[0]
+            self.log(f"[Termbase] FTS5 index rebuilt with {count:,} terms")
+            return count
+        except Exception as e:
+            self.log(f"[Termbase] Error rebuilding FTS index: {e}")
+            return 0
+
+    def check_termbase_fts_index(self) -> Dict:
+        """
+        Check if the termbase FTS5 indexes are in sync with their tables.
+
+        Returns:
+            Dict with 'main_count', 'fts_count' (summed over the indexes),
+            'in_sync' and 'tables' ({fts table: (main_count, fts_count)}) keys
+        """
+        try:
+            tables = {}
+            for fts_table, content_table, _ in self._termbase_fts_specs():
+                self.cursor.execute(f"SELECT COUNT(*) FROM {content_table}")
+                main_count = self.cursor.fetchone()[0]
+                # COUNT(*) on an external-content table counts the content
+                # rows; _docsize has one row per indexed document
+                self.cursor.execute(f"SELECT COUNT(*) FROM {fts_table}_docsize")
+                tables[fts_table] = (main_count, self.cursor.fetchone()[0])
+            return {
+                'main_count': sum(counts[0] for counts in tables.values()),
+                'fts_count': sum(counts[1] for counts in tables.values()),
+                'in_sync': all(main == fts for main, fts in tables.values()),
+                'tables': tables,
+            }
+        except Exception as e:
+            return {'main_count': 0, 'fts_count': 0, 'in_sync': False, 'error': str(e)}
+
+    def _index_unindexed_units(self, where_sql: str, params=(), connection: sqlite3.Connection = None) -> int:
+        """
+        Add TM units that are missing from the persistent fuzzy index.
+        Does not commit (callers commit with their own write).
+
+        Args:
+            where_sql: Condition on translation_units (alias 'u') selecting units to index
+            params: Parameters for where_sql
+            connection: Connection to write with (default: ours)
+
+        Returns:
+            Number of units indexed
+        """
+        from modules.fuzzy_match_engine import clean_for_fuzzy
+
+        connection = connection or self.connection
+        read_cursor = connection.cursor()
+        write_cursor = connection.cursor()
+        read_cursor.execute(f"""
+            SELECT u.id, u.source_text FROM translation_units u
+            LEFT JOIN tm_fuzzy_units f ON f.unit_id = u.id
+            WHERE f.unit_id IS NULL AND {where_sql}
+        """, params)
+
+        indexed = 0
+        while True:
+            rows = read_cursor.fetchmany(FUZZY_INDEX_CHUNK_SIZE)
+            if not rows:
+                break
+            unit_rows = []
+            posting_rows = []
+            df = {}
+            for unit_id, source_text in rows:
+                words = set(clean_for_fuzzy(source_text).split())
+                unit_rows.append((unit_id, len(normalize_for_similarity(source_text or '')), len(words)))
+                posting_rows.extend((word, unit_id) for word in words)
+                for word in words:
+                    df[word] = df.get(word, 0) + 1
+            write_cursor.executemany(
+                "INSERT OR IGNORE INTO tm_fuzzy_units (unit_id, clean_len, word_count) VALUES (?, ?, ?)",
+                unit_rows
+            )
+            write_cursor.executemany(
+                "INSERT OR IGNORE INTO tm_fuzzy_postings (token, unit_id) VALUES (?, ?)",
+                posting_rows
+            )
+            # One upsert per distinct word in the chunk (the units had no postings yet)
+            write_cursor.executemany(
+                "INSERT INTO tm_fuzzy_tokens (token, df) VALUES (?, ?) "
+                "ON CONFLICT(token) DO UPDATE SET df = df + excluded.df",
+                df.items()
+            )
+            indexed += len(unit_rows)
+        read_cursor.close()
+        write_cursor.close()
+        return indexed
+
+    def _drop_fuzzy_units(self, where_sql: str, params=(), connection: sqlite3.Connection = None):
+        """
+        Remove TM units from the persistent fuzzy index, decrementing the word
+        counts (tm_fuzzy_tokens.df) with one grouped statement.
+        Does not commit.
+
+        Args:
+            where_sql: Condition on translation_units selecting units to remove
+            params: Parameters for where_sql
+            connection: Connection to write with (default: ours)
+        """
+        connection = connection or self.connection
+        units_sql = f"SELECT id FROM translation_units WHERE {where_sql}"
+        connection.execute(f"""
+            INSERT INTO tm_fuzzy_tokens (token, df)
+            SELECT token, -COUNT(*) FROM tm_fuzzy_postings
+            WHERE unit_id IN ({units_sql})
+            GROUP BY token
+            ON CONFLICT(token) DO UPDATE SET df = df + excluded.df
+        """, params)
+        connection.execute(f"DELETE FROM tm_fuzzy_postings WHERE unit_id IN ({units_sql})", params)
+        connection.execute(f"DELETE FROM tm_fuzzy_units WHERE unit_id IN ({units_sql})", params)
+
+    def delete_translation_units(self, where_sql: str, params=(), connection: sqlite3.Connection = None) -> int:
+        """
+        Delete TM units and their fuzzy index rows.
+        Does not commit, and leaves the exact-match cache to the caller.
+
+        Args:
+            where_sql: Condition on translation_units selecting units to delete
+            params: Parameters for where_sql
+            connection: Connection to write with (default: ours)
+
+        Returns:
+            Number of units deleted
+        """
+        connection = connection or self.connection
+        self._drop_fuzzy_units(where_sql, params, connection)
+        return connection.execute(f"DELETE FROM translation_units WHERE {where_sql}", params).rowcount
+
+    def rebuild_fuzzy_index(self) -> int:
+        """
+        Rebuild the persistent fuzzy-match index from scratch (blocking; see
+        start_fuzzy_index_build() for the background build used on connect).
+        Use this if fuzzy lookups miss entries that are in the TM.
+        
+        Returns:
+            Number of entries indexed
+        """
+        try:
+            self.cursor.execute("DELETE FROM tm_fuzzy_postings")
+            self.cursor.execute("DELETE FROM tm_fuzzy_units")
+            self.cursor.execute("DELETE FROM tm_fuzzy_tokens")
+            
+            count = self._index_unindexed_units("1=1")
+            self.cursor.execute("UPDATE tm_fuzzy_state SET version = ?, complete = 1 WHERE id = 1",
+                                (FUZZY_INDEX_VERSION,))
+            
+            self.connection.commit()
+            print(f"[TM] Fuzzy index rebuilt with {count:,} entries")
+            return count
+        except Exception as e:
+            print(f"[TM] Error rebuilding fuzzy index: {e}")
+            self.connection.rollback()
+            return 0
+    
+    def check_fuzzy_index(self) -> Dict:
+        """
+        Check if the persistent fuzzy index is in sync with main table.
+        
+        Returns:
+            Dict with 'main_count', 'index_count', 'ready' (current format, build
+            finished) and 'in_sync' keys
+        """
+        try:
+            self.cursor.execute("SELECT COUNT(*) FROM translation_units")
+            main_count = self.cursor.fetchone()[0]
+            
+            self.cursor.execute("SELECT COUNT(*) FROM tm_fuzzy_units")
+            index_count = self.cursor.fetchone()[0]
+            
+            ready = self.fuzzy_index_ready()
+            return {
+                'main_count': main_count,
+                'index_count': index_count,
+                'ready': ready,
+                'in_sync': ready and main_count == index_count
+            }
+        except Exception as e:
+            return {'main_count': 0, 'index_count': 0, 'ready': False, 'in_sync': False, 'error': str(e)}
+
+    def fuzzy_index_ready(self) -> bool:
+        """True if the fuzzy index has the current format and its build has finished"""
+        try:
+            self.cursor.execute("SELECT version, complete FROM tm_fuzzy_state WHERE id = 1")
+            row = self.cursor.fetchone()
+        except sqlite3.Error:
+            return False  # Older database without the index tables
+        return row is not None and row[0] == FUZZY_INDEX_VERSION and bool(row[1])
+
+    def start_fuzzy_index_build(self, progress_callback=None) -> Optional[threading.Thread]:
+        """
+        Bring the fuzzy index in sync on a background thread.
+
+        Does nothing if the index is ready and covers every unit. Otherwise
+        rebuilds it from scratch (older format) or indexes the missing units,
+        in id ranges of FUZZY_INDEX_CHUNK_SIZE units with one short write
+        transaction each, so edits on the UI thread aren't held up. A chunk
+        that finds the database locked (e.g. during a large TMX or termbase
+        import) is retried after a backoff instead of ending the build. Until
+        the build finishes, fuzzy lookups use FTS5 only. connect() calls this.
+
+        Args:
+            progress_callback: Optional callback(done, total) in units, called
+                               on the build thread
+
+        Returns:
+            The build thread, or None if a build for this database is already running
+        """
+        key = os.path.normcase(os.path.abspath(self.db_path))
+        with _fuzzy_builds_lock:
+            running = _fuzzy_builds.get(key)
+            if running is not None and running.is_alive():
+                return None
+            thread = threading.Thread(target=self._build_fuzzy_index, args=(progress_callback,),
+                                      name='fuzzy-index-build', daemon=True)
+            _fuzzy_builds[key] = thread
+        thread.start()
+        return thread
+
+    def _build_fuzzy_index(self, progress_callback=None):
+        """Body of start_fuzzy_index_build() (runs on the build thread)"""
+        pool = self.pool
+        # Keep the writer open for the whole build, even if our manager closes
+        writer = pool.open_writer()
+        start = time.perf_counter()
+        try:
+            with pool.read() as conn:
+                state = conn.execute("SELECT version, complete FROM tm_fuzzy_state WHERE id = 1").fetchone()
+                main_count = conn.execute("SELECT COUNT(*) FROM translation_units").fetchone()[0]
+                index_count = conn.execute("SELECT COUNT(*) FROM tm_fuzzy_units").fetchone()[0]
+            if state is not None and tuple(state) == (FUZZY_INDEX_VERSION, 1) and main_count == index_count:
+                return
+            print(f"[TM] Fuzzy index not ready ({index_count:,} of {main_count:,} entries indexed), "
+                  f"building in the background...")
+
+            def reset(conn):
+                row = conn.execute("SELECT version FROM tm_fuzzy_state WHERE id = 1").fetchone()
+                if row is None or row[0] != FUZZY_INDEX_VERSION:
+                    conn.execute("DELETE FROM tm_fuzzy_postings")
+                    conn.execute("DELETE FROM tm_fuzzy_units")
+                    conn.execute("DELETE FROM tm_fuzzy_tokens")
+                conn.execute("UPDATE tm_fuzzy_state SET version = ?, complete = 0 WHERE id = 1",
+                             (FUZZY_INDEX_VERSION,))
+                return conn.execute("SELECT COALESCE(MAX(id), 0) FROM translation_units").fetchone()[0]
+
+            max_id = self._fuzzy_build_write(reset)
+
+            indexed = 0
+            for low in range(0, max_id, FUZZY_INDEX_CHUNK_SIZE):
+                # Indexes only units not indexed yet, so a retried chunk is safe
+                indexed += self._fuzzy_build_write(
+                    lambda conn: self._index_unindexed_units("u.id > ? AND u.id <= ?",
+                                                             (low, low + FUZZY_INDEX_CHUNK_SIZE), conn))
+                if progress_callback:
+                    progress_callback(min(low + FUZZY_INDEX_CHUNK_SIZE, max_id), max_id)
+
+            # Units added above max_id meanwhile were indexed by their own insert
+            self._fuzzy_build_write(
+                lambda conn: conn.execute("UPDATE tm_fuzzy_state SET complete = 1 WHERE id = 1"))
+            print(f"[TM] Fuzzy index built: {indexed:,} entries indexed in "
+                  f"{time.perf_counter() - start:.1f}s")
+        except Exception as e:
+            print(f"[TM] Fuzzy index build failed (FTS5 fuzzy search stays in use): {e}")
+        finally:
+            pool.release_writer(writer)
+
+    def _fuzzy_build_write(self, work: Callable):
+        """
+        Run work(conn) in a pool write transaction for the fuzzy index build,
+        retrying with a growing delay while the database is locked (the
+        writer is busy with a long transaction, or another process writes).
+
+        Returns: What work returned
+        """
+        delay = FUZZY_INDEX_RETRY_DELAY
+        waiting = False
+        while True:
+            try:
+                with self.pool.write() as conn:
+                    result = work(conn)
+                if waiting:
+                    print("[TM] Fuzzy index build resumed")
+                return result
+            except sqlite3.OperationalError as e:
+                if 'locked' not in str(e):
+                    raise
+                if not waiting:
+                    print(f"[TM] Fuzzy index build waiting for the database ({e})...")
+                    waiting = True
+                time.sleep(delay)
+                delay = min(delay * 2, FUZZY_INDEX_RETRY_MAX_DELAY)
+
+    # ============================================
+    # termbase METHODS (Placeholder for Phase 3)
+    # ============================================
+    
+    def add_termbase_term(self, source_term: str, target_term: str,
+                         source_lang: str, target_lang: str,
+                         termbase_id: str = 'main', **kwargs) -> int:
+        """Add term to termbase (Phase 3)"""
+        # TODO: Implement in Phase 3
+        pass
+    
+    @staticmethod
+    def _termbase_select_sql(reverse: bool = False) -> str:
+        """
+        SELECT/JOIN part of the termbase search queries.
+
+        Includes termbase name and ranking via JOIN. The
+        termbase_activation JOIN (first parameter: project id) gives the ACTUAL
+        priority for this project. For reverse (target_term) matches, source
+        and target are swapped so results are oriented for the current project.
+        """
+        if reverse:
+            return """
+            SELECT
+                t.id, t.target_term as source_term, t.source_term as target_term,
+                t.termbase_id,
+                t.forbidden, t.target_lang as source_lang, t.source_lang as target_lang,
+                t.definition, t.domain,
+                t.notes, t.project, t.client,
+                tb.name as termbase_name,
+                tb.target_lang as termbase_source_lang,
+                tb.source_lang as termbase_target_lang,
+                tb.is_project_termbase,
+                CASE WHEN COALESCE(ta.priority, 0) = 1 OR tb.is_project_termbase = 1 THEN 1 ELSE 0 END as ranking,
+                'target' as match_direction
+            FROM termbase_terms t
+            LEFT JOIN termbases tb ON t.termbase_id = tb.id
+            LEFT JOIN termbase_activation ta ON ta.termbase_id = tb.id AND ta.project_id = ? AND ta.is_active = 1
+        """
+        return """
+            SELECT
+                t.id, t.source_term, t.target_term, t.termbase_id,
+                t.forbidden, t.source_lang, t.target_lang, t.definition, t.domain,
+                t.notes, t.project, t.client,
+                tb.name as termbase_name,
+                tb.source_lang as termbase_source_lang,
+                tb.target_lang as termbase_target_lang,
+                tb.is_project_termbase,
+                CASE WHEN COALESCE(ta.priority, 0) = 1 OR tb.is_project_termbase = 1 THEN 1 ELSE 0 END as ranking,
+                'source' as match_direction
+            FROM termbase_terms t
+            LEFT JOIN termbases tb ON t.termbase_id = tb.id
+            LEFT JOIN termbase_activation ta ON ta.termbase_id = tb.id AND ta.project_id = ? AND ta.is_active = 1
+        """
+
+    @staticmethod
+    def _termbase_filter_sql(reverse: bool = False, source_lang: str = None,
+                             target_lang: str = None, project_id: str = None,
+                             min_length: int = 0) -> Tuple[str, list]:
+        """
+        Activation, language, project and length conditions for termbase searches.
+
+        For reverse matches the language columns are swapped (the project's
+        source language is the term's target language).
+
+        Returns: (" AND ..." SQL, params)
+        """
+        sql = " AND (ta.is_active = 1 OR tb.is_project_termbase = 1)"
+        params = []
+
+        source_column, target_column = ('target_lang', 'source_lang') if reverse else ('source_lang', 'target_lang')
+        for column, lang in ((source_column, source_lang), (target_column, target_lang)):
+            if lang:
+                sql += f""" AND (
+                t.{column} = ? OR
+                (t.{column} IS NULL AND tb.{column} = ?) OR
+                (t.{column} IS NULL AND tb.{column} IS NULL)
+            )"""
+                params.extend([lang, lang])
+
+        if project_id:
+            # Unary + keeps the planner on the term indexes (most terms have no project)
+            sql += " AND (+t.project_id = ? OR t.project_id IS NULL)"
+            params.append(project_id)
 
-        # Min length conditions
-        min_len_forward = ""
-        min_len_reverse = ""
         if min_length > 0:
-            min_len_forward = f" AND LENGTH(t.source_term) >= {min_length}"
-            min_len_reverse = f" AND LENGTH(t.target_term) >= {min_length}"
+            term_column = 'target_term' if reverse else 'source_term'
+            sql += f" AND LENGTH(t.{term_column}) >= {int(min_length)}"
 
-        # Build forward query
-        forward_query = base_select_forward + lang_conditions_forward + project_conditions + min_len_forward
-        forward_params.extend(lang_params_forward)
-        forward_params.extend(project_params)
+        return sql, params
+
+    def _termbase_results(self, rows) -> List[Dict]:
+        """
+        Turn termbase search rows into result dicts.
+
+        Deduplicates (same term pair from the same termbase appears once),
+        converts is_project_termbase to bool and adds 'target_synonyms'.
+        """
+        results = []
+        seen_combinations = set()  # Track (source_term, target_term, termbase_id) to avoid duplicates
+
+        for row in rows:
+            result_dict = dict(row)
+
+            # Deduplicate: same term pair from same termbase should only appear once
+            combo_key = (
+                (result_dict.get('source_term') or '').lower(),
+                (result_dict.get('target_term') or '').lower(),
+                result_dict.get('termbase_id')
+            )
+            if combo_key in seen_combinations:
+                continue
+            seen_combinations.add(combo_key)
+
+            # SQLite stores booleans as 0/1, explicitly convert to Python bool
+            if 'is_project_termbase' in result_dict:
+                result_dict['is_project_termbase'] = bool(result_dict['is_project_termbase'])
+
+            results.append(result_dict)
+
+        self._attach_termbase_synonyms(results)
+        return results
+
+    def _attach_termbase_synonyms(self, results: List[Dict]):
+        """
+        Add 'target_synonyms' (non-forbidden, in display order) to termbase results.
+
+        For reverse matches the 'source' synonyms are fetched, since they become
+        targets. One query for all results.
+        """
+        term_ids = list({result['id'] for result in results if result.get('id')})
+        synonyms = {}
+        try:
+            for start in range(0, len(term_ids), 500):
+                chunk = term_ids[start:start + 500]
+                self.cursor.execute(f"""
+                    SELECT term_id, language, synonym_text, forbidden FROM termbase_synonyms
+                    WHERE term_id IN ({', '.join('?' * len(chunk))})
+                    ORDER BY display_order ASC
+                """, chunk)
+                for term_id, language, synonym_text, forbidden in self.cursor.fetchall():
+                    if not forbidden:  # Only include non-forbidden synonyms
+                        synonyms.setdefault((term_id, language), []).append(synonym_text)
+        except Exception:
+            synonyms = {}
+
+        for result in results:
+            if result.get('id'):
+                synonym_lang = 'source' if result.get('match_direction') == 'target' else 'target'
+                result['target_synonyms'] = synonyms.get((result['id'], synonym_lang), [])
+
+    @staticmethod
+    def _termbase_match_sql(column: str, search_lower: str) -> Tuple[str, list]:
+        """
+        Index-driven "t.id IN (...)" condition for the search_termbases() patterns.
+
+        With norm = {column}_norm, termbase_norm() of the term (idx_gt_*_term_norm):
+        - 1, 5, 6, 7: norm is one of the prefixes of the search term (the term
+          or its trimmed form equals, or starts, the search), then checked
+          exactly (the trimmed punctuation must follow in the search too)
+        - 2: norm in the range [search + ' ', search + '!')
+        - 3, 4: a word suffix of the term (termbase_term_suffixes) equals the
+          search or starts with search + ' '
+
+        Args:
+            column: 'source_term' or 'target_term'
+            search_lower: Search term casefolded
+
+        Returns: (SQL, params)
+        """
+        norm = f"{column}_norm"
+        stem = f"LENGTH(RTRIM({column}, '{TERMBASE_TRIM_CHARS}'))"
+        side = 1 if column == 'target_term' else 0
+        prefixes = {search_lower[:i] for i in range(min(len(search_lower), TERMBASE_SUFFIX_MAX_CHARS) + 1)}
+        prefixes.add(search_lower)
+        prefixes.add(search_lower.rstrip(TERMBASE_TRIM_CHARS))
+        prefixes = sorted(prefixes)
+        sql = f"""t.id IN (
+                SELECT id FROM termbase_terms
+                WHERE {norm} IN ({', '.join('?' * len(prefixes))})
+                  AND ({norm} = ? OR SUBSTR(?, LENGTH({norm}) + 1, LENGTH({column}) - {stem})
+                                     = SUBSTR({column}, {stem} + 1))
+                UNION
+                SELECT id FROM termbase_terms WHERE {norm} >= ? AND {norm} < ?
+                UNION
+                SELECT term_id FROM termbase_term_suffixes WHERE side = {side} AND suffix = ?
+                UNION
+                SELECT term_id FROM termbase_term_suffixes WHERE side = {side} AND suffix >= ? AND suffix < ?
+            )"""
+        params = prefixes + [search_lower, search_lower,
+                             search_lower + ' ', search_lower + '!',
+                             search_lower, search_lower + ' ', search_lower + '!']
+        return sql, params
+
+    def search_termbases(self, search_term: str, source_lang: str = None,
+                        target_lang: str = None, project_id: str = None,
+                        min_length: int = 0, bidirectional: bool = True) -> List[Dict]:
+        """
+        Search termbases for matching terms (bidirectional by default)
+
+        Args:
+            search_term: Term to search for
+            source_lang: Filter by source language (optional)
+            target_lang: Filter by target language (optional)
+            project_id: Filter by project (optional)
+            min_length: Minimum term length to return
+            bidirectional: If True, also search target_term and swap results (default True)
+
+        Returns:
+            List of termbase hits
+            Each result includes 'match_direction' ('source' or 'target') indicating
+            which column matched. For 'target' matches, source_term and target_term
+            are swapped so results are always oriented correctly for the current project.
+        """
+        # CRITICAL FIX: Also match when search_term starts with the glossary term
+        # This handles cases like searching for "ca." when glossary has "ca."
+        # AND searching for "ca" when glossary has "ca."
+        # We also strip trailing punctuation from glossary terms for comparison
+        #
+        # Matching patterns (case-insensitive, search term taken literally):
+        # 1. Exact match: column = search_term
+        # 2. Glossary term starts with search: column LIKE "search_term %"
+        # 3. Glossary term ends with search: column LIKE "% search_term"
+        # 4. Glossary term contains search: column LIKE "% search_term %"
+        # 5. Glossary term (stripped) = search_term: RTRIM(column) = search_term (handles "ca." = "ca")
+        # 6. Search starts with glossary term: search_term LIKE column || '%'
+        # 7. Search = glossary term stripped: search_term = RTRIM(column)
+        # Each is answered from an index (see _termbase_match_sql)
+        search_lower = search_term.casefold()
+
+        project_param = project_id if project_id else 0
+
+        # Build forward query (source_term matches)
+        filter_sql, filter_params = self._termbase_filter_sql(
+            False, source_lang, target_lang, project_id, min_length)
+        match_sql, match_params = self._termbase_match_sql('source_term', search_lower)
+        forward_query = self._termbase_select_sql(False) + f" WHERE {match_sql}" + filter_sql
+        forward_params = [project_param] + match_params + filter_params
 
         if bidirectional:
-            # Build reverse query
-            reverse_query = base_select_reverse + lang_conditions_reverse + project_conditions + min_len_reverse
-            reverse_params.extend(lang_params_reverse)
-            reverse_params.extend(project_params)
+            # Build reverse query (target_term matches, source/target swapped)
+            filter_sql, filter_params = self._termbase_filter_sql(
+                True, source_lang, target_lang, project_id, min_length)
+            match_sql, match_params = self._termbase_match_sql('target_term', search_lower)
+            reverse_query = self._termbase_select_sql(True) + f" WHERE {match_sql}" + filter_sql
+            reverse_params = [project_param] + match_params + filter_params
 
             # Combine with UNION and sort
             query = f"""
@@ -2109,51 +3147,709 @@ class DatabaseManager:
             params = forward_params
 
         self.cursor.execute(query, params)
-        results = []
-        seen_combinations = set()  # Track (source_term, target_term, termbase_id) to avoid duplicates
+        return self._termbase_results(self.cursor.fetchall())
+
+    def termbase_generation(self) -> int:
+        """Counter bumped by triggers whenever termbase matching data changes"""
+        try:
+            self.cursor.execute("SELECT generation FROM termbase_state WHERE id = 1")
+            row = self.cursor.fetchone()
+            return row[0] if row else 0
+        except sqlite3.Error:
+            return -1
+
+    def termbase_watermark(self) -> Dict[str, int]:
+        """
+        Point in the termbase change history, for get_termbase_terms_changed_since().
+
+        Returns: {'generation': termbase_generation(), 'max_term_id': highest term id}
+        """
+        generation = self.termbase_generation()
+        self.cursor.execute("SELECT COALESCE(MAX(id), 0) FROM termbase_terms")
+        return {'generation': generation, 'max_term_id': self.cursor.fetchone()[0]}
+
+    def get_termbase_terms_changed_since(self, watermark: Dict[str, int]) -> set:
+        """
+        Terms added, or whose terms, languages, project or termbase changed, since a watermark.
+
+        Deleted terms are not included (they simply no longer exist). May
+        include terms changed just before the watermark was taken.
+
+        Args:
+            watermark: Result of termbase_watermark()
+
+        Returns: Set of term ids
+        """
+        self.cursor.execute("""
+            SELECT id FROM termbase_terms WHERE id > ?
+            UNION
+            SELECT term_id FROM termbase_term_changes WHERE generation >= ?
+        """, (watermark.get('max_term_id', 0), watermark.get('generation', 0)))
+        return {row[0] for row in self.cursor.fetchall()}
+
+    def get_termbase_matcher(self, source_lang: str = None, target_lang: str = None,
+                             project_id: str = None, min_length: int = 0,
+                             bidirectional: bool = True) -> TermMatcher:
+        """
+        In-memory matcher over the activated termbases' terms (TermLens rule).
+
+        Terms are indexed with TERMLENS_STRIP_CHARS stripped from both ends and
+        match on word boundaries (\\bterm\\b). Built on first use for a language
+        pair/project. When termbase_generation() changes, only the terms
+        reported by get_termbase_terms_changed_since() are reloaded; the
+        matcher is rebuilt if termbases or their activation changed. Deleted
+        terms may stay in the matcher (search_termbases_in_text() loads
+        matches by id with the full filter, which leaves them out).
+
+        Returns: TermMatcher whose entries are (term_id, reverse) tuples
+        """
+        key = (source_lang, target_lang, project_id, min_length, bidirectional)
+        generation = self.termbase_generation()
+        cached = self._termbase_matchers.get(key)
+        if cached is not None and cached[0] == generation and generation >= 0:
+            return cached[3]
+
+        watermark = self.termbase_watermark()
+        scope = self._termbase_scope()
+        if cached is not None and generation >= 0 and cached[2] == scope:
+            matcher = cached[3]
+            changed = self.get_termbase_terms_changed_since(cached[1])
+            if changed:
+                matcher.remove_where(lambda entry: entry[0] in changed)
+                self._load_termbase_matcher_terms(matcher, source_lang, target_lang, project_id,
+                                                  min_length, bidirectional, term_ids=changed)
+        else:
+            matcher = TermMatcher(word_boundaries=True)
+            self._load_termbase_matcher_terms(matcher, source_lang, target_lang, project_id,
+                                              min_length, bidirectional)
+
+        self._termbase_matchers.pop(key, None)
+        while len(self._termbase_matchers) >= TERMBASE_MATCHER_CACHE_SIZE:
+            self._termbase_matchers.pop(next(iter(self._termbase_matchers)))
+        self._termbase_matchers[key] = (watermark['generation'], watermark, scope, matcher)
+        return matcher
+
+    def _load_termbase_matcher_terms(self, matcher: TermMatcher, source_lang: str, target_lang: str,
+                                     project_id: str, min_length: int, bidirectional: bool,
+                                     term_ids: Iterable[int] = None):
+        """Add the matching terms (all, or only term_ids) to a get_termbase_matcher() matcher"""
+        project_param = project_id if project_id else 0
+        id_chunks = [None]
+        if term_ids is not None:
+            term_ids = list(term_ids)
+            id_chunks = [term_ids[i:i + 500] for i in range(0, len(term_ids), 500)]
+        for reverse in ((False, True) if bidirectional else (False,)):
+            term_column = 'target_term' if reverse else 'source_term'
+            filter_sql, filter_params = self._termbase_filter_sql(
+                reverse, source_lang, target_lang, project_id, min_length)
+            for chunk in id_chunks:
+                id_sql = f" AND t.id IN ({', '.join('?' * len(chunk))})" if chunk else ""
+                self.cursor.execute(f"""
+                    SELECT t.id, t.{term_column}
+                    FROM termbase_terms t
+                    LEFT JOIN termbases tb ON t.termbase_id = tb.id
+                    LEFT JOIN termbase_activation ta ON ta.termbase_id = tb.id AND ta.project_id = ? AND ta.is_active = 1
+                    WHERE 1=1{id_sql}{filter_sql}
+                """, [project_param] + (chunk or []) + filter_params)
+                for term_id, term in self.cursor.fetchall():
+                    normalized = (term or '').lower().strip(TERMLENS_STRIP_CHARS)
+                    matcher.add((term_id, reverse), normalized)
+
+    def _termbase_scope(self) -> tuple:
+        """Termbase languages, types and activations (changes here can affect every term)"""
+        self.cursor.execute("SELECT id, source_lang, target_lang, is_project_termbase FROM termbases ORDER BY id")
+        termbases = tuple(tuple(row) for row in self.cursor.fetchall())
+        self.cursor.execute("""
+            SELECT termbase_id, project_id, is_active FROM termbase_activation
+            ORDER BY termbase_id, project_id
+        """)
+        return termbases, tuple(tuple(row) for row in self.cursor.fetchall())
+
+    def search_termbases_in_text(self, text: str, source_lang: str = None,
+                                 target_lang: str = None, project_id: str = None,
+                                 min_length: int = 0, bidirectional: bool = True) -> List[Dict]:
+        """
+        Find every termbase term that occurs in a text, in one pass.
 
+        Replaces calling search_termbases() for each word and n-gram of a
+        segment. A term matches if, with TERMLENS_STRIP_CHARS stripped from both
+        ends, it occurs in the lowercased text on word boundaries; quote
+        characters in the text count as spaces. Matched terms are then loaded
+        by id in one query.
+
+        Args:
+            text: Segment text
+            source_lang, target_lang, project_id, min_length, bidirectional:
+                as for search_termbases()
+
+        Returns:
+            Termbase hits like search_termbases(), ordered by ranking and source term
+        """
+        if not text:
+            return []
+        matcher = self.get_termbase_matcher(source_lang, target_lang, project_id,
+                                            min_length, bidirectional)
+        if not matcher:
+            return []
+
+        text_lower = text.lower()
+        normalized_text = text_lower
+        for quote_char in QUOTE_CHARS:
+            normalized_text = normalized_text.replace(quote_char, ' ')
+
+        hits = {False: set(), True: set()}
+        for term_id, reverse in matcher.search(normalized_text):
+            hits[reverse].add(term_id)
+        if normalized_text != text_lower:
+            for term_id, reverse in matcher.search(text_lower):
+                hits[reverse].add(term_id)
+
+        project_param = project_id if project_id else 0
+        rows = []
+        for reverse, term_ids in hits.items():
+            term_ids = list(term_ids)
+            filter_sql, filter_params = self._termbase_filter_sql(
+                reverse, source_lang, target_lang, project_id, min_length)
+            for start in range(0, len(term_ids), 500):
+                chunk = term_ids[start:start + 500]
+                self.cursor.execute(
+                    self._termbase_select_sql(reverse)
+                    + f" WHERE t.id IN ({', '.join('?' * len(chunk))})" + filter_sql,
+                    [project_param] + chunk + filter_params)
+                rows.extend(self.cursor.fetchall())
+
+        rows.sort(key=lambda row: (-(row['ranking'] or 0), row['source_term'] or ''))
+        return self._termbase_results(rows)
+
+    def get_termbase_match_details(self, term_ids: Iterable[int],
+                                   project_id: Optional[int] = None) -> Dict[int, Dict]:
+        """
+        Load the match dicts for terms found by an id-only in-memory index.
+
+        Args:
+            term_ids: Ids of the matched terms
+            project_id: Project whose termbase activation and priorities apply
+
+        Returns:
+            {term_id: {'source', 'translation', 'term_id', 'termbase_id',
+            'termbase_name', 'ranking', 'is_project_termbase', 'forbidden',
+            'domain', 'notes', 'project', 'client'}}. Deleted terms and terms
+            of termbases that are no longer active are left out.
+        """
+        term_ids = list(term_ids)
+        details = {}
+        for start in range(0, len(term_ids), 500):
+            chunk = term_ids[start:start + 500]
+            self.cursor.execute(f"""
+                SELECT
+                    t.id, t.source_term, t.target_term, t.termbase_id,
+                    t.domain, t.notes, t.project, t.client, t.forbidden,
+                    tb.is_project_termbase, tb.name as termbase_name,
+                    CASE WHEN COALESCE(ta.priority, 0) = 1 OR tb.is_project_termbase = 1 THEN 1 ELSE 0 END as ranking
+                FROM termbase_terms t
+                LEFT JOIN termbases tb ON t.termbase_id = tb.id
+                LEFT JOIN termbase_activation ta ON ta.termbase_id = tb.id
+                    AND ta.project_id = ? AND ta.is_active = 1
+                WHERE t.id IN ({', '.join('?' * len(chunk))})
+                    AND (ta.is_active = 1 OR tb.is_project_termbase = 1)
+            """, [project_id or 0] + chunk)
+            for row in self.cursor.fetchall():
+                details[row[0]] = {
+                    'source': row[1],
+                    'translation': row[2],
+                    'term_id': row[0],
+                    'termbase_id': row[3],
+                    'termbase_name': row[10],
+                    'ranking': row[11],
+                    'is_project_termbase': row[9],
+                    'forbidden': row[8],
+                    'domain': row[4],
+                    'notes': row[5],
+                    'project': row[6],
+                    'client': row[7],
+                }
+        return details
+
+    def get_termbase_qa_terms(self, project_id: Optional[int] = None) -> List[Dict]:
+        """
+        Load every term of the project's active termbases with its synonyms,
+        for the terminology QA check (modules/term_qa.py).
+
+        Args:
+            project_id: Project whose termbase activation applies
+
+        Returns:
+            List of {'term_id', 'source_term', 'target_term', 'forbidden',
+            'termbase_id', 'termbase_name', 'source_synonyms', 'target_synonyms'}
+            - synonyms are (synonym_text, forbidden) pairs in display order
+        """
+        self.cursor.execute("""
+            SELECT t.id, t.source_term, t.target_term, t.forbidden, t.termbase_id, tb.name
+            FROM termbase_terms t
+            LEFT JOIN termbases tb ON t.termbase_id = tb.id
+            LEFT JOIN termbase_activation ta ON ta.termbase_id = tb.id
+                AND ta.project_id = ? AND ta.is_active = 1
+            WHERE (ta.is_active = 1 OR tb.is_project_termbase = 1)
+            ORDER BY (COALESCE(ta.priority, 0) = 1 OR tb.is_project_termbase = 1) DESC, t.id
+        """, (project_id or 0,))
+        terms = {}
         for row in self.cursor.fetchall():
-            result_dict = dict(row)
+            terms[row[0]] = {
+                'term_id': row[0],
+                'source_term': row[1],
+                'target_term': row[2],
+                'forbidden': bool(row[3]),
+                'termbase_id': row[4],
+                'termbase_name': row[5] or '',
+                'source_synonyms': [],
+                'target_synonyms': [],
+            }
+        if terms:
+            # One pass over the synonyms table beats thousands of IN (...) chunks
+            self.cursor.execute("""
+                SELECT term_id, language, synonym_text, forbidden FROM termbase_synonyms
+                ORDER BY term_id, display_order ASC
+            """)
+            for term_id, language, synonym_text, forbidden in self.cursor.fetchall():
+                term = terms.get(term_id)
+                if term is not None and synonym_text:
+                    key = 'source_synonyms' if language == 'source' else 'target_synonyms'
+                    term[key].append((synonym_text, bool(forbidden)))
+        return list(terms.values())
 
-            # Deduplicate: same term pair from same termbase should only appear once
-            # Prefer 'source' match over 'target' match
-            combo_key = (
-                result_dict.get('source_term', '').lower(),
-                result_dict.get('target_term', '').lower(),
-                result_dict.get('termbase_id')
-            )
-            if combo_key in seen_combinations:
-                continue
-            seen_combinations.add(combo_key)
+    def _termbase_search_ids_sql(self, query: str, search_source: bool, search_target: bool,
+                                 include_synonyms: bool, match: str) -> Tuple[str, list, bool]:
+        """
+        SELECT of (id, rank) for the terms matching a query - see search_termbase_terms().
+        Uses the FTS5 indexes; falls back to LIKE scans where they can't answer.
 
-            # SQLite stores booleans as 0/1, explicitly convert to Python bool
-            if 'is_project_termbase' in result_dict:
-                result_dict['is_project_termbase'] = bool(result_dict['is_project_termbase'])
+        Returns: (SQL, params, ranked) - ranked is True if rank orders the matches
+        """
+        sides = [side for side, wanted in (('source', search_source), ('target', search_target)) if wanted]
+        columns = [f"{side}_term" for side in sides]
+        trigram = self.has_termbase_trigram_index()
+        if match not in ('prefix', 'substring', 'fuzzy'):
+            raise ValueError(f"Unknown termbase match mode: {match}")
 
-            # Fetch target synonyms for this term and include them in the result
-            term_id = result_dict.get('id')
-            match_direction = result_dict.get('match_direction', 'source')
-            if term_id:
-                try:
-                    # For reverse matches, fetch 'source' synonyms since they become targets
-                    synonym_lang = 'source' if match_direction == 'target' else 'target'
-                    self.cursor.execute("""
-                        SELECT synonym_text, forbidden FROM termbase_synonyms
-                        WHERE term_id = ? AND language = ?
-                        ORDER BY display_order ASC
-                    """, (term_id, synonym_lang))
-                    synonyms = []
-                    for syn_row in self.cursor.fetchall():
-                        syn_text = syn_row[0]
-                        syn_forbidden = bool(syn_row[1])
-                        if not syn_forbidden:  # Only include non-forbidden synonyms
-                            synonyms.append(syn_text)
-                    result_dict['target_synonyms'] = synonyms
-                except Exception:
-                    result_dict['target_synonyms'] = []
+        text = query.strip()
+        words = _fts_words(text)
+        tables, expression = TERMBASE_FTS_TABLES, None
+        if match == 'fuzzy' and trigram and len(text) >= 3:
+            text_lower = text.lower()
+            grams = dict.fromkeys(text_lower[i:i + 3] for i in range(len(text_lower) - 2))
+            tables, expression = TERMBASE_TRIGRAM_TABLES, ' OR '.join(_fts_phrase(g) for g in grams)
+        elif match == 'fuzzy' and words:
+            expression = ' OR '.join(f"{_fts_phrase(w)}*" for w in words)
+        elif match == 'substring' and trigram and len(text) >= 3:
+            tables, expression = TERMBASE_TRIGRAM_TABLES, _fts_phrase(text)
+        elif match != 'substring' and words:
+            expression = ' '.join(f"{_fts_phrase(w)}*" for w in words)
 
-            results.append(result_dict)
-        return results
+        existing = set(self._fts5_tables())
+        language_sql = f"language IN ({', '.join('?' * len(sides))})"
+        parts, params = [], []
+        if expression is not None:
+            (terms_fts, _, _), (synonyms_fts, _, _) = tables
+            parts.append(f"SELECT rowid AS id, rank FROM {terms_fts} WHERE {terms_fts} MATCH ?")
+            params.append(' OR '.join(f"{column} : ({expression})" for column in columns))
+            if include_synonyms and synonyms_fts in existing:
+                parts.append(f"""
+                    SELECT s.term_id AS id, {synonyms_fts}.rank AS rank FROM {synonyms_fts}
+                    JOIN termbase_synonyms s ON s.id = {synonyms_fts}.rowid
+                    WHERE {synonyms_fts} MATCH ? AND s.{language_sql}""")
+                params += [expression] + sides
+            return ' UNION ALL '.join(parts), params, match == 'fuzzy'
+
+        # Substring search without the trigram index, or a query without words
+        # (LIKE is case-insensitive for ASCII, as the filters it replaces)
+        pattern = '%' + text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        parts.append("SELECT id, 0 AS rank FROM termbase_terms WHERE "
+                     + ' OR '.join(f"{column} LIKE ? ESCAPE '\\'" for column in columns))
+        params += [pattern] * len(columns)
+        if include_synonyms:
+            parts.append(f"SELECT term_id AS id, 0 AS rank FROM termbase_synonyms "
+                         f"WHERE {language_sql} AND synonym_text LIKE ? ESCAPE '\\'")
+            params += sides + [pattern]
+        return ' UNION ALL '.join(parts), params, False
+
+    def _termbase_term_rows(self, ids_sql: str, params: list, termbase_ids: Optional[Iterable[int]],
+                            ranked: bool = False, limit: Optional[int] = None, offset: int = 0) -> List[Dict]:
+        """Load the terms selected by ids_sql (id, rank), driven by the matches"""
+        sql = f"""
+            SELECT t.id, t.termbase_id, t.source_term, t.target_term, t.source_lang, t.target_lang,
+                   t.domain, t.definition, t.notes, t.project, t.client, t.forbidden, t.term_uuid,
+                   MIN(m.rank) AS rank
+            FROM ({ids_sql}) m CROSS JOIN termbase_terms t ON t.id = m.id"""
+        params = list(params)
+        if termbase_ids is not None:
+            termbase_ids = [int(tb_id) for tb_id in termbase_ids]
+            sql += f" WHERE t.termbase_id IN ({', '.join('?' * len(termbase_ids))})"
+            params += termbase_ids
+        sql += " GROUP BY t.id ORDER BY " + ("MIN(m.rank), t.source_term" if ranked else "t.source_term")
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+        self.cursor.execute(sql, params)
+        return [dict(row) for row in self.cursor.fetchall()]
+
+    def search_termbase_terms(self, query: str, termbase_ids: Optional[Iterable[int]] = None,
+                              search_source: bool = True, search_target: bool = True,
+                              include_synonyms: bool = False, match: str = 'substring',
+                              limit: Optional[int] = TERMBASE_SEARCH_MAX_RESULTS,
+                              offset: int = 0) -> List[Dict]:
+        """
+        Search termbase terms with the FTS5 indexes (Superlookup, termbase
+        editor filter, TermbaseManager.search_termbase()).
+
+        Args:
+            query: Search text
+            termbase_ids: Termbases to search (None = all)
+            search_source: Search source terms (and source synonyms)
+            search_target: Search target terms (and target synonyms)
+            include_synonyms: Also return terms with a matching synonym
+            match: 'prefix' - every word of the query starts a word of the term;
+                   'substring' (default) - the term contains the query, like
+                   the LIKE filters this replaces (trigram index for 3+
+                   characters, else a LIKE scan);
+                   'fuzzy' - terms sharing trigrams with the query, most similar
+                   first (without the trigram index: terms with any query word)
+            limit: Maximum number of terms (None = all)
+            offset: Number of terms to skip (paging)
+
+        Returns:
+            Term dicts (termbase_terms columns plus 'rank'), ordered by source
+            term ('fuzzy': best match first)
+        """
+        if not query or not query.strip() or not (search_source or search_target):
+            return []
+        ids_sql, params, ranked = self._termbase_search_ids_sql(
+            query, search_source, search_target, include_synonyms, match)
+        return self._termbase_term_rows(ids_sql, params, termbase_ids, ranked, limit, offset)
+
+    def count_termbase_terms(self, query: str, termbase_ids: Optional[Iterable[int]] = None,
+                             search_source: bool = True, search_target: bool = True,
+                             include_synonyms: bool = False, match: str = 'substring') -> int:
+        """Number of terms search_termbase_terms() finds without a limit"""
+        if not query or not query.strip() or not (search_source or search_target):
+            return 0
+        ids_sql, params, _ = self._termbase_search_ids_sql(
+            query, search_source, search_target, include_synonyms, match)
+        sql = f"SELECT COUNT(DISTINCT t.id) FROM ({ids_sql}) m CROSS JOIN termbase_terms t ON t.id = m.id"
+        params = list(params)
+        if termbase_ids is not None:
+            termbase_ids = [int(tb_id) for tb_id in termbase_ids]
+            sql += f" WHERE t.termbase_id IN ({', '.join('?' * len(termbase_ids))})"
+            params += termbase_ids
+        self.cursor.execute(sql, params)
+        return self.cursor.fetchone()[0]
+
+    def search_termbase_terms_in_text(self, text: str, termbase_ids: Optional[Iterable[int]] = None,
+                                      search_source: bool = True, search_target: bool = True,
+                                      max_words: int = TERMBASE_TEXT_MAX_WORDS) -> List[Dict]:
+        """
+        Find the terms that occur in a text as whole words, for explicit
+        termbase selections (search_termbases_in_text() covers activated termbases).
+
+        Every run of up to max_words words of the text is looked up in the
+        normalized-term indexes (idx_gt_source_term_norm / idx_gt_target_term_norm), with
+        quotes and brackets stripped from its ends and trailing punctuation
+        trimmed like the terms.
+
+        Args:
+            text: Text to search
+            termbase_ids: Termbases to search (None = all)
+            search_source: Find source terms
+            search_target: Find target terms
+            max_words: Longest term to find, in words
+
+        Returns:
+            Term dicts like search_termbase_terms(), ordered by source term
+        """
+        words = text.split() if text else []
+        keys = set()
+        for start in range(len(words)):
+            for end in range(start + 1, min(start + max_words, len(words)) + 1):
+                key = ' '.join(words[start:end]).lstrip(TERMBASE_NGRAM_STRIP_CHARS)
+                key = key.rstrip(TERMBASE_NGRAM_STRIP_CHARS + TERMBASE_TRIM_CHARS)
+                if key:
+                    keys.add(_termbase_norm(key))
+        columns = [column for column, wanted in (('source_term', search_source), ('target_term', search_target))
+                   if wanted]
+        if not keys or not columns:
+            return []
+
+        keys = sorted(keys)
+        found = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ', '.join('?' * len(chunk))
+            ids_sql = ' UNION '.join(f"SELECT id, 0 AS rank FROM termbase_terms "
+                                     f"WHERE {column}_norm IN ({placeholders})"
+                                     for column in columns)
+            for row in self._termbase_term_rows(ids_sql, chunk * len(columns), termbase_ids):
+                found[row['id']] = row
+        return sorted(found.values(), key=lambda row: row['source_term'] or '')
+
+    def bulk_import_termbase_terms(self, termbase_id: int, rows: Iterable[Dict],
+                                   skip_duplicates: bool = True,
+                                   update_duplicates: bool = False,
+                                   update_columns: Iterable[str] = TERMBASE_BULK_UPDATE_COLUMNS) -> Dict:
+        """
+        Import terms into a termbase in a single transaction.
+
+        Rows are streamed into a temporary staging table with executemany();
+        duplicates are then resolved with a few set-based statements instead
+        of one lookup (and one commit) per term:
+
+        - a row whose term UUID, or else whose source term (case-insensitive),
+          already exists in the termbase is skipped, or updates that term
+          when update_duplicates is set (the newest term with that source;
+          the last such row wins)
+        - a new row whose source + target pair already exists in the termbase
+          or earlier in the file is skipped
+        - a new row whose term UUID is already in use (e.g. a glossary
+          exported from another termbase) gets a new UUID
+
+        New terms and their synonyms are inserted in one statement each. Large
+        imports drop the termbase_terms indexes and rebuild them at the end.
+        On any failure the whole import is rolled back.
+
+        Args:
+            termbase_id: Target termbase ID
+            rows: Dicts with 'line', 'source_term', 'target_term' and optional
+                  'domain', 'notes', 'project', 'client', 'forbidden', 'term_uuid',
+                  'source_synonyms' / 'target_synonyms' (lists of (text, forbidden))
+            skip_duplicates: Match rows against existing terms (UUID / source term)
+            update_duplicates: Update matched terms instead of skipping them
+            update_columns: Columns updated on matched terms
+
+        Returns:
+            Dict with 'imported', 'updated' and 'skipped' counts
+        """
+        update_columns = [c for c in update_columns if c in TERMBASE_BULK_UPDATE_COLUMNS]
+        self.connection.create_function('unicode_lower', 1, _unicode_lower, deterministic=True)
+        if self.connection.in_transaction:
+            self.connection.commit()
+        cursor = self.cursor
+        deferred = []
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute("DROP TABLE IF EXISTS temp.termbase_import_staging")
+            cursor.execute("DROP TABLE IF EXISTS temp.termbase_import_synonyms")
+            cursor.execute("DROP TABLE IF EXISTS temp.termbase_import_existing")
+            cursor.execute("""
+                CREATE TEMP TABLE termbase_import_staging (
+                    line INTEGER PRIMARY KEY,
+                    source_term TEXT, target_term TEXT,
+                    source_key TEXT, target_key TEXT,
+                    domain TEXT, notes TEXT, project TEXT, client TEXT,
+                    forbidden INTEGER,
+                    term_uuid TEXT,
+                    existing_id INTEGER,
+                    action TEXT,          -- insert / update / skip
+                    term_id INTEGER
+                )
+            """)
+            cursor.execute("""
+                CREATE TEMP TABLE termbase_import_synonyms (
+                    line INTEGER, synonym_text TEXT, language TEXT,
+                    display_order INTEGER, forbidden INTEGER
+                )
+            """)
+
+            # 1. Stream rows into the staging tables
+            staged, synonyms = [], []
+            for row in rows:
+                source_term, target_term = row['source_term'], row['target_term']
+                term_uuid = row.get('term_uuid') or None
+                staged.append((row['line'], source_term, target_term,
+                               source_term.lower(), target_term.lower(),
+                               row.get('domain', ''), row.get('notes', ''),
+                               row.get('project', ''), row.get('client', ''),
+                               1 if row.get('forbidden') else 0, term_uuid))
+                for language in ('source', 'target'):
+                    for order, (text, forbidden) in enumerate(row.get(f'{language}_synonyms') or ()):
+                        synonyms.append((row['line'], text, language, order, 1 if forbidden else 0))
+                if len(staged) >= TERMBASE_BULK_CHUNK_SIZE:
+                    self._stage_termbase_import(staged, synonyms)
+                    staged, synonyms = [], []
+            self._stage_termbase_import(staged, synonyms)
+
+            cursor.execute("CREATE INDEX temp.idx_tbi_staging_pair ON termbase_import_staging(source_key, target_key, line)")
+            cursor.execute("CREATE INDEX temp.idx_tbi_staging_uuid ON termbase_import_staging(term_uuid)")
+
+            # 2. Existing terms of this termbase, keyed like the staged rows
+            cursor.execute("""
+                CREATE TEMP TABLE termbase_import_existing AS
+                SELECT id, unicode_lower(source_term) AS source_key,
+                       unicode_lower(target_term) AS target_key, term_uuid
+                FROM termbase_terms WHERE termbase_id = ?
+            """, (termbase_id,))
+            cursor.execute("CREATE INDEX temp.idx_tbi_existing_pair ON termbase_import_existing(source_key, target_key)")
+            cursor.execute("CREATE INDEX temp.idx_tbi_existing_uuid ON termbase_import_existing(term_uuid)")
+
+            # 3. Rows matching an existing term: update or skip
+            if skip_duplicates or update_duplicates:
+                cursor.execute("""
+                    UPDATE termbase_import_staging SET existing_id = (
+                        SELECT MIN(e.id) FROM termbase_import_existing e
+                        WHERE e.term_uuid = termbase_import_staging.term_uuid)
+                    WHERE term_uuid IS NOT NULL
+                """)
+                cursor.execute("""
+                    UPDATE termbase_import_staging SET existing_id = (
+                        SELECT MAX(e.id) FROM termbase_import_existing e
+                        WHERE e.source_key = termbase_import_staging.source_key)
+                    WHERE existing_id IS NULL
+                """)
+                cursor.execute("UPDATE termbase_import_staging SET action = ? WHERE existing_id IS NOT NULL",
+                               ('update' if update_duplicates else 'skip',))
+
+            # 4. New rows: skip repeated source + target pairs, drop UUIDs already in use
+            cursor.execute("""
+                UPDATE termbase_import_staging SET action = 'skip'
+                WHERE action IS NULL AND (
+                    EXISTS (SELECT 1 FROM termbase_import_existing e
+                            WHERE e.source_key = termbase_import_staging.source_key
+                            AND e.target_key = termbase_import_staging.target_key)
+                    OR EXISTS (SELECT 1 FROM termbase_import_staging s
+                               WHERE s.source_key = termbase_import_staging.source_key
+                               AND s.target_key = termbase_import_staging.target_key
+                               AND s.line < termbase_import_staging.line))
+            """)
+            cursor.execute("""
+                UPDATE termbase_import_staging SET term_uuid = NULL
+                WHERE action IS NULL AND term_uuid IS NOT NULL AND (
+                    term_uuid IN (SELECT t.term_uuid FROM termbase_terms t
+                                  WHERE t.term_uuid IN (SELECT term_uuid FROM termbase_import_staging))
+                    OR EXISTS (SELECT 1 FROM termbase_import_staging s
+                               WHERE s.term_uuid = termbase_import_staging.term_uuid
+                               AND s.line < termbase_import_staging.line
+                               AND s.action IS NULL))
+            """)
+            cursor.execute("UPDATE termbase_import_staging SET action = 'insert' WHERE action IS NULL")
+
+            # 5. Number the new terms in file order (explicit ids link the synonyms)
+            cursor.execute("""
+                SELECT MAX(COALESCE((SELECT MAX(id) FROM termbase_terms), 0),
+                           COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'termbase_terms'), 0))
+            """)
+            last_id = cursor.fetchone()[0]
+            cursor.execute("""
+                UPDATE termbase_import_staging SET term_id = ? + numbered.n
+                FROM (SELECT line, ROW_NUMBER() OVER (ORDER BY line) AS n
+                      FROM termbase_import_staging WHERE action = 'insert') AS numbered
+                WHERE termbase_import_staging.line = numbered.line
+            """, (last_id,))
+            cursor.execute("SELECT COUNT(*) FROM termbase_import_staging WHERE action = 'insert'")
+            insert_count = cursor.fetchone()[0]
+
+            cursor.execute("SELECT COUNT(*) FROM termbase_terms")
+            table_rows = cursor.fetchone()[0]
+            if insert_count >= TERMBASE_BULK_DEFER_MIN_ROWS and insert_count * 4 >= table_rows:
+                cursor.execute("SELECT COALESCE(MAX(id), 0) FROM termbase_synonyms")
+                last_synonym_id = cursor.fetchone()[0]
+                deferred = self._drop_termbase_term_indexes()
+
+            # 6. Write: new terms, their synonyms, updated terms
+            cursor.execute(f"""
+                INSERT INTO termbase_terms
+                (id, termbase_id, source_term, target_term, domain, notes,
+                 project, client, forbidden, source_lang, target_lang, term_uuid,
+                 source_term_norm, target_term_norm)
+                SELECT term_id, ?, source_term, target_term, domain, notes,
+                       project, client, forbidden, NULL, NULL, COALESCE(term_uuid, {SQL_UUID4}),
+                       termbase_norm(source_term), termbase_norm(target_term)
+                FROM termbase_import_staging WHERE action = 'insert' ORDER BY term_id
+            """, (termbase_id,))
+            cursor.execute("""
+                INSERT INTO termbase_synonyms (term_id, synonym_text, language, display_order, forbidden)
+                SELECT s.term_id, y.synonym_text, y.language, MIN(y.display_order), y.forbidden
+                FROM termbase_import_synonyms y
+                JOIN termbase_import_staging s ON s.line = y.line
+                WHERE s.action = 'insert' AND y.synonym_text != ''
+                GROUP BY s.term_id, y.synonym_text, y.language
+            """)
+            if update_columns:
+                cursor.execute(f"""
+                    UPDATE termbase_terms SET {', '.join(f'{c} = latest.{c}' for c in update_columns)}
+                    FROM (SELECT s.* FROM termbase_import_staging s
+                          WHERE s.action = 'update' AND s.line = (
+                              SELECT MAX(s2.line) FROM termbase_import_staging s2
+                              WHERE s2.existing_id = s.existing_id AND s2.action = 'update')) AS latest
+                    WHERE termbase_terms.id = latest.existing_id
+                """)
+
+            if deferred:
+                self._restore_termbase_term_indexes(deferred, last_id, last_synonym_id)
+                deferred = []
+
+            cursor.execute("SELECT action, COUNT(*) FROM termbase_import_staging GROUP BY action")
+            counts = {action: count for action, count in cursor.fetchall()}
+
+            cursor.execute("DROP TABLE temp.termbase_import_staging")
+            cursor.execute("DROP TABLE temp.termbase_import_synonyms")
+            cursor.execute("DROP TABLE temp.termbase_import_existing")
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+
+        imported = counts.get('insert', 0)
+        if self.performance_profile['analyze_after_import'] and imported >= ANALYZE_MIN_ROWS:
+            self.analyze()
+        return {
+            'imported': imported,
+            'updated': counts.get('update', 0),
+            'skipped': counts.get('skip', 0),
+        }
+
+    def _stage_termbase_import(self, staged: list, synonyms: list):
+        """Write a chunk of rows to the bulk import staging tables"""
+        if staged:
+            self.cursor.executemany(
+                "INSERT OR REPLACE INTO termbase_import_staging "
+                "(line, source_term, target_term, source_key, target_key, domain, notes, "
+                "project, client, forbidden, term_uuid) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", staged)
+        if synonyms:
+            self.cursor.executemany(
+                "INSERT INTO termbase_import_synonyms VALUES (?, ?, ?, ?, ?)", synonyms)
+
+    def _drop_termbase_term_indexes(self) -> List[Tuple[str, str]]:
+        """
+        Drop the secondary indexes of termbase_terms and the per-row insert
+        triggers (normalized terms and word suffixes, FTS5 indexes of terms and
+        synonyms) inside the current transaction; the import inserts the
+        normalized terms itself.
+
+        Returns: (type, sql) of what was dropped, for _restore_termbase_term_indexes()
+        """
+        insert_triggers = ['tb_term_norm_insert'] + [f"{fts_table}_insert" for fts_table, _, _ in
+                                                     TERMBASE_FTS_TABLES + TERMBASE_TRIGRAM_TABLES]
+        self.cursor.execute(f"""
+            SELECT type, name, sql FROM sqlite_master
+            WHERE sql IS NOT NULL AND ((tbl_name = 'termbase_terms' AND type = 'index')
+                  OR (type = 'trigger' AND name IN ({', '.join('?' * len(insert_triggers))})))
+        """, insert_triggers)
+        dropped = []
+        for kind, name, sql in self.cursor.fetchall():
+            self.cursor.execute(f"DROP {kind.upper()} {name}")
+            dropped.append((kind, sql))
+        return dropped
+
+    def _restore_termbase_term_indexes(self, dropped: List[Tuple[str, str]], last_id: int,
+                                       last_synonym_id: int):
+        """Recreate what _drop_termbase_term_indexes() dropped and index the
+        terms (id > last_id) and synonyms (id > last_synonym_id) added meanwhile"""
+        for kind, sql in dropped:
+            self.cursor.execute(sql)
+        self.cursor.execute(TERMBASE_SUFFIX_BULK_SQL, (last_id, last_id))
+        for fts_table, content_table, columns in self._termbase_fts_specs():
+            self.cursor.execute(f"""
+                INSERT INTO {fts_table}(rowid, {', '.join(columns)})
+                SELECT id, {', '.join(columns)} FROM {content_table} WHERE id > ?
+            """, (last_synonym_id if content_table == 'termbase_synonyms' else last_id,))
     
     # ============================================
     # UTILITY METHODS
@@ -2208,6 +3904,118 @@ class DatabaseManager:
         """Optimize database (VACUUM)"""
         self.cursor.execute("VACUUM")
         self.connection.commit()
+
+    # ============================================
+    # PERFORMANCE PROFILE & MAINTENANCE
+    # ============================================
+
+    def set_performance_profile(self, profile):
+        """
+        Switch the SQLite performance profile (page cache, mmap, synchronous, ...).
+
+        Args:
+            profile: Profile name ('default', 'low_memory', 'legacy') or dict of
+                     overrides on the default profile
+        """
+        resolved = resolve_profile(profile)
+        if resolved == self.performance_profile:
+            return
+        self.performance_profile = resolved
+        # Applies the pragmas to the writer (our connection) and pooled readers
+        if self.pool.profile != resolved:
+            self.pool.configure(resolved)
+
+    def analyze(self):
+        """
+        Refresh query planner statistics (ANALYZE).
+
+        Bounded by the profile's analysis_limit, so it stays fast on large
+        databases. Runs automatically after bulk imports.
+        """
+        try:
+            self.connection.execute("ANALYZE")
+            self.connection.commit()
+        except sqlite3.Error as e:
+            self.log(f"[WARNING] ANALYZE failed: {e}")
+
+    def _fts5_tables(self) -> List[str]:
+        """Names of the FTS5 tables in this database"""
+        self.cursor.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type = 'table' AND sql LIKE '%USING fts5%'
+        """)
+        return [row[0] for row in self.cursor.fetchall()]
+
+    def optimize_fts_indexes(self, mode: str = 'optimize', merge_pages: int = 500) -> List[str]:
+        """
+        Compact the FTS5 indexes (translation units, termbase terms).
+
+        Args:
+            mode: 'optimize' merges every index b-tree into one (best query speed,
+                  rewrites the whole index); 'merge' does a bounded incremental
+                  merge of merge_pages pages per table (cheap, can run often)
+            merge_pages: Page budget for 'merge'
+
+        Returns: Names of the FTS5 tables processed
+        """
+        if mode not in ('optimize', 'merge'):
+            raise ValueError(f"Unknown FTS maintenance mode: {mode}")
+        tables = self._fts5_tables()
+        for table in tables:
+            if mode == 'optimize':
+                self.cursor.execute(f"INSERT INTO {table}({table}) VALUES('optimize')")
+            else:
+                self.cursor.execute(f"INSERT INTO {table}({table}, rank) VALUES('merge', ?)",
+                                    (int(merge_pages),))
+        self.connection.commit()
+        return tables
+
+    def maintenance(self, vacuum: bool = True, fts_mode: str = 'optimize',
+                    analyze: bool = True) -> Dict:
+        """
+        Full database maintenance: compact FTS5 indexes, refresh planner
+        statistics, VACUUM and truncate the WAL file.
+
+        Slow on large databases (VACUUM rewrites the file) - run on demand,
+        not during translation work.
+
+        Args:
+            vacuum: Run VACUUM
+            fts_mode: 'optimize', 'merge' or None to skip FTS5 maintenance
+            analyze: Run ANALYZE
+
+        Returns: Dict with seconds per step and size before/after (bytes)
+        """
+        import time
+
+        report = {'size_before': os.path.getsize(self.db_path) if os.path.exists(self.db_path) else 0}
+
+        # Write pending usage counts first so VACUUM sees the final data
+        self.flush_usage_counts()
+
+        if fts_mode:
+            start = time.perf_counter()
+            report['fts_tables'] = self.optimize_fts_indexes(fts_mode)
+            report['fts_seconds'] = time.perf_counter() - start
+
+        if analyze:
+            start = time.perf_counter()
+            self.analyze()
+            report['analyze_seconds'] = time.perf_counter() - start
+
+        if vacuum:
+            start = time.perf_counter()
+            self.vacuum()
+            report['vacuum_seconds'] = time.perf_counter() - start
+
+        # Fold the WAL back into the database file and truncate it
+        self.cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self.cursor.fetchall()
+
+        report['size_after'] = os.path.getsize(self.db_path) if os.path.exists(self.db_path) else 0
+        self.log(f"[OK] Database maintenance complete: {report['size_before'] / 1e6:.1f} MB -> "
+                 f"{report['size_after'] / 1e6:.1f} MB")
+        return report
     
     # ============================================
     # TMX EDITOR METHODS (database-backed TMX files)
@@ -4,6 +4,7 @@ Database Migration Functions
 Handles schema updates and data migrations for the Supervertaler database.
 """
 
+import re
 import sqlite3
 from typing import Optional
 
@@ -191,6 +192,22 @@ def run_all_migrations(db_manager) -> bool:
     if not migrate_termbase_ai_inject(db_manager):
         success = False
 
+    # Migration 5: Add normalized base-language columns to translation_units
+    if not migrate_tm_lang_base_columns(db_manager):
+        success = False
+
+    # Migration 6: Add target_hash to translation_units (reverse exact matches)
+    if not migrate_tm_target_hash(db_manager):
+        success = False
+
+    # Migration 7: termbase_terms.termbase_id as INTEGER foreign key + word suffixes
+    if not migrate_termbase_integer_fk(db_manager):
+        success = False
+
+    # Migration 8: casefolded normalized term columns (termbase search)
+    if not migrate_termbase_norm_columns(db_manager):
+        success = False
+
     print("="*60)
 
     return success
@@ -235,6 +252,12 @@ def check_and_migrate(db_manager) -> bool:
         termbase_columns = {row[1] for row in cursor.fetchall()}
         needs_ai_inject = 'ai_inject' not in termbase_columns
 
+        # Check if translation_units has populated, indexed base-language columns
+        needs_lang_base = tm_lang_base_migration_needed(cursor)
+        needs_target_hash = tm_target_hash_migration_needed(cursor)
+        needs_termbase_fk = termbase_fk_migration_needed(cursor)
+        needs_termbase_norm = termbase_norm_migration_needed(cursor)
+
         if needs_migration:
             print(f"⚠️ Migration needed - missing columns: {', '.join([c for c in ['project', 'client', 'term_uuid', 'note'] if c not in columns])}")
 
@@ -244,7 +267,20 @@ def check_and_migrate(db_manager) -> bool:
         if needs_ai_inject:
             print("⚠️ Migration needed - termbases.ai_inject column missing")
 
-        if needs_migration or needs_synonyms_table or needs_ai_inject:
+        if needs_lang_base:
+            print("⚠️ Migration needed - translation_units base-language columns missing or incomplete")
+
+        if needs_target_hash:
+            print("⚠️ Migration needed - translation_units.target_hash column missing or incomplete")
+
+        if needs_termbase_fk:
+            print("⚠️ Migration needed - termbase_terms.termbase_id is not an integer foreign key")
+
+        if needs_termbase_norm:
+            print("⚠️ Migration needed - termbase_terms normalized term columns missing")
+
+        if (needs_migration or needs_synonyms_table or needs_ai_inject or needs_lang_base
+                or needs_target_hash or needs_termbase_fk or needs_termbase_norm):
             success = run_all_migrations(db_manager)
             if success:
                 # Generate UUIDs for terms that don't have them
@@ -363,6 +399,372 @@ def migrate_termbase_ai_inject(db_manager) -> bool:
         return False
 
 
+# Composite indexes over the base-language columns (created by migration 5)
+TM_LANG_BASE_INDEXES = {
+    # Exact matches: source_hash IN (...) AND langs AND tm_id IN (...)
+    'idx_tu_hash_langs': "translation_units(source_hash, source_lang_base, target_lang_base, tm_id)",
+    # Fuzzy/concordance candidate scans: langs AND tm_id IN (...)
+    'idx_tu_lang_base': "translation_units(source_lang_base, target_lang_base, tm_id)",
+    # Rows still waiting for a backfill (keeps the startup check cheap)
+    'idx_tu_lang_base_missing': "translation_units(id) WHERE source_lang_base IS NULL OR target_lang_base IS NULL",
+}
+
+
+def _translation_units_incomplete(cursor, columns, indexes, missing_where: str) -> bool:
+    """
+    Check whether translation_units lacks any of the given columns or indexes,
+    or has rows matching missing_where (values never filled in).
+    """
+    cursor.execute("PRAGMA table_info(translation_units)")
+    existing_columns = {row[1] for row in cursor.fetchall()}
+    if any(column not in existing_columns for column in columns):
+        return True
+
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='index' AND tbl_name='translation_units'
+    """)
+    existing_indexes = {row[0] for row in cursor.fetchall()}
+    if any(name not in existing_indexes for name in indexes):
+        return True
+
+    cursor.execute(f"SELECT 1 FROM translation_units WHERE {missing_where} LIMIT 1")
+    return cursor.fetchone() is not None
+
+
+def tm_lang_base_migration_needed(cursor) -> bool:
+    """
+    Check whether translation_units lacks the base-language columns or indexes,
+    or still has rows whose base languages were never filled in.
+    """
+    return _translation_units_incomplete(
+        cursor, ('source_lang_base', 'target_lang_base'), TM_LANG_BASE_INDEXES,
+        "source_lang_base IS NULL OR target_lang_base IS NULL")
+
+
+def migrate_tm_lang_base_columns(db_manager) -> bool:
+    """
+    Add source_lang_base/target_lang_base to translation_units, fill them in
+    and create the composite indexes used by TM lookups.
+
+    The columns hold get_base_lang_code() of the stored language codes
+    ('nl-BE', 'nl_NL' and 'Dutch' all become 'nl'), so match queries filter
+    with plain equality instead of OR/LIKE chains over every variant.
+
+    Args:
+        db_manager: DatabaseManager instance
+
+    Returns:
+        True if migration successful
+    """
+    try:
+        from modules.tmx_generator import get_base_lang_code
+
+        cursor = db_manager.cursor
+
+        # Check which columns exist
+        cursor.execute("PRAGMA table_info(translation_units)")
+        columns = {row[1] for row in cursor.fetchall()}
+
+        for column_name in ('source_lang_base', 'target_lang_base'):
+            if column_name not in columns:
+                print(f"📊 Adding column '{column_name}' to translation_units...")
+                cursor.execute(f"ALTER TABLE translation_units ADD COLUMN {column_name} TEXT")
+                print(f"  ✓ Column '{column_name}' added successfully")
+
+        # Backfill once per distinct language pair (uses idx_tu_langs)
+        cursor.execute("""
+            SELECT DISTINCT source_lang, target_lang FROM translation_units
+            WHERE source_lang_base IS NULL OR target_lang_base IS NULL
+        """)
+        pairs = cursor.fetchall()
+        updated = 0
+        for source_lang, target_lang in pairs:
+            cursor.execute("""
+                UPDATE translation_units
+                SET source_lang_base = ?, target_lang_base = ?
+                WHERE source_lang = ? AND target_lang = ?
+                  AND (source_lang_base IS NULL OR target_lang_base IS NULL)
+            """, (get_base_lang_code(source_lang), get_base_lang_code(target_lang),
+                  source_lang, target_lang))
+            updated += cursor.rowcount
+        if updated:
+            print(f"  ✓ Filled base languages for {updated} translation units ({len(pairs)} language pair(s))")
+
+        for index_name, definition in TM_LANG_BASE_INDEXES.items():
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {definition}")
+
+        db_manager.connection.commit()
+        print("✅ translation_units base-language columns and indexes are up to date")
+        return True
+
+    except Exception as e:
+        print(f"❌ Base-language migration failed: {e}")
+        import traceback
+        traceback.print_exc()
+        try:
+            db_manager.connection.rollback()
+        except Exception:
+            pass
+        return False
+
+
+# Indexes over target_hash (created by migration 6)
+TM_TARGET_HASH_INDEXES = {
+    # Reverse exact matches: target_hash IN (...) AND langs (swapped) AND tm_id IN (...)
+    'idx_tu_target_hash_langs': "translation_units(target_hash, source_lang_base, target_lang_base, tm_id)",
+    # Rows still waiting for a backfill (keeps the startup check cheap)
+    'idx_tu_target_hash_missing': "translation_units(id) WHERE target_hash IS NULL",
+}
+
+
+def tm_target_hash_migration_needed(cursor) -> bool:
+    """
+    Check whether translation_units lacks the target_hash column or indexes,
+    or still has rows without a target_hash.
+    """
+    return _translation_units_incomplete(
+        cursor, ('target_hash',), TM_TARGET_HASH_INDEXES, "target_hash IS NULL")
+
+
+def migrate_tm_target_hash(db_manager) -> bool:
+    """
+    Add target_hash to translation_units, fill it in and index it.
+
+    target_hash is computed like source_hash (MD5 of the normalized text), so
+    bidirectional exact matches look up our source text among TM targets
+    with the same four hash variants and an index search instead of
+    scanning target_text.
+
+    Args:
+        db_manager: DatabaseManager instance
+
+    Returns:
+        True if migration successful
+    """
+    try:
+        from modules.database_manager import _match_hash
+
+        cursor = db_manager.cursor
+
+        # Check which columns exist
+        cursor.execute("PRAGMA table_info(translation_units)")
+        columns = {row[1] for row in cursor.fetchall()}
+
+        if 'target_hash' not in columns:
+            print("📊 Adding column 'target_hash' to translation_units...")
+            cursor.execute("ALTER TABLE translation_units ADD COLUMN target_hash TEXT")
+            print("  ✓ Column 'target_hash' added successfully")
+
+        # Hash in SQL so the backfill is a single UPDATE statement
+        db_manager.connection.create_function("supervertaler_match_hash", 1, _match_hash,
+                                              deterministic=True)
+        cursor.execute("""
+            UPDATE translation_units
+            SET target_hash = supervertaler_match_hash(target_text)
+            WHERE target_hash IS NULL
+        """)
+        if cursor.rowcount > 0:
+            print(f"  ✓ Computed target_hash for {cursor.rowcount} translation units")
+
+        for index_name, definition in TM_TARGET_HASH_INDEXES.items():
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {definition}")
+
+        db_manager.connection.commit()
+        print("✅ translation_units.target_hash column and indexes are up to date")
+        return True
+
+    except Exception as e:
+        print(f"❌ target_hash migration failed: {e}")
+        import traceback
+        traceback.print_exc()
+        try:
+            db_manager.connection.rollback()
+        except Exception:
+            pass
+        return False
+
+
+def termbase_fk_migration_needed(cursor) -> bool:
+    """Check whether termbase_terms.termbase_id is still declared as TEXT"""
+    cursor.execute("PRAGMA table_info(termbase_terms)")
+    for row in cursor.fetchall():
+        if row[1] == 'termbase_id':
+            return (row[2] or '').upper() != 'INTEGER'
+    return False
+
+
+def migrate_termbase_integer_fk(db_manager) -> bool:
+    """
+    Rebuild termbase_terms with termbase_id as an INTEGER foreign key to
+    termbases(id) and fill the word-suffix index used by search_termbases().
+
+    termbase_id used to be TEXT, so every join needed CAST(termbase_id AS
+    INTEGER) and could not use idx_gt_termbase_id. SQLite can't change a
+    column type in place: the table is recreated from its own CREATE
+    statement (keeping columns added by earlier migrations), rows are copied
+    with their ids, and its indexes and triggers are recreated. Numeric
+    termbase_id values become integers; rows pointing at deleted termbases
+    are kept as they were.
+
+    Args:
+        db_manager: DatabaseManager instance
+
+    Returns:
+        True if migration successful
+    """
+    connection = db_manager.connection
+    cursor = db_manager.cursor
+    try:
+        if not termbase_fk_migration_needed(cursor):
+            print("✅ termbase_terms.termbase_id is an integer foreign key")
+            return True
+
+        from modules.database_manager import TERMBASE_SUFFIX_BULK_SQL
+
+        print("📊 Rebuilding termbase_terms with an integer termbase_id...")
+        cursor.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name='termbase_terms'")
+        create_sql = cursor.fetchone()[0]
+        new_create_sql, replaced = re.subn(
+            r'termbase_id\s+TEXT(\s+NOT\s+NULL)?',
+            r'termbase_id INTEGER\1 REFERENCES termbases(id) ON DELETE CASCADE',
+            create_sql, count=1, flags=re.IGNORECASE)
+        if not replaced:
+            raise ValueError("termbase_id column definition not found")
+        new_create_sql = re.sub(r'^\s*CREATE\s+TABLE\s+(IF\s+NOT\s+EXISTS\s+)?["\'`]?termbase_terms["\'`]?',
+                                'CREATE TABLE termbase_terms_new', new_create_sql, count=1, flags=re.IGNORECASE)
+
+        cursor.execute("""
+            SELECT sql FROM sqlite_master
+            WHERE tbl_name = 'termbase_terms' AND type IN ('index', 'trigger') AND sql IS NOT NULL
+        """)
+        dependent_sql = [row[0] for row in cursor.fetchall()]
+
+        # Foreign keys must be off while the table is swapped (and can only be
+        # switched outside a transaction)
+        connection.commit()
+        cursor.execute("PRAGMA foreign_keys = OFF")
+        try:
+            cursor.execute("BEGIN")
+            cursor.execute(new_create_sql)
+            cursor.execute("INSERT INTO termbase_terms_new SELECT * FROM termbase_terms")
+            copied = cursor.rowcount
+            cursor.execute("DROP TABLE termbase_terms")
+            cursor.execute("ALTER TABLE termbase_terms_new RENAME TO termbase_terms")
+
+            # Word suffixes in one statement, before the triggers are back
+            cursor.execute("DELETE FROM termbase_term_suffixes")
+            cursor.execute(TERMBASE_SUFFIX_BULK_SQL, (0, 0))
+
+            for sql in dependent_sql:
+                cursor.execute(sql)
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            cursor.execute("PRAGMA foreign_keys = ON")
+
+        print(f"  ✓ Copied {copied} terms, recreated {len(dependent_sql)} indexes/triggers")
+        print("✅ termbase_terms.termbase_id is an integer foreign key")
+        return True
+
+    except Exception as e:
+        print(f"❌ termbase_id migration failed: {e}")
+        import traceback
+        traceback.print_exc()
+        try:
+            connection.rollback()
+        except Exception:
+            pass
+        return False
+
+
+TERMBASE_NORM_INDEXES = {
+    # search_termbases(): normalized term equals / starts the search (covering)
+    'idx_gt_source_term_norm': "termbase_terms(source_term_norm, source_term)",
+    'idx_gt_target_term_norm': "termbase_terms(target_term_norm, target_term)",
+}
+
+
+def termbase_norm_migration_needed(cursor) -> bool:
+    """Check whether termbase_terms lacks the normalized term columns or their indexes"""
+    cursor.execute("PRAGMA table_info(termbase_terms)")
+    columns = {row[1] for row in cursor.fetchall()}
+    if 'source_term_norm' not in columns or 'target_term_norm' not in columns:
+        return True
+
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='index' AND tbl_name='termbase_terms'
+    """)
+    indexes = {row[0] for row in cursor.fetchall()}
+    return any(name not in indexes for name in TERMBASE_NORM_INDEXES)
+
+
+def migrate_termbase_norm_columns(db_manager) -> bool:
+    """
+    Add source_term_norm / target_term_norm to termbase_terms, fill them in
+    and index them, and rebuild the word-suffix index.
+
+    The normalized terms (casefolded, trailing punctuation trimmed) used to
+    be LOWER(RTRIM(...)) expression indexes; SQLite's LOWER() only folds
+    ASCII letters, so "Éclair" never matched "éclair". They are now computed
+    in Python (termbase_norm()) and kept up to date by the termbase_terms
+    triggers. Word suffixes are casefolded the same way.
+
+    Args:
+        db_manager: DatabaseManager instance
+
+    Returns:
+        True if migration successful
+    """
+    connection = db_manager.connection
+    cursor = db_manager.cursor
+    try:
+        from modules.database_manager import TERMBASE_SUFFIX_BULK_SQL, register_termbase_functions
+
+        cursor.execute("PRAGMA table_info(termbase_terms)")
+        columns = {row[1] for row in cursor.fetchall()}
+        for column in ('source_term_norm', 'target_term_norm'):
+            if column not in columns:
+                print(f"📊 Adding column '{column}' to termbase_terms...")
+                cursor.execute(f"ALTER TABLE termbase_terms ADD COLUMN {column} TEXT")
+                print(f"  ✓ Column '{column}' added successfully")
+
+        register_termbase_functions(connection)
+        cursor.execute("""
+            UPDATE termbase_terms
+            SET source_term_norm = termbase_norm(source_term),
+                target_term_norm = termbase_norm(target_term)
+        """)
+        print(f"  ✓ Normalized {cursor.rowcount} terms")
+
+        # Replaced by the indexes on the stored columns
+        for old_index in ('idx_gt_source_norm', 'idx_gt_target_norm'):
+            cursor.execute(f"DROP INDEX IF EXISTS {old_index}")
+        for index_name, definition in TERMBASE_NORM_INDEXES.items():
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {definition}")
+
+        # Suffixes were lowercased with LOWER(): casefold them too
+        cursor.execute("DELETE FROM termbase_term_suffixes")
+        cursor.execute(TERMBASE_SUFFIX_BULK_SQL, (0, 0))
+
+        connection.commit()
+        print("✅ termbase_terms normalized term columns and indexes are up to date")
+        return True
+
+    except Exception as e:
+        print(f"❌ termbase normalized terms migration failed: {e}")
+        import traceback
+        traceback.print_exc()
+        try:
+            connection.rollback()
+        except Exception:
+            pass
+        return False
+
+
 def generate_missing_uuids(db_manager) -> bool:
     """
     Generate UUIDs for any termbase terms that don't have them.
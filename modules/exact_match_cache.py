@@ -0,0 +1,174 @@
+"""
+Exact Match Cache - In-process LRU cache for TM exact-match lookups
+
+DatabaseManager.get_exact_match() computes four MD5 hash variants, expands
+language variants and runs a hash query for every call. Grid navigation
+repeats the same lookups over and over, so results (including "no match")
+are cached here per database file and shared by every DatabaseManager
+instance in the process, including the thread-local ones used by workers.
+
+Invalidation is precise: every cached lookup is registered under the hash
+variants it queried against source_hash (and, for bidirectional lookups,
+against target_hash). When a unit is added, updated or deleted, only the
+lookups that could have matched that unit are dropped.
+
+Usage:
+    cache = get_exact_match_cache(db_path)
+    result = cache.get(key)
+    if result is ExactMatchCache.MISS:
+        generation = cache.generation
+        result = run_sql_lookup()
+        cache.put(key, result, hashes, reverse_hashes, generation)
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, Optional, Tuple
+
+
+DEFAULT_MAX_ENTRIES = 10000
+
+
+class ExactMatchCache:
+    """Size-bounded LRU cache of exact-match results with write invalidation"""
+
+    # Returned by get() when the key is not cached (None is a valid result)
+    MISS = object()
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        # key -> (result, hashes, reverse_hashes)
+        self._entries: OrderedDict = OrderedDict()
+        # hash -> keys whose lookup queried that source_hash
+        self._by_hash: Dict[str, set] = {}
+        # hash -> keys whose reverse lookup queried that target_hash
+        self._by_target: Dict[str, set] = {}
+        self._lock = threading.Lock()
+        # Bumped on every invalidation so lookups that raced a write aren't stored
+        self.generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable):
+        """Return a copy of the cached result, or ExactMatchCache.MISS"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return self.MISS
+            self._entries.move_to_end(key)
+            self.hits += 1
+            result = entry[0]
+        return dict(result) if result is not None else None
+
+    def put(self, key: Hashable, result: Optional[Dict], hashes: Iterable[str],
+            reverse_hashes: Iterable[str] = (), generation: int = None):
+        """
+        Store a lookup result.
+
+        Args:
+            key: Lookup key (source text, TM set, language pair, direction)
+            result: Match dict or None (no match)
+            hashes: source_hash values the lookup queried
+            reverse_hashes: target_hash values the lookup queried (bidirectional lookups)
+            generation: Value of self.generation before the lookup ran; the
+                        result is dropped if a write happened in between
+        """
+        if self.max_entries <= 0:
+            return
+        hashes = frozenset(hashes)
+        reverse_hashes = frozenset(reverse_hashes)
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (dict(result) if result is not None else None, hashes, reverse_hashes)
+            for h in hashes:
+                self._by_hash.setdefault(h, set()).add(key)
+            for h in reverse_hashes:
+                self._by_target.setdefault(h, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key: Hashable):
+        """Drop one entry and its reverse-index references (lock held)"""
+        _, hashes, reverse_hashes = self._entries.pop(key)
+        for index, index_hashes in ((self._by_hash, hashes), (self._by_target, reverse_hashes)):
+            for h in index_hashes:
+                keys = index.get(h)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del index[h]
+
+    def invalidate_units(self, units: Iterable[Tuple[str, str]]) -> int:
+        """
+        Drop every cached lookup that could match the given units.
+
+        Args:
+            units: (source_hash, target_hash) of units that were added,
+                   updated (old and new values) or deleted
+
+        Returns: Number of cached lookups dropped
+        """
+        removed = 0
+        with self._lock:
+            self.generation += 1
+            if not self._entries:
+                return 0
+            for source_hash, target_hash in units:
+                stale = set(self._by_hash.get(source_hash, ()))
+                if target_hash is not None:
+                    stale.update(self._by_target.get(target_hash, ()))
+                for key in stale:
+                    if key in self._entries:
+                        self._remove(key)
+                        removed += 1
+            self.invalidations += removed
+        return removed
+
+    def clear(self):
+        """Drop all cached lookups (bulk TM changes)"""
+        with self._lock:
+            self.generation += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._by_hash.clear()
+            self._by_target.clear()
+
+    def stats(self) -> Dict:
+        """Cache statistics (hit rate is 0.0 before the first lookup)"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+            }
+
+
+_caches: Dict[str, ExactMatchCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_exact_match_cache(db_path: str) -> ExactMatchCache:
+    """Return the process-wide cache for a database file"""
+    key = os.path.normcase(os.path.abspath(db_path))
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = ExactMatchCache()
+        return cache
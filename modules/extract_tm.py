@@ -13,11 +13,12 @@ import sqlite3
 import threading
 import os
 from pathlib import Path
-from difflib import SequenceMatcher
 from typing import Dict, List, Optional, Callable, Tuple
 import re
 import time
 
+from modules.similarity import get_backend, strip_tags_lower
+
 
 class ExtractTM:
     """
@@ -376,8 +377,13 @@ class ExtractTM:
 
                     candidates = cursor.fetchall()
 
-                    for row in candidates:
-                        similarity = self._calculate_similarity(source_text, row['source_text'])
+                    # Score all candidates in one backend call
+                    scores = get_backend().ratio_batch(
+                        strip_tags_lower(source_text),
+                        [strip_tags_lower(row['source_text']) for row in candidates],
+                        score_cutoff=0.5
+                    )
+                    for row, similarity in zip(candidates, scores):
                         if similarity >= 0.5:
                             results.append({
                                 'source_text': row['source_text'],
@@ -399,9 +405,8 @@ class ExtractTM:
 
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate similarity between two texts"""
-        clean1 = re.sub(r'<[^>]+>', '', text1).lower()
-        clean2 = re.sub(r'<[^>]+>', '', text2).lower()
-        return SequenceMatcher(None, clean1, clean2).ratio()
+        # Tags are stripped for comparison
+        return get_backend().ratio(strip_tags_lower(text1), strip_tags_lower(text2))
 
     def export_to_tmx(self, output_path: str, progress_callback: Optional[Callable[[int, int], None]] = None) -> int:
         """
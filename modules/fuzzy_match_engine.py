@@ -0,0 +1,351 @@
+"""
+Fuzzy Match Engine - Inverted word index for batch TM fuzzy matching
+
+Replaces the "compare every source against every TM unit" scan used by batch
+pre-translation with an inverted word index plus candidate pruning:
+
+- Prefix filtering: the batch scan only accepts candidates whose word overlap
+  with the query is at least threshold * 0.5 of the larger word set. Any such
+  candidate must share at least one word with the (n - k + 1) rarest words of
+  the query, so only those postings lists are probed.
+- Length bands: candidates whose cleaned length ratio is below the threshold
+  are discarded before any set or similarity scoring.
+
+Surviving candidates are scored with exactly the same filters as the original
+scan, in the same (id) order, using the active similarity backend
+(modules.similarity). With the difflib backend the best match and its
+match_pct are identical to the original scan - each query just touches a few
+hundred candidates instead of the whole TM.
+
+The same prefix selection drives the persistent word index that
+DatabaseManager keeps in supervertaler.db (tm_fuzzy_postings) for
+interactive lookups, so no warm-up scan is needed after reopening a project.
+Interactive lookups still run the FTS5 search as well and merge both, since
+the word-overlap filter is the batch scan's and FTS5 never applied it.
+
+Large batches can be spread over several processes (best_matches_parallel):
+the TM rows are split into one contiguous id range per worker, each worker
+indexes only its range, and every source is scored by all workers. The
+per-range best matches are merged in id order the way the serial scan would
+pick them, so the result is identical to the serial path while the workers
+together hold about one copy of the index.
+"""
+
+import math
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from modules.similarity import get_backend, set_backend
+
+
+# Below this many sources, process start-up costs more than it saves
+PARALLEL_MIN_SOURCES = 200
+
+# Sources per task sent to a worker (also the progress granularity)
+PARALLEL_CHUNK_SIZE = 50
+
+
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def clean_for_fuzzy(text: str) -> str:
+    """Strip HTML/XML tags and lowercase (the batch fuzzy comparison form)"""
+    return _TAG_RE.sub('', text or '').lower()
+
+
+def select_prefix_words(words: frozenset, threshold: float,
+                        frequency: Callable[[str], int]) -> Optional[List[str]]:
+    """
+    Pick the words whose postings must be probed for a query.
+
+    A candidate passes the word-overlap filter only if it shares at least
+    ceil(threshold * 0.5 * len(words)) words with the query, so it must contain
+    at least one of the (n - k + 1) rarest query words.
+
+    Args:
+        words: Query word set
+        threshold: Minimum similarity (0.0-1.0)
+        frequency: Callable returning the number of units containing a word
+
+    Returns: List of words to probe, or None if no word filter can apply
+             (caller must consider every unit)
+    """
+    # Slack keeps float rounding on the safe (longer prefix) side
+    min_overlap = math.ceil(threshold * 0.5 * len(words) - 1e-9)
+    if not words or min_overlap < 1:
+        return None
+    ranked = sorted(words, key=frequency)
+    return ranked[:len(words) - min_overlap + 1]
+
+
+class FuzzyMatchIndex:
+    """
+    In-memory inverted word index over TM source texts.
+
+    Units are stored in parallel lists (no per-unit dicts) and addressed by
+    their position, which follows insertion order. Build it from rows ordered
+    by id so that ties are resolved exactly like the sequential scan.
+
+    Usage:
+        index = FuzzyMatchIndex.from_rows(cursor.execute(
+            "SELECT id, source_text FROM translation_units ORDER BY id"))
+        hit = index.best_match("source text", threshold=0.75)
+        if hit:
+            unit_id, similarity = hit
+    """
+
+    def __init__(self):
+        self.ids: List[int] = []
+        self.clean: List[str] = []
+        self.lengths: List[int] = []
+        self.words: List[frozenset] = []
+        # word -> positions (ascending) of units containing that word
+        self.postings: Dict[str, List[int]] = {}
+        # Units with text but no words (whitespace only) skip the word filter
+        self.wordless: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, unit_id: int, source_text: str):
+        """Append a unit to the index"""
+        clean = clean_for_fuzzy(source_text)
+        words = frozenset(clean.split())
+        pos = len(self.ids)
+
+        self.ids.append(unit_id)
+        self.clean.append(clean)
+        self.lengths.append(len(clean))
+        self.words.append(words)
+
+        if not clean:
+            return
+        if not words:
+            self.wordless.append(pos)
+            return
+        postings = self.postings
+        for word in words:
+            plist = postings.get(word)
+            if plist is None:
+                postings[word] = [pos]
+            else:
+                plist.append(pos)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable) -> 'FuzzyMatchIndex':
+        """Build an index from (id, source_text) rows"""
+        index = cls()
+        for row in rows:
+            index.add(row[0], row[1])
+        return index
+
+    def candidates(self, clean: str, words: frozenset, threshold: float) -> List[int]:
+        """
+        Return candidate positions (ascending) that can pass the word-overlap
+        and length pre-filters for the given cleaned query.
+        """
+        source_len = len(clean)
+        postings = self.postings
+        prefix = select_prefix_words(words, threshold, lambda w: len(postings.get(w, ())))
+
+        if prefix is None:
+            # No word filter can apply - fall back to the length band only
+            pool = range(len(self.ids))
+        else:
+            pool = set(self.wordless)
+            for word in prefix:
+                plist = postings.get(word)
+                if plist:
+                    pool.update(plist)
+            pool = sorted(pool)
+
+        lengths = self.lengths
+        result = []
+        for pos in pool:
+            cand_len = lengths[pos]
+            if cand_len == 0:
+                continue
+            if min(source_len, cand_len) / max(source_len, cand_len) < threshold:
+                continue
+            result.append(pos)
+        return result
+
+    def best_match(self, text: str, threshold: float = 0.75) -> Optional[Tuple[int, float]]:
+        """
+        Find the best fuzzy match for text.
+
+        Returns: (unit_id, similarity) or None if nothing reaches threshold
+        """
+        source_clean = clean_for_fuzzy(text)
+        source_len = len(source_clean)
+        if source_len == 0:
+            return None
+        source_words = frozenset(source_clean.split())
+
+        word_sets = self.words
+        pool = []
+        for pos in self.candidates(source_clean, source_words, threshold):
+            cand_words = word_sets[pos]
+
+            # Word overlap (same filter as the sequential scan)
+            if source_words and cand_words:
+                overlap = len(source_words & cand_words)
+                max_words = max(len(source_words), len(cand_words))
+                if max_words > 0 and overlap / max_words < threshold * 0.5:
+                    continue
+            pool.append(pos)
+
+        if not pool:
+            return None
+
+        clean = self.clean
+        hit = get_backend().best_match(source_clean, [clean[pos] for pos in pool], threshold)
+        if hit is None:
+            return None
+        idx, similarity = hit
+        return self.ids[pool[idx]], similarity
+
+    def best_matches(self, sources: List[str], threshold: float = 0.75,
+                     progress_callback: Callable = None) -> Dict[str, Tuple[int, float]]:
+        """
+        Find the best match for each source text.
+
+        Args:
+            sources: Source texts to match
+            threshold: Minimum similarity (0.0-1.0)
+            progress_callback: Optional callback(current, total) every 10 sources
+
+        Returns: Dict mapping source_text -> (unit_id, similarity)
+        """
+        results = {}
+        total = len(sources)
+        for idx, source in enumerate(sources):
+            if progress_callback and idx % 10 == 0:
+                progress_callback(idx, total)
+            hit = self.best_match(source, threshold)
+            if hit:
+                results[source] = hit
+        return results
+
+
+def default_worker_count() -> int:
+    """
+    Number of worker processes to use when none is configured (max 8).
+
+    Workers share the TM between them (one shard each), so more workers
+    don't multiply the index memory; the calling process still holds the
+    (id, source) rows while they run.
+    """
+    return max(1, min((os.cpu_count() or 1) - 1, 8))
+
+
+# Per-process index of one shard of the TM, built once by _init_worker
+_worker_index: Optional[FuzzyMatchIndex] = None
+
+
+def _init_worker(rows: List[Tuple[int, str]], backend_name: str):
+    """ProcessPoolExecutor initializer: build this worker's index (of its shard)"""
+    global _worker_index
+    set_backend(backend_name)
+    _worker_index = FuzzyMatchIndex.from_rows(rows)
+
+
+def _match_chunk(sources: List[str], threshold: float) -> List[Optional[Tuple[int, float]]]:
+    """Score a chunk of sources against this worker's shard (one entry per source)"""
+    return [_worker_index.best_match(source, threshold) for source in sources]
+
+
+def best_matches_parallel(rows: List[Tuple[int, str]], sources: List[str],
+                          threshold: float = 0.75, workers: int = None,
+                          progress_callback: Callable = None) -> Dict[str, Tuple[int, float]]:
+    """
+    Find the best match for each source text using worker processes.
+
+    The rows are split into one contiguous shard per worker; each worker
+    indexes only its shard (pickled to it once) and scores every chunk of
+    sources against it. Per-shard best matches are merged in shard order,
+    keeping the first of equal scores and honouring the backend's early
+    exit, exactly like the serial scan over all rows.
+
+    Args:
+        rows: (id, source_text) rows ordered by id (the TM to match against)
+        sources: Source texts to match
+        threshold: Minimum similarity (0.0-1.0)
+        workers: Number of worker processes (None = default_worker_count())
+        progress_callback: Optional callback(current, total) after each finished
+                           chunk. Raising from the callback (e.g. InterruptedError
+                           when the user cancels) cancels the remaining chunks
+                           and is propagated to the caller.
+
+    Returns: Dict mapping source_text -> (unit_id, similarity), identical to
+             FuzzyMatchIndex.best_matches on the same rows
+    """
+    total = len(sources)
+    if workers is None:
+        workers = default_worker_count()
+    workers = max(1, min(workers, len(rows)))
+
+    shard_size = math.ceil(len(rows) / workers)
+    shards = [rows[i:i + shard_size] for i in range(0, len(rows), shard_size)]
+    chunks = [sources[i:i + PARALLEL_CHUNK_SIZE] for i in range(0, total, PARALLEL_CHUNK_SIZE)]
+    # chunk -> per-shard results, and how many shards are still scoring it
+    chunk_results: List[List[Optional[list]]] = [[None] * len(shards) for _ in chunks]
+    chunk_pending = [len(shards)] * len(chunks)
+
+    if progress_callback:
+        progress_callback(0, total)
+
+    backend = get_backend()
+    # One single-process executor per shard, so each worker keeps its own shard
+    executors = [ProcessPoolExecutor(max_workers=1, initializer=_init_worker,
+                                     initargs=(shard, backend.name))
+                 for shard in shards]
+    try:
+        pending = {executor.submit(_match_chunk, chunk, threshold): (idx, shard_idx)
+                   for idx, chunk in enumerate(chunks)
+                   for shard_idx, executor in enumerate(executors)}
+        done_count = 0
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                idx, shard_idx = pending.pop(future)
+                chunk_results[idx][shard_idx] = future.result()
+                chunk_pending[idx] -= 1
+                if not chunk_pending[idx]:
+                    done_count += len(chunks[idx])
+            if progress_callback:
+                progress_callback(done_count, total)
+    except BaseException:
+        # Cancelled or failed: drop queued chunks, don't wait for running ones
+        for executor in executors:
+            executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    for executor in executors:
+        executor.shutdown(wait=True)
+
+    # Merge in input order so duplicate sources resolve like the serial path
+    results = {}
+    for chunk, shard_hits in zip(chunks, chunk_results):
+        for pos, source in enumerate(chunk):
+            hit = _merge_shard_hits([hits[pos] for hits in shard_hits], backend.early_exit_score)
+            if hit:
+                results[source] = hit
+    return results
+
+
+def _merge_shard_hits(hits: List[Optional[Tuple[int, float]]],
+                      early_exit_score: Optional[float]) -> Optional[Tuple[int, float]]:
+    """
+    Combine one source's best matches from consecutive shards (in id order)
+    into the match a single scan over all shards returns: a later shard only
+    wins with a higher score, and a score reaching early_exit_score ends the scan.
+    """
+    best = None
+    for hit in hits:
+        if hit and (best is None or hit[1] > best[1]):
+            best = hit
+        if best and early_exit_score is not None and best[1] >= early_exit_score:
+            break
+    return best
@@ -31,11 +31,21 @@ Usage:
     response = client.translate("Hello world", source_lang="en", target_lang="nl")
 """
 
+import atexit
+import json
 import os
 import sys
-from typing import Dict, Optional, Literal, List
+import threading
+from typing import Callable, Dict, Optional, Literal, List
 from dataclasses import dataclass
 
+try:
+    from modules.response_cache import get_response_cache, response_cache_key
+except ImportError:  # Used standalone, outside the Supervertaler package
+    def get_response_cache():
+        return None
+    response_cache_key = None
+
 
 def load_api_keys() -> Dict[str, str]:
     """Load API keys from unified settings/settings.json, with legacy api_keys.txt fallback."""
@@ -130,6 +140,120 @@ def _sanitize_ollama_endpoint(endpoint: str) -> str:
     return endpoint
 
 
+def _ollama_endpoint() -> str:
+    """Ollama endpoint from the environment (OLLAMA_ENDPOINT), or the local default."""
+    return _sanitize_ollama_endpoint(os.environ.get('OLLAMA_ENDPOINT', 'http://localhost:11434'))
+
+
+# ============================================================================
+# PERSISTENT HTTP CLIENTS
+# ============================================================================
+# Creating an SDK client per call opens a new connection pool, so every
+# segment paid for a TCP + TLS handshake (twice with a proxy). Clients are
+# shared by all LLMClient instances with the same provider, base URL and
+# proxy, keep connections alive between calls, and are closed at exit.
+
+HTTP_KEEPALIVE_SECONDS = 60.0  # Idle connections are kept this long
+HTTP_MAX_CONNECTIONS = 32      # Per pooled client (enough for parallel batches)
+
+_pooled_clients: Dict[tuple, object] = {}
+_pooled_clients_lock = threading.RLock()  # Re-entrant: SDK factories fetch the httpx client
+_gemini_api_key: Optional[str] = None
+
+
+def _http2_supported() -> bool:
+    """HTTP/2 in httpx needs the optional 'h2' package"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _get_pooled(key: tuple, factory: Callable[[], object]) -> object:
+    """Return the pooled client for key, creating it with factory() on first use"""
+    with _pooled_clients_lock:
+        client = _pooled_clients.get(key)
+        if client is None:
+            client = factory()
+            _pooled_clients[key] = client
+        return client
+
+
+def get_http_client(provider: str, base_url: Optional[str] = None, proxy: Optional[str] = None,
+                    client_class: Optional[type] = None):
+    """
+    Shared keep-alive httpx client for a (provider, base_url, proxy).
+
+    Args:
+        provider: Provider name (clients are not shared between providers)
+        base_url: API base URL, if not the provider default
+        proxy: Optional HTTP/HTTPS proxy URL
+        client_class: httpx.Client subclass to create (e.g. openai.DefaultHttpxClient)
+
+    Returns:
+        httpx.Client using HTTP/2 when the 'h2' package is installed
+    """
+    import httpx
+
+    def create():
+        cls = client_class or httpx.Client
+        return cls(
+            proxy=proxy,
+            http2=_http2_supported(),
+            limits=httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS,
+                                max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+                                keepalive_expiry=HTTP_KEEPALIVE_SECONDS),
+            # Per-request timeouts are passed on each call
+            timeout=httpx.Timeout(600.0, connect=30.0),
+        )
+
+    return _get_pooled(("httpx", provider, base_url, proxy), create)
+
+
+def get_requests_session(name: str, proxy: Optional[str] = None):
+    """
+    Shared keep-alive requests.Session (used for Ollama and Google Translate).
+
+    Args:
+        name: Pool name, e.g. the endpoint URL
+        proxy: Optional HTTP/HTTPS proxy URL
+
+    Returns:
+        requests.Session
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    def create():
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_MAX_CONNECTIONS)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if proxy:
+            session.proxies = {"http": proxy, "https": proxy}
+        return session
+
+    return _get_pooled(("requests", name, proxy), create)
+
+
+def close_http_clients():
+    """Close all pooled HTTP clients and their connections (called at exit)"""
+    global _gemini_api_key
+    with _pooled_clients_lock:
+        clients = list(_pooled_clients.values())
+        _pooled_clients.clear()
+        _gemini_api_key = None
+    for client in clients:
+        try:
+            client.close()
+        except Exception:
+            pass
+
+
+atexit.register(close_http_clients)
+
+
 @dataclass
 class LLMConfig:
     """Configuration for LLM client"""
@@ -448,6 +572,9 @@ class LLMClient:
 
         # Auto-detect temperature based on model
         self.temperature = self._get_temperature()
+
+        # True when the last translate() was answered from the response cache
+        self.last_response_cached = False
     
     def _clean_translation_response(self, translation: str, prompt: str) -> str:
         """
@@ -642,6 +769,35 @@ class LLMClient:
         # Standard models use 0.3 for consistency
         return 0.3
     
+    def _get_openai_client(self):
+        """OpenAI SDK client on the shared connection pool for this base URL and proxy"""
+        import openai
+
+        def create():
+            client_class = getattr(openai, "DefaultHttpxClient", None)
+            client_kwargs = {
+                "api_key": self.api_key,
+                "http_client": get_http_client(self.provider, self.base_url, self.http_proxy, client_class),
+            }
+            if self.base_url:
+                client_kwargs["base_url"] = self.base_url
+            return openai.OpenAI(**client_kwargs)
+
+        return _get_pooled(("openai", self.provider, self.base_url, self.http_proxy, self.api_key), create)
+
+    def _get_claude_client(self):
+        """Anthropic SDK client on the shared connection pool for this proxy"""
+        import anthropic
+
+        def create():
+            client_class = getattr(anthropic, "DefaultHttpxClient", None)
+            return anthropic.Anthropic(
+                api_key=self.api_key,
+                http_client=get_http_client(self.provider, None, self.http_proxy, client_class),
+            )
+
+        return _get_pooled(("claude", self.http_proxy, self.api_key), create)
+
     def translate(
         self,
         text: str,
@@ -652,7 +808,9 @@ class LLMClient:
         max_tokens: Optional[int] = None,
         images: Optional[List] = None,
         system_prompt: Optional[str] = None,
-        skip_cleaning: bool = False
+        skip_cleaning: bool = False,
+        use_cache: bool = False,
+        stream_callback: Optional[Callable[[str], None]] = None
     ) -> str:
         """
         Translate text using configured LLM
@@ -666,6 +824,12 @@ class LLMClient:
             system_prompt: Optional system prompt for AI behavior context
             skip_cleaning: If True, skip _clean_translation_response post-processing
                 (used for prompt generation where translation-related keywords are expected)
+            use_cache: Answer identical requests from the response cache (see
+                modules/response_cache.py). Off by default: interactive requests
+                are expected to reach the model; batch callers opt in.
+            stream_callback: If set, the response is streamed and each piece of raw
+                text is passed to it as it arrives (a cached response in one piece).
+                The return value is still the complete, cleaned response.
 
         Returns:
             Translated text
@@ -685,18 +849,43 @@ class LLMClient:
             print(f"⚠️ Warning: Model {self.model} doesn't support vision. Images will be ignored.")
             images = None  # Don't pass to API
 
+        # Identical requests are answered from the response cache (requests with images are not cached)
+        cache = get_response_cache() if use_cache and not images else None
+        cache_key = None
+        result = None
+        if cache:
+            # Ollama has no base_url; its endpoint decides which server (and model build) answers
+            base_url = _ollama_endpoint() if self.provider == "ollama" else self.base_url
+            cache_key = response_cache_key(
+                kind="llm", provider=self.provider, model=self.model, base_url=base_url,
+                system_prompt=system_prompt, prompt=prompt, temperature=self.temperature,
+                max_tokens=max_tokens if max_tokens is not None else self.max_tokens)
+            result = cache.get(cache_key)
+        self.last_response_cached = result is not None
+
         # Call appropriate provider
-        if self.provider in ("openai", "custom_openai"):
-            result = self._call_openai(prompt, max_tokens=max_tokens, images=images, system_prompt=system_prompt)
+        if result is not None:
+            print(f"💾 Response cache hit ({self.provider}/{self.model})")
+            if stream_callback:
+                stream_callback(result)
+        elif self.provider in ("openai", "custom_openai"):
+            result = self._call_openai(prompt, max_tokens=max_tokens, images=images, system_prompt=system_prompt,
+                                       stream_callback=stream_callback)
         elif self.provider == "claude":
-            result = self._call_claude(prompt, max_tokens=max_tokens, images=images, system_prompt=system_prompt)
+            result = self._call_claude(prompt, max_tokens=max_tokens, images=images, system_prompt=system_prompt,
+                                       stream_callback=stream_callback)
         elif self.provider == "gemini":
-            result = self._call_gemini(prompt, max_tokens=max_tokens, images=images, system_prompt=system_prompt)
+            result = self._call_gemini(prompt, max_tokens=max_tokens, images=images, system_prompt=system_prompt,
+                                       stream_callback=stream_callback)
         elif self.provider == "ollama":
-            result = self._call_ollama(prompt, max_tokens=max_tokens, system_prompt=system_prompt)
+            result = self._call_ollama(prompt, max_tokens=max_tokens, system_prompt=system_prompt,
+                                       stream_callback=stream_callback)
         else:
             raise ValueError(f"Unsupported provider: {self.provider}")
 
+        if cache_key and not self.last_response_cached:
+            cache.put(cache_key, result, provider=self.provider, model=self.model)
+
         # Post-process: clean translation response to remove prompt remnants,
         # unless skip_cleaning is set (e.g. for prompt generation where
         # translation-related keywords are expected content, not remnants)
@@ -705,7 +894,8 @@ class LLMClient:
 
         return result
     
-    def _call_openai(self, prompt: str, max_tokens: Optional[int] = None, images: Optional[List] = None, system_prompt: Optional[str] = None) -> str:
+    def _call_openai(self, prompt: str, max_tokens: Optional[int] = None, images: Optional[List] = None, system_prompt: Optional[str] = None,
+                     stream_callback: Optional[Callable[[str], None]] = None) -> str:
         """Call OpenAI API with GPT-5/o1/o3 reasoning model support and vision capability"""
         print(f"🔵 _call_openai START: model={self.model}, prompt_len={len(prompt)}, max_tokens={max_tokens}, images={len(images) if images else 0}, has_system={bool(system_prompt)}")
 
@@ -722,14 +912,8 @@ class LLMClient:
 
         # Reasoning models need MUCH longer timeout (they can take 5-10 minutes for large prompts)
         timeout_seconds = 600.0 if is_reasoning_model else 120.0  # 10 min vs 2 min
-        client_kwargs = {"api_key": self.api_key, "timeout": timeout_seconds}
-        if self.base_url:
-            client_kwargs["base_url"] = self.base_url
-        if self.http_proxy:
-            import httpx
-            client_kwargs["http_client"] = httpx.Client(proxy=self.http_proxy, timeout=timeout_seconds)
-        client = OpenAI(**client_kwargs)
-        print(f"🔵 OpenAI client created successfully (timeout: {timeout_seconds}s)")
+        client = self._get_openai_client()
+        print(f"🔵 OpenAI client ready (timeout: {timeout_seconds}s)")
 
         # Use provided max_tokens or default
         # IMPORTANT: Reasoning models need MUCH higher limits because they use tokens for:
@@ -789,6 +973,22 @@ class LLMClient:
             print(f"🔵 Standard model params: max_tokens={tokens_to_use}, temperature={self.temperature}")
 
         try:
+            if stream_callback:
+                print(f"🔵 Calling OpenAI API (streaming)...")
+                chunks = []
+                for chunk in client.chat.completions.create(**api_params, stream=True):
+                    piece = chunk.choices[0].delta.content if chunk.choices else None
+                    if piece:
+                        chunks.append(piece)
+                        stream_callback(piece)
+                translation = ''.join(chunks).strip()
+                if not translation:
+                    error_msg = f"OpenAI returned empty streamed response for model {self.model}"
+                    print(f"❌ ERROR: {error_msg}")
+                    raise ValueError(error_msg)
+                print(f"🔵 OpenAI streaming completed")
+                return translation
+
             print(f"🔵 Calling OpenAI API...")
             response = client.chat.completions.create(**api_params)
             print(f"🔵 OpenAI API call completed")
@@ -820,7 +1020,8 @@ class LLMClient:
                 print(f"   Response: {e.response}")
             raise  # Re-raise to be caught by calling code
     
-    def _call_claude(self, prompt: str, max_tokens: Optional[int] = None, images: Optional[List] = None, system_prompt: Optional[str] = None) -> str:
+    def _call_claude(self, prompt: str, max_tokens: Optional[int] = None, images: Optional[List] = None, system_prompt: Optional[str] = None,
+                     stream_callback: Optional[Callable[[str], None]] = None) -> str:
         """Call Anthropic Claude API with vision support"""
         try:
             import anthropic
@@ -839,12 +1040,8 @@ class LLMClient:
         else:
             timeout_seconds = 120.0  # 2 minutes for normal operations
         
-        claude_kwargs = {"api_key": self.api_key, "timeout": timeout_seconds}
-        if self.http_proxy:
-            import httpx
-            claude_kwargs["http_client"] = httpx.Client(proxy=self.http_proxy, timeout=timeout_seconds)
-        client = anthropic.Anthropic(**claude_kwargs)
-        
+        client = self._get_claude_client()
+
         # Use provided max_tokens or default (Claude uses 4096 as default)
         tokens_to_use = max_tokens if max_tokens is not None else self.max_tokens
         
@@ -880,6 +1077,17 @@ class LLMClient:
         if system_prompt:
             api_params["system"] = system_prompt
 
+        if stream_callback:
+            chunks = []
+            with client.messages.stream(**api_params) as stream:
+                for piece in stream.text_stream:
+                    chunks.append(piece)
+                    stream_callback(piece)
+            translation = ''.join(chunks).strip()
+            if not translation:
+                raise ValueError("Claude returned an empty streamed response")
+            return translation
+
         response = client.messages.create(**api_params)
 
         if not response.content:
@@ -888,7 +1096,8 @@ class LLMClient:
 
         return translation
 
-    def _call_gemini(self, prompt: str, max_tokens: Optional[int] = None, images: Optional[List] = None, system_prompt: Optional[str] = None) -> str:
+    def _call_gemini(self, prompt: str, max_tokens: Optional[int] = None, images: Optional[List] = None, system_prompt: Optional[str] = None,
+                     stream_callback: Optional[Callable[[str], None]] = None) -> str:
         """Call Google Gemini API with vision support"""
         try:
             import google.generativeai as genai
@@ -898,7 +1107,12 @@ class LLMClient:
                 "Google AI library not installed. Install with: pip install google-generativeai pillow"
             )
 
-        genai.configure(api_key=self.api_key)
+        # configure() replaces the SDK's clients, so only call it when the key changes
+        global _gemini_api_key
+        with _pooled_clients_lock:
+            if _gemini_api_key != self.api_key:
+                genai.configure(api_key=self.api_key)
+                _gemini_api_key = self.api_key
 
         # Gemini supports system instructions via GenerativeModel parameter
         if system_prompt:
@@ -917,12 +1131,28 @@ class LLMClient:
             # Standard text-only
             content = prompt
 
+        if stream_callback:
+            chunks = []
+            for chunk in model.generate_content(content, stream=True):
+                try:
+                    piece = chunk.text
+                except ValueError:
+                    continue  # Chunk without text parts (e.g. only safety ratings)
+                if piece:
+                    chunks.append(piece)
+                    stream_callback(piece)
+            translation = ''.join(chunks).strip()
+            if not translation:
+                raise ValueError("Gemini returned an empty streamed response")
+            return translation
+
         response = model.generate_content(content)
         translation = response.text.strip()
 
         return translation
 
-    def _call_ollama(self, prompt: str, max_tokens: Optional[int] = None, system_prompt: Optional[str] = None) -> str:
+    def _call_ollama(self, prompt: str, max_tokens: Optional[int] = None, system_prompt: Optional[str] = None,
+                     stream_callback: Optional[Callable[[str], None]] = None) -> str:
         """
         Call local Ollama server for translation.
 
@@ -933,6 +1163,7 @@ class LLMClient:
             prompt: The full prompt to send
             max_tokens: Maximum tokens to generate (default: 4096)
             system_prompt: Optional system prompt for AI behavior context
+            stream_callback: Called with each piece of text as it arrives (forces streaming)
 
         Returns:
             Translated text
@@ -949,9 +1180,7 @@ class LLMClient:
             )
         
         # Get Ollama endpoint from environment or use default
-        endpoint = _sanitize_ollama_endpoint(
-            os.environ.get('OLLAMA_ENDPOINT', 'http://localhost:11434')
-        )
+        endpoint = _ollama_endpoint()
 
         # Use provided max_tokens or default
         tokens_to_use = max_tokens if max_tokens is not None else min(self.max_tokens, 8192)
@@ -991,7 +1220,8 @@ class LLMClient:
         # Use streaming for large requests to avoid timeout issues
         # Streaming reads tokens as they arrive — only the connection + first token
         # must arrive within the timeout, not the entire response
-        use_streaming = prompt_len > 3000 or tokens_to_use > 4096
+        # (and always when the caller wants the text as it arrives)
+        use_streaming = prompt_len > 3000 or tokens_to_use > 4096 or stream_callback is not None
 
         # Build request payload
         # Using /api/chat for chat-style interaction (better for translation prompts)
@@ -1014,16 +1244,15 @@ class LLMClient:
             model_size_str = f"{param_billions}B" if param_billions > 0 else "unknown size"
             print(f"🟠 Calling Ollama API... (model: {model_size_str}, timeout: {timeout_seconds}s, streaming: {use_streaming})")
 
-            proxies = {"http": self.http_proxy, "https": self.http_proxy} if self.http_proxy else None
+            session = get_requests_session(endpoint, self.http_proxy)
 
             if use_streaming:
                 # Streaming mode: read tokens incrementally to avoid timeout on large responses
                 # Connection timeout = 120s (model loading), no read timeout (tokens arrive gradually)
-                response = requests.post(
+                response = session.post(
                     f"{endpoint}/api/chat",
                     json=payload,
                     timeout=(120, timeout_seconds),  # (connect_timeout, read_timeout for first chunk)
-                    proxies=proxies,
                     stream=True
                 )
 
@@ -1045,6 +1274,8 @@ class LLMClient:
                             chunk = json_module.loads(line)
                             if 'message' in chunk and 'content' in chunk['message']:
                                 chunks.append(chunk['message']['content'])
+                                if stream_callback and chunk['message']['content']:
+                                    stream_callback(chunk['message']['content'])
                             # Last chunk contains stats
                             if chunk.get('done', False):
                                 eval_count = chunk.get('eval_count', 0)
@@ -1062,11 +1293,10 @@ class LLMClient:
                 return translation
             else:
                 # Non-streaming mode for small/simple requests
-                response = requests.post(
+                response = session.post(
                     f"{endpoint}/api/chat",
                     json=payload,
-                    timeout=timeout_seconds,
-                    proxies=proxies
+                    timeout=timeout_seconds
                 )
 
                 if response.status_code == 404:
@@ -1147,7 +1377,8 @@ def main():
 
 
 # Wrapper functions for easy integration with Supervertaler
-def get_openai_translation(text: str, source_lang: str, target_lang: str, context: str = "") -> Dict:
+def get_openai_translation(text: str, source_lang: str, target_lang: str, context: str = "",
+                           use_cache: bool = False) -> Dict:
     """
     Get OpenAI translation with metadata
     
@@ -1156,6 +1387,7 @@ def get_openai_translation(text: str, source_lang: str, target_lang: str, contex
         source_lang: Source language name
         target_lang: Target language name
         context: Optional context for better translation
+        use_cache: Answer identical requests from the response cache
     
     Returns:
         Dict with translation, model, and metadata
@@ -1178,7 +1410,8 @@ def get_openai_translation(text: str, source_lang: str, target_lang: str, contex
             text=text,
             source_lang=_convert_lang_name_to_code(source_lang),
             target_lang=_convert_lang_name_to_code(target_lang),
-            context=context if context else None
+            context=context if context else None,
+            use_cache=use_cache
         )
         
         print(f"🔍 [DEBUG] OpenAI: Translation received: '{translation[:30]}...'")
@@ -1186,6 +1419,7 @@ def get_openai_translation(text: str, source_lang: str, target_lang: str, contex
             'translation': translation,
             'model': client.model,
             'explanation': f"Translation provided with context: {context[:50]}..." if context else "Translation completed",
+            'cached': client.last_response_cached,
             'success': True
         }
     except Exception as e:
@@ -1197,7 +1431,8 @@ def get_openai_translation(text: str, source_lang: str, target_lang: str, contex
         }
 
 
-def get_claude_translation(text: str, source_lang: str, target_lang: str, context: str = "") -> Dict:
+def get_claude_translation(text: str, source_lang: str, target_lang: str, context: str = "",
+                           use_cache: bool = False) -> Dict:
     """
     Get Claude translation with metadata
     
@@ -1206,6 +1441,7 @@ def get_claude_translation(text: str, source_lang: str, target_lang: str, contex
         source_lang: Source language name
         target_lang: Target language name
         context: Optional context for better translation
+        use_cache: Answer identical requests from the response cache
     
     Returns:
         Dict with translation, model, and metadata
@@ -1228,7 +1464,8 @@ def get_claude_translation(text: str, source_lang: str, target_lang: str, contex
             text=text,
             source_lang=_convert_lang_name_to_code(source_lang),
             target_lang=_convert_lang_name_to_code(target_lang),
-            context=context if context else None
+            context=context if context else None,
+            use_cache=use_cache
         )
         
         print(f"🔍 [DEBUG] Claude: Translation received: '{translation[:30]}...'")
@@ -1236,6 +1473,7 @@ def get_claude_translation(text: str, source_lang: str, target_lang: str, contex
             'translation': translation,
             'model': client.model,
             'reasoning': f"High-quality translation considering context: {context[:50]}..." if context else "Translation completed",
+            'cached': client.last_response_cached,
             'success': True
         }
     except Exception as e:
@@ -1273,7 +1511,7 @@ def _convert_lang_name_to_code(lang_name: str) -> str:
     }
     return lang_map.get(lang_name, lang_name.lower()[:2])
 
-def get_google_translation(text: str, source_lang: str, target_lang: str) -> Dict:
+def get_google_translation(text: str, source_lang: str, target_lang: str, use_cache: bool = False) -> Dict:
     """
     Get Google Cloud Translation API translation with metadata
     
@@ -1281,6 +1519,7 @@ def get_google_translation(text: str, source_lang: str, target_lang: str) -> Dic
         text: Text to translate
         source_lang: Source language code (e.g., 'en', 'nl', 'auto')
         target_lang: Target language code (e.g., 'en', 'nl')
+        use_cache: Answer identical requests from the response cache
     
     Returns:
         Dict with translation, confidence, and metadata
@@ -1298,6 +1537,28 @@ def get_google_translation(text: str, source_lang: str, target_lang: str) -> Dic
                 'success': False
             }
         
+        # Identical requests are answered from the response cache
+        cache = get_response_cache() if use_cache else None
+        cache_key = None
+        if cache:
+            cache_key = response_cache_key(kind="mt", provider="google", source_lang=source_lang,
+                                           target_lang=target_lang, text=text)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                translation_data = json.loads(cached)
+                return {
+                    'translation': translation_data['translatedText'],
+                    'confidence': 'High',
+                    'detected_source_language': translation_data.get('detectedSourceLanguage', source_lang),
+                    'provider': 'Google Cloud Translation',
+                    'success': True,
+                    'cached': True,
+                    'metadata': {
+                        'model': 'nmt',
+                        'input': text
+                    }
+                }
+
         # Use Google Cloud Translation API (Basic/v2) via REST
         try:
             import requests
@@ -1316,12 +1577,15 @@ def get_google_translation(text: str, source_lang: str, target_lang: str) -> Dic
                 params['source'] = source_lang
             
             # Make API request
-            response = requests.post(url, params=params)
+            response = get_requests_session(url).post(url, params=params)
             
             if response.status_code == 200:
                 result = response.json()
                 if 'data' in result and 'translations' in result['data']:
                     translation_data = result['data']['translations'][0]
+                    if cache_key:
+                        cache.put(cache_key, json.dumps(translation_data, ensure_ascii=False),
+                                  provider="google", model="nmt")
                     return {
                         'translation': translation_data['translatedText'],
                         'confidence': 'High',
@@ -0,0 +1,356 @@
+"""
+LLM Dispatcher - Concurrent batch requests with rate limiting
+
+Batch pre-translation used to send its LLM batches one after another, so a
+10,000-segment job at 20 segments per batch was 500 serial round trips.
+BatchDispatcher keeps several batches in flight at once (per provider, see
+DEFAULT_LIMITS), while staying within the provider's rate limits:
+
+- token buckets for requests per minute and tokens per minute
+- rate-limit responses (HTTP 429, "overloaded", quota errors) and transient
+  errors (5xx, timeouts, dropped connections) are retried with exponential
+  backoff and jitter; a Retry-After header is honoured, and a 429 pauses
+  all workers so they don't retry in lockstep
+- results are handed back in batch order, so grid updates and progress
+  signals stay in segment order however the requests complete
+
+The dispatcher only knows batches and a send() callable, so it works with any
+client - LLMClient in the app, plain HTTP against a mock server in
+scripts/benchmarks/benchmark_llm_dispatcher.py.
+
+Usage:
+    limits = limits_for_provider('openai', general_settings)
+    dispatcher = BatchDispatcher(send=lambda prompt: client.translate(...), limits=limits,
+                                 estimate_tokens=lambda prompt: len(prompt) // 4)
+    dispatcher.run(batches, on_result, prepare=build_prompt, cancelled=lambda: worker._cancelled)
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Iterable, Optional
+
+
+@dataclass
+class DispatchLimits:
+    """Concurrency and rate limits for one provider (0 = no limit)"""
+    max_in_flight: int = 4
+    requests_per_minute: float = 0
+    tokens_per_minute: float = 0
+    max_retries: int = 5
+    backoff_base: float = 2.0  # First retry waits up to this many seconds
+    backoff_max: float = 60.0
+
+
+# Conservative defaults that stay within the lowest paid tiers; override with the
+# 'llm_concurrent_batches' and 'llm_rate_limits' general settings
+DEFAULT_LIMITS: Dict[str, DispatchLimits] = {
+    'openai': DispatchLimits(max_in_flight=4, requests_per_minute=500, tokens_per_minute=200000),
+    'claude': DispatchLimits(max_in_flight=4, requests_per_minute=50, tokens_per_minute=40000),
+    'gemini': DispatchLimits(max_in_flight=4, requests_per_minute=150, tokens_per_minute=1000000),
+    'custom_openai': DispatchLimits(max_in_flight=2),
+    'ollama': DispatchLimits(max_in_flight=1),  # One local model serves one request at a time
+}
+
+
+def limits_for_provider(provider: str, settings: Optional[Dict] = None) -> DispatchLimits:
+    """
+    Dispatch limits for a provider, with the user's overrides applied.
+
+    Args:
+        provider: LLM provider key ('openai', 'claude', ...)
+        settings: General settings; 'llm_concurrent_batches' is an int (all
+            providers) or {provider: int}, 'llm_rate_limits' is
+            {provider: {DispatchLimits field: value}}
+
+    Returns:
+        DispatchLimits
+    """
+    limits = DEFAULT_LIMITS.get(provider, DispatchLimits(max_in_flight=1))
+    settings = settings or {}
+    overrides = dict((settings.get('llm_rate_limits') or {}).get(provider) or {})
+    concurrent = settings.get('llm_concurrent_batches')
+    if isinstance(concurrent, dict):
+        concurrent = concurrent.get(provider)
+    if concurrent:
+        overrides['max_in_flight'] = concurrent
+    valid = {name: value for name, value in overrides.items() if name in DispatchLimits.__dataclass_fields__}
+    limits = replace(limits, **valid)
+    limits.max_in_flight = max(1, int(limits.max_in_flight))
+    return limits
+
+
+def estimate_request_tokens(prompt: str, output_ratio: float = 1.0) -> int:
+    """
+    Rough token count of a request for the tokens-per-minute budget: about
+    four characters per token for the prompt, plus the expected output as a
+    ratio of the prompt.
+    """
+    prompt_tokens = len(prompt or '') / 4
+    return int(prompt_tokens * (1 + output_ratio)) + 1
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    """HTTP status of an SDK / requests / urllib error, if it has one"""
+    for holder in (exc, getattr(exc, 'response', None)):
+        for attr in ('status_code', 'status', 'code'):
+            value = getattr(holder, attr, None)
+            if isinstance(value, int):
+                return value
+    return None
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """True for 429 / overloaded / quota errors (worth retrying after a pause)"""
+    if _status_code(exc) in (429, 529):
+        return True
+    name = type(exc).__name__
+    if name in ('RateLimitError', 'ResourceExhausted', 'OverloadedError'):
+        return True
+    text = str(exc).lower()
+    return 'rate limit' in text or 'rate_limit' in text or 'too many requests' in text or 'overloaded' in text
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """True for server errors, timeouts and dropped connections"""
+    status = _status_code(exc)
+    if status is not None and 500 <= status < 600:
+        return True
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    name = type(exc).__name__
+    return name in ('APITimeoutError', 'APIConnectionError', 'InternalServerError', 'ServiceUnavailable',
+                    'DeadlineExceeded', 'Timeout', 'ReadTimeout', 'ConnectTimeout')
+
+
+def retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """Retry-After header of a rate-limit response (seconds), if present"""
+    for holder in (getattr(exc, 'response', None), exc):
+        headers = getattr(holder, 'headers', None)
+        if headers is None:
+            continue
+        try:
+            value = headers.get('retry-after') or headers.get('Retry-After')
+        except Exception:
+            continue
+        if value:
+            try:
+                return max(0.0, float(value))
+            except (TypeError, ValueError):
+                return None
+    return None
+
+
+class DispatchCancelled(Exception):
+    """Raised in a worker when the job is cancelled before its batch is sent"""
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled at per_minute / 60 tokens per second.
+
+    The bucket holds at most capacity tokens (default: one minute's worth), so
+    an idle period allows a burst of that size and no more.
+    """
+
+    def __init__(self, per_minute: float, capacity: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.rate = per_minute / 60.0
+        self.capacity = capacity if capacity is not None else per_minute
+        self._tokens = self.capacity
+        self._clock = clock
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, amount: float = 1.0) -> float:
+        """
+        Take amount tokens if available.
+
+        Returns: 0.0 on success, otherwise the seconds until they will be
+        """
+        amount = min(amount, self.capacity)  # A request larger than the bucket waits for a full one
+        with self._lock:
+            self._refill()
+            if self._tokens >= amount:
+                self._tokens -= amount
+                return 0.0
+            return (amount - self._tokens) / self.rate
+
+    def acquire(self, amount: float = 1.0, cancelled: Optional[Callable[[], bool]] = None) -> bool:
+        """Block until amount tokens are taken. Returns False if cancelled while waiting."""
+        while True:
+            wait = self.try_acquire(amount)
+            if wait <= 0:
+                return True
+            if cancelled and cancelled():
+                return False
+            time.sleep(min(wait, 0.25))
+
+
+class BatchDispatcher:
+    """
+    Sends batches concurrently and hands the results back in order.
+
+    send(request) runs on a pool of max_in_flight worker threads; it should
+    raise on failure (rate-limit and transient errors are retried here).
+    on_result(index, batch, result, error) is called on the thread that
+    called run(), in batch order.
+    """
+
+    def __init__(self, send: Callable[[Any], Any], limits: DispatchLimits,
+                 estimate_tokens: Optional[Callable[[Any], int]] = None,
+                 log: Optional[Callable[[str], None]] = None, rng: Optional[random.Random] = None):
+        self.send = send
+        self.limits = limits
+        self.estimate_tokens = estimate_tokens
+        self.log = log or print
+        self._rng = rng or random.Random()
+        self._requests = TokenBucket(limits.requests_per_minute) if limits.requests_per_minute else None
+        self._tokens = TokenBucket(limits.tokens_per_minute) if limits.tokens_per_minute else None
+        self._pause_until = 0.0
+        self._lock = threading.Lock()
+        self._cancelled: Callable[[], bool] = lambda: False
+        # Statistics of the last run()
+        self.stats = {'requests': 0, 'retries': 0, 'rate_limited': 0, 'max_in_flight': 0}
+        self._in_flight = 0
+
+    def _backoff(self, attempt: int, exc: BaseException) -> float:
+        """Seconds to wait before retry number attempt + 1"""
+        retry_after = retry_after_seconds(exc)
+        if retry_after is not None:
+            # Small jitter so workers told the same Retry-After don't return together
+            return min(retry_after, self.limits.backoff_max) + self._rng.uniform(0, 0.5)
+        # Exponential with jitter: uniform over [half, all] of base * 2^attempt, capped
+        ceiling = min(self.limits.backoff_max, self.limits.backoff_base * (2 ** attempt))
+        return self._rng.uniform(ceiling / 2, ceiling)
+
+    def _sleep(self, seconds: float):
+        """Sleep in small steps so cancellation is noticed"""
+        end = time.monotonic() + seconds
+        while not self._cancelled():
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(remaining, 0.25))
+
+    def _wait_for_slot(self, tokens: int):
+        """Wait out a rate-limit pause and take request and token budget"""
+        while True:
+            with self._lock:
+                pause = self._pause_until - time.monotonic()
+            if pause > 0:
+                self._sleep(pause)
+            if self._cancelled():
+                raise DispatchCancelled()
+            if self._requests and not self._requests.acquire(1, self._cancelled):
+                raise DispatchCancelled()
+            if self._tokens and tokens and not self._tokens.acquire(tokens, self._cancelled):
+                raise DispatchCancelled()
+            with self._lock:
+                # A 429 elsewhere may have started a pause while we waited for budget
+                if self._pause_until <= time.monotonic():
+                    return
+
+    def _send_with_retry(self, request: Any) -> Any:
+        tokens = self.estimate_tokens(request) if self.estimate_tokens else 0
+        attempt = 0
+        while True:
+            self._wait_for_slot(tokens)
+            with self._lock:
+                self.stats['requests'] += 1
+                self._in_flight += 1
+                self.stats['max_in_flight'] = max(self.stats['max_in_flight'], self._in_flight)
+            try:
+                return self.send(request)
+            except Exception as e:
+                rate_limited = is_rate_limit_error(e)
+                if attempt >= self.limits.max_retries or not (rate_limited or is_transient_error(e)):
+                    raise
+                delay = self._backoff(attempt, e)
+                with self._lock:
+                    self.stats['retries'] += 1
+                    if rate_limited:
+                        self.stats['rate_limited'] += 1
+                        # Hold back every worker, not just this one
+                        self._pause_until = max(self._pause_until, time.monotonic() + delay)
+                self.log(f"⏳ {'Rate limited' if rate_limited else 'Request failed'} ({e}); "
+                         f"retry {attempt + 1}/{self.limits.max_retries} in {delay:.1f}s")
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+            attempt += 1
+            self._sleep(delay)
+
+    def run(self, batches: Iterable[Any], on_result: Callable[[int, Any, Any, Optional[BaseException]], None],
+            prepare: Optional[Callable[[Any], Any]] = None,
+            cancelled: Optional[Callable[[], bool]] = None) -> int:
+        """
+        Send all batches and report each result in order.
+
+        Args:
+            batches: The batches (any objects). Iterators are consumed lazily as
+                slots free up, so a generator can plan later batches from the
+                results of earlier ones
+            on_result: Called as (index, batch, result, error) in batch order;
+                error is the exception if the batch failed (result is then None)
+            prepare: Turns a batch into the request passed to send(); runs on
+                the calling thread, just before the batch is queued
+            cancelled: Returns True to stop; batches already sent are still
+                reported, the rest are not
+
+        Returns:
+            Number of batches reported
+        """
+        source = iter(batches)
+        batches = {}  # index -> batch, until reported
+        exhausted = False
+        self._cancelled = cancelled or (lambda: False)
+        self.stats = {'requests': 0, 'retries': 0, 'rate_limited': 0, 'max_in_flight': 0}
+        # Queue a few batches beyond the in-flight limit, so a slow batch at the
+        # head of the line doesn't leave workers idle
+        window = self.limits.max_in_flight * 2
+        pending = {}
+        next_submit = 0
+        next_report = 0
+        reported = 0
+        with ThreadPoolExecutor(max_workers=self.limits.max_in_flight,
+                                thread_name_prefix='llm-dispatch') as pool:
+            while True:
+                while not exhausted and len(pending) < window and not self._cancelled():
+                    try:
+                        batch = next(source)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    batches[next_submit] = batch
+                    try:
+                        request = prepare(batch) if prepare else batch
+                        pending[next_submit] = pool.submit(self._send_with_retry, request)
+                    except Exception as e:
+                        pending[next_submit] = e
+                    next_submit += 1
+                if next_report >= next_submit:
+                    break  # All done, or cancelled and nothing more queued
+                index = next_report
+                next_report += 1
+                future = pending.pop(index)
+                result, error = None, None
+                if isinstance(future, Exception):
+                    error = future
+                else:
+                    try:
+                        result = future.result()
+                    except DispatchCancelled:
+                        continue  # Never sent
+                    except Exception as e:
+                        error = e
+                on_result(index, batches.pop(index), result, error)
+                reported += 1
+        return reported
@@ -60,6 +60,7 @@ class BenchmarkResult:
     tokens_input: Optional[int] = None
     tokens_output: Optional[int] = None
     cost_estimate: Optional[float] = None
+    cached: bool = False  # Answered from the response cache (latency not comparable)
 
 
 @dataclass
@@ -285,7 +286,8 @@ Return ONLY the translation, no explanations or additional text."""
                     self.log(f"   ERROR {model_config.name} seg {segment.id}: {result.error}")
                 else:
                     quality_str = f", chrF++: {result.quality_score:.1f}" if result.quality_score else ""
-                    self.log(f"   OK {model_config.name} seg {segment.id}: {result.latency_ms:.0f}ms{quality_str}")
+                    cached_str = " (cached)" if result.cached else ""
+                    self.log(f"   OK {model_config.name} seg {segment.id}: {result.latency_ms:.0f}ms{cached_str}{quality_str}")
 
         self.is_running = False
         self.log(f"Benchmark complete: {len(self.results)} results")
@@ -378,7 +380,8 @@ Return ONLY the translation, no explanations or additional text."""
                     text=segment.source,
                     source_lang=source_lang,
                     target_lang=target_lang,
-                    custom_prompt=prompt
+                    custom_prompt=prompt,
+                    use_cache=True
                 )
                 elapsed_time = time.perf_counter() - start_time
 
@@ -393,6 +396,7 @@ Return ONLY the translation, no explanations or additional text."""
 
                 result.output = output if isinstance(output, str) else str(output)
                 result.latency_ms = elapsed_time * 1000
+                result.cached = getattr(client, 'last_response_cached', False)
 
             except Exception as translate_err:
                 result.error = f"Translation failed: {str(translate_err)}"
@@ -462,7 +466,8 @@ Return ONLY the translation, no explanations or additional text."""
                 model_stats["error_count"] += 1
             else:
                 model_stats["success_count"] += 1
-                model_stats["latencies"].append(result.latency_ms)
+                if not result.cached:
+                    model_stats["latencies"].append(result.latency_ms)
 
                 if result.quality_score is not None:
                     model_stats["quality_scores"].append(result.quality_score)
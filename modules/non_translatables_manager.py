@@ -20,10 +20,18 @@ Features:
 - Case-sensitive/insensitive matching options
 - Merge import with duplicate detection
 - Export to native format
+
+Matching:
+find_all_matches() used to run every entry of every active list as its own
+regex over each segment (rebuilt each time, as Python's re cache only holds
+512 patterns). The active lists are now compiled into one NonTranslatableMatcher
+- a trie-shaped regex per case mode - that finds all spans of a segment in one
+pass. It is cached and rebuilt only after a list changes.
 """
 
 import os
 import re
+import threading
 import yaml
 import xml.etree.ElementTree as ET
 from pathlib import Path
@@ -39,6 +47,24 @@ class NonTranslatable:
     case_sensitive: bool = True  # Default to case-sensitive matching
     category: str = ""
     notes: str = ""
+    # Compiled pattern and the (text, case_sensitive) it was built for
+    _compiled: Optional[Tuple[str, bool, 're.Pattern']] = field(default=None, init=False, repr=False, compare=False)
+    
+    def _pattern(self) -> 're.Pattern':
+        """
+        Compiled match pattern, built once per text / case setting.
+        
+        - Full word only: no word character may precede the entry, and none
+          may follow it if it ends with a letter or digit
+        - Special characters at the end (®, ™, etc.) need no trailing boundary
+        """
+        if self._compiled is None or self._compiled[:2] != (self.text, self.case_sensitive):
+            pattern = r'(?<!\w)' + re.escape(self.text)
+            if self.text and self.text[-1].isalnum():
+                pattern += r'(?!\w)'
+            flags = 0 if self.case_sensitive else re.IGNORECASE
+            self._compiled = (self.text, self.case_sensitive, re.compile(pattern, flags))
+        return self._compiled[2]
     
     def matches(self, source_text: str) -> List[Tuple[int, int]]:
         """
@@ -53,35 +79,11 @@ class NonTranslatable:
             List of (start_pos, end_pos) tuples for each match
         """
         matches = []
-        pattern = self.text
-        
-        # Escape special regex characters in the pattern
-        escaped_pattern = re.escape(pattern)
-        
-        # Set regex flags based on case sensitivity
+        escaped_pattern = re.escape(self.text)
         flags = 0 if self.case_sensitive else re.IGNORECASE
         
-        # Check if pattern starts/ends with word characters (letters, digits, underscore)
-        # Word boundaries only work properly between word and non-word characters
-        starts_with_word_char = pattern and pattern[0].isalnum()
-        ends_with_word_char = pattern and pattern[-1].isalnum()
-        
-        # Build pattern with appropriate boundaries
-        if starts_with_word_char:
-            boundary_pattern = r'\b' + escaped_pattern
-        else:
-            # For patterns starting with special chars, use start of string or whitespace/punctuation
-            boundary_pattern = r'(?:^|(?<=\s)|(?<=[^\w]))' + escaped_pattern
-        
-        if ends_with_word_char:
-            boundary_pattern = boundary_pattern + r'\b'
-        else:
-            # For patterns ending with special chars (like ®, ™), no trailing boundary needed
-            # The special char itself acts as a natural boundary
-            pass
-        
         try:
-            for match in re.finditer(boundary_pattern, source_text, flags):
+            for match in self._pattern().finditer(source_text):
                 matches.append((match.start(), match.end()))
         except re.error:
             # Fallback: try simpler word boundary pattern
@@ -160,6 +162,106 @@ class NonTranslatableList:
         return all_matches
 
 
+class NonTranslatableMatcher:
+    """
+    All entries of a set of NT lists compiled for one-pass matching.
+    
+    Entries are merged into a character trie that becomes a single regex
+    (one for case-sensitive entries, one for the others), so the regex engine
+    only follows the branches that match the text instead of trying every
+    entry. The boundary rules are those of NonTranslatable.matches(). At a
+    position the longest entry wins; entries occurring in several lists are
+    reported for the first active list.
+    """
+    
+    def __init__(self, nt_lists: List[NonTranslatableList]):
+        self.entry_count = 0
+        # (compiled regex, {matched key: (entry, list_name, list_index)}, case_sensitive)
+        self._patterns = []
+        for case_sensitive in (True, False):
+            lookup = {}
+            for list_index, nt_list in enumerate(nt_lists):
+                for entry in nt_list.entries:
+                    if entry.case_sensitive != case_sensitive or not entry.text:
+                        continue
+                    key = entry.text if case_sensitive else entry.text.lower()
+                    if key not in lookup:
+                        lookup[key] = (entry, nt_list.name, list_index)
+            if lookup:
+                self.entry_count += len(lookup)
+                pattern = r'(?<!\w)' + self._trie_regex(lookup)
+                self._patterns.append((re.compile(pattern, 0 if case_sensitive else re.IGNORECASE),
+                                       lookup, case_sensitive))
+    
+    def __bool__(self) -> bool:
+        return bool(self._patterns)
+    
+    @staticmethod
+    def _trie_regex(texts) -> str:
+        """Regex source matching any of texts, longest first, with trailing boundaries"""
+        trie = {}
+        for text in texts:
+            node = trie
+            for ch in text:
+                node = node.setdefault(ch, {})
+            node[''] = True
+        
+        def node_regex(node: dict, last_char: str) -> str:
+            alternatives = []
+            for ch in sorted(key for key in node if key):
+                # Follow single-child chains without nesting a group per character
+                chain, child = [ch], node[ch]
+                while len(child) == 1 and '' not in child:
+                    next_ch = next(iter(child))
+                    chain.append(next_ch)
+                    child = child[next_ch]
+                alternatives.append(re.escape(''.join(chain)) + node_regex(child, chain[-1]))
+            if '' in node:
+                # Entry ends here; tried last so longer entries win
+                alternatives.append(r'(?!\w)' if last_char.isalnum() else '')
+            if len(alternatives) == 1:
+                return alternatives[0]
+            return '(?:' + '|'.join(alternatives) + ')'
+        
+        return node_regex(trie, '')
+    
+    def find_all(self, source_text: str) -> List[Dict]:
+        """
+        Find all NT spans in source text.
+        
+        Returns:
+            List of dicts with 'text', 'start', 'end', 'entry', 'list_name' keys,
+            sorted by position, without overlaps (the longer match is kept)
+        """
+        if not source_text or not self._patterns:
+            return []
+        all_matches = []
+        for regex, lookup, case_sensitive in self._patterns:
+            for match in regex.finditer(source_text):
+                matched_text = match.group()
+                found = lookup.get(matched_text if case_sensitive else matched_text.lower())
+                if found is None:
+                    continue  # Case folding the IGNORECASE regex allows but lower() doesn't
+                all_matches.append((match.start(), match.end(), found))
+        if len(self._patterns) > 1:
+            # Merge both case modes: earliest, then longest, then first list; no overlaps
+            all_matches.sort(key=lambda m: (m[0], m[0] - m[1], m[2][2]))
+            filtered = []
+            last_end = -1
+            for match in all_matches:
+                if match[0] >= last_end:
+                    filtered.append(match)
+                    last_end = match[1]
+            all_matches = filtered
+        return [{
+            'text': source_text[start:end],
+            'start': start,
+            'end': end,
+            'entry': found[0],
+            'list_name': found[1]
+        } for start, end, found in all_matches]
+
+
 class NonTranslatablesManager:
     """Manages non-translatable lists: loading, saving, searching, import/export"""
     
@@ -180,6 +282,11 @@ class NonTranslatablesManager:
         self.lists: Dict[str, NonTranslatableList] = {}  # name -> list
         self.active_lists: List[str] = []  # Names of active lists
         
+        # Compiled matcher for the active lists (see get_matcher)
+        self._matcher: Optional[NonTranslatableMatcher] = None
+        self._matcher_key = None
+        self._matcher_lock = threading.Lock()
+        
         # Ensure directory exists
         self.base_path.mkdir(parents=True, exist_ok=True)
     
@@ -482,6 +589,7 @@ class NonTranslatablesManager:
             Number of lists loaded
         """
         self.lists.clear()
+        self.invalidate_matcher()
         count = 0
         
         # Load new .svntl files
@@ -521,6 +629,7 @@ class NonTranslatablesManager:
                 self.active_lists.append(name)
             elif not active and name in self.active_lists:
                 self.active_lists.remove(name)
+            self.invalidate_matcher()
     
     def create_list(self, name: str, description: str = "") -> NonTranslatableList:
         """Create a new empty NT list"""
@@ -530,6 +639,7 @@ class NonTranslatablesManager:
         )
         self.lists[name] = nt_list
         self.active_lists.append(name)
+        self.invalidate_matcher()
         return nt_list
     
     def delete_list(self, name: str) -> bool:
@@ -552,6 +662,7 @@ class NonTranslatablesManager:
         del self.lists[name]
         if name in self.active_lists:
             self.active_lists.remove(name)
+        self.invalidate_matcher()
         
         self.log(f"✓ Deleted NT list: {name}")
         return True
@@ -594,6 +705,7 @@ class NonTranslatablesManager:
             added += 1
         
         target.modified_date = datetime.now().isoformat()
+        self.invalidate_matcher()
         
         self.log(f"✓ Merged into {target_name}: {added} added, {skipped} duplicates skipped")
         return (added, skipped)
@@ -606,6 +718,7 @@ class NonTranslatablesManager:
         entry = NonTranslatable(text=text, notes=notes, category=category)
         self.lists[list_name].entries.append(entry)
         self.lists[list_name].modified_date = datetime.now().isoformat()
+        self.invalidate_matcher()
         return True
     
     def remove_entry(self, list_name: str, text: str) -> bool:
@@ -619,6 +732,7 @@ class NonTranslatablesManager:
         
         if len(nt_list.entries) < original_count:
             nt_list.modified_date = datetime.now().isoformat()
+            self.invalidate_matcher()
             return True
         return False
     
@@ -626,34 +740,48 @@ class NonTranslatablesManager:
     # SEARCH & MATCHING
     # ========================================================================
     
+    def invalidate_matcher(self):
+        """
+        Drop the compiled matcher; the next search rebuilds it. Called by the
+        methods that change lists - call it after changing a list's entries
+        or the active lists directly.
+        """
+        with self._matcher_lock:
+            self._matcher = None
+    
+    def _matcher_fingerprint(self) -> Tuple:
+        """Cheap check for list changes made without invalidate_matcher()"""
+        return tuple((nt_list.name, id(nt_list), id(nt_list.entries), len(nt_list.entries))
+                     for nt_list in self.get_active_lists())
+    
+    def get_matcher(self) -> NonTranslatableMatcher:
+        """
+        Matcher for all active lists, compiled on first use after a change.
+        
+        Returns:
+            NonTranslatableMatcher (shared, safe to use from worker threads)
+        """
+        key = self._matcher_fingerprint()
+        with self._matcher_lock:
+            if self._matcher is None or self._matcher_key != key:
+                self._matcher = NonTranslatableMatcher(self.get_active_lists())
+                self._matcher_key = key
+            return self._matcher
+    
     def find_all_matches(self, source_text: str) -> List[Dict]:
         """
-        Find all NT matches in source text from all active lists.
+        Find all NT matches in source text from all active lists, in one pass
+        with the cached matcher.
         
         Args:
             source_text: Text to search in
             
         Returns:
-            List of match dicts sorted by position
+            List of match dicts sorted by position (overlaps removed, longer match kept)
         """
-        all_matches = []
-        
-        for nt_list in self.get_active_lists():
-            matches = nt_list.find_matches(source_text)
-            all_matches.extend(matches)
-        
-        # Sort by position, remove overlapping matches (keep longer ones)
-        all_matches.sort(key=lambda m: (m['start'], -(m['end'] - m['start'])))
-        
-        # Remove overlapping matches
-        filtered = []
-        last_end = -1
-        for match in all_matches:
-            if match['start'] >= last_end:
-                filtered.append(match)
-                last_end = match['end']
-        
-        return filtered
+        if not source_text:
+            return []
+        return self.get_matcher().find_all(source_text)
     
     def get_unique_entries_from_active(self) -> Set[str]:
         """Get all unique NT entries from active lists (lowercase)"""
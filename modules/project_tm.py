@@ -10,10 +10,11 @@ Inspired by CafeTran's "Total Recall" feature.
 
 import sqlite3
 import threading
-from difflib import SequenceMatcher
 from typing import Dict, List, Optional, Callable
 import re
 
+from modules.similarity import get_backend, strip_tags_lower
+
 
 class ProjectTM:
     """
@@ -282,9 +283,13 @@ class ProjectTM:
 
                     candidates = cursor.fetchall()
 
-                    # Re-rank by actual similarity
-                    for row in candidates:
-                        similarity = self._calculate_similarity(source_text, row['source_text'])
+                    # Re-rank by actual similarity (one batched backend call)
+                    scores = get_backend().ratio_batch(
+                        strip_tags_lower(source_text),
+                        [strip_tags_lower(row['source_text']) for row in candidates],
+                        score_cutoff=0.5
+                    )
+                    for row, similarity in zip(candidates, scores):
                         if similarity >= 0.5:  # Lower threshold for ProjectTM (pre-filtered)
                             results.append({
                                 'source_text': row['source_text'],
@@ -307,10 +312,8 @@ class ProjectTM:
 
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate similarity ratio between two texts"""
-        # Strip HTML/XML tags for comparison
-        clean1 = re.sub(r'<[^>]+>', '', text1).lower()
-        clean2 = re.sub(r'<[^>]+>', '', text2).lower()
-        return SequenceMatcher(None, clean1, clean2).ratio()
+        # Tags are stripped for comparison
+        return get_backend().ratio(strip_tags_lower(text1), strip_tags_lower(text2))
 
     def get_stats(self) -> Dict:
         """Get statistics about the ProjectTM"""
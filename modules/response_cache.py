@@ -0,0 +1,256 @@
+"""
+Response Cache Module
+
+On-disk cache of LLM and MT responses, keyed by a hash of everything that
+determines the answer (provider, model, system prompt, prompt, temperature,
+...). Re-running pre-translation after a crash, re-translating a revised file
+or re-running an LLM Leaderboard test returns identical requests from the
+cache instantly and without API cost.
+
+Entries expire after a TTL; when the cache grows past its size limit the
+least recently used entries are evicted. The cache is off until the
+application calls configure_response_cache(), and can be switched off
+globally (enabled=False). Callers opt in per call (use_cache=True): batch
+pre-translation, the LLM Leaderboard and TranslationServices do; interactive
+requests (single-segment translation, QuickMenu, assistant) always reach the
+model.
+
+Usage:
+    from modules.response_cache import configure_response_cache, get_response_cache, response_cache_key
+
+    configure_response_cache("user_data/cache/responses.db", ttl_days=30, max_size_mb=200)
+    cache = get_response_cache()          # None when not configured or disabled
+    key = response_cache_key(kind="llm", provider="openai", model="gpt-4o", prompt=prompt)
+    text = cache.get(key)
+    if text is None:
+        text = call_api(prompt)
+        cache.put(key, text, provider="openai", model="gpt-4o")
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+
+def response_cache_key(**parts) -> str:
+    """
+    Content hash of a request.
+
+    Args:
+        **parts: Everything that determines the response (JSON-serializable)
+
+    Returns:
+        SHA-256 hex digest
+    """
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed response cache with TTL, LRU size eviction and hit counters"""
+
+    def __init__(self, db_path: str, ttl_days: float = 30, max_size_mb: float = 200, enabled: bool = True):
+        """
+        Args:
+            db_path: Path to the SQLite cache file (created on first use)
+            ttl_days: Entries older than this are not returned (0 = never expire)
+            max_size_mb: Evict least recently used entries above this size
+            enabled: False bypasses the cache entirely
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_days * 86400
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.connection = None
+        self.cursor = None
+        self._size = 0
+        self._lock = threading.Lock()  # Pre-translation sends batches from several threads
+
+    def _connect(self):
+        """Open the database on first use"""
+        if self.connection is not None:
+            return
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.cursor = self.connection.cursor()
+        self.cursor.execute("PRAGMA journal_mode=WAL")
+        self.cursor.execute("PRAGMA synchronous=NORMAL")
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                provider TEXT,
+                model TEXT,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+        """)
+        self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses(last_used)")
+        self.connection.commit()
+        self._size = self.cursor.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Key from response_cache_key()
+
+        Returns:
+            Cached response text, or None on a miss or expired entry
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            self._connect()
+            row = self.cursor.execute("SELECT response, created_at FROM responses WHERE key = ?",
+                                      (key,)).fetchone()
+            now = time.time()
+            if row and self.ttl_seconds and now - row[1] > self.ttl_seconds:
+                self._delete_where("key = ?", (key,))
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self.cursor.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+            self.connection.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, response: str, provider: str = "", model: str = ""):
+        """
+        Store a response (empty responses are not cached).
+
+        Args:
+            key: Key from response_cache_key()
+            response: Response text
+            provider: Provider name (for stats)
+            model: Model name (for stats)
+        """
+        if not self.enabled or not response:
+            return
+        size = len(response.encode('utf-8')) + len(key)
+        with self._lock:
+            self._connect()
+            old = self.cursor.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            now = time.time()
+            self.cursor.execute(
+                "INSERT OR REPLACE INTO responses (key, response, provider, model, created_at, last_used, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)", (key, response, provider, model, now, now, size))
+            self._size += size - (old[0] if old else 0)
+            if self.max_bytes and self._size > self.max_bytes:
+                self._evict()
+            # Committed per entry so a crash mid-run keeps everything paid for so far
+            self.connection.commit()
+
+    def _delete_where(self, condition: str, params: tuple):
+        freed = self.cursor.execute(f"SELECT COALESCE(SUM(size), 0) FROM responses WHERE {condition}",
+                                    params).fetchone()[0]
+        self.cursor.execute(f"DELETE FROM responses WHERE {condition}", params)
+        self._size -= freed
+
+    def _evict(self):
+        """Drop expired entries, then least recently used ones down to 90% of the limit"""
+        if self.ttl_seconds:
+            self._delete_where("created_at < ?", (time.time() - self.ttl_seconds,))
+        target = int(self.max_bytes * 0.9)
+        while self._size > target:
+            rows = self.cursor.execute("SELECT key, size FROM responses ORDER BY last_used LIMIT 500").fetchall()
+            if not rows:
+                self._size = 0
+                break
+            drop = []
+            for key, size in rows:
+                drop.append((key,))
+                self._size -= size
+                if self._size <= target:
+                    break
+            self.cursor.executemany("DELETE FROM responses WHERE key = ?", drop)
+
+    def clear(self):
+        """Delete all cached responses and reset the counters"""
+        with self._lock:
+            self._connect()
+            self.cursor.execute("DELETE FROM responses")
+            self.connection.commit()
+            self.cursor.execute("VACUUM")
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict:
+        """
+        Returns:
+            Dict with hits, misses, hit_rate (0-1), entries and size_bytes
+        """
+        with self._lock:
+            entries = 0
+            if self.connection is not None or os.path.exists(self.db_path):
+                self._connect()
+                entries = self.cursor.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'entries': entries,
+                'size_bytes': self._size,
+            }
+
+    def close(self):
+        with self._lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+                self.cursor = None
+
+
+_response_cache: Optional[ResponseCache] = None
+
+
+def configure_response_cache(db_path: str, ttl_days: float = 30, max_size_mb: float = 200,
+                             enabled: bool = True) -> ResponseCache:
+    """
+    Set up (or update) the process-wide response cache.
+
+    Args:
+        db_path: Path to the SQLite cache file
+        ttl_days: Entry lifetime in days (0 = never expire)
+        max_size_mb: Size limit before LRU eviction
+        enabled: False bypasses the cache (hit counters are kept)
+
+    Returns:
+        The ResponseCache instance
+    """
+    global _response_cache
+    if _response_cache is None or _response_cache.db_path != db_path:
+        if _response_cache is not None:
+            _response_cache.close()
+        _response_cache = ResponseCache(db_path, ttl_days, max_size_mb, enabled)
+    else:
+        _response_cache.ttl_seconds = ttl_days * 86400
+        _response_cache.max_bytes = int(max_size_mb * 1024 * 1024)
+        _response_cache.enabled = enabled
+    return _response_cache
+
+
+def get_response_cache(include_disabled: bool = False) -> Optional[ResponseCache]:
+    """
+    Args:
+        include_disabled: Also return the cache when it is switched off (for stats)
+
+    Returns:
+        The configured ResponseCache, or None if not configured (or disabled)
+    """
+    if _response_cache is None or (not _response_cache.enabled and not include_disabled):
+        return None
+    return _response_cache
@@ -0,0 +1,209 @@
+"""
+Similarity Backends - Pluggable string similarity scoring for TM fuzzy matching
+
+All TM classes score fuzzy matches through the active backend instead of
+calling difflib directly:
+
+- RapidFuzzBackend: C++ Indel-ratio (normalized LCS) from rapidfuzz, with
+  native "one query against N candidates" calls. Used when rapidfuzz is
+  installed.
+- DifflibBackend: difflib.SequenceMatcher ratio (the original scorer), used
+  as fallback. Batched calls prune candidates with quick_ratio() first.
+
+Both return scores from 0.0 to 1.0 computed as 2 * matches / total length;
+rapidfuzz counts the true longest common subsequence, so its scores can be
+slightly higher than SequenceMatcher's for reordered text.
+
+Usage:
+    from modules.similarity import get_backend
+    backend = get_backend()
+    score = backend.ratio("hello world", "hello there world")
+    scores = backend.ratio_batch("hello world", candidates, score_cutoff=0.75)
+    best = backend.best_match("hello world", candidates, score_cutoff=0.75)
+"""
+
+import re
+from difflib import SequenceMatcher
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_LINE_BREAK_RE = re.compile(r'\s*\n\s*')
+
+
+def strip_tags_lower(text: str) -> str:
+    """Strip HTML/XML tags and lowercase"""
+    return _TAG_RE.sub('', text).lower()
+
+
+def normalize_for_similarity(text: str) -> str:
+    """
+    Strip tags, lowercase and collapse line breaks (with surrounding
+    whitespace) to a single space - the comparison form used for TM matches.
+    """
+    return _LINE_BREAK_RE.sub(' ', strip_tags_lower(text)).strip()
+
+
+class SimilarityBackend:
+    """
+    Base class for similarity scorers.
+
+    Inputs are expected to be normalized already (see strip_tags_lower and
+    normalize_for_similarity); backends only compare strings.
+    """
+
+    name = 'base'
+    # best_match() stops at the first candidate scoring at least this (None = never)
+    early_exit_score: Optional[float] = None
+
+    def ratio(self, text1: str, text2: str) -> float:
+        """Similarity of two strings (0.0-1.0)"""
+        raise NotImplementedError
+
+    def ratio_batch(self, query: str, candidates: Sequence[str],
+                    score_cutoff: float = 0.0) -> List[float]:
+        """
+        Score one query against many candidates.
+
+        Returns: One score per candidate (same order); candidates scoring
+                 below score_cutoff get 0.0
+        """
+        scores = []
+        for candidate in candidates:
+            score = self.ratio(query, candidate)
+            scores.append(score if score >= score_cutoff else 0.0)
+        return scores
+
+    def best_match(self, query: str, candidates: Sequence[str],
+                   score_cutoff: float = 0.0) -> Optional[Tuple[int, float]]:
+        """
+        Find the best scoring candidate (the first one on ties).
+
+        Returns: (candidate index, score) or None if none reaches score_cutoff
+        """
+        best = None
+        for idx, score in enumerate(self.ratio_batch(query, candidates, score_cutoff)):
+            if score >= score_cutoff and score > 0.0 and (best is None or score > best[1]):
+                best = (idx, score)
+        return best
+
+
+class DifflibBackend(SimilarityBackend):
+    """difflib.SequenceMatcher ratio (pure Python fallback)"""
+
+    name = 'difflib'
+    early_exit_score = 0.999
+
+    def ratio(self, text1: str, text2: str) -> float:
+        return SequenceMatcher(None, text1, text2).ratio()
+
+    def ratio_batch(self, query: str, candidates: Sequence[str],
+                    score_cutoff: float = 0.0) -> List[float]:
+        scores = []
+        for candidate in candidates:
+            sm = SequenceMatcher(None, query, candidate)
+            # quick_ratio() is an upper bound of ratio()
+            if score_cutoff > 0.0 and sm.quick_ratio() < score_cutoff:
+                scores.append(0.0)
+                continue
+            score = sm.ratio()
+            scores.append(score if score >= score_cutoff else 0.0)
+        return scores
+
+    def best_match(self, query: str, candidates: Sequence[str],
+                   score_cutoff: float = 0.0) -> Optional[Tuple[int, float]]:
+        best_idx = None
+        best_score = 0.0
+        for idx, candidate in enumerate(candidates):
+            sm = SequenceMatcher(None, query, candidate)
+            # Skip candidates that can't beat the current best or the cutoff
+            upper = sm.quick_ratio()
+            if upper <= best_score or upper < score_cutoff:
+                continue
+            score = sm.ratio()
+            if score >= score_cutoff and score > best_score:
+                best_score = score
+                best_idx = idx
+                # Early exit on perfect match
+                if score >= self.early_exit_score:
+                    break
+        if best_idx is None:
+            return None
+        return best_idx, best_score
+
+
+class RapidFuzzBackend(SimilarityBackend):
+    """rapidfuzz Indel ratio (native, batched)"""
+
+    name = 'rapidfuzz'
+
+    def __init__(self):
+        if not RAPIDFUZZ_AVAILABLE:
+            raise ImportError("rapidfuzz is not installed (pip install rapidfuzz)")
+
+    def ratio(self, text1: str, text2: str) -> float:
+        return _rf_fuzz.ratio(text1, text2) / 100.0
+
+    def ratio_batch(self, query: str, candidates: Sequence[str],
+                    score_cutoff: float = 0.0) -> List[float]:
+        scores = [0.0] * len(candidates)
+        for _, score, idx in _rf_process.extract(query, candidates, scorer=_rf_fuzz.ratio,
+                                                 processor=None, limit=None,
+                                                 score_cutoff=score_cutoff * 100.0):
+            scores[idx] = score / 100.0
+        return scores
+
+    def best_match(self, query: str, candidates: Sequence[str],
+                   score_cutoff: float = 0.0) -> Optional[Tuple[int, float]]:
+        hit = _rf_process.extractOne(query, candidates, scorer=_rf_fuzz.ratio,
+                                     processor=None, score_cutoff=score_cutoff * 100.0)
+        if hit is None or hit[1] <= 0.0:
+            return None
+        return hit[2], hit[1] / 100.0
+
+
+_BACKENDS = {
+    'difflib': DifflibBackend,
+    'rapidfuzz': RapidFuzzBackend,
+}
+
+_active_backend: Optional[SimilarityBackend] = None
+
+
+def available_backends() -> List[str]:
+    """Names of the backends that can be used in this installation"""
+    return [name for name in _BACKENDS if name != 'rapidfuzz' or RAPIDFUZZ_AVAILABLE]
+
+
+def set_backend(name: str = 'auto') -> SimilarityBackend:
+    """
+    Select the similarity backend used by all TM classes.
+
+    Args:
+        name: 'auto' (rapidfuzz if installed, else difflib), 'rapidfuzz' or 'difflib'
+
+    Returns: The active backend
+    """
+    global _active_backend
+    if name == 'auto':
+        name = 'rapidfuzz' if RAPIDFUZZ_AVAILABLE else 'difflib'
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown similarity backend: {name} (choose from {', '.join(_BACKENDS)})")
+    if name == 'rapidfuzz' and not RAPIDFUZZ_AVAILABLE:
+        print("⚠️ rapidfuzz is not installed - using difflib similarity backend")
+        name = 'difflib'
+    _active_backend = _BACKENDS[name]()
+    return _active_backend
+
+
+def get_backend() -> SimilarityBackend:
+    """Return the active similarity backend (selected automatically on first use)"""
+    if _active_backend is None:
+        return set_backend('auto')
+    return _active_backend
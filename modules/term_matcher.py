@@ -0,0 +1,332 @@
+"""
+Term Matcher - Multi-pattern termbase matching in one pass over a segment
+
+The in-memory termbase index used to be a list of term dicts, each with its
+own compiled regex. Every segment was checked against every term (substring
+test, then regex), i.e. O(terms x segments), and 250k compiled patterns took
+hundreds of MB.
+
+TermMatcher indexes terms by their token sequence instead. Text is split into
+tokens - maximal runs of word characters (regex \\w) and single non-word
+characters - so "hinge load" becomes ("hinge", " ", "load"). Terms are stored
+in a dict keyed by their token tuple, plus the set of token lengths per first
+token. Searching tokenizes the segment once and, at every token position,
+looks up only the term lengths that exist for that first token: a single
+linear pass whose cost doesn't grow with the number of terms.
+
+Word-boundary rules are applied to each occurrence afterwards and are the
+same as the previous per-term regexes:
+- terms containing any of . % , / -  ->  (?<!\\w)term(?!\\w)
+- all other terms                     ->  \\bterm\\b
+With word_boundaries=True every term uses \\bterm\\b (the TermLens rule).
+Because word runs are never split into several tokens, every regex match
+starts and ends on token boundaries, so both approaches find the same terms.
+
+The index can be patched in place: add() new entries and remove_where()
+entries that were edited, deleted or belong to a deactivated termbase.
+
+Memory: each distinct term is stored once, in a flat list, and keyed by the
+term string itself, not by a tuple of token strings; a term with a single
+entry maps to a plain slot number instead of a list, and the token lengths
+per first token are a bit mask. Entries can be any
+object - the editor's project index stores TermRef records (term id and
+termbase id in __slots__) and fetches the rest of a term from SQLite by id
+when it matches. memory_usage() reports the footprint.
+
+Usage:
+    matcher = TermMatcher()
+    matcher.add({'source_term_lower': 'hinge load', ...})
+    matcher.add(TermRef(42, 1), 'hinge load')
+    for entry in matcher.search("The hinge load is..."):
+        ...
+    matcher.remove_where(lambda entry: entry.term_id == 42)
+"""
+
+import re
+import sys
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+
+_TOKEN_RE = re.compile(r'\w+|\W')
+
+# Terms containing these characters use (?<!\w)...(?!\w) instead of \b...\b
+PUNCTUATION_BOUNDARY_CHARS = '.%,/-'
+
+# Quote characters TermLens treats as spaces in the segment text
+QUOTE_CHARS = '\"\'\u201C\u201D\u201E\u00AB\u00BB\u2018\u2019\u201A\u2039\u203A'
+
+# Stripped from both ends of a glossary term before TermLens matches it
+# (so "ca." or "problemen." match the segment words "ca" / "problemen")
+TERMLENS_STRIP_CHARS = '.,;:!?' + QUOTE_CHARS
+
+
+def tokenize(text: str) -> Tuple[str, ...]:
+    """Split text into word runs and single non-word characters"""
+    return tuple(_TOKEN_RE.findall(text))
+
+
+def _is_word_char(ch: str) -> bool:
+    """Same definition as regex \\w for str patterns ('' = text edge)"""
+    return bool(ch) and (ch.isalnum() or ch == '_')
+
+
+def term_boundary_ok(text: str, start: int, end: int, term: str,
+                     word_boundaries: bool = False) -> bool:
+    """
+    Check the word-boundary rule for an occurrence of term at text[start:end].
+
+    Equivalent to searching text with the term's old regex at that position.
+    word_boundaries=True always applies the \\bterm\\b rule.
+    """
+    before = text[start - 1] if start > 0 else ''
+    after = text[end] if end < len(text) else ''
+    if not word_boundaries and any(c in term for c in PUNCTUATION_BOUNDARY_CHARS):
+        # (?<!\w)term(?!\w)
+        return not _is_word_char(before) and not _is_word_char(after)
+    # \bterm\b: word-ness must change at both edges
+    return (_is_word_char(before) != _is_word_char(term[0])
+            and _is_word_char(after) != _is_word_char(term[-1]))
+
+
+class TermRef:
+    """
+    Compact termbase index entry: just the ids. The term's text, translation
+    and metadata stay in SQLite and are fetched by term_id on a match.
+    """
+
+    __slots__ = ('term_id', 'termbase_id')
+
+    def __init__(self, term_id: int, termbase_id: int):
+        self.term_id = term_id
+        self.termbase_id = termbase_id
+
+    def __repr__(self) -> str:
+        return f"TermRef(term_id={self.term_id}, termbase_id={self.termbase_id})"
+
+
+class TermMatcher:
+    """
+    Token-sequence index of termbase entries.
+
+    Each entry is stored with its lowercased, stripped source term: dict
+    entries bring it as 'source_term_lower', other entries (e.g. TermRef)
+    pass it to add(). Entries are returned untouched. search() returns
+    matching entries longest term first (insertion order for equal lengths),
+    the order of the former sorted term list.
+    """
+
+    def __init__(self, entries: Iterable[Dict] = (), word_boundaries: bool = False):
+        self.word_boundaries = word_boundaries
+        # Parallel slot arrays; removed entries leave None slots until the next compaction
+        self._terms: List[Optional[str]] = []
+        self._entries: List[Any] = []
+        self._count = 0
+        # term -> slot (one entry) or list of slots (several entries)
+        self._by_term: Dict[str, Union[int, List[int]]] = {}
+        # first token -> bit mask of the token lengths of the terms starting with it
+        self._lengths: Dict[str, int] = {}
+        # (first token, token length) -> number of distinct terms with it, only
+        # kept when more than one (most are unique; short masks are shared ints)
+        self._length_refs: Dict[Tuple[str, int], int] = {}
+        self._lock = threading.RLock()
+        for entry in entries:
+            self.add(entry)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def __iter__(self):
+        with self._lock:
+            return iter([entry for entry in self._entries if entry is not None])
+
+    def add(self, entry: Any, term: Optional[str] = None) -> bool:
+        """
+        Add a termbase entry.
+
+        Args:
+            entry: The object search() returns for this term
+            term: Lowercased, stripped source term (default: entry['source_term_lower'])
+
+        Returns: False if the term is empty (nothing was added)
+        """
+        if term is None:
+            term = entry.get('source_term_lower') or ''
+        tokens = tokenize(term)
+        if not tokens:
+            return False
+        with self._lock:
+            idx = len(self._entries)
+            slots = self._by_term.get(term)
+            if slots is None:
+                self._by_term[term] = idx
+                self._add_length(term, tokens)
+            elif isinstance(slots, int):
+                term = self._terms[slots]  # Share one string per distinct term
+                self._by_term[term] = [slots, idx]
+            else:
+                term = self._terms[slots[0]]
+                slots.append(idx)
+            self._entries.append(entry)
+            self._terms.append(term)
+            self._count += 1
+        return True
+
+    def remove_where(self, predicate: Callable[[Any], bool]) -> List[Any]:
+        """
+        Remove every entry for which predicate(entry) is true.
+
+        Args:
+            predicate: Called once per entry
+
+        Returns: The removed entries
+        """
+        removed = []
+        with self._lock:
+            for idx, entry in enumerate(self._entries):
+                if entry is None or not predicate(entry):
+                    continue
+                removed.append(entry)
+                term = self._terms[idx]
+                self._entries[idx] = None
+                self._terms[idx] = None
+                self._count -= 1
+                slots = self._by_term[term]
+                if isinstance(slots, int):
+                    del self._by_term[term]
+                    self._drop_length(tokenize(term))
+                else:
+                    slots.remove(idx)
+                    if len(slots) == 1:
+                        self._by_term[term] = slots[0]
+            if len(self._entries) > 2 * self._count + 1000:
+                self._compact()
+        return removed
+
+    def _add_length(self, term: str, tokens: Tuple[str, ...]):
+        """Record the token length of a new distinct term under its first token"""
+        # A one-token term is its own first token: reuse the string
+        first = term if len(tokens) == 1 else tokens[0]
+        bit = 1 << len(tokens)
+        mask = self._lengths.get(first, 0)
+        if mask & bit:
+            key = (first, len(tokens))
+            self._length_refs[key] = self._length_refs.get(key, 1) + 1
+        else:
+            self._lengths[first] = mask | bit
+
+    def _drop_length(self, tokens: Tuple[str, ...]):
+        """Forget a token length for tokens[0] once no term has it any more"""
+        key = (tokens[0], len(tokens))
+        refs = self._length_refs.get(key, 1)
+        if refs > 2:
+            self._length_refs[key] = refs - 1
+        elif refs == 2:
+            del self._length_refs[key]
+        else:
+            mask = self._lengths[tokens[0]] & ~(1 << len(tokens))
+            if mask:
+                self._lengths[tokens[0]] = mask
+            else:
+                del self._lengths[tokens[0]]
+
+    def _compact(self):
+        """Rebuild the index without the slots of removed entries"""
+        pairs = [(entry, term) for entry, term in zip(self._entries, self._terms) if entry is not None]
+        self._terms, self._entries, self._count = [], [], 0
+        self._by_term, self._lengths, self._length_refs = {}, {}, {}
+        for entry, term in pairs:
+            self.add(entry, term)
+
+    def memory_usage(self) -> Dict[str, int]:
+        """
+        Approximate memory held by the index (sys.getsizeof of its containers,
+        terms, slot lists and entries, each shared object counted once).
+
+        Returns: {'terms': entry count, 'bytes': total, 'bytes_per_term': average}
+        """
+        seen = set()
+
+        def size(obj) -> int:
+            if obj is None or id(obj) in seen:
+                return 0
+            seen.add(id(obj))
+            return sys.getsizeof(obj)
+
+        with self._lock:
+            total = sum(size(obj) for obj in (self._terms, self._entries, self._by_term,
+                                              self._lengths, self._length_refs))
+            total += sum(size(term) for term in self._terms)
+            for slots in self._by_term.values():
+                total += size(slots)
+            for first, mask in self._lengths.items():
+                total += size(first) + size(mask)
+            total += sum(size(key) for key in self._length_refs)
+            for entry in self._entries:
+                total += size(entry)
+                if isinstance(entry, dict):
+                    total += sum(size(value) for value in entry.values())
+                elif hasattr(entry, '__slots__'):
+                    total += sum(size(getattr(entry, name, None)) for name in entry.__slots__)
+            count = self._count
+        return {'terms': count, 'bytes': total, 'bytes_per_term': total // count if count else 0}
+
+    def search(self, text: str) -> List[Any]:
+        """
+        Find every entry whose term occurs in text (case-insensitive) with
+        valid word boundaries.
+
+        Returns: Matching entries, each once
+        """
+        if not text or not self._count:
+            return []
+
+        text_lower = text.lower()
+        tokens = tokenize(text_lower)
+        with self._lock:
+            return self._search_tokens(text_lower, tokens)
+
+    def _search_tokens(self, text_lower: str, tokens: Tuple[str, ...]) -> List[Any]:
+        by_term = self._by_term
+        lengths = self._lengths
+
+        # Token i spans text_lower[starts[i]:starts[i + 1]]
+        starts = [0]
+        for token in tokens:
+            starts.append(starts[-1] + len(token))
+
+        found = set()
+        token_count = len(tokens)
+        for i, token in enumerate(tokens):
+            mask = lengths.get(token)
+            if mask is None:
+                continue
+            start = starts[i]
+            # Token lengths in ascending order
+            while mask:
+                low = mask & -mask
+                mask ^= low
+                n = low.bit_length() - 1
+                if i + n > token_count:
+                    break
+                end = starts[i + n]
+                # Equal text means equal tokens: word runs are never split
+                candidate = text_lower[start:end]
+                slots = by_term.get(candidate)
+                if slots is None:
+                    continue
+                if term_boundary_ok(text_lower, start, end, candidate, self.word_boundaries):
+                    if isinstance(slots, int):
+                        found.add(slots)
+                    else:
+                        found.update(slots)
+
+        if not found:
+            return []
+        terms = self._terms
+        # Longest term first, then insertion order
+        ordered = sorted(found, key=lambda idx: (-len(terms[idx]), idx))
+        return [self._entries[idx] for idx in ordered]
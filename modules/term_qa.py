@@ -0,0 +1,279 @@
+"""
+Terminology QA - Batch check of a project's targets against its termbases
+
+Termbase terms marked forbidden (and forbidden synonyms) were only shown as
+red highlights in the segment being edited. This module checks all segments
+in one go and reports:
+
+- missing terms: a source term occurs in the source, but none of its approved
+  translations (target term and non-forbidden target synonyms, of any entry
+  with the same source term) occurs in the target
+- forbidden terms: the target contains the target term of a forbidden entry
+  or a forbidden target synonym
+
+Every term is compiled into two TermMatchers - source terms (plus their
+non-forbidden source synonyms) and target terms (approved and forbidden
+ones together) - so a segment costs one pass over its source and one pass
+over its target, whatever the number of terms. Matching uses the TermMatcher
+word-boundary rules, case-insensitive. Untranslated segments are skipped.
+
+Usage:
+    checker = TermQAChecker(db.get_termbase_qa_terms(project_id))
+    report = checker.check(project.segments, progress_callback=...)
+    report.export_tsv("qa.tsv")
+    report.export_html("qa.html", title=project.name)
+"""
+
+import csv
+import html
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional
+
+from modules.term_matcher import TermMatcher
+
+
+MISSING_TERM = 'missing'
+FORBIDDEN_TERM = 'forbidden'
+
+ISSUE_LABELS = {
+    MISSING_TERM: "Missing term translation",
+    FORBIDDEN_TERM: "Forbidden term used",
+}
+
+
+def _normalize(term: Optional[str]) -> str:
+    """Lowercased, stripped term as matched ('' = too short to match)"""
+    term = (term or '').lower().strip()
+    return term if len(term) >= 2 else ''
+
+
+@dataclass
+class TermQAIssue:
+    """One terminology problem in one segment"""
+    segment_id: int
+    kind: str  # MISSING_TERM or FORBIDDEN_TERM
+    source_term: str
+    target_terms: List[str]  # Approved translations (missing) or the forbidden term found
+    termbase_name: str = ''
+    term_id: Optional[int] = None
+
+    @property
+    def label(self) -> str:
+        return ISSUE_LABELS.get(self.kind, self.kind)
+
+    @property
+    def message(self) -> str:
+        if self.kind == MISSING_TERM:
+            return f"'{self.source_term}' should be translated as: {' | '.join(self.target_terms)}"
+        return f"Forbidden term '{' | '.join(self.target_terms)}' (for '{self.source_term}')"
+
+
+@dataclass
+class TermQAReport:
+    """Result of a terminology QA run"""
+    issues: List[TermQAIssue] = field(default_factory=list)
+    segments_checked: int = 0
+    segments_skipped: int = 0  # Untranslated
+    terms: int = 0
+    elapsed: float = 0.0
+    cancelled: bool = False
+
+    def count(self, kind: str) -> int:
+        return sum(1 for issue in self.issues if issue.kind == kind)
+
+    def segment_ids(self) -> List[int]:
+        """Ids of the segments with issues, in report order"""
+        return list(dict.fromkeys(issue.segment_id for issue in self.issues))
+
+    def export_tsv(self, file_path: str, segments: Optional[Iterable] = None):
+        """
+        Write the issues as tab-separated values (UTF-8, with header row).
+
+        Args:
+            file_path: Output file
+            segments: Project segments, to include their source and target text
+        """
+        texts = {segment.id: (segment.source, segment.target) for segment in segments or ()}
+        with open(file_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f, delimiter='\t', lineterminator='\n', quoting=csv.QUOTE_MINIMAL)
+            writer.writerow(["Segment", "Issue", "Source term", "Target terms", "Termbase",
+                             "Source", "Target"])
+            for issue in self.issues:
+                source, target = texts.get(issue.segment_id, ('', ''))
+                writer.writerow([issue.segment_id, issue.label, issue.source_term,
+                                 ' | '.join(issue.target_terms), issue.termbase_name,
+                                 ' '.join(source.split()), ' '.join(target.split())])
+
+    def export_html(self, file_path: str, segments: Optional[Iterable] = None, title: str = ''):
+        """
+        Write the issues as a standalone HTML page.
+
+        Args:
+            file_path: Output file
+            segments: Project segments, to include their source and target text
+            title: Shown in the heading (e.g. the project name)
+        """
+        texts = {segment.id: (segment.source, segment.target) for segment in segments or ()}
+        heading = "Terminology QA" + (f" - {title}" if title else "")
+        rows = []
+        for issue in self.issues:
+            source, target = texts.get(issue.segment_id, ('', ''))
+            css = 'forbidden' if issue.kind == FORBIDDEN_TERM else 'missing'
+            rows.append(
+                f"<tr class=\"{css}\"><td>{issue.segment_id}</td>"
+                f"<td>{html.escape(issue.label)}</td>"
+                f"<td>{html.escape(issue.source_term)}</td>"
+                f"<td>{html.escape(' | '.join(issue.target_terms))}</td>"
+                f"<td>{html.escape(issue.termbase_name)}</td>"
+                f"<td>{html.escape(source)}</td><td>{html.escape(target)}</td></tr>")
+        summary = (f"{self.segments_checked:,} segments checked against {self.terms:,} terms: "
+                   f"{self.count(MISSING_TERM):,} missing, {self.count(FORBIDDEN_TERM):,} forbidden")
+        page = f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{html.escape(heading)}</title>
+<style>
+body {{ font-family: Segoe UI, Arial, sans-serif; font-size: 10pt; }}
+table {{ border-collapse: collapse; width: 100%; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 6px; text-align: left; vertical-align: top; }}
+th {{ background: #f0f0f0; }}
+tr.forbidden td:nth-child(2) {{ color: #c0392b; font-weight: bold; }}
+tr.missing td:nth-child(2) {{ color: #d35400; }}
+</style>
+</head>
+<body>
+<h2>{html.escape(heading)}</h2>
+<p>{html.escape(summary)}</p>
+<table>
+<tr><th>Segment</th><th>Issue</th><th>Source term</th><th>Target terms</th><th>Termbase</th><th>Source</th><th>Target</th></tr>
+{chr(10).join(rows)}
+</table>
+</body>
+</html>
+"""
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(page)
+
+
+class TermQAChecker:
+    """
+    Compiled termbase terms for checking segment targets.
+
+    Source terms are grouped by their lowercased text, so a segment passes
+    if it uses the translation of any termbase entry for the term.
+    """
+
+    def __init__(self, terms: Iterable[Dict]):
+        """
+        Args:
+            terms: Term dicts as returned by DatabaseManager.get_termbase_qa_terms()
+        """
+        self._source = TermMatcher()
+        # Approved translations are stored as their group number (>= 0),
+        # forbidden ones as ~index into _forbidden (< 0): one target pass finds both
+        self._target = TermMatcher()
+        self._groups: Dict[str, int] = {}
+        self._group_terms: List[Dict] = []  # {'source', 'targets', 'termbase_name', 'term_id'}
+        self._forbidden: List[Dict] = []
+        self.term_count = 0
+
+        for term in terms:
+            self.term_count += 1
+            targets = [] if term.get('forbidden') else [term.get('target_term')]
+            targets += [text for text, forbidden in term.get('target_synonyms', ()) if not forbidden]
+            targets = [text for text in targets if _normalize(text)]
+            if targets:
+                group = self._group(term)
+                info = self._group_terms[group]
+                for text in targets:
+                    if text not in info['targets']:
+                        info['targets'].append(text)
+                        self._target.add(group, _normalize(text))
+                for text, forbidden in term.get('source_synonyms', ()):
+                    if not forbidden and _normalize(text):
+                        self._source.add(group, _normalize(text))
+
+            forbidden_targets = [term.get('target_term')] if term.get('forbidden') else []
+            forbidden_targets += [text for text, forbidden in term.get('target_synonyms', ()) if forbidden]
+            for text in forbidden_targets:
+                if _normalize(text):
+                    self._target.add(~len(self._forbidden), _normalize(text))
+                    self._forbidden.append({'source': term.get('source_term') or '', 'target': text,
+                                            'termbase_name': term.get('termbase_name') or '',
+                                            'term_id': term.get('term_id')})
+
+    def _group(self, term: Dict) -> int:
+        """Group number of a term's source term, created (and indexed) on first use"""
+        key = _normalize(term.get('source_term'))
+        group = self._groups.get(key)
+        if group is None:
+            group = len(self._group_terms)
+            self._groups[key] = group
+            self._group_terms.append({'source': term.get('source_term') or '', 'targets': [],
+                                      'termbase_name': term.get('termbase_name') or '',
+                                      'term_id': term.get('term_id')})
+            if key:
+                self._source.add(group, key)
+        return group
+
+    def check_segment(self, segment_id: int, source: str, target: str) -> List[TermQAIssue]:
+        """
+        Terminology issues of one segment.
+
+        Returns: Missing terms (longest source term first), then forbidden terms
+        """
+        issues = []
+        found = self._source.search(source) if source else []
+        hits = self._target.search(target) if target else []
+        approved = {entry for entry in hits if entry >= 0}
+        reported = set()
+        for group in found:
+            if group in approved or group in reported:
+                continue
+            reported.add(group)
+            info = self._group_terms[group]
+            issues.append(TermQAIssue(segment_id, MISSING_TERM, info['source'], list(info['targets']),
+                                      info['termbase_name'], info['term_id']))
+        for entry in hits:
+            if entry < 0:
+                info = self._forbidden[~entry]
+                issues.append(TermQAIssue(segment_id, FORBIDDEN_TERM, info['source'], [info['target']],
+                                          info['termbase_name'], info['term_id']))
+        return issues
+
+    def check(self, segments: Iterable, progress_callback: Optional[Callable[[int, int], None]] = None,
+              cancel_check: Optional[Callable[[], bool]] = None, progress_every: int = 500) -> TermQAReport:
+        """
+        Check every translated segment.
+
+        Args:
+            segments: Segments with .id, .source and .target
+            progress_callback: Called as (done, total) every progress_every segments and at the end
+            cancel_check: Returns True to stop (the report then has cancelled=True)
+            progress_every: Segments between progress callbacks
+
+        Returns: TermQAReport
+        """
+        segments = list(segments)
+        report = TermQAReport(terms=self.term_count)
+        start = time.perf_counter()
+        for done, segment in enumerate(segments, 1):
+            target = segment.target or ''
+            if target.strip():
+                report.issues.extend(self.check_segment(segment.id, segment.source or '', target))
+                report.segments_checked += 1
+            else:
+                report.segments_skipped += 1
+            if done % progress_every == 0:
+                if cancel_check and cancel_check():
+                    report.cancelled = True
+                    break
+                if progress_callback:
+                    progress_callback(done, len(segments))
+        else:
+            if progress_callback:
+                progress_callback(len(segments), len(segments))
+        report.elapsed = time.perf_counter() - start
+        return report
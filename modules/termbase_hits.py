@@ -0,0 +1,199 @@
+"""
+Termbase Hits - Per-segment termbase matches persisted in the project file
+
+Opening a project used to recompute the termbase matches of every segment
+in the background, which takes minutes for 40k-segment projects before all
+highlighting is there. The matches found so far are now saved with the
+project ('termbase_hits' in the .svproj) and put back into the termbase
+cache on open; the batch worker then only computes the segments that are
+missing.
+
+Saved block:
+    {
+        'version': TERMBASE_HITS_VERSION,
+        'database': normalized path of the database the term ids belong to,
+        'termbases': ids of the termbases in the index (the fingerprint),
+        'watermark': DatabaseManager.termbase_watermark() taken when the
+                     termbase index was built,
+        'segments': {segment id: [crc32 of the source, term_id, start, end,
+                                  term_id, start, end, ...]}
+    }
+
+Offsets are those of the first occurrence of the term in the lowercased
+source. A segment's hits are reused only if:
+- the database and the version match
+- its source checksum is unchanged
+- every term still exists in an indexed termbase and is still found at its
+  offsets
+- no term added or changed since the watermark (or belonging to a termbase
+  added to the index since) occurs in it
+
+Usage:
+    project.termbase_hits = collect_termbase_hits(segments, cache, watermark, termbase_ids, db_path)
+    ...
+    restored = restore_termbase_hits(project.termbase_hits, segments, db, termbase_ids,
+                                     load_entries, project_id)
+"""
+
+import os
+import zlib
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from modules.term_matcher import TermMatcher, term_boundary_ok
+
+
+TERMBASE_HITS_VERSION = 1
+
+
+def source_checksum(source: str) -> int:
+    """CRC32 of a segment's source text"""
+    return zlib.crc32((source or '').encode('utf-8'))
+
+
+def database_key(db_path: str) -> str:
+    """Normalized database path saved with the hits"""
+    return os.path.normcase(os.path.abspath(db_path))
+
+
+def find_term_offsets(text_lower: str, term_lower: str) -> Optional[Tuple[int, int]]:
+    """
+    First occurrence of a term in lowercased text that passes the
+    TermMatcher word-boundary rule.
+
+    Returns: (start, end), or None if the term doesn't occur
+    """
+    if not term_lower:
+        return None
+    start = text_lower.find(term_lower)
+    while start >= 0:
+        end = start + len(term_lower)
+        if term_boundary_ok(text_lower, start, end, term_lower):
+            return start, end
+        start = text_lower.find(term_lower, start + 1)
+    return None
+
+
+def encode_segment_hits(source: str, matches: Dict) -> Optional[List[int]]:
+    """
+    Flat hit list for one segment's cached termbase matches.
+
+    Returns: [crc, term_id, start, end, ...], or None if a match can't be
+    stored (not keyed by term id, or its term isn't found in the source)
+    """
+    encoded = [source_checksum(source)]
+    text_lower = (source or '').lower()
+    for term_id, match in matches.items():
+        if not isinstance(term_id, int) or not isinstance(match, dict):
+            return None
+        offsets = find_term_offsets(text_lower, (match.get('source') or '').lower().strip())
+        if offsets is None:
+            return None
+        encoded.extend((term_id, offsets[0], offsets[1]))
+    return encoded
+
+
+def decode_segment_hits(encoded: List[int]) -> Tuple[int, List[Tuple[int, int, int]]]:
+    """Inverse of encode_segment_hits(): (crc, [(term_id, start, end), ...])"""
+    hits = [tuple(encoded[i:i + 3]) for i in range(1, len(encoded) - 2, 3)]
+    return encoded[0], hits
+
+
+def collect_termbase_hits(segments: Iterable, cache: Dict[int, Dict], watermark: Dict[str, int],
+                          termbase_ids: Iterable[int], db_path: str) -> Dict[str, Any]:
+    """
+    Build the 'termbase_hits' block for the project file.
+
+    Args:
+        segments: Project segments (with .id and .source)
+        cache: Termbase cache {segment_id: {term_id: match dict}}
+        watermark: Termbase watermark taken when the index was built
+        termbase_ids: Ids of the termbases in the index
+        db_path: Termbase database file
+
+    Returns: The block; segments that aren't cached (or can't be stored) are left out
+    """
+    stored = {}
+    for segment in segments:
+        matches = cache.get(segment.id)
+        if matches is None:
+            continue
+        encoded = encode_segment_hits(segment.source, matches)
+        if encoded is not None:
+            stored[str(segment.id)] = encoded
+    return {
+        'version': TERMBASE_HITS_VERSION,
+        'database': database_key(db_path),
+        'termbases': sorted(termbase_ids),
+        'watermark': dict(watermark),
+        'segments': stored,
+    }
+
+
+def restore_termbase_hits(data: Optional[Dict[str, Any]], segments: Iterable, db,
+                          termbase_ids: Iterable[int],
+                          load_entries: Callable[..., List[Tuple[str, Any]]],
+                          project_id=None) -> Dict[int, Dict]:
+    """
+    Termbase cache entries for the segments whose saved hits are still valid.
+
+    Args:
+        data: Saved 'termbase_hits' block (None = nothing saved)
+        segments: Project segments
+        db: DatabaseManager of the termbase database
+        termbase_ids: Ids of the termbases in the index now
+        load_entries: Loads (source_term_lower, TermRef) index entries; called
+            as load_entries(term_ids=...) and load_entries(termbase_ids=...)
+        project_id: Project whose termbase activation and priorities apply
+
+    Returns: {segment_id: {term_id: match dict}}
+    """
+    if not data or data.get('version') != TERMBASE_HITS_VERSION:
+        return {}
+    if data.get('database') != database_key(db.db_path):
+        return {}
+    saved = data.get('segments') or {}
+    if not saved:
+        return {}
+
+    # Terms that can match segments they didn't match when the hits were saved
+    changed_ids = db.get_termbase_terms_changed_since(data.get('watermark') or {})
+    added_termbases = set(termbase_ids) - set(data.get('termbases') or [])
+    new_terms = TermMatcher()
+    if changed_ids:
+        for term, ref in load_entries(term_ids=changed_ids):
+            new_terms.add(ref, term)
+    if added_termbases:
+        for term, ref in load_entries(termbase_ids=added_termbases):
+            new_terms.add(ref, term)
+
+    decoded = {}
+    term_ids = set()
+    for segment in segments:
+        encoded = saved.get(str(segment.id))
+        if not encoded:
+            continue
+        crc, hits = decode_segment_hits(encoded)
+        if crc != source_checksum(segment.source):
+            continue
+        if changed_ids and any(term_id in changed_ids for term_id, _, _ in hits):
+            continue
+        decoded[segment.id] = (segment.source, hits)
+        term_ids.update(term_id for term_id, _, _ in hits)
+
+    # Leaves out deleted terms and terms of termbases no longer in the index
+    details = db.get_termbase_match_details(term_ids, project_id) if term_ids else {}
+    term_lowers = {term_id: (match['source'] or '').lower().strip() for term_id, match in details.items()}
+    restored = {}
+    for segment_id, (source, hits) in decoded.items():
+        text_lower = source.lower()
+        matches = {}
+        for term_id, start, end in hits:
+            match = details.get(term_id)
+            if match is None or text_lower[start:end] != term_lowers[term_id]:
+                break
+            matches[term_id] = dict(match)
+        else:
+            if new_terms and new_terms.search(source):
+                continue
+            restored[segment_id] = matches
+    return restored
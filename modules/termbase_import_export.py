@@ -3,6 +3,12 @@ Termbase Import/Export Module
 
 Handles importing and exporting termbases in TSV (Tab-Separated Values) format.
 TSV is simple, universal, and works well with Excel, Google Sheets, and text editors.
+Imports also accept CSV (comma or semicolon separated, same columns) and TBX.
+
+Imports stream the file and hand the rows to
+DatabaseManager.bulk_import_termbase_terms(), which stages them and resolves
+duplicates in SQL within a single transaction. Progress is reported as bytes
+read, so the file is only read once.
 
 Format:
 - First row: header with column names
@@ -23,10 +29,21 @@ Standard columns:
 
 import csv
 import os
-from typing import Dict, List, Optional, Tuple
+import xml.etree.ElementTree as ET
+from typing import Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 
 
+# Rows read between two progress reports during an import
+PROGRESS_INTERVAL_ROWS = 2000
+
+# TBX administrative statuses that mark a term as forbidden
+TBX_FORBIDDEN_STATUSES = ('deprecatedterm-admn-sts', 'supersededterm-admn-sts',
+                          'deprecated', 'superseded', 'forbidden')
+
+XML_LANG = '{http://www.w3.org/XML/1998/namespace}lang'
+
+
 @dataclass
 class ImportResult:
     """Result of a termbase import operation"""
@@ -39,7 +56,7 @@ class ImportResult:
 
 
 class TermbaseImporter:
-    """Import termbases from TSV files"""
+    """Import termbases from TSV, CSV and TBX files"""
     
     # Standard column headers (case-insensitive matching)
     STANDARD_HEADERS = {
@@ -78,6 +95,28 @@ class TermbaseImporter:
         self.db_manager = db_manager
         self.termbase_manager = termbase_manager
     
+    def import_file(self, filepath: str, termbase_id: int,
+                    skip_duplicates: bool = True,
+                    update_duplicates: bool = False,
+                    progress_callback=None) -> ImportResult:
+        """
+        Import terms from a TSV, CSV or TBX file (chosen by file extension)
+
+        Args:
+            filepath: Path to .tsv/.txt, .csv or .tbx file
+            termbase_id, skip_duplicates, update_duplicates, progress_callback:
+                as for import_tsv()
+
+        Returns:
+            ImportResult with statistics and errors
+        """
+        extension = os.path.splitext(filepath)[1].lower()
+        if extension == '.tbx':
+            return self.import_tbx(filepath, termbase_id, skip_duplicates, update_duplicates, progress_callback)
+        if extension == '.csv':
+            return self.import_csv(filepath, termbase_id, skip_duplicates, update_duplicates, progress_callback)
+        return self.import_tsv(filepath, termbase_id, skip_duplicates, update_duplicates, progress_callback)
+
     def import_tsv(self, filepath: str, termbase_id: int, 
                    skip_duplicates: bool = True,
                    update_duplicates: bool = False,
@@ -88,35 +127,96 @@ class TermbaseImporter:
         Args:
             filepath: Path to TSV file
             termbase_id: Target termbase ID
-            skip_duplicates: Skip terms that already exist (based on source term)
+            skip_duplicates: Skip terms that already exist (based on UUID or source term)
             update_duplicates: Update existing terms instead of skipping
-            progress_callback: Optional callback(current, total, message) for progress updates
+            progress_callback: Optional callback(bytes_read, total_bytes, message) for progress updates
             
         Returns:
             ImportResult with statistics and errors
         """
+        return self._import_delimited(filepath, termbase_id, '\t', skip_duplicates,
+                                      update_duplicates, progress_callback)
+
+    def import_csv(self, filepath: str, termbase_id: int,
+                   skip_duplicates: bool = True,
+                   update_duplicates: bool = False,
+                   progress_callback=None) -> ImportResult:
+        """
+        Import terms from CSV file (comma or semicolon separated, detected
+        from the header row; same columns as TSV)
+
+        Args:
+            filepath: Path to CSV file
+            termbase_id, skip_duplicates, update_duplicates, progress_callback:
+                as for import_tsv()
+
+        Returns:
+            ImportResult with statistics and errors
+        """
+        return self._import_delimited(filepath, termbase_id, None, skip_duplicates,
+                                      update_duplicates, progress_callback)
+
+    def import_tbx(self, filepath: str, termbase_id: int,
+                   skip_duplicates: bool = True,
+                   update_duplicates: bool = False,
+                   progress_callback=None) -> ImportResult:
+        """
+        Import terms from TBX file (TBX v2 termEntry/langSet/tig and
+        TBX v3 conceptEntry/langSec/termSec)
+
+        The langSets matching the glossary's source and target languages are
+        used (the first two langSets if the glossary has no languages). The
+        first term of a langSet is the main term, further terms become
+        synonyms; deprecated/superseded terms are marked forbidden. Line
+        numbers in errors are entry numbers.
+
+        Args:
+            filepath: Path to TBX file
+            termbase_id, skip_duplicates, update_duplicates, progress_callback:
+                as for import_tsv()
+
+        Returns:
+            ImportResult with statistics and errors
+        """
+        from modules.tmx_generator import get_base_lang_code
+
+        termbase = self.termbase_manager.get_termbase(termbase_id) or {}
+        source_lang = termbase.get('source_lang')
+        target_lang = termbase.get('target_lang')
+        languages = (get_base_lang_code(source_lang) if source_lang else None,
+                     get_base_lang_code(target_lang) if target_lang else None)
         errors = []
-        imported_count = 0
-        skipped_count = 0
-        error_count = 0
-        
-        def report_progress(current, total, message):
-            """Report progress if callback is provided"""
-            if progress_callback:
-                progress_callback(current, total, message)
-        
+        report = self._progress_reporter(progress_callback)
+
+        try:
+            with open(filepath, 'rb') as f:
+                total_bytes = os.fstat(f.fileno()).st_size
+                report(0, total_bytes, f"Starting import ({total_bytes / 1e6:.1f} MB)...")
+                rows = self._read_tbx(f, total_bytes, languages, errors, report)
+                return self._import_rows(termbase_id, rows, errors, skip_duplicates, update_duplicates,
+                                         ['target_term', 'domain', 'notes', 'forbidden'], report, total_bytes)
+        except Exception as e:
+            return self._failed_result(errors, e)
+
+    def _import_delimited(self, filepath: str, termbase_id: int, delimiter: Optional[str],
+                          skip_duplicates: bool, update_duplicates: bool,
+                          progress_callback) -> ImportResult:
+        """Import a TSV/CSV file (delimiter None = detect from the header row)"""
+        errors = []
+        report = self._progress_reporter(progress_callback)
+
         try:
-            # Count total lines first for progress reporting
-            total_lines = 0
-            with open(filepath, 'r', encoding='utf-8-sig', newline='') as f:
-                total_lines = sum(1 for _ in f) - 1  # Subtract header row
-            
-            report_progress(0, total_lines, f"Starting import of {total_lines} entries...")
-            
             # Read file with UTF-8 encoding (handle BOM if present)
             with open(filepath, 'r', encoding='utf-8-sig', newline='') as f:
-                # Use csv.DictReader with tab delimiter
-                reader = csv.DictReader(f, delimiter='\t')
+                total_bytes = os.fstat(f.fileno()).st_size
+                report(0, total_bytes, f"Starting import ({total_bytes / 1e6:.1f} MB)...")
+
+                if delimiter is None:
+                    header_line = f.readline()
+                    delimiter = max(',;\t', key=header_line.count)
+                    f.seek(0)
+
+                reader = csv.DictReader(f, delimiter=delimiter)
                 
                 # Get column mapping
                 if not reader.fieldnames:
@@ -131,7 +231,7 @@ class TermbaseImporter:
                 
                 column_map = self._map_columns(reader.fieldnames)
                 
-                report_progress(0, total_lines, f"Found columns: {', '.join(column_map.keys())}")
+                report(0, total_bytes, f"Found columns: {', '.join(column_map.keys())}")
                 
                 if not column_map.get('source') or not column_map.get('target'):
                     return ImportResult(
@@ -142,161 +242,190 @@ class TermbaseImporter:
                         errors=[(0, f"Could not find required columns. Headers: {reader.fieldnames}")],
                         message="Import failed: Missing required columns (Source Term and Target Term)"
                     )
-                
-                # Get existing terms for duplicate detection
-                existing_terms_by_source = {}
-                existing_terms_by_uuid = {}
-                if skip_duplicates or update_duplicates:
-                    report_progress(0, total_lines, "Loading existing terms for duplicate detection...")
-                    terms = self.termbase_manager.get_terms(termbase_id)
-                    existing_terms_by_source = {term['source_term'].lower(): term for term in terms}
-                    existing_terms_by_uuid = {term.get('term_uuid'): term for term in terms if term.get('term_uuid')}
-                    report_progress(0, total_lines, f"Found {len(existing_terms_by_source)} existing terms")
-                
-                # Process each row
-                for line_num, row in enumerate(reader, start=2):  # Start at 2 (line 1 is header)
-                    current_row = line_num - 1  # Adjust for progress (1-indexed from data rows)
-                    try:
-                        # Extract data using column mapping
-                        source_field = self._get_field(row, column_map.get('source', ''))
-                        target_field = self._get_field(row, column_map.get('target', ''))
-                        term_uuid = self._get_field(row, column_map.get('term_uuid', ''))
-                        
-                        # Validate required fields
-                        if not source_field or not target_field:
-                            errors.append((line_num, "Missing source or target term"))
-                            error_count += 1
-                            report_progress(current_row, total_lines, f"❌ Line {line_num}: Missing source or target")
-                            continue
-                        
-                        # Parse source: first item = main term, rest = synonyms
-                        source_parts = [s.strip() for s in source_field.split('|') if s.strip()]
-                        source_term = source_parts[0] if source_parts else ''
-                        source_synonym_parts = source_parts[1:] if len(source_parts) > 1 else []
-                        
-                        # Parse target: first item = main term, rest = synonyms  
-                        target_parts = [s.strip() for s in target_field.split('|') if s.strip()]
-                        target_term = target_parts[0] if target_parts else ''
-                        target_synonym_parts = target_parts[1:] if len(target_parts) > 1 else []
-                        
-                        # Check for duplicates - UUID takes priority over source term matching
-                        existing_term = None
-                        
-                        if term_uuid and term_uuid in existing_terms_by_uuid:
-                            # UUID match - this is definitely the same term
-                            existing_term = existing_terms_by_uuid[term_uuid]
-                        elif source_term.lower() in existing_terms_by_source:
-                            # Source term match (no UUID or UUID doesn't match)
-                            existing_term = existing_terms_by_source[source_term.lower()]
-                        
-                        if existing_term:
-                            if update_duplicates:
-                                # Update existing term
-                                self._update_term_from_row(existing_term['id'], row, column_map)
-                                imported_count += 1
-                                report_progress(current_row, total_lines, f"🔄 Updated: {source_term} → {target_term}")
-                            else:
-                                skipped_count += 1
-                                report_progress(current_row, total_lines, f"⏭️ Skipped duplicate: {source_term}")
-                            continue
-                        
-                        # Parse optional fields
-                        domain = self._get_field(row, column_map.get('domain', ''))
-                        notes = self._get_field(row, column_map.get('notes', ''))
-                        project = self._get_field(row, column_map.get('project', ''))
-                        client = self._get_field(row, column_map.get('client', ''))
-                        forbidden = self._parse_boolean(
-                            self._get_field(row, column_map.get('forbidden', ''))
-                        )
-                        
-                        # Add term to termbase (pass UUID if present, otherwise one will be generated)
-                        term_id = self.termbase_manager.add_term(
-                            termbase_id=termbase_id,
-                            source_term=source_term,
-                            target_term=target_term,
-                            domain=domain,
-                            notes=notes,
-                            project=project,
-                            client=client,
-                            forbidden=forbidden,
-                            term_uuid=term_uuid if term_uuid else None
-                        )
-                        
-                        if term_id:
-                            imported_count += 1
-                            report_progress(current_row, total_lines, f"✅ Imported: {source_term} → {target_term}")
-                            
-                            # Add source synonyms (already parsed from source_field above)
-                            for order, syn_part in enumerate(source_synonym_parts):
-                                # Check for forbidden marker [!text]
-                                forbidden = False
-                                synonym_text = syn_part
-                                
-                                if syn_part.startswith('[!') and syn_part.endswith(']'):
-                                    forbidden = True
-                                    synonym_text = syn_part[2:-1]  # Remove [! and ]
-                                
-                                self.termbase_manager.add_synonym(
-                                    term_id, 
-                                    synonym_text, 
-                                    language='source',
-                                    display_order=order,
-                                    forbidden=forbidden
-                                )
-                            
-                            # Add target synonyms (already parsed from target_field above)
-                            for order, syn_part in enumerate(target_synonym_parts):
-                                # Check for forbidden marker [!text]
-                                forbidden = False
-                                synonym_text = syn_part
-                                
-                                if syn_part.startswith('[!') and syn_part.endswith(']'):
-                                    forbidden = True
-                                    synonym_text = syn_part[2:-1]  # Remove [! and ]
-                                
-                                self.termbase_manager.add_synonym(
-                                    term_id, 
-                                    synonym_text, 
-                                    language='target',
-                                    display_order=order,
-                                    forbidden=forbidden
-                                )
-                        else:
-                            errors.append((line_num, "Failed to add term to database"))
-                            error_count += 1
-                            report_progress(current_row, total_lines, f"❌ Line {line_num}: Failed to add term")
-                            
-                    except Exception as e:
-                        errors.append((line_num, f"Error processing row: {str(e)}"))
-                        report_progress(current_row, total_lines, f"❌ Line {line_num}: {str(e)}")
-                        error_count += 1
-                        continue
-            
-            # Generate summary message
-            message = f"Import complete: {imported_count} terms imported"
-            if skipped_count > 0:
-                message += f", {skipped_count} duplicates skipped"
-            if error_count > 0:
-                message += f", {error_count} errors"
-            
-            return ImportResult(
-                success=True,
-                imported_count=imported_count,
-                skipped_count=skipped_count,
-                error_count=error_count,
-                errors=errors,
-                message=message
-            )
-            
+
+                # Existing terms only get the columns present in the file
+                update_columns = ['target_term'] + [
+                    column for column in ('domain', 'notes', 'project', 'client', 'forbidden')
+                    if column_map.get(column)]
+                rows = self._read_delimited(f, reader, column_map, total_bytes, errors, report)
+                return self._import_rows(termbase_id, rows, errors, skip_duplicates, update_duplicates,
+                                         update_columns, report, total_bytes)
         except Exception as e:
-            return ImportResult(
-                success=False,
-                imported_count=imported_count,
-                skipped_count=skipped_count,
-                error_count=error_count + 1,
-                errors=errors + [(0, f"Fatal error: {str(e)}")],
-                message=f"Import failed: {str(e)}"
-            )
+            return self._failed_result(errors, e)
+
+    def _read_delimited(self, f, reader, column_map: Dict[str, str], total_bytes: int,
+                        errors: List[Tuple[int, str]], report) -> Iterator[Dict]:
+        """Yield import rows from a csv.DictReader (invalid rows go to errors)"""
+        for line_num, row in enumerate(reader, start=2):  # Start at 2 (line 1 is header)
+            if line_num % PROGRESS_INTERVAL_ROWS == 0:
+                report(f.buffer.tell(), total_bytes, f"📥 Read {line_num - 1:,} entries...")
+
+            # Extract data using column mapping
+            source_term, source_synonyms = self._split_synonyms(
+                self._get_field(row, column_map.get('source', '')))
+            target_term, target_synonyms = self._split_synonyms(
+                self._get_field(row, column_map.get('target', '')))
+
+            # Validate required fields
+            if not source_term or not target_term:
+                errors.append((line_num, "Missing source or target term"))
+                report(f.buffer.tell(), total_bytes, f"❌ Line {line_num}: Missing source or target")
+                continue
+
+            yield {
+                'line': line_num,
+                'source_term': source_term,
+                'target_term': target_term,
+                'source_synonyms': source_synonyms,
+                'target_synonyms': target_synonyms,
+                'domain': self._get_field(row, column_map.get('domain', '')),
+                'notes': self._get_field(row, column_map.get('notes', '')),
+                'project': self._get_field(row, column_map.get('project', '')),
+                'client': self._get_field(row, column_map.get('client', '')),
+                'forbidden': self._parse_boolean(self._get_field(row, column_map.get('forbidden', ''))),
+                'term_uuid': self._get_field(row, column_map.get('term_uuid', '')),
+            }
+
+    def _read_tbx(self, f, total_bytes: int, languages: Tuple[Optional[str], Optional[str]],
+                  errors: List[Tuple[int, str]], report) -> Iterator[Dict]:
+        """Yield import rows from a TBX file, one entry at a time"""
+        from modules.tmx_generator import get_base_lang_code
+
+        entry_num = 0
+        for _event, elem in ET.iterparse(f, events=('end',)):
+            if _local_name(elem.tag) not in ('termEntry', 'conceptEntry'):
+                continue
+            entry_num += 1
+            if entry_num % PROGRESS_INTERVAL_ROWS == 0:
+                report(f.tell(), total_bytes, f"📥 Read {entry_num:,} entries...")
+
+            domain, notes = '', []
+            lang_terms = []  # (base language, [(term, forbidden)]) in document order
+            for child in elem.iter():
+                name = _local_name(child.tag)
+                if name == 'descrip' and child.get('type') == 'subjectField' and not domain:
+                    domain = _element_text(child)
+                elif (name == 'descrip' and child.get('type') == 'definition') or name == 'note':
+                    text = _element_text(child)
+                    if text and text not in notes:
+                        notes.append(text)
+                elif name in ('langSet', 'langSec'):
+                    lang_terms.append((get_base_lang_code(child.get(XML_LANG) or child.get('lang') or ''),
+                                       self._tbx_terms(child)))
+            elem.clear()
+
+            source_terms = target_terms = None
+            if languages[0] and languages[1]:
+                by_language = {}
+                for lang, terms in lang_terms:
+                    by_language.setdefault(lang, terms)
+                source_terms = by_language.get(languages[0])
+                target_terms = by_language.get(languages[1])
+            elif len(lang_terms) >= 2:
+                source_terms, target_terms = lang_terms[0][1], lang_terms[1][1]
+
+            if not source_terms or not target_terms:
+                errors.append((entry_num, "Missing source or target term"))
+                report(f.tell(), total_bytes, f"❌ Entry {entry_num}: Missing source or target")
+                continue
+
+            yield {
+                'line': entry_num,
+                'source_term': source_terms[0][0],
+                'target_term': target_terms[0][0],
+                'source_synonyms': source_terms[1:],
+                'target_synonyms': target_terms[1:],
+                'domain': domain,
+                'notes': '\n'.join(notes),
+                'forbidden': target_terms[0][1],
+            }
+
+    def _tbx_terms(self, lang_set) -> List[Tuple[str, bool]]:
+        """(term, forbidden) for each term of a TBX langSet/langSec"""
+        terms = []
+        for term_group in lang_set.iter():
+            if _local_name(term_group.tag) not in ('tig', 'ntig', 'termSec'):
+                continue
+            text, forbidden = '', False
+            for child in term_group.iter():
+                name = _local_name(child.tag)
+                if name == 'term' and not text:
+                    text = _element_text(child)
+                elif name == 'termNote' and child.get('type') in ('administrativeStatus', 'normativeAuthorization'):
+                    forbidden = _element_text(child).lower() in TBX_FORBIDDEN_STATUSES
+            if text:
+                terms.append((text, forbidden))
+        return terms
+
+    def _import_rows(self, termbase_id: int, rows: Iterator[Dict], errors: List[Tuple[int, str]],
+                     skip_duplicates: bool, update_duplicates: bool, update_columns: List[str],
+                     report, total_bytes: int) -> ImportResult:
+        """Bulk-insert parsed rows and build the ImportResult"""
+        stats = self.db_manager.bulk_import_termbase_terms(
+            termbase_id, rows,
+            skip_duplicates=skip_duplicates,
+            update_duplicates=update_duplicates,
+            update_columns=update_columns)
+        imported_count = stats['imported'] + stats['updated']
+        skipped_count = stats['skipped']
+        error_count = len(errors)
+
+        # Generate summary message
+        message = f"Import complete: {imported_count} terms imported"
+        if stats['updated'] > 0:
+            message += f" ({stats['updated']} existing terms updated)"
+        if skipped_count > 0:
+            message += f", {skipped_count} duplicates skipped"
+        if error_count > 0:
+            message += f", {error_count} errors"
+        report(total_bytes, total_bytes, f"✓ {message}")
+
+        return ImportResult(
+            success=True,
+            imported_count=imported_count,
+            skipped_count=skipped_count,
+            error_count=error_count,
+            errors=errors,
+            message=message
+        )
+
+    def _failed_result(self, errors: List[Tuple[int, str]], error: Exception) -> ImportResult:
+        """ImportResult for an import that was aborted (nothing was written)"""
+        return ImportResult(
+            success=False,
+            imported_count=0,
+            skipped_count=0,
+            error_count=len(errors) + 1,
+            errors=errors + [(0, f"Fatal error: {str(error)}")],
+            message=f"Import failed: {str(error)}"
+        )
+
+    def _progress_reporter(self, progress_callback):
+        """Wrap an optional progress_callback(current, total, message)"""
+        def report_progress(current, total, message):
+            """Report progress if callback is provided"""
+            if progress_callback:
+                progress_callback(current, total, message)
+        return report_progress
+
+    def _split_synonyms(self, field: str) -> Tuple[str, List[Tuple[str, bool]]]:
+        """
+        Split a pipe-delimited term field: first item = main term, rest =
+        synonyms ([!text] marks a forbidden synonym)
+
+        Returns:
+            (main term, [(synonym, forbidden), ...])
+        """
+        parts = [part.strip() for part in field.split('|') if part.strip()]
+        if not parts:
+            return '', []
+        synonyms = []
+        for part in parts[1:]:
+            if part.startswith('[!') and part.endswith(']'):
+                synonyms.append((part[2:-1], True))
+            else:
+                synonyms.append((part, False))
+        return parts[0], synonyms
     
     def _map_columns(self, headers: List[str]) -> Dict[str, str]:
         """
@@ -355,25 +484,16 @@ class TermbaseImporter:
             return False
         value_lower = value.lower().strip()
         return value_lower in ['true', '1', 'yes', 'y', 'forbidden', 'prohibited']
-    
-    def _update_term_from_row(self, term_id: int, row: Dict, column_map: Dict):
-        """Update an existing term with data from row"""
-        updates = {}
-        
-        if column_map.get('target'):
-            updates['target_term'] = self._get_field(row, column_map['target'])
-        if column_map.get('domain'):
-            updates['domain'] = self._get_field(row, column_map['domain'])
-        if column_map.get('notes'):
-            updates['notes'] = self._get_field(row, column_map['notes'])
-        if column_map.get('project'):
-            updates['project'] = self._get_field(row, column_map['project'])
-        if column_map.get('client'):
-            updates['client'] = self._get_field(row, column_map['client'])
-        if column_map.get('forbidden'):
-            updates['forbidden'] = self._parse_boolean(self._get_field(row, column_map['forbidden']))
-        
-        self.termbase_manager.update_term(term_id, **updates)
+
+
+def _local_name(tag: str) -> str:
+    """Element name without XML namespace"""
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ''
+
+
+def _element_text(elem) -> str:
+    """All text inside an element (including inline markup), stripped"""
+    return ''.join(elem.itertext()).strip()
 
 
 class TermbaseExporter:
@@ -101,7 +101,7 @@ class TermbaseManager:
                     t.ranking, t.read_only, t.created_date, t.modified_date,
                     COUNT(gt.id) as term_count
                 FROM termbases t
-                LEFT JOIN termbase_terms gt ON CAST(t.id AS TEXT) = gt.termbase_id
+                LEFT JOIN termbase_terms gt ON t.id = gt.termbase_id
                 GROUP BY t.id
                 ORDER BY t.is_project_termbase DESC, t.is_global DESC, t.name ASC
             """)
@@ -680,7 +680,7 @@ class TermbaseManager:
                     t.created_date, t.modified_date,
                     COUNT(gt.id) as term_count
                 FROM termbases t
-                LEFT JOIN termbase_terms gt ON CAST(t.id AS TEXT) = gt.termbase_id
+                LEFT JOIN termbase_terms gt ON t.id = gt.termbase_id
                 WHERE t.project_id = ? AND t.is_project_termbase = 1
                 GROUP BY t.id
             """, (project_id,))
@@ -872,6 +872,9 @@ class TermbaseManager:
         """
         Search within a termbase (searches main terms AND synonyms)
         
+        Substring match, using the termbase trigram index (a LIKE scan for
+        queries under 3 characters or with the index turned off).
+        
         Args:
             termbase_id: Termbase ID to search in
             search_term: Term to search for
@@ -882,69 +885,22 @@ class TermbaseManager:
             List of matching terms (includes main term + synonyms as separate entries)
         """
         try:
-            cursor = self.db_manager.cursor
-            
-            # Find matching term IDs (from main terms OR synonyms)
-            matching_term_ids = set()
-            
-            if search_source:
-                # Search main source terms
-                cursor.execute("""
-                    SELECT id FROM termbase_terms
-                    WHERE termbase_id = ? AND source_term LIKE ?
-                """, (termbase_id, f"%{search_term}%"))
-                matching_term_ids.update(row[0] for row in cursor.fetchall())
-                
-                # Search source synonyms
-                cursor.execute("""
-                    SELECT term_id FROM termbase_synonyms
-                    WHERE term_id IN (SELECT id FROM termbase_terms WHERE termbase_id = ?)
-                    AND language = 'source' AND synonym_text LIKE ?
-                """, (termbase_id, f"%{search_term}%"))
-                matching_term_ids.update(row[0] for row in cursor.fetchall())
-            
-            if search_target:
-                # Search main target terms
-                cursor.execute("""
-                    SELECT id FROM termbase_terms
-                    WHERE termbase_id = ? AND target_term LIKE ?
-                """, (termbase_id, f"%{search_term}%"))
-                matching_term_ids.update(row[0] for row in cursor.fetchall())
-                
-                # Search target synonyms
-                cursor.execute("""
-                    SELECT term_id FROM termbase_synonyms
-                    WHERE term_id IN (SELECT id FROM termbase_terms WHERE termbase_id = ?)
-                    AND language = 'target' AND synonym_text LIKE ?
-                """, (termbase_id, f"%{search_term}%"))
-                matching_term_ids.update(row[0] for row in cursor.fetchall())
-            
-            if not matching_term_ids:
-                return []
+            terms = self.db_manager.search_termbase_terms(
+                search_term, [termbase_id], search_source, search_target,
+                include_synonyms=True, limit=None)
             
-            # Get full details for matching terms
-            placeholders = ','.join('?' * len(matching_term_ids))
-            sql = f"""
-                SELECT id, source_term, target_term, domain, definition, forbidden
-                FROM termbase_terms
-                WHERE id IN ({placeholders})
-                ORDER BY source_term ASC
-            """
-
-            cursor.execute(sql, list(matching_term_ids))
-
             results = []
-            for row in cursor.fetchall():
-                term_id = row[0]
+            for term in terms:
+                term_id = term['id']
 
                 # Add main term
                 results.append({
                     'id': term_id,
-                    'source_term': row[1],
-                    'target_term': row[2],
-                    'domain': row[3],
-                    'definition': row[4],
-                    'forbidden': row[5]
+                    'source_term': term['source_term'],
+                    'target_term': term['target_term'],
+                    'domain': term['domain'],
+                    'definition': term['definition'],
+                    'forbidden': term['forbidden']
                 })
 
                 # Add target synonyms as separate entries (memoQ style)
@@ -953,10 +909,10 @@ class TermbaseManager:
                 for syn in target_synonyms:
                     results.append({
                         'id': term_id,  # Same term ID
-                        'source_term': row[1],  # Same source
+                        'source_term': term['source_term'],  # Same source
                         'target_term': syn['synonym_text'],  # Synonym as target
-                        'domain': row[3],
-                        'definition': row[4],
+                        'domain': term['domain'],
+                        'definition': term['definition'],
                         'forbidden': syn['forbidden']  # Use synonym's forbidden flag
                     })
             
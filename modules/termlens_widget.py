@@ -945,10 +945,14 @@ class TermLensWidget(QWidget):
     
     def get_all_termbase_matches(self, text: str) -> Dict[str, List[Dict]]:
         """
-        Get all termbase matches for text by using the proper termbase search
+        Get all termbase matches for text in a single indexed lookup pass
         
-        This uses the SAME search logic as the Translation Results panel,
-        ensuring we only show terms that actually match, not false positives.
+        Uses DatabaseManager.search_termbases_in_text(), which finds every
+        glossary term present in the segment with one in-memory pass instead
+        of one search_termbases() query per word and n-gram. A term matches on
+        word boundaries, with trailing/leading punctuation and quotes stripped
+        (e.g. "...problemen." matches "problemen") and quotes in the segment
+        treated as spaces.
         
         Args:
             text: Source text
@@ -962,93 +966,32 @@ class TermLensWidget(QWidget):
         matches = {}
         
         try:
-            # Extract all words from the text to search
-            # Use the same token pattern as we use for display
-            # Includes / for unit-style terms like kg/l, m/s, etc.
-            token_pattern = re.compile(r'(?<!\w)[\w.,%-/]+(?!\w)', re.UNICODE)
-            tokens = [match.group() for match in token_pattern.finditer(text)]
-            
-            # Also check for multi-word phrases (up to 8 words)
-            words = re.findall(r'\b[\w-]+\b', text, re.UNICODE)
-            phrases_to_check = []
-            
-            # Generate n-grams for multi-word term detection
-            for n in range(2, min(9, len(words) + 1)):
-                for i in range(len(words) - n + 1):
-                    phrase = ' '.join(words[i:i+n])
-                    phrases_to_check.append(phrase)
-            
-            # Search each token and phrase using the database's search_termbases method
-            all_search_terms = set(tokens + phrases_to_check)
+            results = self.db_manager.search_termbases_in_text(
+                text,
+                source_lang=self.current_source_lang,
+                target_lang=self.current_target_lang,
+                project_id=self.current_project_id,
+                min_length=2
+            )
             
-            for search_term in all_search_terms:
-                if not search_term or len(search_term) < 2:
+            for result in results:
+                source_term = result.get('source_term', '')
+                if not source_term:
                     continue
                 
-                # Strip trailing punctuation for search (but keep internal punctuation like "gew.%")
-                # This handles cases like "edelmetalen." → "edelmetalen"
-                search_term_clean = search_term.rstrip('.,;:!?')
-                if not search_term_clean or len(search_term_clean) < 2:
-                    continue
+                key = source_term.lower()
+                if key not in matches:
+                    matches[key] = []
                 
-                # Use the SAME search method as translation results panel
-                results = self.db_manager.search_termbases(
-                    search_term=search_term_clean,
-                    source_lang=self.current_source_lang,
-                    target_lang=self.current_target_lang,
-                    project_id=self.current_project_id,
-                    min_length=2
+                # DEDUPLICATION: Only add if not already present
+                # Check by target_term to avoid duplicate translations
+                target_term = result.get('target_term', '')
+                already_exists = any(
+                    m.get('target_term', '') == target_term 
+                    for m in matches[key]
                 )
-                
-                # Add results to matches dict, but ONLY if the source term actually exists in the text
-                for result in results:
-                    source_term = result.get('source_term', '')
-                    if not source_term:
-                        continue
-                    
-                    # CRITICAL FIX: Verify the source term actually exists in the segment
-                    # This prevents false positives like "het gebruik van" showing when only "het" exists
-                    source_lower = source_term.lower()
-                    text_lower = text.lower()
-                    
-                    # Normalize text: replace ALL quote variants with spaces
-                    # Using Unicode escapes to avoid encoding issues
-                    normalized_text = text_lower
-                    for quote_char in '\"\'\u201C\u201D\u201E\u00AB\u00BB\u2018\u2019\u201A\u2039\u203A':
-                        normalized_text = normalized_text.replace(quote_char, ' ')
-                    
-                    # CRITICAL FIX v1.9.118: Strip punctuation from glossary term before matching
-                    # This allows entries like "...problemen." (with period) to match source text
-                    # where tokenization strips the period during word splitting
-                    # Comprehensive set of quote and punctuation characters to strip
-                    PUNCT_CHARS = '.,;:!?\"\'\u201C\u201D\u201E\u00AB\u00BB\u2018\u2019\u201A\u2039\u203A'
-                    normalized_term = source_lower.rstrip(PUNCT_CHARS).lstrip(PUNCT_CHARS)
-                    
-                    # Use word boundaries to match complete words/phrases only
-                    if ' ' in source_term:
-                        # Multi-word term - must exist as exact phrase
-                        pattern = r'\b' + re.escape(normalized_term) + r'\b'
-                    else:
-                        # Single word
-                        pattern = r'\b' + re.escape(normalized_term) + r'\b'
-                    
-                    # Try matching on normalized text first, then original
-                    if not re.search(pattern, normalized_text) and not re.search(pattern, text_lower):
-                        continue  # Skip - term not actually in segment
-                    
-                    key = source_lower
-                    if key not in matches:
-                        matches[key] = []
-                    
-                    # DEDUPLICATION: Only add if not already present
-                    # Check by target_term to avoid duplicate translations
-                    target_term = result.get('target_term', '')
-                    already_exists = any(
-                        m.get('target_term', '') == target_term 
-                        for m in matches[key]
-                    )
-                    if not already_exists:
-                        matches[key].append(result)
+                if not already_exists:
+                    matches[key].append(result)
             
             return matches
         except Exception as e:
@@ -831,8 +831,9 @@ class TMManagerDialog(QDialog):
         
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                self.db_manager.cursor.execute("DELETE FROM translation_units WHERE id = ?", (entry_id,))
+                self.db_manager.delete_translation_units("id = ?", (entry_id,))
                 self.db_manager.connection.commit()
+                self.db_manager.invalidate_exact_match_cache()
                 self.log(f"Deleted TM entry {entry_id}")
                 self.refresh_browser()
                 QMessageBox.information(self, "Success", "Entry deleted successfully")
@@ -1164,9 +1165,9 @@ Average Target Length: {avg_target:.1f} characters
                 return
             
             # Delete identical entries
-            query = f"DELETE FROM translation_units WHERE source_text = target_text{tm_filter}"
-            self.db_manager.cursor.execute(query, params)
+            self.db_manager.delete_translation_units(f"source_text = target_text{tm_filter}", params)
             self.db_manager.connection.commit()
+            self.db_manager.invalidate_exact_match_cache()
             
             # Report results
             result_text = f"""
@@ -1250,13 +1251,11 @@ Your TM is now cleaner and more efficient.
                 if len(ids) > 1:
                     ids_to_delete = ids[1:]  # All except the first
                     placeholders = ','.join('?' * len(ids_to_delete))
-                    self.db_manager.cursor.execute(f"""
-                        DELETE FROM translation_units
-                        WHERE id IN ({placeholders})
-                    """, ids_to_delete)
+                    self.db_manager.delete_translation_units(f"id IN ({placeholders})", ids_to_delete)
                     total_deleted += len(ids_to_delete)
             
             self.db_manager.connection.commit()
+            self.db_manager.invalidate_exact_match_cache()
             
             # Report results
             result_text = f"""
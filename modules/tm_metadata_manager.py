@@ -267,13 +267,15 @@ class TMMetadataManager:
             
             # Delete translation units if requested
             if delete_entries:
-                cursor.execute("DELETE FROM translation_units WHERE tm_id = ?", (tm_id,))
+                self.db_manager.delete_translation_units("tm_id = ?", (tm_id,))
                 self.log(f"✓ Deleted translation units for tm_id: {tm_id}")
             
             # Delete TM metadata (this will cascade delete tm_activation entries)
             cursor.execute("DELETE FROM translation_memories WHERE id = ?", (tm_db_id,))
             
             self.db_manager.connection.commit()
+            if delete_entries:
+                self.db_manager.invalidate_exact_match_cache()
             self.log(f"✓ Deleted TM (ID: {tm_db_id})")
             return True
         except Exception as e:
@@ -10,9 +10,9 @@ Migrated from in-memory dictionaries to SQLite for scalability.
 import os
 import xml.etree.ElementTree as ET
 from datetime import datetime
-from difflib import SequenceMatcher
 from typing import Dict, List, Optional, Tuple
 from modules.database_manager import DatabaseManager
+from modules.similarity import get_backend
 
 
 class TM:
@@ -45,15 +45,19 @@ class TM:
     
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate similarity ratio between two texts"""
-        return SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
+        return get_backend().ratio(text1.lower(), text2.lower())
     
     def get_fuzzy_matches(self, source: str, max_matches: int = 5) -> List[Dict]:
         """Get fuzzy matches from this TM"""
         source = source.strip()
         matches = []
         
-        for tm_source, tm_target in self.entries.items():
-            similarity = self.calculate_similarity(source, tm_source)
+        entries = list(self.entries.items())
+        scores = get_backend().ratio_batch(
+            source.lower(), [tm_source.lower() for tm_source, _ in entries],
+            score_cutoff=self.fuzzy_threshold
+        )
+        for (tm_source, tm_target), similarity in zip(entries, scores):
             if similarity >= self.fuzzy_threshold:
                 matches.append({
                     'source': tm_source,
@@ -126,6 +130,9 @@ class TMDatabase:
         # Global fuzzy threshold (75% minimum similarity for fuzzy matches)
         self.fuzzy_threshold = 0.75
         
+        # Worker processes for batch fuzzy matching (None = automatic, 1 = single process)
+        self.fuzzy_workers = None
+        
         # TM metadata cache (populated from database as needed)
         # Note: Legacy 'project' and 'big_mama' TMs are no longer used.
         # All TMs are now managed through TMMetadataManager and stored in translation_memories table.
@@ -330,7 +337,8 @@ class TMDatabase:
                 threshold=self.fuzzy_threshold,
                 source_lang=self.source_lang,
                 target_lang=self.target_lang,
-                progress_callback=progress_callback
+                progress_callback=progress_callback,
+                workers=self.fuzzy_workers
             )
 
             for source_text, match in fuzzy_matches.items():
@@ -438,6 +446,14 @@ class TMDatabase:
         """
         return self.db.update_entry(tm_id, old_source, old_target, new_source, new_target)
 
+    def get_exact_match_cache_stats(self) -> Dict:
+        """Exact-match cache statistics (entries, hits, misses, hit_rate, ...)"""
+        return self.db.get_exact_match_cache_stats()
+
+    def get_connection_pool_stats(self) -> Dict:
+        """Connection pool statistics (open readers, leases, reuses, writer, ...)"""
+        return self.db.get_connection_pool_stats()
+
     def add_custom_tm(self, name: str, tm_id: str = None, read_only: bool = False):
         """Register a custom TM"""
         if tm_id is None:
@@ -59,6 +59,9 @@ class TranslationServices:
         # Enable/disable flags
         self.enable_mt_matching = self.config.get('enable_mt_matching', True)
         self.enable_llm_matching = self.config.get('enable_llm_matching', True)
+
+        # Response cache (modules/response_cache.py); False always calls the APIs
+        self.use_response_cache = self.config.get('use_response_cache', True)
         
         self.logger = logging.getLogger(__name__)
     
@@ -107,7 +110,8 @@ class TranslationServices:
                 mt_result = get_google_translation(
                     request.source_text,
                     request.source_lang_code or 'auto',
-                    request.target_lang_code or 'en'
+                    request.target_lang_code or 'en',
+                    use_cache=self.use_response_cache
                 )
                 
                 if mt_result and mt_result.get('translation'):
@@ -118,7 +122,8 @@ class TranslationServices:
                         metadata={
                             'provider': 'Google Translate',
                             'confidence': mt_result.get('confidence', 'N/A'),
-                            'detected_lang': mt_result.get('detected_source_language', request.source_lang_code)
+                            'detected_lang': mt_result.get('detected_source_language', request.source_lang_code),
+                            'cached': mt_result.get('cached', False)
                         },
                         match_type='MT',
                         provider_code='GT'
@@ -161,7 +166,8 @@ class TranslationServices:
                     request.source_text,
                     request.source_lang or 'Dutch',
                     request.target_lang or 'English',
-                    context=request.context or "Technical documentation translation"
+                    context=request.context or "Technical documentation translation",
+                    use_cache=self.use_response_cache
                 )
                 
                 if llm_result and llm_result.get('translation'):
@@ -179,7 +185,8 @@ class TranslationServices:
                             'provider': 'OpenAI GPT',
                             'model': llm_result.get('model', 'gpt-3.5-turbo'),
                             'context_aware': True,
-                            'explanation': llm_result.get('explanation', '')
+                            'explanation': llm_result.get('explanation', ''),
+                            'cached': llm_result.get('cached', False)
                         },
                         match_type='LLM',
                         provider_code='AI'
@@ -198,7 +205,8 @@ class TranslationServices:
                     request.source_text,
                     request.source_lang or 'Dutch',
                     request.target_lang or 'English',
-                    context=request.context or "Technical documentation translation"
+                    context=request.context or "Technical documentation translation",
+                    use_cache=self.use_response_cache
                 )
                 
                 if claude_result and claude_result.get('translation'):
@@ -216,7 +224,8 @@ class TranslationServices:
                             'provider': 'Anthropic Claude',
                             'model': claude_result.get('model', 'claude-3'),
                             'context_aware': True,
-                            'reasoning': claude_result.get('reasoning', '')
+                            'reasoning': claude_result.get('reasoning', ''),
+                            'cached': claude_result.get('cached', False)
                         },
                         match_type='LLM',
                         provider_code='CL'
@@ -229,6 +238,17 @@ class TranslationServices:
         
         return results
     
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get response cache counters
+        
+        Returns:
+            Dict with hits, misses, hit_rate, entries and size_bytes, or None if no cache is configured
+        """
+        from modules.response_cache import get_response_cache
+        cache = get_response_cache(include_disabled=True)
+        return cache.stats() if cache else None
+    
     def _clean_provider_prefix(self, translation: str, prefixes: List[str]) -> str:
         """
         Remove provider prefixes from translation text
@@ -0,0 +1,163 @@
+"""
+Usage Stats - Deferred, batched write-back of TM usage counts
+
+Every TM hit used to run "UPDATE translation_units SET usage_count = ..."
+plus a commit, turning each lookup into a WAL write that contends with the
+other connections. Hits are now counted in memory and written back in one
+transaction:
+
+- every FLUSH_INTERVAL seconds (background timer, only while counts are pending)
+- on project save and when the database is closed
+- at interpreter exit (atexit)
+
+A flush swaps the pending counts out under a lock and writes them in a single
+transaction. If the write fails (database locked, disk error) the counts are
+merged back and retried on the next flush, so increments are never lost or
+applied twice. A hard crash loses at most the counts since the last flush.
+
+Deferral can be switched off (set_deferred(False)); hits are then written
+immediately, as before.
+"""
+
+import atexit
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, Optional
+
+from modules.connection_pool import get_connection_pool
+
+
+FLUSH_INTERVAL = 30.0  # seconds
+
+
+class UsageStatsAccumulator:
+    """Buffers usage_count increments for one database file"""
+
+    UPDATE_SQL = "UPDATE translation_units SET usage_count = usage_count + ? WHERE id = ?"
+
+    def __init__(self, db_path: str, flush_interval: float = FLUSH_INTERVAL):
+        self.db_path = db_path
+        self.flush_interval = flush_interval
+        self.deferred = True
+        self._pending: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        # Serializes flushes (timer thread vs. save/close)
+        self._flush_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+        self.flushes = 0
+        self.rows_written = 0
+        self.failed_flushes = 0
+
+    def record(self, unit_ids: Iterable[int]):
+        """Count one hit for each unit id"""
+        counts: Dict[int, int] = {}
+        for unit_id in unit_ids:
+            counts[unit_id] = counts.get(unit_id, 0) + 1
+        self.record_counts(counts)
+
+    def record_counts(self, counts: Dict[int, int]):
+        """Add already-aggregated increments (unit_id -> count)"""
+        with self._lock:
+            pending = self._pending
+            for unit_id, count in counts.items():
+                pending[unit_id] = pending.get(unit_id, 0) + count
+            # Arm the timer while counts are pending
+            if pending and self._timer is None and self.flush_interval > 0:
+                self._timer = threading.Timer(self.flush_interval, self._timer_flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def pending_count(self) -> int:
+        """Number of units with unwritten increments"""
+        with self._lock:
+            return len(self._pending)
+
+    def _timer_flush(self):
+        with self._lock:
+            self._timer = None
+        self.flush()
+
+    def flush(self, connection: sqlite3.Connection = None) -> int:
+        """
+        Write pending increments in one transaction.
+
+        Args:
+            connection: Connection to write with (its open transaction is
+                        committed too). None = the connection pool's writer,
+                        safe to call from any thread.
+
+        Returns: Number of units updated (0 if nothing was pending or the
+                 write failed and was re-queued)
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                batch, self._pending = self._pending, {}
+
+            rows = [(count, unit_id) for unit_id, count in batch.items()]
+            try:
+                if connection is None:
+                    # Pool writer commits, or rolls back on error
+                    with get_connection_pool(self.db_path).write() as writer:
+                        writer.executemany(self.UPDATE_SQL, rows)
+                else:
+                    try:
+                        connection.executemany(self.UPDATE_SQL, rows)
+                        connection.commit()
+                    except Exception:
+                        connection.rollback()
+                        raise
+            except Exception as e:
+                # Re-queue so the increments are written by the next flush
+                self.record_counts(batch)
+                self.failed_flushes += 1
+                print(f"⚠️ Usage count flush failed, will retry: {e}")
+                return 0
+
+            self.flushes += 1
+            self.rows_written += len(batch)
+            return len(batch)
+
+    def set_deferred(self, deferred: bool, connection: sqlite3.Connection = None):
+        """Enable/disable deferred write-back (disabling flushes pending counts)"""
+        self.deferred = deferred
+        if not deferred:
+            self.flush(connection)
+
+    def stats(self) -> Dict:
+        """Accumulator statistics"""
+        return {
+            'deferred': self.deferred,
+            'pending_units': self.pending_count(),
+            'flushes': self.flushes,
+            'rows_written': self.rows_written,
+            'failed_flushes': self.failed_flushes,
+        }
+
+
+_accumulators: Dict[str, UsageStatsAccumulator] = {}
+_accumulators_lock = threading.Lock()
+
+
+def get_usage_accumulator(db_path: str) -> UsageStatsAccumulator:
+    """Return the process-wide accumulator for a database file"""
+    key = os.path.normcase(os.path.abspath(db_path))
+    with _accumulators_lock:
+        accumulator = _accumulators.get(key)
+        if accumulator is None:
+            accumulator = _accumulators[key] = UsageStatsAccumulator(db_path)
+        return accumulator
+
+
+def flush_all():
+    """Flush every accumulator (registered with atexit)"""
+    with _accumulators_lock:
+        accumulators = list(_accumulators.values())
+    for accumulator in accumulators:
+        accumulator.flush()
+
+
+atexit.register(flush_all)
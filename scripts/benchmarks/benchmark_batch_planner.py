@@ -0,0 +1,199 @@
+"""
+Benchmark: token-budgeted batch planning (modules/batch_planner.py) vs.
+fixed-size batches for LLM pre-translation.
+
+Builds a document of alternating runs of long legal paragraphs and short UI
+strings and translates it with a mock model that answers numbered batch
+prompts with a fixed expansion and cuts its response off at --output-tokens,
+as a real model does at max_tokens. Then compares:
+
+- fixed batches of --batch-size, with empty segments re-sent in further
+  passes (the former retry path, up to 5 retries)
+- the BatchPlanner fed lazily through BatchDispatcher, learning the
+  expansion ratio and splitting only incompletely parsed batches
+
+and reports requests, truncated responses and billed tokens. Asserts that
+the planner translates every segment with fewer requests and truncations
+(no more, when a small --segments fits one fixed batch or never truncates),
+that the learned ratio ends up close to the model's, and that a planner
+started from a badly wrong ratio recovers by splitting truncated batches.
+
+Usage:
+    python scripts/benchmarks/benchmark_batch_planner.py --segments 2000 --output-tokens 4096
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from modules.batch_planner import BatchPlanner, estimate_tokens
+from modules.llm_dispatcher import BatchDispatcher, DispatchLimits
+from benchmark_fuzzy_batch import make_sentence, make_vocabulary
+
+PROMPT_TOKENS = 600  # Instructions sent with every batch
+
+
+class MockModel:
+    """Translates numbered lines with a fixed expansion; truncates at the output limit"""
+
+    def __init__(self, ratio, output_tokens):
+        self.ratio = ratio
+        self.output_tokens = output_tokens
+        self.requests = 0
+        self.truncated = 0
+        self.billed_tokens = 0
+
+    def translate(self, source):
+        words = source.split()
+        extra = int(len(words) * (self.ratio - 1))
+        return " ".join([f"nl{word}" for word in words] + ["vulwoord"] * max(extra, 0))
+
+    def send(self, request):
+        batch = request  # [(seg_id, source)]
+        self.requests += 1
+        lines, used = [], 0
+        for seg_id, source in batch:
+            line = f"{seg_id}. {self.translate(source)}"
+            cost = estimate_tokens(line) + 1
+            if used + cost > self.output_tokens:
+                # Cut off mid-line, like a response that hit max_tokens
+                lines.append(line[:max(0, (self.output_tokens - used) * 4)])
+                self.truncated += 1
+                used = self.output_tokens
+                break
+            lines.append(line)
+            used += cost
+        self.billed_tokens += PROMPT_TOKENS + sum(estimate_tokens(source) + 4 for _, source in batch) + used
+        return "\n".join(lines)
+
+
+def parse(model, result, batch):
+    """
+    Numbered-line parse as in PreTranslationWorker._parse_batch_response. The
+    cut-off last line of a truncated response is not a usable translation
+    (in the app it is usually rejected by the retry-empty checks or by the
+    translator), so it counts as missing here.
+    """
+    found = {}
+    for match in re.finditer(r'^(\d+)\.\s*(.*)$', result, re.MULTILINE):
+        found[int(match.group(1))] = match.group(2)
+    translations = [found.get(seg_id) for seg_id, _ in batch]
+    return [t if t == model.translate(source) else None for (_, source), t in zip(batch, translations)]
+
+
+def run_fixed(model, segments, batch_size, passes=6):
+    done = {}
+    todo = list(segments)
+    for _ in range(passes):
+        for start in range(0, len(todo), batch_size):
+            batch = todo[start:start + batch_size]
+            for (seg_id, _), translation in zip(batch, parse(model, model.send(batch), batch)):
+                if translation:
+                    done[seg_id] = translation
+        todo = [(seg_id, source) for seg_id, source in segments if seg_id not in done]
+        if not todo:
+            break
+    return done
+
+
+def run_planned(model, segments, context_tokens, output_tokens, expansion_ratio=None):
+    planner = BatchPlanner(context_tokens, output_tokens, expansion_ratio=expansion_ratio,
+                           prompt_tokens=PROMPT_TOKENS)
+    dispatcher = BatchDispatcher(send=model.send, limits=DispatchLimits(max_in_flight=4), log=lambda msg: None)
+    done = {}
+    retry = []
+
+    def on_result(index, positions, result, error):
+        assert error is None, error
+        batch = [segments[pos] for pos in positions]
+        translations = parse(model, result, batch)
+        planner.observe([source for _, source in batch], translations)
+        missing = [pos for pos, t in zip(positions, translations) if not t]
+        if missing and len(positions) > 1:
+            retry.extend(BatchPlanner.split(missing) if len(missing) == len(positions) else [missing])
+        for (seg_id, _), t in zip(batch, translations):
+            if t:
+                done[seg_id] = t
+
+    sources = [source for _, source in segments]
+    batches = (list(range(start, end)) for start, end in planner.plan(sources))
+    sizes = []
+    while batches:
+        dispatcher.run(batches, lambda *args: (sizes.append(len(args[1])), on_result(*args)),
+                       prepare=lambda positions: [segments[pos] for pos in positions])
+        batches = list(retry)
+        retry.clear()
+    return done, planner, sizes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--segments', type=int, default=2000)
+    parser.add_argument('--batch-size', type=int, default=20)
+    parser.add_argument('--output-tokens', type=int, default=4096)
+    parser.add_argument('--context-tokens', type=int, default=32000)
+    parser.add_argument('--ratio', type=float, default=1.25, help="the mock model's words per source word")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocab = make_vocabulary(rng)
+    # Documents come in runs: a contract's paragraphs, then a software UI's strings
+    segments = []
+    while len(segments) < args.segments:
+        legal = rng.random() < 0.4
+        for _ in range(min(rng.randint(50, 200), args.segments - len(segments))):
+            if legal:  # Paragraph, 150-250 words
+                text = " ".join(make_sentence(rng, vocab) for _ in range(rng.randint(9, 14)))
+            else:  # UI string
+                text = " ".join(rng.choice(vocab).capitalize() for _ in range(rng.randint(1, 4)))
+            segments.append((len(segments) + 1, text))
+    tokens = sum(estimate_tokens(text) for _, text in segments)
+    probe = MockModel(args.ratio, args.output_tokens)
+    true_ratio = sum(estimate_tokens(probe.translate(text)) for _, text in segments) / tokens
+    print(f"=== {args.segments} segments ({tokens:,} source tokens), model output limit "
+          f"{args.output_tokens} tokens, actual expansion {true_ratio:.2f} tokens per source token ===")
+
+    fixed_model = MockModel(args.ratio, args.output_tokens)
+    fixed = run_fixed(fixed_model, segments, args.batch_size)
+    print(f"fixed {args.batch_size}/batch + retries  {fixed_model.requests:5} requests, "
+          f"{fixed_model.truncated:4} truncated, {fixed_model.billed_tokens:,} tokens billed, "
+          f"{len(segments) - len(fixed)} segments never translated")
+
+    planned_model = MockModel(args.ratio, args.output_tokens)
+    planned, planner, sizes = run_planned(planned_model, segments, args.context_tokens, args.output_tokens)
+    print(f"token-budgeted         {planned_model.requests:5} requests, "
+          f"{planned_model.truncated:4} truncated, {planned_model.billed_tokens:,} tokens billed, "
+          f"{len(segments) - len(planned)} segments never translated")
+    print(f"batch sizes {min(sizes)}-{max(sizes)} segments; learned expansion ratio "
+          f"{planner.expansion_ratio:.2f} after {planner.batches_observed} batches")
+
+    assert len(planned) == len(segments), "planner left segments untranslated"
+    # Strictly fewer only when there are several fixed batches / truncations
+    # to save (a small --segments may fit one batch and never truncate)
+    assert planned_model.requests <= fixed_model.requests
+    if fixed_model.requests > 1:
+        assert planned_model.requests < fixed_model.requests
+    assert planned_model.truncated <= fixed_model.truncated
+    if fixed_model.truncated:
+        assert planned_model.truncated < fixed_model.truncated
+    assert abs(planner.expansion_ratio - true_ratio) / true_ratio < 0.15, (planner.expansion_ratio, true_ratio)
+
+    # Started from a badly wrong ratio: early batches come back truncated, are split and re-sent
+    cold_model = MockModel(args.ratio, args.output_tokens)
+    cold, cold_planner, _ = run_planned(cold_model, segments, args.context_tokens, args.output_tokens,
+                                        expansion_ratio=0.4)
+    print(f"cold start at ratio 0.4 {cold_model.requests:5} requests, {cold_model.truncated:4} truncated, "
+          f"{cold_model.billed_tokens:,} tokens billed; learned {cold_planner.expansion_ratio:.2f}")
+    assert len(cold) == len(segments), "split re-sends left segments untranslated"
+    if fixed_model.truncated:
+        assert cold_model.truncated > 0 and cold_model.truncated < fixed_model.truncated
+    print(f"all segments translated; learned ratio within 15% of the actual {true_ratio:.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark: SQLite performance profiles (import and lookup times).
+
+For each profile, builds a synthetic TM in a fresh temporary database with
+add_translation_units_batch() (50,000 units per batch, like the TMX importer)
+and then times exact-match lookups (exact-match cache disabled), fuzzy
+lookups and concordance searches. 'legacy' is SQLite's default configuration,
+i.e. the behaviour before performance profiles existed.
+
+Usage:
+    python scripts/benchmarks/benchmark_db_profile.py --size 1000000
+    python scripts/benchmarks/benchmark_db_profile.py --size 200000 --profiles legacy default
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from modules.database_manager import DatabaseManager
+from modules.db_performance import PERFORMANCE_PROFILES
+from benchmark_fuzzy_batch import make_sentence, make_vocabulary, mutate
+
+
+IMPORT_BATCH_SIZE = 50000
+
+
+def run_profile(profile, args, tmp):
+    rng = random.Random(args.seed)
+    vocab = make_vocabulary(rng)
+    db_path = os.path.join(tmp, f'bench_{profile}.db')
+    db = DatabaseManager(db_path, log_callback=lambda msg: None, performance_profile=profile)
+    db.connect()
+    db.exact_match_cache.max_entries = 0  # measure the SQL lookups
+
+    sources = []
+    t0 = time.perf_counter()
+    for start in range(0, args.size, IMPORT_BATCH_SIZE):
+        batch = []
+        for i in range(start, min(start + IMPORT_BATCH_SIZE, args.size)):
+            src = make_sentence(rng, vocab)
+            sources.append(src)
+            batch.append((src, f"TGT {i} {src}"))
+        db.add_translation_units_batch(batch, 'en', 'nl', tm_id='bench')
+    t_import = time.perf_counter() - t0
+
+    exact_queries = [rng.choice(sources) for _ in range(args.queries // 2)]
+    exact_queries += [make_sentence(rng, vocab) for _ in range(args.queries - len(exact_queries))]
+    t0 = time.perf_counter()
+    hits = sum(db.get_exact_match(q, ['bench'], 'en', 'nl') is not None for q in exact_queries)
+    t_exact = time.perf_counter() - t0
+
+    fuzzy_queries = [mutate(rng, rng.choice(sources), vocab) for _ in range(args.fuzzy_queries)]
+    t0 = time.perf_counter()
+    for q in fuzzy_queries:
+        db.search_fuzzy_matches(q, ['bench'], threshold=0.75, max_results=5,
+                                source_lang='en', target_lang='nl')
+    t_fuzzy = time.perf_counter() - t0
+
+    words = [rng.choice(vocab) for _ in range(args.fuzzy_queries)]
+    t0 = time.perf_counter()
+    for word in words:
+        db.concordance_search(word, ['bench'])
+    t_concordance = time.perf_counter() - t0
+
+    db.close()
+    size_mb = os.path.getsize(db_path) / 1e6
+    print(f"{profile:10s} import {t_import:8.1f}s ({args.size / t_import:8,.0f} units/s)  "
+          f"exact {t_exact * 1000 / len(exact_queries):6.3f} ms/q ({hits} hits)  "
+          f"fuzzy {t_fuzzy * 1000 / len(fuzzy_queries):7.2f} ms/q  "
+          f"concordance {t_concordance * 1000 / len(words):7.2f} ms/q  "
+          f"db {size_mb:,.0f} MB")
+    os.remove(db_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=1000000)
+    parser.add_argument('--queries', type=int, default=5000)
+    parser.add_argument('--fuzzy-queries', type=int, default=200)
+    parser.add_argument('--profiles', nargs='+', choices=list(PERFORMANCE_PROFILES),
+                        default=['legacy', 'default'])
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"=== TM size {args.size:,}, {args.queries:,} exact / {args.fuzzy_queries:,} fuzzy "
+          f"and concordance queries ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        for profile in args.profiles:
+            run_profile(profile, args, tmp)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+"""
+Benchmark: batch fuzzy matching - inverted index vs. full TM scan.
+
+Builds a synthetic TM in a temporary database and runs
+DatabaseManager.search_fuzzy_matches_batch() against the original
+"every source x every TM unit" scan, checking that both return the same best
+match and match_pct for every query.
+
+Usage:
+    python scripts/benchmarks/benchmark_fuzzy_batch.py --sizes 100000 1000000 --queries 200
+    python scripts/benchmarks/benchmark_fuzzy_batch.py --sizes 1000000 --skip-scan
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+from difflib import SequenceMatcher
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from modules.database_manager import DatabaseManager
+from modules.similarity import available_backends, set_backend
+
+
+VOCABULARY_SIZE = 20000
+
+
+def make_vocabulary(rng):
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    return [''.join(rng.choice(letters) for _ in range(rng.randint(3, 10)))
+            for _ in range(VOCABULARY_SIZE)]
+
+
+def make_sentence(rng, vocab):
+    # Zipf-ish word distribution so some words are common and most are rare
+    words = [vocab[int(len(vocab) ** rng.random()) - 1]
+             for _ in range(rng.randint(5, 25))]
+    return ' '.join(words).capitalize() + '.'
+
+
+def mutate(rng, sentence, vocab):
+    words = sentence.rstrip('.').split()
+    for _ in range(max(1, len(words) // 8)):
+        words[rng.randrange(len(words))] = rng.choice(vocab)
+    return ' '.join(words) + '.'
+
+
+def build_tm(db, size, rng, vocab):
+    sources = []
+    batch = []
+    for i in range(size):
+        src = make_sentence(rng, vocab)
+        sources.append(src)
+        batch.append((src, f"TGT {i} {src}"))
+        if len(batch) >= 50000:
+            db.add_translation_units_batch(batch, 'en', 'nl', tm_id='bench')
+            batch = []
+    if batch:
+        db.add_translation_units_batch(batch, 'en', 'nl', tm_id='bench')
+    return sources
+
+
+def legacy_scan(db, sources, threshold=0.75):
+    """The original O(sources x TM) implementation (reference)"""
+    tag_re = re.compile(r'<[^>]+>')
+    db.cursor.execute("SELECT id, source_text FROM translation_units WHERE tm_id = 'bench' ORDER BY id")
+    candidates = []
+    for row in db.cursor.fetchall():
+        clean = tag_re.sub('', row[1]).lower()
+        candidates.append((row[0], clean, len(clean), set(clean.split())))
+
+    results = {}
+    for source in sources:
+        source_clean = tag_re.sub('', source).lower()
+        source_len = len(source_clean)
+        source_words = set(source_clean.split())
+        if source_len == 0:
+            continue
+        best_id, best_similarity = None, 0.0
+        for cand_id, cand_clean, cand_len, cand_words in candidates:
+            if cand_len == 0:
+                continue
+            if min(source_len, cand_len) / max(source_len, cand_len) < threshold:
+                continue
+            if source_words and cand_words:
+                overlap = len(source_words & cand_words)
+                max_words = max(len(source_words), len(cand_words))
+                if max_words > 0 and overlap / max_words < threshold * 0.5:
+                    continue
+            sm = SequenceMatcher(None, source_clean, cand_clean)
+            if sm.quick_ratio() <= best_similarity:
+                continue
+            similarity = sm.ratio()
+            if similarity >= threshold and similarity > best_similarity:
+                best_id, best_similarity = cand_id, similarity
+                if similarity >= 0.999:
+                    break
+        if best_id is not None:
+            results[source] = (best_id, int(best_similarity * 100))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100000, 1000000])
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--skip-scan', action='store_true', help="Don't run the legacy full scan")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--backend', choices=available_backends(), default='difflib',
+                        help="Similarity backend (results match the full scan exactly with difflib)")
+    args = parser.parse_args()
+    set_backend(args.backend)
+
+    for size in args.sizes:
+        rng = random.Random(args.seed)
+        vocab = make_vocabulary(rng)
+        with tempfile.TemporaryDirectory() as tmp:
+            db = DatabaseManager(os.path.join(tmp, 'bench.db'), log_callback=lambda msg: None)
+            db.connect()
+
+            t0 = time.perf_counter()
+            tm_sources = build_tm(db, size, rng, vocab)
+            print(f"\n=== TM size {size:,} (built in {time.perf_counter() - t0:.1f}s) ===")
+
+            # Half near-duplicates of TM units (fuzzy hits), half fresh sentences (mostly misses)
+            queries = [mutate(rng, rng.choice(tm_sources), vocab) for _ in range(args.queries // 2)]
+            queries += [make_sentence(rng, vocab) for _ in range(args.queries - len(queries))]
+
+            t0 = time.perf_counter()
+            indexed = db.search_fuzzy_matches_batch(queries, tm_ids=['bench'], threshold=0.75,
+                                                     workers=1)
+            t_index = time.perf_counter() - t0
+            print(f"inverted index: {t_index:8.2f}s  ({len(indexed)} matches)")
+
+            if not args.skip_scan:
+                t0 = time.perf_counter()
+                scanned = legacy_scan(db, queries)
+                t_scan = time.perf_counter() - t0
+                print(f"full scan:      {t_scan:8.2f}s  ({len(scanned)} matches)")
+                print(f"speed-up:       {t_scan / t_index:8.1f}x")
+
+                indexed_simple = {s: (m['id'], m['match_pct']) for s, m in indexed.items()}
+                if indexed_simple == scanned:
+                    print("results:        identical")
+                else:
+                    diff = set(indexed_simple.items()) ^ set(scanned.items())
+                    print(f"results:        {len(diff)} DIFFERENCES")
+
+            db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""
+Benchmark: interactive fuzzy lookups with the persistent word index vs FTS5.
+
+Builds a synthetic TM, then runs search_fuzzy_matches() (forward direction)
+for queries that are light edits of TM units, inflected forms ("-s"/"-en"
+appended to most words) and punctuation variants:
+
+- FTS5 path: the index marked as not built, i.e. the "any word" OR query
+  over the 500 best BM25 candidates (the behaviour before the index)
+- index path: the FTS5 search merged with the word index probe (units
+  sharing enough rare query words within the length band)
+
+and asserts that the index path returns every match the FTS5 path returns
+(or better ones), with the same similarity. Also times connect() on a database whose index
+has to be rebuilt (the build runs in the background) and the build itself.
+
+Usage:
+    python scripts/benchmarks/benchmark_fuzzy_index.py --size 200000 --queries 60
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from modules.database_manager import DatabaseManager
+from benchmark_fuzzy_batch import build_tm, make_vocabulary, mutate
+
+
+def inflect(rng, sentence):
+    words = sentence.rstrip('.').split()
+    return ' '.join(w + rng.choice(('s', 'en')) if rng.random() < 0.7 else w for w in words) + '.'
+
+
+def punctuate(rng, sentence):
+    words = sentence.rstrip('.').split()
+    return ', '.join(' '.join(words[i:i + 3]) for i in range(0, len(words), 3)) + '!'
+
+
+def set_index_ready(db, ready):
+    db.cursor.execute("UPDATE tm_fuzzy_state SET complete = ? WHERE id = 1", (1 if ready else 0,))
+    db.connection.commit()
+
+
+def run_queries(db, queries, threshold, max_results=10):
+    # max_results=10 gives the FTS5 search its usual 500 candidates
+    results = []
+    t0 = time.perf_counter()
+    for query in queries:
+        results.append(db.search_fuzzy_matches(query, tm_ids=['bench'], threshold=threshold,
+                                               max_results=max_results, bidirectional=False))
+    return results, (time.perf_counter() - t0) / len(queries) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=50000)
+    parser.add_argument('--queries', type=int, default=60)
+    parser.add_argument('--threshold', type=float, default=0.75)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocab = make_vocabulary(rng)
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'bench.db')
+        db = DatabaseManager(db_path, log_callback=lambda msg: None)
+        db.connect()
+        t0 = time.perf_counter()
+        sources = build_tm(db, args.size, rng, vocab)
+        print(f"=== {args.size:,} units imported in {time.perf_counter() - t0:.1f}s ===")
+
+        picks = [rng.choice(sources) for _ in range(args.queries)]
+        queries = ([mutate(rng, s, vocab) for s in picks[0::3]] +
+                   [inflect(rng, s) for s in picks[1::3]] +
+                   [punctuate(rng, s) for s in picks[2::3]])
+
+        set_index_ready(db, False)
+        fts_results, fts_ms = run_queries(db, queries, args.threshold)
+        set_index_ready(db, True)
+        index_results, index_ms = run_queries(db, queries, args.threshold)
+
+        fts_hits = index_hits = 0
+        for query, fts, indexed in zip(queries, fts_results, index_results):
+            found = {m['id']: m['similarity'] for m in indexed}
+            for match in fts:
+                if match['id'] in found:
+                    assert abs(found[match['id']] - match['similarity']) < 1e-9
+                else:
+                    # Only displaced by at least as good matches FTS5 didn't find
+                    assert len(indexed) == 10 and indexed[-1]['similarity'] >= match['similarity'], \
+                        f"index path missed unit {match['id']} for {query!r}"
+            fts_hits += len(fts)
+            index_hits += len(indexed)
+        print(f"FTS5 path        {fts_ms:8.2f} ms/query  {fts_hits:,} matches")
+        print(f"index path       {index_ms:8.2f} ms/query  {index_hits:,} matches "
+              f"(every FTS5 match or better, same scores)")
+
+        # Reopen with an outdated index: connect() must not wait for the rebuild
+        db.cursor.execute("UPDATE tm_fuzzy_state SET version = 0, complete = 0 WHERE id = 1")
+        db.connection.commit()
+        db.close()
+        db = DatabaseManager(db_path, log_callback=lambda msg: None)
+        t0 = time.perf_counter()
+        db.connect()
+        t_connect = time.perf_counter() - t0
+        building = not db.fuzzy_index_ready()
+        while not db.fuzzy_index_ready():
+            time.sleep(0.05)
+        t_build = time.perf_counter() - t0
+        status = db.check_fuzzy_index()
+        assert status['in_sync'], status
+        rebuilt, _ = run_queries(db, queries, args.threshold)
+        assert [len(r) for r in rebuilt] == [len(r) for r in index_results]
+        print(f"connect() with outdated index {t_connect:6.2f}s "
+              f"({'build still running' if building else 'build already done'}), "
+              f"background build finished after {t_build:.1f}s")
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: batch fuzzy matching scaling over worker processes.
+
+Builds a synthetic TM (same generator as benchmark_fuzzy_batch.py) and runs
+DatabaseManager.search_fuzzy_matches_batch() with 1, 2, 4 and 8 workers
+(each indexing its own shard of the TM), asserting that every run returns
+exactly the same matches as the serial path.
+
+Usage:
+    python scripts/benchmarks/benchmark_fuzzy_parallel.py --size 100000 --queries 2000
+    python scripts/benchmarks/benchmark_fuzzy_parallel.py --workers 1 2 4 8 16
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from modules.database_manager import DatabaseManager
+from modules.similarity import available_backends, set_backend
+from benchmark_fuzzy_batch import build_tm, make_sentence, make_vocabulary, mutate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=100000)
+    parser.add_argument('--queries', type=int, default=2000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--backend', choices=available_backends(), default='difflib')
+    args = parser.parse_args()
+    set_backend(args.backend)
+
+    rng = random.Random(args.seed)
+    vocab = make_vocabulary(rng)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(os.path.join(tmp, 'bench.db'), log_callback=lambda msg: None)
+        db.connect()
+
+        t0 = time.perf_counter()
+        tm_sources = build_tm(db, args.size, rng, vocab)
+        print(f"=== TM size {args.size:,} (built in {time.perf_counter() - t0:.1f}s), "
+              f"{args.queries:,} queries, {os.cpu_count()} CPUs ===")
+
+        queries = [mutate(rng, rng.choice(tm_sources), vocab) for _ in range(args.queries // 2)]
+        queries += [make_sentence(rng, vocab) for _ in range(args.queries - len(queries))]
+
+        baseline = None
+        t_serial = None
+        for workers in args.workers:
+            t0 = time.perf_counter()
+            result = db.search_fuzzy_matches_batch(queries, tm_ids=['bench'], threshold=0.75,
+                                                   workers=workers)
+            elapsed = time.perf_counter() - t0
+            simple = {s: (m['id'], m['similarity']) for s, m in result.items()}
+
+            if baseline is None:
+                baseline, t_serial = simple, elapsed
+                status = "baseline"
+            else:
+                status = "identical" if simple == baseline else "DIFFERENT"
+            print(f"{workers:2d} worker(s): {elapsed:8.2f}s  speed-up {t_serial / elapsed:5.2f}x  "
+                  f"({len(result)} matches, {status})")
+            assert simple == baseline, f"{workers} workers returned different matches"
+
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
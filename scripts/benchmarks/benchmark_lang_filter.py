@@ -0,0 +1,179 @@
+"""
+Benchmark: base-language columns vs. OR/LIKE language variant filters.
+
+Builds a synthetic multi-language TM (language codes stored in mixed forms:
+'en-US', 'EN', 'English', 'nl_BE', ...), then:
+
+- asserts with EXPLAIN QUERY PLAN that the exact-match (forward and reverse)
+  and fuzzy candidate queries search the composite indexes instead of scanning
+- times exact-match lookups (exact-match cache disabled) and the language
+  filtered candidate query against the original OR/LIKE variant filter,
+  checking that the base columns return every row the old filter did (plus
+  spellings it missed, e.g. 'nl_NL' is not matched by LIKE 'nl-%')
+
+Usage:
+    python scripts/benchmarks/benchmark_lang_filter.py --size 200000 --queries 2000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from modules.database_manager import DatabaseManager, _exact_match_hashes
+from modules.tmx_generator import get_lang_match_variants
+from benchmark_fuzzy_batch import make_sentence, make_vocabulary
+
+
+# (source_lang, target_lang, tm_id) - the same pair stored in different spellings
+LANGUAGE_PAIRS = [
+    ('en-US', 'nl-BE', 'tm_en_nl'),
+    ('English', 'Dutch', 'tm_en_nl'),
+    ('en', 'nl_NL', 'tm_en_nl'),
+    ('en-GB', 'de-DE', 'tm_en_de'),
+    ('de', 'en', 'tm_de_en'),
+    ('fr-FR', 'en-US', 'tm_fr_en'),
+    ('es', 'pt-BR', 'tm_es_pt'),
+    ('it', 'en', 'tm_it_en'),
+]
+
+
+def legacy_lang_filter(source_lang, target_lang):
+    """The original OR/LIKE filter over every language variant (reference)"""
+    sql = ""
+    params = []
+    for column, lang in (('source_lang', source_lang), ('target_lang', target_lang)):
+        conditions = []
+        for variant in get_lang_match_variants(lang):
+            conditions.append(f"{column} = ?")
+            params.append(variant)
+            conditions.append(f"{column} LIKE ?")
+            params.append(f"{variant}-%")
+        sql += f" AND ({' OR '.join(conditions)})"
+    return sql, params
+
+
+def compare(new, legacy):
+    """Describe how the new result relates to the reference result"""
+    if new == legacy:
+        return "identical"
+    if legacy <= new:
+        return f"superset, +{len(new - legacy)} missed by OR/LIKE"
+    return "DIFFERENT"
+
+
+def query_plan(db, sql, params):
+    db.cursor.execute("EXPLAIN QUERY PLAN " + sql, params)
+    return [row[3] for row in db.cursor.fetchall()]
+
+
+def assert_index_used(db, label, sql, params, index_name):
+    plan = query_plan(db, sql, params)
+    print(f"{label:18s} {' | '.join(plan)}")
+    assert any(index_name in step for step in plan), f"{label}: {index_name} not used"
+    assert not any(step.startswith('SCAN translation_units') for step in plan), f"{label}: table scan"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=200000)
+    parser.add_argument('--queries', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocab = make_vocabulary(rng)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(os.path.join(tmp, 'bench.db'), log_callback=lambda msg: None)
+        db.connect()
+        db.exact_match_cache.max_entries = 0  # measure the SQL lookups
+
+        t0 = time.perf_counter()
+        en_nl_sources = []
+        per_pair = args.size // len(LANGUAGE_PAIRS)
+        for source_lang, target_lang, tm_id in LANGUAGE_PAIRS:
+            entries = [(make_sentence(rng, vocab), f"TGT {make_sentence(rng, vocab)}")
+                       for _ in range(per_pair)]
+            db.add_translation_units_batch(entries, source_lang, target_lang, tm_id=tm_id)
+            if tm_id == 'tm_en_nl':
+                en_nl_sources.extend(src for src, _ in entries)
+        db.cursor.execute("ANALYZE")
+        print(f"=== TM size {per_pair * len(LANGUAGE_PAIRS):,} in {len(LANGUAGE_PAIRS)} language spellings "
+              f"(built in {time.perf_counter() - t0:.1f}s), {args.queries:,} queries ===")
+
+        tm_ids = ['tm_en_nl', 'tm_en_de']
+        tm_sql = f" AND tm_id IN ({', '.join('?' * len(tm_ids))})"
+
+        # --- Query plans ---
+        exact_lang_sql, exact_lang_params = db._lang_filter_sql('en', 'nl')
+        exact_sql = ("SELECT * FROM translation_units WHERE source_hash IN (?, ?, ?, ?)"
+                     + tm_sql + exact_lang_sql + " ORDER BY usage_count DESC, modified_date DESC LIMIT 1")
+        exact_params = ['x'] * 4 + tm_ids + exact_lang_params
+        assert_index_used(db, "exact match", exact_sql, exact_params, 'idx_tu_hash_langs')
+
+        reverse_lang_sql, reverse_lang_params = db._lang_filter_sql('en', 'nl', reverse=True)
+        reverse_exact_sql = ("SELECT * FROM translation_units WHERE target_hash IN (?, ?, ?, ?)"
+                             + tm_sql + reverse_lang_sql + " ORDER BY usage_count DESC, modified_date DESC LIMIT 1")
+        assert_index_used(db, "reverse exact", reverse_exact_sql, exact_params, 'idx_tu_target_hash_langs')
+
+        scan_sql = "SELECT id, source_text FROM translation_units WHERE 1=1" + tm_sql + exact_lang_sql
+        assert_index_used(db, "fuzzy candidates", scan_sql, tm_ids + exact_lang_params, 'idx_tu_lang_base')
+
+        assert_index_used(db, "reverse candidates",
+                          "SELECT id FROM translation_units WHERE 1=1" + tm_sql + reverse_lang_sql,
+                          tm_ids + reverse_lang_params, 'idx_tu_lang_base')
+
+        # --- Exact-match lookups ---
+        queries = [rng.choice(en_nl_sources) for _ in range(args.queries // 2)]
+        queries += [make_sentence(rng, vocab) for _ in range(args.queries - len(queries))]
+
+        legacy_sql, legacy_params = legacy_lang_filter('en', 'nl')
+        legacy_exact = ("SELECT id FROM translation_units WHERE source_hash IN (?, ?, ?, ?)"
+                        + tm_sql + legacy_sql + " ORDER BY usage_count DESC, modified_date DESC LIMIT 1")
+
+        t0 = time.perf_counter()
+        legacy_ids = []
+        for query in queries:
+            db.cursor.execute(legacy_exact, list(_exact_match_hashes(query)) + tm_ids + legacy_params)
+            row = db.cursor.fetchone()
+            legacy_ids.append(row[0] if row else None)
+        t_legacy = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        new_ids = []
+        for query in queries:
+            match = db.get_exact_match(query, tm_ids, 'en', 'nl', bidirectional=False)
+            new_ids.append(match['id'] if match else None)
+        t_new = time.perf_counter() - t0
+
+        status = compare({(q, i) for q, i in zip(queries, new_ids) if i is not None},
+                         {(q, i) for q, i in zip(queries, legacy_ids) if i is not None})
+        print(f"exact match       OR/LIKE {t_legacy:7.3f}s  base columns {t_new:7.3f}s  "
+              f"speed-up {t_legacy / t_new:6.1f}x  ({sum(i is not None for i in new_ids)} hits, {status})")
+
+        # --- Language-filtered candidate scan ---
+        t0 = time.perf_counter()
+        db.cursor.execute("SELECT id FROM translation_units WHERE 1=1" + tm_sql + legacy_sql,
+                          tm_ids + legacy_params)
+        legacy_rows = {row[0] for row in db.cursor.fetchall()}
+        t_legacy = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        db.cursor.execute("SELECT id FROM translation_units WHERE 1=1" + tm_sql + exact_lang_sql,
+                          tm_ids + exact_lang_params)
+        new_rows = {row[0] for row in db.cursor.fetchall()}
+        t_new = time.perf_counter() - t0
+
+        status = compare(new_rows, legacy_rows)
+        print(f"candidate scan    OR/LIKE {t_legacy:7.3f}s  base columns {t_new:7.3f}s  "
+              f"speed-up {t_legacy / t_new:6.1f}x  ({len(new_rows):,} rows, {status})")
+
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,206 @@
+"""
+Benchmark: concurrent LLM batch dispatch against a local mock server.
+
+Starts a mock OpenAI-style chat completions server on localhost that answers
+numbered batch prompts after a fixed latency. It answers HTTP 429 with a
+Retry-After header to every --reject-every'th request it receives (a fixed
+schedule, so every run sees the same number of rate limits), and to any
+request beyond --server-concurrency open at once (a provider's concurrency
+limit). Then sends the same batches:
+
+- one at a time (the former PreTranslationWorker loop)
+- with BatchDispatcher at --in-flight concurrent batches, plus a
+  requests-per-minute budget
+
+and asserts that every batch comes back complete, that results are reported
+in batch order, that the 429s were retried and that the dispatcher is at
+least --min-speedup times faster. The dispatcher's backoff jitter is seeded
+with --seed, so the timing is repeatable.
+
+Usage:
+    python scripts/benchmarks/benchmark_llm_dispatcher.py --batches 60 --latency 0.5 --in-flight 8
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from modules.llm_dispatcher import BatchDispatcher, DispatchLimits, estimate_request_tokens
+
+
+class MockLLMServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, latency, max_concurrent, reject_every=0):
+        super().__init__(('127.0.0.1', 0), MockHandler)
+        self.latency = latency
+        self.max_concurrent = max_concurrent
+        self.reject_every = reject_every
+        self.received = 0
+        self.open_requests = 0
+        self.peak = 0
+        self.rejected = 0
+        self.lock = threading.Lock()
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        with server.lock:
+            server.received += 1
+            scheduled = server.reject_every and server.received % server.reject_every == 0
+            if scheduled or server.open_requests >= server.max_concurrent:
+                server.rejected += 1
+                reject = True
+            else:
+                server.open_requests += 1
+                server.peak = max(server.peak, server.open_requests)
+                reject = False
+        if reject:
+            payload = json.dumps({'error': {'message': 'Rate limit reached', 'type': 'rate_limit'}}).encode()
+            self.send_response(429)
+            self.send_header('Retry-After', '1')
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+            return
+        try:
+            time.sleep(server.latency)
+            prompt = body['messages'][-1]['content']
+            lines = [f"{m.group(1)}. NL {m.group(2)}"
+                     for m in re.finditer(r'^(\d+)\. (.*)$', prompt, re.MULTILINE)]
+            payload = json.dumps({'choices': [{'message': {'role': 'assistant',
+                                                           'content': "\n".join(lines)}}]}).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        finally:
+            with server.lock:
+                server.open_requests -= 1
+
+
+def make_batches(count, size):
+    batches = []
+    for b in range(count):
+        ids = range(b * size + 1, (b + 1) * size + 1)
+        batches.append([(seg_id, f"Source sentence number {seg_id} for the mock model.") for seg_id in ids])
+    return batches
+
+
+def build_prompt(batch):
+    lines = ["Translate the following text segments from en to nl.", ""]
+    lines += [f"{seg_id}. {source}" for seg_id, source in batch]
+    return "\n".join(lines)
+
+
+def make_sender(url):
+    def send(prompt):
+        request = urllib.request.Request(url, data=json.dumps({
+            'model': 'mock', 'messages': [{'role': 'user', 'content': prompt}]}).encode(),
+            headers={'Content-Type': 'application/json'})
+        # urllib raises HTTPError (with .code and .headers) for the 429s
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return json.loads(response.read())['choices'][0]['message']['content']
+    return send
+
+
+def parse(result, batch):
+    found = dict((int(m.group(1)), m.group(2)) for m in re.finditer(r'^(\d+)\.\s*(.*)$', result, re.MULTILINE))
+    return [found.get(seg_id) for seg_id, _ in batch]
+
+
+def check(batches, reported):
+    assert [index for index, _ in reported] == list(range(len(batches))), "results out of order"
+    for (index, translations), batch in zip(reported, batches):
+        expected = [f"NL {source}" for _, source in batch]
+        assert translations == expected, f"batch {index} incomplete"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--batches', type=int, default=60)
+    parser.add_argument('--batch-size', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=0.5, help="seconds per mock completion")
+    parser.add_argument('--in-flight', type=int, default=8)
+    parser.add_argument('--server-concurrency', type=int, default=8,
+                        help="open requests the mock server accepts before answering 429")
+    parser.add_argument('--reject-every', type=int, default=20,
+                        help="the mock server answers 429 to every n-th request it receives")
+    parser.add_argument('--rpm', type=float, default=600, help="requests-per-minute budget")
+    parser.add_argument('--seed', type=int, default=21, help="seed for the dispatcher's backoff jitter")
+    parser.add_argument('--min-speedup', type=float, default=3.0)
+    args = parser.parse_args()
+
+    server = MockLLMServer(args.latency, args.server_concurrency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/v1/chat/completions"
+    send = make_sender(url)
+    batches = make_batches(args.batches, args.batch_size)
+    print(f"=== {args.batches} batches x {args.batch_size} segments, {args.latency:.2f}s latency, "
+          f"server accepts {args.server_concurrency} at once ===")
+
+    t0 = time.perf_counter()
+    serial = [(index, parse(send(build_prompt(batch)), batch)) for index, batch in enumerate(batches)]
+    t_serial = time.perf_counter() - t0
+    check(batches, serial)
+    print(f"one at a time          {t_serial:8.2f}s")
+
+    # Rate limits start with the dispatcher run; the serial baseline sees none
+    server.reject_every = args.reject_every
+    server.received = 0
+    reported = []
+    limits = DispatchLimits(max_in_flight=args.in_flight, requests_per_minute=args.rpm,
+                            backoff_base=0.5, backoff_max=5)
+    dispatcher = BatchDispatcher(send=send, limits=limits, estimate_tokens=estimate_request_tokens,
+                                 log=lambda msg: None, rng=random.Random(args.seed))
+    t0 = time.perf_counter()
+    dispatcher.run(batches, lambda index, batch, result, error: reported.append(
+        (index, parse(result, batch) if error is None else error)), prepare=build_prompt)
+    t_dispatch = time.perf_counter() - t0
+    errors = [result for _, result in reported if isinstance(result, Exception)]
+    assert not errors, errors[:3]
+    check(batches, reported)
+    stats = dispatcher.stats
+    print(f"dispatcher, {args.in_flight} in flight {t_dispatch:8.2f}s  (speed-up {t_serial / t_dispatch:.1f}x, "
+          f"{stats['requests']} requests, {stats['rate_limited']} rate limited and retried, "
+          f"peak {server.peak} open at the server)")
+    assert server.peak <= args.server_concurrency
+    assert server.rejected == stats['rate_limited'], "expected 429s to be retried"
+    if args.reject_every and args.in_flight <= args.server_concurrency:
+        # Only the fixed schedule rejects: the last of n successes is request n + (n - 1) // (k - 1)
+        expected = (args.batches - 1) // (args.reject_every - 1) if args.reject_every > 1 else None
+        assert expected is None or stats['rate_limited'] == expected, \
+            f"{stats['rate_limited']} rate limited, {expected} scheduled"
+    assert t_serial / t_dispatch >= args.min_speedup, f"speed-up {t_serial / t_dispatch:.1f}x"
+
+    # Cancelling stops sending; what was sent is still reported in order
+    reported = []
+    cancel_after = args.batches // 3
+    dispatcher = BatchDispatcher(send=send, limits=DispatchLimits(max_in_flight=args.server_concurrency),
+                                 log=lambda msg: None, rng=random.Random(args.seed))
+    dispatcher.run(batches, lambda index, batch, result, error: reported.append(index),
+                   prepare=build_prompt, cancelled=lambda: len(reported) >= cancel_after)
+    assert reported == list(range(len(reported))) and len(reported) < args.batches, reported
+    print(f"all batches complete and in order, 429s retried; cancel after {cancel_after} "
+          f"reported {len(reported)} of {args.batches}")
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
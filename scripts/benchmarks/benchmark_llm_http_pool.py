@@ -0,0 +1,184 @@
+"""
+Benchmark: per-request overhead of LLMClient with pooled keep-alive clients
+vs. a new SDK client / bare requests.post() per call.
+
+Starts a local stub server answering OpenAI chat completions, Anthropic
+messages and Ollama /api/chat, with an emulated connection setup cost
+(--handshake-ms per new connection, standing in for TCP + TLS round trips
+and proxies). For each provider it sends --requests translate() calls:
+
+- the former way: a new openai.OpenAI / anthropic.Anthropic client (or a
+  bare requests.post for Ollama) per call
+- through LLMClient, creating a new LLMClient per call as the app does
+
+and reports ms/request and the number of connections the server saw.
+Asserts that the pooled path reuses connections, is faster, and that
+close_http_clients() closes them and later calls reconnect.
+
+Needs openai, anthropic and requests (see requirements.txt).
+
+Usage:
+    python scripts/benchmarks/benchmark_llm_http_pool.py --requests 200 --handshake-ms 20
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import anthropic
+import openai
+import requests
+
+from modules.llm_clients import LLMClient, close_http_clients
+
+REPLY = "Hallo wereld"
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, handshake):
+        super().__init__(('127.0.0.1', 0), StubHandler)
+        self.handshake = handshake
+        self.connections = 0
+        self.open_connections = 0
+        self.lock = threading.Lock()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        # Headers and body go out in separate writes; without this, Nagle plus
+        # delayed ACKs add ~40 ms to every response on a kept-alive connection
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.server.lock:
+            self.server.connections += 1
+            self.server.open_connections += 1
+        time.sleep(self.server.handshake)
+
+    def finish(self):
+        super().finish()
+        with self.server.lock:
+            self.server.open_connections -= 1
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+        if self.path.endswith('/chat/completions'):
+            payload = {'id': 'chatcmpl-1', 'object': 'chat.completion', 'created': 0, 'model': body.get('model'),
+                       'choices': [{'index': 0, 'finish_reason': 'stop',
+                                    'message': {'role': 'assistant', 'content': REPLY}}],
+                       'usage': {'prompt_tokens': 10, 'completion_tokens': 3, 'total_tokens': 13}}
+        elif self.path.endswith('/messages'):
+            payload = {'id': 'msg_1', 'type': 'message', 'role': 'assistant', 'model': body.get('model'),
+                       'content': [{'type': 'text', 'text': REPLY}], 'stop_reason': 'end_turn',
+                       'stop_sequence': None, 'usage': {'input_tokens': 10, 'output_tokens': 3}}
+        elif self.path == '/api/chat':
+            payload = {'model': body.get('model'), 'message': {'role': 'assistant', 'content': REPLY},
+                       'done': True, 'eval_count': 3}
+        else:
+            self.send_error(404)
+            return
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def per_call_openai(url):
+    client = openai.OpenAI(api_key='stub', base_url=f"{url}/v1")
+    response = client.chat.completions.create(model='gpt-4o', messages=[{'role': 'user', 'content': 'Hello world'}],
+                                              max_tokens=100, temperature=0.3)
+    client.close()
+    return response.choices[0].message.content
+
+
+def per_call_claude(url):
+    client = anthropic.Anthropic(api_key='stub', base_url=url)
+    response = client.messages.create(model='claude-sonnet-4-6', max_tokens=100,
+                                      messages=[{'role': 'user', 'content': 'Hello world'}])
+    client.close()
+    return response.content[0].text
+
+
+def per_call_ollama(url):
+    response = requests.post(f"{url}/api/chat", json={'model': 'qwen3:4b', 'stream': False,
+                                                      'messages': [{'role': 'user', 'content': 'Hello world'}]})
+    return response.json()['message']['content']
+
+
+def pooled(provider, url):
+    def call(_url):
+        client = LLMClient(api_key='stub', provider=provider, base_url=url if provider == 'custom_openai' else None)
+        return client.translate("Hello world", source_lang="en", target_lang="nl")
+    return call
+
+
+def timed(server, call, url, count):
+    before = server.connections
+    with contextlib.redirect_stdout(io.StringIO()):  # LLMClient logs every call
+        t0 = time.perf_counter()
+        for _ in range(count):
+            assert call(url) == REPLY
+        elapsed = time.perf_counter() - t0
+    return elapsed * 1000 / count, server.connections - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--handshake-ms', type=float, default=20.0,
+                        help="emulated setup cost of each new connection")
+    args = parser.parse_args()
+
+    server = StubServer(args.handshake_ms / 1000)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    os.environ['ANTHROPIC_BASE_URL'] = url  # LLMClient has no base_url for Claude
+    os.environ['OLLAMA_ENDPOINT'] = url
+    print(f"=== {args.requests} requests per provider, {args.handshake_ms:.0f} ms per new connection ===")
+
+    cases = [
+        ('OpenAI-compatible', per_call_openai, pooled('custom_openai', f"{url}/v1")),
+        ('Claude', per_call_claude, pooled('claude', None)),
+        ('Ollama', per_call_ollama, pooled('ollama', None)),
+    ]
+    for name, former, new in cases:
+        t_former, c_former = timed(server, former, url, args.requests)
+        t_new, c_new = timed(server, new, url, args.requests)
+        print(f"{name:18} per call {t_former:7.2f} ms/request ({c_former} connections)   "
+              f"pooled {t_new:7.2f} ms/request ({c_new} connections, {t_former / t_new:.1f}x)")
+        assert c_former >= args.requests, c_former
+        assert c_new <= 2, f"{name}: pooled path opened {c_new} connections"
+        assert t_new < t_former, name
+
+    open_before = server.open_connections
+    close_http_clients()
+    deadline = time.time() + 5
+    while server.open_connections and time.time() < deadline:
+        time.sleep(0.01)
+    assert server.open_connections == 0, server.open_connections
+    t_new, c_new = timed(server, pooled('custom_openai', f"{url}/v1"), url, 5)
+    assert c_new == 1, c_new
+    print(f"close_http_clients() closed {open_before} kept-alive connections; next call reconnected")
+    close_http_clients()
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+"""
+Benchmark: non-translatable matching with the cached NonTranslatableMatcher
+vs. the former per-entry regex scan.
+
+Builds active NT lists of product names (20k entries by default: brand
+names, model numbers, names with ® / ™, a few case-insensitive entries) and
+segments with entries spliced in, then:
+
+- times the former find_all_matches() (a regex built and run per entry per
+  segment) on a sample of segments
+- times compiling the matcher and find_all_matches() on all segments, and
+  that repeated calls reuse the compiled matcher
+- asserts both return identical spans on the sample, and that add_entry(),
+  remove_entry() and set_list_active() are picked up by the next search
+
+Usage:
+    python scripts/benchmarks/benchmark_non_translatables.py --entries 20000 --segments 5000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from modules.non_translatables_manager import NonTranslatable, NonTranslatablesManager
+from benchmark_fuzzy_batch import make_sentence, make_vocabulary
+
+
+def make_entry(rng, vocab, i):
+    kind = rng.random()
+    if kind < 0.4:
+        return f"{rng.choice(vocab).capitalize()} {rng.choice(vocab).capitalize()}"
+    if kind < 0.6:
+        return f"{rng.choice(vocab).upper()}-{i}"
+    if kind < 0.8:
+        return f"{rng.choice(vocab).capitalize()}{rng.choice(['®', '™'])}"
+    if kind < 0.9:
+        return f"{rng.choice(vocab).capitalize()} {rng.randint(1, 9999)}"
+    return f"{rng.choice(vocab).capitalize()}{i}"
+
+
+def legacy_matches(entry, source_text):
+    """The former NonTranslatable.matches(): pattern built on every call"""
+    pattern = entry.text
+    escaped_pattern = re.escape(pattern)
+    flags = 0 if entry.case_sensitive else re.IGNORECASE
+    if pattern and pattern[0].isalnum():
+        boundary_pattern = r'\b' + escaped_pattern
+    else:
+        boundary_pattern = r'(?:^|(?<=\s)|(?<=[^\w]))' + escaped_pattern
+    if pattern and pattern[-1].isalnum():
+        boundary_pattern = boundary_pattern + r'\b'
+    return [(m.start(), m.end()) for m in re.finditer(boundary_pattern, source_text, flags)]
+
+
+def legacy_find_all(manager, source_text):
+    """The former NonTranslatablesManager.find_all_matches()"""
+    all_matches = []
+    for nt_list in manager.get_active_lists():
+        for entry in nt_list.entries:
+            for start, end in legacy_matches(entry, source_text):
+                all_matches.append((start, end, nt_list.name))
+    all_matches.sort(key=lambda m: (m[0], -(m[1] - m[0])))
+    filtered = []
+    last_end = -1
+    for match in all_matches:
+        if match[0] >= last_end:
+            filtered.append(match)
+            last_end = match[1]
+    return filtered
+
+
+def spans(matches):
+    return [(m['start'], m['end'], m['list_name']) for m in matches]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--entries', type=int, default=20000)
+    parser.add_argument('--lists', type=int, default=3)
+    parser.add_argument('--segments', type=int, default=5000)
+    parser.add_argument('--legacy-segments', type=int, default=20,
+                        help="segments also matched the former way")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocab = make_vocabulary(rng)
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = NonTranslatablesManager(tmp, log_callback=lambda msg: None)
+        names = [f"Products {n + 1}" for n in range(args.lists)]
+        for name in names:
+            manager.create_list(name)
+        known = []
+        for i in range(args.entries):
+            text = make_entry(rng, vocab, i)
+            entry = NonTranslatable(text=text, case_sensitive=rng.random() > 0.05)
+            manager.lists[rng.choice(names)].entries.append(entry)
+            known.append(text)
+        manager.invalidate_matcher()
+
+        segments = []
+        for _ in range(args.segments):
+            words = make_sentence(rng, vocab).rstrip('.').split()
+            for _ in range(rng.randint(0, 3)):
+                text = rng.choice(known)
+                words.insert(rng.randint(0, len(words)), text if rng.random() < 0.9 else text.lower())
+            segments.append(" ".join(words) + ".")
+        print(f"=== {args.entries:,} entries in {args.lists} lists, {args.segments:,} segments ===")
+
+        sample = segments[:args.legacy_segments]
+        t0 = time.perf_counter()
+        legacy = [legacy_find_all(manager, segment) for segment in sample]
+        t_legacy = (time.perf_counter() - t0) / len(sample)
+        print(f"per-entry regex        {t_legacy * 1000:8.2f} ms/segment  "
+              f"(~{t_legacy * args.segments:,.0f}s for all segments)")
+
+        t0 = time.perf_counter()
+        matcher = manager.get_matcher()
+        print(f"compile matcher        {time.perf_counter() - t0:8.2f}s  ({matcher.entry_count:,} distinct entries)")
+        t0 = time.perf_counter()
+        results = [manager.find_all_matches(segment) for segment in segments]
+        t_new = (time.perf_counter() - t0) / len(segments)
+        hits = sum(len(r) for r in results)
+        print(f"cached matcher         {t_new * 1000:8.3f} ms/segment  ({hits:,} spans, "
+              f"speed-up {t_legacy / t_new:,.0f}x)")
+        assert manager.get_matcher() is matcher, "matcher rebuilt without a list change"
+
+        for segment, old, new in zip(sample, legacy, results):
+            assert old == spans(new), f"Different spans for {segment!r}: {old} vs {spans(new)}"
+
+        # Changes through the manager are picked up
+        text = "Zzyzx Ultra"
+        manager.add_entry(names[0], text)
+        assert spans(manager.find_all_matches(f"Buy {text} now")) == [(4, 15, names[0])]
+        manager.remove_entry(names[0], text)
+        assert manager.find_all_matches(f"Buy {text} now") == []
+        manager.set_list_active(names[0], False)
+        assert all(m['list_name'] != names[0] for segment in sample
+                   for m in manager.find_all_matches(segment))
+        print(f"same spans as the per-entry scan on {len(sample)} segments, list changes picked up")
+
+
+if __name__ == '__main__':
+    main()
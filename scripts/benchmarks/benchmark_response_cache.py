@@ -0,0 +1,124 @@
+"""
+Benchmark: LLM/MT response cache (modules/response_cache.py).
+
+Translates --segments segments one by one through LLMClient against the
+local stub server from benchmark_llm_http_pool.py (with --latency seconds
+per completion), twice: the first run calls the API for every segment, the
+re-run of the unchanged segments must be answered from the cache without a
+single API call. Then asserts that:
+
+- use_cache=False and a disabled cache still call the API
+- entries expire after the TTL
+- the cache stays under its size limit (least recently used entries go first)
+- the hit-rate counter matches
+
+Needs openai, anthropic and requests (see requirements.txt).
+
+Usage:
+    python scripts/benchmarks/benchmark_response_cache.py --segments 200 --latency 0.05
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from modules.llm_clients import LLMClient, close_http_clients
+from modules.response_cache import ResponseCache, configure_response_cache, response_cache_key
+from benchmark_llm_http_pool import REPLY, StubHandler, StubServer
+
+
+class SlowStubHandler(StubHandler):
+    def do_POST(self):
+        with self.server.lock:
+            self.server.api_calls += 1
+        time.sleep(self.server.latency)
+        super().do_POST()
+
+
+def translate_all(url, segments, use_cache=True):
+    """Translate every segment; returns (seconds, outputs)"""
+    with contextlib.redirect_stdout(io.StringIO()):  # LLMClient logs every call
+        t0 = time.perf_counter()
+        outputs = [LLMClient(api_key='stub', provider='custom_openai', base_url=url).translate(
+            segment, source_lang='en', target_lang='nl', use_cache=use_cache) for segment in segments]
+    return time.perf_counter() - t0, outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--segments', type=int, default=200)
+    parser.add_argument('--latency', type=float, default=0.05, help="seconds per stub completion")
+    args = parser.parse_args()
+
+    server = StubServer(0)
+    server.RequestHandlerClass = SlowStubHandler
+    server.latency = args.latency
+    server.api_calls = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    segments = [f"Segment {i}: the pump housing must be cleaned before assembly." for i in range(args.segments)]
+    print(f"=== {args.segments} segments, {args.latency * 1000:.0f} ms per API call ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = configure_response_cache(os.path.join(tmp, 'cache', 'responses.db'))
+
+        t_first, first = translate_all(url, segments)
+        calls_first = server.api_calls
+        t_rerun, rerun = translate_all(url, segments)
+        calls_rerun = server.api_calls - calls_first
+        stats = cache.stats()
+        print(f"first run              {t_first:8.2f}s  ({calls_first} API calls)")
+        print(f"re-run, unchanged      {t_rerun:8.3f}s  ({calls_rerun} API calls, {t_first / t_rerun:,.0f}x faster)")
+        print(f"hit rate               {stats['hit_rate']:8.0%}   ({stats['hits']} hits, {stats['misses']} misses, "
+              f"{stats['entries']} entries, {stats['size_bytes'] / 1024:.0f} KB)")
+        assert first == rerun == [REPLY] * args.segments
+        assert calls_first == args.segments and calls_rerun == 0
+        assert stats['hits'] == args.segments and stats['misses'] == args.segments
+
+        # A changed segment misses, the rest hit
+        changed = segments[:-1] + [segments[-1] + " Revised."]
+        translate_all(url, changed)
+        assert server.api_calls - calls_first == 1
+
+        # Bypass per call and globally
+        calls = server.api_calls
+        translate_all(url, segments[:5], use_cache=False)
+        cache.enabled = False
+        translate_all(url, segments[:5])
+        cache.enabled = True
+        assert server.api_calls - calls == 10, server.api_calls - calls
+
+        # TTL
+        short = ResponseCache(os.path.join(tmp, 'ttl.db'), ttl_days=0.5 / 86400)
+        key = response_cache_key(kind='mt', provider='google', text='Hello')
+        short.put(key, 'Hallo')
+        assert short.get(key) == 'Hallo'
+        time.sleep(0.6)
+        assert short.get(key) is None and short.stats()['entries'] == 0
+
+        # Size-based LRU eviction
+        small = ResponseCache(os.path.join(tmp, 'small.db'), max_size_mb=0.1)
+        keep = response_cache_key(text='kept')
+        small.put(keep, 'x' * 1000)
+        for i in range(300):
+            small.put(response_cache_key(text=i), 'y' * 1000)
+            small.get(keep)  # Recently used, so never evicted
+        stats = small.stats()
+        assert stats['size_bytes'] <= 0.1 * 1024 * 1024 and stats['entries'] < 300, stats
+        assert small.get(keep) is not None
+        print(f"bypass, TTL expiry and LRU eviction ({stats['entries']} of 301 entries kept under 0.1 MB) checked")
+        for c in (cache, short, small):
+            c.close()
+    close_http_clients()
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark: similarity backends (difflib vs. rapidfuzz).
+
+Scores synthetic segment pairs with every available backend, both pairwise
+(ratio) and batched (ratio_batch / best_match, one query against N
+candidates), and reports how often the backends agree on the >= threshold
+decision.
+
+Usage:
+    python scripts/benchmarks/benchmark_similarity.py --queries 200 --candidates 500
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from modules.similarity import available_backends, set_backend
+from benchmark_fuzzy_batch import make_sentence, make_vocabulary, mutate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--candidates', type=int, default=500)
+    parser.add_argument('--threshold', type=float, default=0.75)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocab = make_vocabulary(rng)
+    pool = [make_sentence(rng, vocab).lower() for _ in range(args.candidates)]
+    queries = [mutate(rng, rng.choice(pool), vocab) for _ in range(args.queries)]
+    print(f"=== {args.queries} queries x {args.candidates} candidates "
+          f"(backends: {', '.join(available_backends())}) ===")
+
+    decisions = {}
+    for name in available_backends():
+        backend = set_backend(name)
+
+        t0 = time.perf_counter()
+        for query in queries:
+            for candidate in pool:
+                backend.ratio(query, candidate)
+        t_pair = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        batched = [backend.ratio_batch(query, pool, score_cutoff=args.threshold) for query in queries]
+        t_batch = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for query in queries:
+            backend.best_match(query, pool, score_cutoff=args.threshold)
+        t_best = time.perf_counter() - t0
+
+        decisions[name] = [[score >= args.threshold for score in scores] for scores in batched]
+        print(f"{name:10s} pairwise {t_pair:7.2f}s  batch {t_batch:7.2f}s  best_match {t_best:7.2f}s")
+
+    if len(decisions) > 1:
+        names = list(decisions)
+        a, b = decisions[names[0]], decisions[names[1]]
+        same = sum(x == y for row_a, row_b in zip(a, b) for x, y in zip(row_a, row_b))
+        print(f"threshold decisions identical for {same / (args.queries * args.candidates):.2%} of pairs")
+
+
+if __name__ == '__main__':
+    main()
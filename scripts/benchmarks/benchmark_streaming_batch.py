@@ -0,0 +1,244 @@
+"""
+Benchmark: streamed vs. whole-response batch translation (stream_callback in
+LLMClient.translate + modules/batch_response_parser.py).
+
+Starts a local stub server that answers a numbered batch prompt with a
+numbered response, generated at --token-ms per ~4-character token, as an
+OpenAI-compatible SSE stream, an Anthropic message stream or an Ollama NDJSON
+stream (or, without streaming, all at once after the full generation time).
+For each provider it sends one batch of --segments segments:
+
+- without streaming: every segment becomes available when the response is done
+- streamed through NumberedResponseParser: each segment is reported as soon
+  as the next segment's number line starts
+
+and reports time to the first segment and the mean time until a segment is
+available. The batch includes multi-line translations, blank lines and
+numbered lists inside segments. Asserts that streaming and the whole-response
+parse give identical translations, that each segment is reported once and in
+order, and that segments arrive about when their part of the response has
+been generated (bounds scaled to --segments and --token-ms, so small batches
+or a fast stub, where the request overhead dominates, are checked too).
+
+Needs openai, anthropic and requests (see requirements.txt). Gemini streaming
+is not covered (no local stub for its SDK).
+
+Usage:
+    python scripts/benchmarks/benchmark_streaming_batch.py --segments 30 --token-ms 3
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from modules.batch_response_parser import NumberedResponseParser
+from modules.llm_clients import LLMClient, close_http_clients
+from benchmark_fuzzy_batch import make_sentence, make_vocabulary
+from benchmark_llm_http_pool import StubHandler, StubServer
+
+
+class StreamingStubHandler(StubHandler):
+    """Returns server.reply, token by token when the request asks for a stream"""
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+        reply, delay = self.server.reply, self.server.token_delay
+        tokens = [reply[i:i + 4] for i in range(0, len(reply), 4)]
+        if not body.get('stream'):
+            time.sleep(len(tokens) * delay)
+            self._send_json(self._full_payload(body, reply))
+            return
+        self.send_response(200)
+        ndjson = self.path == '/api/chat'
+        self.send_header('Content-Type', 'application/x-ndjson' if ndjson else 'text/event-stream')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        for event in self._stream_events(body, tokens, delay):
+            data = (json.dumps(event) + "\n" if ndjson else event).encode()
+            self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _send_json(self, payload):
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _full_payload(self, body, reply):
+        if self.path.endswith('/chat/completions'):
+            return {'id': 'chatcmpl-1', 'object': 'chat.completion', 'created': 0, 'model': body.get('model'),
+                    'choices': [{'index': 0, 'finish_reason': 'stop',
+                                 'message': {'role': 'assistant', 'content': reply}}]}
+        if self.path.endswith('/messages'):
+            return {'id': 'msg_1', 'type': 'message', 'role': 'assistant', 'model': body.get('model'),
+                    'content': [{'type': 'text', 'text': reply}], 'stop_reason': 'end_turn',
+                    'stop_sequence': None, 'usage': {'input_tokens': 10, 'output_tokens': 10}}
+        return {'model': body.get('model'), 'message': {'role': 'assistant', 'content': reply}, 'done': True}
+
+    def _stream_events(self, body, tokens, delay):
+        def sse(data, event=None):
+            return (f"event: {event}\n" if event else "") + f"data: {json.dumps(data)}\n\n"
+
+        if self.path.endswith('/messages'):
+            yield sse({'type': 'message_start', 'message': {
+                'id': 'msg_1', 'type': 'message', 'role': 'assistant', 'model': body.get('model'), 'content': [],
+                'stop_reason': None, 'stop_sequence': None, 'usage': {'input_tokens': 10, 'output_tokens': 1}}},
+                'message_start')
+            yield sse({'type': 'content_block_start', 'index': 0, 'content_block': {'type': 'text', 'text': ''}},
+                      'content_block_start')
+        for token in tokens:
+            time.sleep(delay)
+            if self.path.endswith('/chat/completions'):
+                yield sse({'id': 'chatcmpl-1', 'object': 'chat.completion.chunk', 'created': 0,
+                           'model': body.get('model'),
+                           'choices': [{'index': 0, 'delta': {'content': token}, 'finish_reason': None}]})
+            elif self.path.endswith('/messages'):
+                yield sse({'type': 'content_block_delta', 'index': 0,
+                           'delta': {'type': 'text_delta', 'text': token}}, 'content_block_delta')
+            else:
+                yield {'model': body.get('model'), 'message': {'role': 'assistant', 'content': token}, 'done': False}
+        if self.path.endswith('/chat/completions'):
+            yield "data: [DONE]\n\n"
+        elif self.path.endswith('/messages'):
+            yield sse({'type': 'content_block_stop', 'index': 0}, 'content_block_stop')
+            yield sse({'type': 'message_delta', 'delta': {'stop_reason': 'end_turn', 'stop_sequence': None},
+                       'usage': {'output_tokens': len(tokens)}}, 'message_delta')
+            yield sse({'type': 'message_stop'}, 'message_stop')
+        else:
+            yield {'model': body.get('model'), 'message': {'role': 'assistant', 'content': ''}, 'done': True,
+                   'eval_count': len(tokens)}
+
+
+def make_batch(rng, count, first_id=101):
+    """(segment IDs, expected translations, numbered response text)"""
+    vocab = make_vocabulary(rng)
+    ids, expected = [], {}
+    for seg_id in range(first_id, first_id + count):
+        kind = rng.random()
+        if kind < 0.15:  # Line breaks in the segment
+            text = "\n".join(make_sentence(rng, vocab) for _ in range(rng.randint(2, 3)))
+        elif kind < 0.25:  # Numbered steps inside one segment
+            text = make_sentence(rng, vocab) + "\n" + "\n".join(
+                f"{step}. {make_sentence(rng, vocab)}" for step in range(1, rng.randint(3, 5)))
+        else:
+            text = " ".join(make_sentence(rng, vocab) for _ in range(rng.randint(1, 3)))
+        ids.append(seg_id)
+        expected[seg_id] = text
+    lines = ["Here are the translations:", ""]
+    for seg_id in ids:
+        lines.append(f"{seg_id}. {expected[seg_id]}")
+        if rng.random() < 0.2:
+            lines.append("")  # Some models put blank lines between items
+    return ids, expected, "\n".join(lines)
+
+
+def report_fractions(reply, ids):
+    """Fraction of the reply's tokens generated when each segment can be reported
+    (the next segment's number line has started; the last one at the end)"""
+    tokens = -(-len(reply) // 4)
+    fractions, pos = [], 0
+    for next_id in ids[1:]:
+        marker = f"\n{next_id}. "
+        pos = reply.index(marker, pos) + len(marker)
+        fractions.append(-(-pos // 4) / tokens)
+    return fractions + [1.0]
+
+
+def run(provider, url, ids, stream):
+    """Translate one batch; returns (translations, [(seconds, seg_id)], total seconds)"""
+    arrivals = []
+    client = LLMClient(api_key='stub', provider=provider, model='stub-model',
+                       base_url=f"{url}/v1" if provider == 'custom_openai' else None)
+    with contextlib.redirect_stdout(io.StringIO()):  # LLMClient logs every call
+        t0 = time.perf_counter()
+        parser = NumberedResponseParser(
+            ids, on_segment=lambda seg_id, text: arrivals.append((time.perf_counter() - t0, seg_id)))
+        # skip_cleaning: the prompt-remnant cleanup drops long lines from short
+        # responses; this measures delivery and parsing of the reply itself
+        result = client.translate("batch prompt", custom_prompt="batch prompt", use_cache=False,
+                                  skip_cleaning=True, stream_callback=parser.feed if stream else None)
+        total = time.perf_counter() - t0
+    if stream:
+        translations = parser.close()
+        arrivals += [(total, seg_id) for seg_id in ids if seg_id not in {s for _, s in arrivals}]
+    else:
+        translations = NumberedResponseParser.parse(result, ids)
+        arrivals = [(total, seg_id) for seg_id in ids]
+    return translations, arrivals, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--segments', type=int, default=30)
+    parser.add_argument('--token-ms', type=float, default=3.0, help="generation time per ~4-character token")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    ids, expected, reply = make_batch(random.Random(args.seed), args.segments)
+    server = StubServer(0)
+    server.RequestHandlerClass = StreamingStubHandler
+    server.reply = reply
+    server.token_delay = args.token_ms / 1000
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    os.environ['ANTHROPIC_BASE_URL'] = url  # LLMClient has no base_url for Claude
+    os.environ['OLLAMA_ENDPOINT'] = url
+    multi_line = sum('\n' in text for text in expected.values())
+    print(f"=== batch of {args.segments} segments ({multi_line} multi-line), {len(reply):,} characters "
+          f"at {args.token_ms:.0f} ms per 4-character token ===")
+
+    # Stub generation time, and when each segment can be reported during it
+    generation = -(-len(reply) // 4) * args.token_ms / 1000
+    fractions = report_fractions(reply, ids)
+    mean_fraction = sum(fractions) / len(fractions)
+
+    for name, provider in [('OpenAI-compatible', 'custom_openai'), ('Claude', 'claude'), ('Ollama', 'ollama')]:
+        whole, whole_arrivals, whole_total = run(provider, url, ids, stream=False)
+        streamed, arrivals, total = run(provider, url, ids, stream=True)
+        first = arrivals[0][0]
+        mean_whole = sum(t for t, _ in whole_arrivals) / len(ids)
+        mean_streamed = sum(t for t, _ in arrivals) / len(ids)
+        print(f"{name:18} whole response: all segments at {whole_total:5.2f}s   "
+              f"streamed: first at {first:5.2f}s, mean {mean_streamed:5.2f}s vs {mean_whole:5.2f}s "
+              f"({mean_whole / mean_streamed:.1f}x sooner), batch done at {total:5.2f}s")
+        assert whole == expected, f"{name}: whole-response parse differs"
+        assert streamed == expected, f"{name}: streamed parse differs"
+        assert [seg_id for _, seg_id in arrivals] == ids, f"{name}: segments reported out of order or twice"
+        # Request overhead plus the SSE/NDJSON cost per token, counted as if
+        # all of it came before the first token (generous)
+        overhead = max(total - generation, 0.0)
+        assert first <= overhead + 2 * fractions[0] * generation, (first, overhead, generation)
+        assert mean_streamed <= overhead + 1.5 * mean_fraction * generation, (mean_streamed, overhead, generation)
+        if generation >= 2 * overhead and mean_fraction <= 0.5:
+            # Generation dominates: streaming must clearly beat the whole response
+            assert mean_streamed < mean_whole * 0.75, (mean_streamed, mean_whole)
+
+    # Arbitrary chunk boundaries (split mid-number, mid-line, at "\r\n") parse the same
+    rng = random.Random(args.seed)
+    for crlf in (False, True):
+        text = reply.replace("\n", "\r\n") if crlf else reply
+        chunked = NumberedResponseParser(ids)
+        pos = 0
+        while pos < len(text):
+            step = rng.randint(1, 12)
+            chunked.feed(text[pos:pos + step])
+            pos += step
+        assert chunked.close() == expected
+    print("streamed and whole-response parses identical (multi-line, numbered steps, blank lines, CRLF)")
+    close_http_clients()
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+"""
+Benchmark: TermMatcher vs. the per-term substring + regex scan.
+
+Builds synthetic termbases (10k, 100k and 1M terms by default; single words,
+multi-word phrases and terms with punctuation such as 'ISO-9001' or '5.2%'),
+then for each size:
+
+- times building the TermMatcher and, on a sample of segments, building the
+  old list of per-term compiled regexes (plus its memory via tracemalloc)
+- times searching segments with TermMatcher and with the old scan
+- asserts that both return exactly the same terms for every sampled segment
+
+Usage:
+    python scripts/benchmarks/benchmark_term_matcher.py
+    python scripts/benchmarks/benchmark_term_matcher.py --sizes 10000 100000 --segments 2000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from modules.term_matcher import TermMatcher
+from benchmark_fuzzy_batch import make_sentence, make_vocabulary
+
+
+def make_term(rng, vocab, i):
+    """A synthetic source term (unique suffix keeps most terms distinct)"""
+    kind = rng.random()
+    if kind < 0.4:
+        return f"{rng.choice(vocab)}{i}"
+    if kind < 0.8:
+        return " ".join(rng.choice(vocab) for _ in range(rng.randint(2, 4)))
+    if kind < 0.9:
+        return f"{rng.choice(vocab).upper()}-{rng.randint(1, 9999)}"
+    return f"{rng.randint(1, 99)}.{rng.randint(0, 9)}%"
+
+
+def make_entries(rng, vocab, size):
+    entries = []
+    for i in range(size):
+        term = make_term(rng, vocab, i)
+        entries.append({'term_id': i, 'source_term': term, 'source_term_lower': term.lower().strip()})
+    return entries
+
+
+def make_segment(rng, vocab, entries):
+    """A sentence with a few known terms spliced in"""
+    words = make_sentence(rng, vocab).split()
+    for _ in range(rng.randint(1, 3)):
+        words.insert(rng.randint(0, len(words)), rng.choice(entries)['source_term'])
+    return " ".join(words).capitalize() + "."
+
+
+def build_legacy_index(entries):
+    """The former index: term dicts with a compiled regex each, longest first"""
+    index = []
+    for entry in entries:
+        term_lower = entry['source_term_lower']
+        if any(c in term_lower for c in '.%,/-'):
+            pattern = re.compile(r'(?<!\w)' + re.escape(term_lower) + r'(?!\w)')
+        else:
+            pattern = re.compile(r'\b' + re.escape(term_lower) + r'\b')
+        index.append(dict(entry, pattern=pattern))
+    index.sort(key=lambda x: len(x['source_term_lower']), reverse=True)
+    return index
+
+
+def legacy_search(index, source_text):
+    source_lower = source_text.lower()
+    found = []
+    for term in index:
+        if term['source_term_lower'] not in source_lower:
+            continue
+        if not term['pattern'].search(source_lower):
+            continue
+        found.append(term['term_id'])
+    return found
+
+
+def measure(build):
+    """Run build() and return (result, seconds, traced peak MB)"""
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def run_size(size, args):
+    rng = random.Random(args.seed)
+    vocab = make_vocabulary(rng)
+    entries = make_entries(rng, vocab, size)
+    segments = [make_segment(rng, vocab, entries) for _ in range(args.segments)]
+
+    matcher, t_build, mem = measure(lambda: TermMatcher(entries))
+
+    t0 = time.perf_counter()
+    results = [[e['term_id'] for e in matcher.search(seg)] for seg in segments]
+    t_search = time.perf_counter() - t0
+    hits = sum(len(r) for r in results)
+    print(f"{size:>9,} terms  TermMatcher  build {t_build:6.2f}s  index {mem:7.1f} MB  "
+          f"search {t_search * 1000 / len(segments):8.3f} ms/segment  ({hits:,} hits)")
+
+    # The old scan is O(terms x segments): compare on a sample only
+    sample = segments[:args.legacy_segments]
+    legacy, t_build, mem = measure(lambda: build_legacy_index(entries))
+    t0 = time.perf_counter()
+    legacy_results = [legacy_search(legacy, seg) for seg in sample]
+    t_legacy = time.perf_counter() - t0
+    print(f"{'':>9s}        regex scan   build {t_build:6.2f}s  index {mem:7.1f} MB  "
+          f"search {t_legacy * 1000 / len(sample):8.3f} ms/segment  "
+          f"(speed-up {t_legacy / len(sample) / (t_search / len(segments)):,.0f}x)")
+
+    for seg, new, old in zip(sample, results, legacy_results):
+        # Same terms; order may differ only among terms of equal length
+        assert sorted(new) == sorted(old), f"Mismatch for {seg!r}: {new} vs {old}"
+    print(f"{'':>9s}        identical results on {len(sample)} segments")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--segments', type=int, default=5000)
+    parser.add_argument('--legacy-segments', type=int, default=50,
+                        help="segments searched with the old regex scan (it is slow)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        run_size(size, args)
+
+
+if __name__ == '__main__':
+    main()
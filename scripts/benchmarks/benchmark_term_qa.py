@@ -0,0 +1,180 @@
+"""
+Benchmark: batch terminology QA (modules/term_qa.py).
+
+Bulk-imports a synthetic termbase (100k terms by default, with approved and
+forbidden target synonyms and some forbidden terms), activates it for a
+project and builds 50k translated segments whose targets use the approved
+translation of their terms, leave it out or use a forbidden term, then:
+
+- times get_termbase_qa_terms(), compiling the TermQAChecker and checking
+  every segment, and asserts the check stays under --max-seconds
+- checks a sample of segments with a term-by-term reference (substring test
+  plus the TermMatcher boundary rule for every term) and asserts both report
+  the same missing and forbidden terms
+- writes the TSV and HTML reports and checks their row counts
+
+Usage:
+    python scripts/benchmarks/benchmark_term_qa.py --terms 100000 --segments 50000
+"""
+
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from modules.database_manager import DatabaseManager
+from modules.term_qa import FORBIDDEN_TERM, MISSING_TERM, TermQAChecker
+from modules.termbase_hits import find_term_offsets
+from benchmark_fuzzy_batch import make_sentence, make_vocabulary
+from benchmark_term_matcher import make_term
+
+PROJECT_ID = 1
+
+
+def term_rows(rng, vocab, count, terms):
+    """Import rows; each is also appended to terms"""
+    for i in range(count):
+        row = {'line': i + 2, 'source_term': make_term(rng, vocab, i), 'target_term': f"doel{i}",
+               'forbidden': rng.random() < 0.02, 'target_synonyms': []}
+        if rng.random() < 0.1:
+            row['target_synonyms'].append((f"synoniem{i}", False))
+        if rng.random() < 0.05:
+            row['target_synonyms'].append((f"verboden{i} woord", True))
+        terms.append(row)
+        yield row
+
+
+def make_target(rng, vocab, terms):
+    """Target text for a segment containing terms: mostly approved translations"""
+    words = [f"nl{word}" for word in make_sentence(rng, vocab).rstrip('.').split()]
+    for term in terms:
+        approved = [] if term['forbidden'] else [term['target_term']]
+        approved += [text for text, forbidden in term['target_synonyms'] if not forbidden]
+        forbidden = [term['target_term']] if term['forbidden'] else []
+        forbidden += [text for text, is_forbidden in term['target_synonyms'] if is_forbidden]
+        kind = rng.random()
+        if kind < 0.8 and approved:
+            words.insert(rng.randint(0, len(words)), rng.choice(approved))
+        elif kind < 0.9 and forbidden:
+            words.insert(rng.randint(0, len(words)), rng.choice(forbidden))
+    return " ".join(words) + "."
+
+
+class Reference:
+    """Term-by-term check, the obvious way"""
+
+    def __init__(self, terms):
+        self.approved = {}
+        self.forbidden = []
+        for term in terms:
+            key = term['source_term'].lower().strip()
+            targets = [] if term['forbidden'] else [term['target_term']]
+            targets += [text for text, forbidden in term['target_synonyms'] if not forbidden]
+            if targets:
+                self.approved.setdefault(key, set()).update(text.lower() for text in targets)
+            forbidden = [term['target_term']] if term['forbidden'] else []
+            forbidden += [text for text, is_forbidden in term['target_synonyms'] if is_forbidden]
+            self.forbidden.extend((text.lower(), text) for text in forbidden)
+
+    def check(self, source, target):
+        source, target = source.lower(), target.lower()
+        missing = set()
+        for key, approved in self.approved.items():
+            if key in source and find_term_offsets(source, key):
+                if not any(text in target and find_term_offsets(target, text) for text in approved):
+                    missing.add(key)
+        forbidden = {text for lower, text in self.forbidden
+                     if lower in target and find_term_offsets(target, lower)}
+        return missing, forbidden
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--terms', type=int, default=100000)
+    parser.add_argument('--segments', type=int, default=50000)
+    parser.add_argument('--reference-segments', type=int, default=200,
+                        help="segments also checked term by term")
+    parser.add_argument('--max-seconds', type=float, default=10.0,
+                        help="limit for checking all segments")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocab = make_vocabulary(rng)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(os.path.join(tmp, 'bench.db'), log_callback=lambda msg: None)
+        db.connect()
+        db.cursor.execute("INSERT INTO termbases (name, source_lang, target_lang) VALUES ('bench', 'en', 'nl')")
+        termbase_id = db.cursor.lastrowid
+        db.cursor.execute("INSERT INTO termbase_activation (termbase_id, project_id, is_active, priority) "
+                          "VALUES (?, ?, 1, 1)", (termbase_id, PROJECT_ID))
+        db.connection.commit()
+        terms = []
+        db.bulk_import_termbase_terms(termbase_id, term_rows(rng, vocab, args.terms, terms),
+                                      skip_duplicates=False)
+
+        segments = []
+        for i in range(args.segments):
+            words = make_sentence(rng, vocab).rstrip('.').split()
+            used = rng.sample(terms, rng.randint(0, 3))
+            for term in used:
+                words.insert(rng.randint(0, len(words)), term['source_term'])
+            target = make_target(rng, vocab, used) if rng.random() < 0.9 else ""
+            segments.append(SimpleNamespace(id=i + 1, source=" ".join(words).capitalize() + ".", target=target))
+        print(f"=== {args.terms:,} terms, {args.segments:,} segments ===")
+
+        t0 = time.perf_counter()
+        qa_terms = db.get_termbase_qa_terms(PROJECT_ID)
+        t_load = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        checker = TermQAChecker(qa_terms)
+        t_compile = time.perf_counter() - t0
+        progress = []
+        report = checker.check(segments, progress_callback=lambda done, total: progress.append(done))
+        print(f"load terms + synonyms  {t_load:8.2f}s  ({len(qa_terms):,} terms)")
+        print(f"compile checker        {t_compile:8.2f}s")
+        print(f"check all segments     {report.elapsed:8.2f}s  ({report.elapsed * 1e6 / args.segments:.0f} us/segment, "
+              f"{report.segments_checked:,} checked, {report.segments_skipped:,} untranslated)")
+        print(f"issues                 {report.count(MISSING_TERM):,} missing, "
+              f"{report.count(FORBIDDEN_TERM):,} forbidden")
+        assert report.elapsed <= args.max_seconds, f"check took {report.elapsed:.1f}s"
+        assert progress and progress[-1] == args.segments, progress[-1:]
+
+        reference = Reference(terms)
+        by_segment = {}
+        for issue in report.issues:
+            by_segment.setdefault(issue.segment_id, []).append(issue)
+        t0 = time.perf_counter()
+        sample = [segment for segment in rng.sample(segments, min(args.reference_segments, len(segments)))
+                  if segment.target]
+        for segment in sample:
+            missing, forbidden = reference.check(segment.source, segment.target)
+            issues = by_segment.get(segment.id, [])
+            got_missing = {issue.source_term.lower().strip() for issue in issues if issue.kind == MISSING_TERM}
+            got_forbidden = {issue.target_terms[0] for issue in issues if issue.kind == FORBIDDEN_TERM}
+            assert got_missing == missing, (segment, got_missing, missing)
+            assert got_forbidden == forbidden, (segment, got_forbidden, forbidden)
+        t_reference = (time.perf_counter() - t0) / max(len(sample), 1)
+        print(f"term-by-term reference {t_reference * 1000:8.1f} ms/segment  "
+              f"(~{t_reference * args.segments:,.0f}s for all segments)")
+
+        tsv_path = os.path.join(tmp, 'qa.tsv')
+        html_path = os.path.join(tmp, 'qa.html')
+        report.export_tsv(tsv_path, segments)
+        report.export_html(html_path, segments, title='bench')
+        with open(tsv_path, encoding='utf-8', newline='') as f:
+            assert sum(1 for _ in csv.reader(f, delimiter='\t')) == len(report.issues) + 1
+        with open(html_path, encoding='utf-8') as f:
+            assert f.read().count('<tr class=') == len(report.issues)
+        print(f"same issues as the reference on {len(sample):,} segments, TSV and HTML reports written")
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
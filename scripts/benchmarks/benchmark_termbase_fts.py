@@ -0,0 +1,175 @@
+"""
+Benchmark: FTS5 termbase search vs. the LIKE scans it replaces.
+
+Bulk-imports a synthetic termbase (1M terms by default; single words, phrases
+and compounds) into a database connected with the default settings, which
+build the trigram index, times a rebuild of that index (the one-off cost when
+an existing database is upgraded), then:
+
+- asserts with EXPLAIN QUERY PLAN that prefix searches are driven by the FTS5
+  index and never scan termbase_terms
+- times search_termbase_terms() in 'prefix', 'substring' (trigram) and 'fuzzy'
+  mode, plus search_termbase_terms_in_text(), against the former termbase
+  editor filter (LIKE '%query%' on source and target terms)
+- times the default configuration as the app calls it: search_termbase_terms()
+  and count_termbase_terms() with no match mode or limit
+- checks that substring search returns exactly the LIKE scan's terms (and the
+  default search and count the same terms), that
+  every prefix hit contains the query words, that terms spliced into a text
+  are found in it and that the FTS5 indexes pass their integrity check
+
+Usage:
+    python scripts/benchmarks/benchmark_termbase_fts.py --terms 1000000 --queries 200
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from modules.database_manager import DatabaseManager
+from benchmark_fuzzy_batch import make_sentence, make_vocabulary
+
+
+def make_term(rng, vocab, i):
+    kind = rng.random()
+    if kind < 0.4:
+        return f"{rng.choice(vocab)}{i}"
+    if kind < 0.8:
+        return " ".join(rng.choice(vocab) for _ in range(rng.randint(2, 4)))
+    return rng.choice(vocab) + rng.choice(vocab)
+
+
+def typo(rng, term):
+    """term with one character dropped (a fuzzy query)"""
+    i = rng.randrange(len(term))
+    return term[:i] + term[i + 1:]
+
+
+def term_rows(rng, vocab, count, sample):
+    """Import rows; every 1000th source term is also appended to sample"""
+    for i in range(count):
+        source = make_term(rng, vocab, i)
+        if i % 1000 == 0:
+            sample.append(source)
+        yield {'line': i + 2, 'source_term': source, 'target_term': f"nl {source}"}
+
+
+def like_filter(db, termbase_id, query):
+    """The former termbase editor filter"""
+    db.cursor.execute("""
+        SELECT id FROM termbase_terms
+        WHERE termbase_id = ? AND (LOWER(source_term) LIKE ? OR LOWER(target_term) LIKE ?)
+    """, (termbase_id, f"%{query}%", f"%{query}%"))
+    return {row[0] for row in db.cursor.fetchall()}
+
+
+def timed(label, count, search):
+    t0 = time.perf_counter()
+    results = search()
+    elapsed = (time.perf_counter() - t0) * 1000 / count
+    print(f"{label:22s} {elapsed:8.2f} ms/query  ({sum(len(r) for r in results):,} hits)")
+    return results, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--terms', type=int, default=1000000)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--legacy-queries', type=int, default=10,
+                        help="queries also run as LIKE scans (a full table scan each)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocab = make_vocabulary(rng)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(os.path.join(tmp, 'bench.db'), log_callback=lambda msg: None)
+        db.connect()
+        assert db.termbase_trigram_supported(), "trigram tokenizer not available"
+        assert db.has_termbase_trigram_index(), "trigram index not built by default"
+        db.cursor.execute("INSERT INTO termbases (name, source_lang, target_lang) VALUES ('bench', 'en', 'nl')")
+        termbase_id = db.cursor.lastrowid
+        db.connection.commit()
+
+        known_terms = []
+        t0 = time.perf_counter()
+        db.bulk_import_termbase_terms(termbase_id, term_rows(rng, vocab, args.terms, known_terms),
+                                      skip_duplicates=False)
+        t_import = time.perf_counter() - t0
+        db.set_termbase_trigram_index(False)
+        t0 = time.perf_counter()
+        assert db.set_termbase_trigram_index(True)
+        t_trigram = time.perf_counter() - t0
+        print(f"=== {args.terms:,} terms (bulk import {t_import:.1f}s, trigram index rebuild {t_trigram:.1f}s), "
+              f"{args.queries:,} queries ===")
+
+        ids_sql, params, _ = db._termbase_search_ids_sql('foo', True, True, True, 'prefix')
+        db.cursor.execute(f"EXPLAIN QUERY PLAN SELECT t.id FROM ({ids_sql}) m "
+                          f"CROSS JOIN termbase_terms t ON t.id = m.id WHERE t.termbase_id IN (?)",
+                          params + [termbase_id])
+        plan = [row[3] for row in db.cursor.fetchall()]
+        print(f"plan     {' | '.join(step for step in plan if step.startswith(('SCAN', 'SEARCH')))}")
+        # The only scans are FTS5 MATCH lookups; terms are then fetched by rowid
+        assert all('VIRTUAL TABLE INDEX' in step for step in plan if step.startswith('SCAN')), plan
+
+        vocab_sample = [rng.choice(vocab) for _ in range(args.queries)]
+        word_queries = [word[:rng.randint(3, len(word))] if len(word) > 3 else word for word in vocab_sample]
+        substring_queries = [word[1:] if len(word) > 4 else word for word in vocab_sample]
+        fuzzy_queries = [typo(rng, make_term(rng, vocab, 0)) for _ in range(args.queries)]
+        texts, spliced = [], []
+        for _ in range(args.queries):
+            words = make_sentence(rng, vocab).split()
+            spliced.append(rng.choice(known_terms))
+            words.insert(rng.randint(0, len(words)), spliced[-1])
+            texts.append(" ".join(words))
+        tb = [termbase_id]
+
+        prefix, _ = timed("prefix", len(word_queries), lambda: [
+            db.search_termbase_terms(q, tb, match='prefix', limit=None) for q in word_queries])
+        substring, t_substring = timed("substring (trigram)", len(substring_queries), lambda: [
+            db.search_termbase_terms(q, tb, match='substring', limit=None) for q in substring_queries])
+        timed("substring, first 100", len(substring_queries), lambda: [
+            db.search_termbase_terms(q, tb, match='substring', limit=100) for q in substring_queries])
+        default, _ = timed("default search", len(substring_queries), lambda: [
+            db.search_termbase_terms(q, tb) for q in substring_queries])
+        counts, _ = timed("default count", len(substring_queries), lambda: [
+            [None] * db.count_termbase_terms(q, tb) for q in substring_queries])
+        timed("fuzzy, best 20", len(fuzzy_queries), lambda: [
+            db.search_termbase_terms(q, tb, match='fuzzy', limit=20) for q in fuzzy_queries])
+        in_text, _ = timed("terms in text", len(texts), lambda: [
+            db.search_termbase_terms_in_text(text, tb) for text in texts])
+
+        sample = substring_queries[:args.legacy_queries]
+        legacy, t_legacy = timed("LIKE scan", len(sample), lambda: [
+            like_filter(db, termbase_id, q) for q in sample])
+        print(f"substring speed-up     {t_legacy / t_substring:8,.0f}x")
+
+        for query, old, new in zip(sample, legacy, substring):
+            assert old == {row['id'] for row in new}, f"Different substring results for {query!r}"
+        for query, rows, first, count in zip(substring_queries, substring, default, counts):
+            assert [row['id'] for row in first] == [row['id'] for row in rows][:len(first)], query
+            assert len(count) == len(rows), f"Different default count for {query!r}"
+        for query, rows in zip(word_queries, prefix):
+            words = re.findall(r'[^\W_]+', query.lower())
+            for row in rows:
+                text = f" {row['source_term']} {row['target_term']}".lower()
+                assert all(re.search(r'(?<![^\W_])' + re.escape(w), text) for w in words), (query, row)
+        for term, rows in zip(spliced, in_text):
+            assert term in {row['source_term'] for row in rows}, f"{term!r} not found in its text"
+        for fts_table in db._fts5_tables():
+            if fts_table.startswith('termbase_'):
+                db.cursor.execute(f"INSERT INTO {fts_table}({fts_table}, rank) VALUES('integrity-check', 1)")
+        print(f"substring results identical to the LIKE scan on {len(sample)} queries, "
+              f"default search and count match, prefix and in-text hits verified, "
+              f"FTS5 integrity check passed")
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+"""
+Benchmark: reopening a project with saved termbase hits vs. recomputing them.
+
+Bulk-imports a synthetic termbase (200k terms by default), activates it for a
+project and builds 40k segments with known terms spliced in, then:
+
+- computes every segment's termbase matches the way the batch worker does
+  (TermMatcher over TermRefs plus get_termbase_match_details())
+- saves them with collect_termbase_hits(), through JSON as in the .svproj,
+  and times restore_termbase_hits() on reopen
+- changes the termbase (edited, new and deleted terms) and some segment
+  sources, restores again and asserts that every restored segment equals a
+  fresh computation and that every segment that needs it is recomputed
+
+Usage:
+    python scripts/benchmarks/benchmark_termbase_hits.py --terms 200000 --segments 40000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from modules.database_manager import DatabaseManager
+from modules.term_matcher import TermMatcher, TermRef
+from modules.termbase_hits import collect_termbase_hits, restore_termbase_hits
+from benchmark_fuzzy_batch import make_sentence, make_vocabulary
+from benchmark_term_matcher import make_term
+
+PROJECT_ID = 1
+
+
+def term_rows(rng, vocab, count):
+    for i in range(count):
+        source = make_term(rng, vocab, i)
+        yield {'line': i + 2, 'source_term': source, 'target_term': f"nl {source}"}
+
+
+def make_loader(db):
+    """The editor's _load_termbase_index_entries()"""
+    def load_entries(term_ids=None, termbase_ids=None):
+        query = """
+            SELECT t.id, t.source_term, t.termbase_id
+            FROM termbase_terms t
+            LEFT JOIN termbases tb ON t.termbase_id = tb.id
+            LEFT JOIN termbase_activation ta ON ta.termbase_id = tb.id
+                AND ta.project_id = ? AND ta.is_active = 1
+            WHERE (ta.is_active = 1 OR tb.is_project_termbase = 1)
+        """
+        params = [PROJECT_ID]
+        if termbase_ids is not None:
+            termbase_ids = list(termbase_ids)
+            query += f" AND t.termbase_id IN ({','.join('?' * len(termbase_ids))})"
+            params.extend(termbase_ids)
+        rows = []
+        if term_ids is None:
+            db.cursor.execute(query, params)
+            rows = db.cursor.fetchall()
+        else:
+            term_ids = list(term_ids)
+            for i in range(0, len(term_ids), 500):
+                chunk = term_ids[i:i + 500]
+                db.cursor.execute(query + f" AND t.id IN ({','.join('?' * len(chunk))})", params + chunk)
+                rows.extend(db.cursor.fetchall())
+        entries = []
+        for term_id, source_term, termbase_id in rows:
+            source_term_lower = (source_term or '').lower().strip()
+            if len(source_term_lower) >= 2:
+                entries.append((source_term_lower, TermRef(term_id, termbase_id)))
+        return entries
+    return load_entries
+
+
+def compute_all(db, load_entries, segments):
+    """Build the index and match every segment (the batch worker)"""
+    index = TermMatcher()
+    for term, ref in load_entries():
+        index.add(ref, term)
+    cache = {}
+    for segment in segments:
+        term_ids = [ref.term_id for ref in index.search(segment.source)]
+        details = db.get_termbase_match_details(term_ids, PROJECT_ID) if term_ids else {}
+        cache[segment.id] = {term_id: details[term_id] for term_id in term_ids if term_id in details}
+    return cache
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--terms', type=int, default=200000)
+    parser.add_argument('--segments', type=int, default=40000)
+    parser.add_argument('--changes', type=int, default=200,
+                        help="terms edited, added and deleted (each) before the second reopen")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocab = make_vocabulary(rng)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(os.path.join(tmp, 'bench.db'), log_callback=lambda msg: None)
+        db.connect()
+        db.cursor.execute("INSERT INTO termbases (name, source_lang, target_lang) VALUES ('bench', 'en', 'nl')")
+        termbase_id = db.cursor.lastrowid
+        db.cursor.execute("INSERT INTO termbase_activation (termbase_id, project_id, is_active, priority) "
+                          "VALUES (?, ?, 1, 1)", (termbase_id, PROJECT_ID))
+        db.connection.commit()
+        db.bulk_import_termbase_terms(termbase_id, term_rows(rng, vocab, args.terms), skip_duplicates=False)
+        db.cursor.execute("SELECT id, source_term FROM termbase_terms")
+        known = db.cursor.fetchall()
+
+        segments = []
+        for i in range(args.segments):
+            words = make_sentence(rng, vocab).split()
+            for _ in range(rng.randint(0, 3)):
+                words.insert(rng.randint(0, len(words)), rng.choice(known)[1])
+            segments.append(SimpleNamespace(id=i + 1, source=" ".join(words).capitalize() + "."))
+        load_entries = make_loader(db)
+        print(f"=== {args.terms:,} terms, {args.segments:,} segments ===")
+
+        watermark = db.termbase_watermark()
+        t0 = time.perf_counter()
+        cache = compute_all(db, load_entries, segments)
+        t_compute = time.perf_counter() - t0
+        print(f"compute all segments   {t_compute:8.2f}s  (index build + batch worker)")
+
+        t0 = time.perf_counter()
+        saved = json.dumps(collect_termbase_hits(segments, cache, watermark, [termbase_id], db.db_path))
+        print(f"collect + JSON dump    {time.perf_counter() - t0:8.2f}s  ({len(saved) / 1e6:.1f} MB in the project file)")
+
+        t0 = time.perf_counter()
+        data = json.loads(saved)
+        print(f"JSON load              {time.perf_counter() - t0:8.2f}s  (part of reading the project file)")
+
+        t0 = time.perf_counter()
+        restored = restore_termbase_hits(data, segments, db, [termbase_id], load_entries, PROJECT_ID)
+        t_restore = time.perf_counter() - t0
+        print(f"reopen, unchanged      {t_restore:8.2f}s  ({len(restored):,} segments reused, "
+              f"speed-up {t_compute / t_restore:,.0f}x)")
+        assert restored == cache, "Restored hits differ from the computed ones"
+
+        # Termbase and source changes between save and reopen
+        ids = [term_id for term_id, _ in rng.sample(known, 2 * args.changes)]
+        edited, deleted = ids[:args.changes], ids[args.changes:]
+        for term_id in edited:
+            db.cursor.execute("UPDATE termbase_terms SET source_term = source_term || 'x' WHERE id = ?", (term_id,))
+        db.cursor.executemany("DELETE FROM termbase_terms WHERE id = ?", [(term_id,) for term_id in deleted])
+        for i in range(args.changes):
+            db.cursor.execute("INSERT INTO termbase_terms (source_term, target_term, termbase_id) VALUES (?, ?, ?)",
+                              (make_term(rng, vocab, args.terms + i), "nieuw", termbase_id))
+        db.connection.commit()
+        for segment in rng.sample(segments, args.changes):
+            segment.source += " " + rng.choice(known)[1]
+
+        t0 = time.perf_counter()
+        restored = restore_termbase_hits(data, segments, db, [termbase_id], load_entries, PROJECT_ID)
+        t_restore = time.perf_counter() - t0
+        fresh = compute_all(db, load_entries, segments)
+        stale = [seg_id for seg_id, matches in restored.items() if matches != fresh[seg_id]]
+        assert not stale, f"{len(stale)} restored segments differ from a fresh computation"
+        print(f"reopen after changes   {t_restore:8.2f}s  ({len(restored):,} segments reused, "
+              f"{args.segments - len(restored):,} to compute)")
+        print("every reused segment equals a fresh computation")
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+"""
+Benchmark: bulk termbase import vs. the former row-by-row import.
+
+Writes a synthetic glossary TSV (300k rows by default, with synonyms,
+forbidden markers, repeated source terms and a few invalid rows), then:
+
+- imports it into an empty termbase with TermbaseImporter.import_file()
+  (staging table, set-based duplicate detection, one transaction)
+- imports a sample of the same file the old way: a source-term dict for
+  duplicate detection and TermbaseManager.add_term()/add_synonym() per row,
+  each committing on its own
+- re-imports the sample with update_duplicates=True (every row an update)
+- asserts that both imports of the sample store the same terms and synonyms,
+  and that the termbase FTS5 indexes are in sync after the bulk import
+
+Usage:
+    python scripts/benchmarks/benchmark_termbase_import.py --rows 300000 --legacy-rows 5000
+"""
+
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from modules.database_manager import DatabaseManager
+from modules.termbase_manager import TermbaseManager
+from modules.termbase_import_export import TermbaseImporter
+from benchmark_fuzzy_batch import make_vocabulary
+
+
+HEADER = ['Source Term', 'Target Term', 'Domain', 'Notes', 'Forbidden']
+
+
+def make_rows(rng, vocab, count):
+    rows = []
+    for i in range(count):
+        if rows and rng.random() < 0.05:
+            # Same source term with another target (imported as a separate term)
+            rows.append([rows[rng.randrange(len(rows))][0].split('|')[0], f"nl {i}", '', '', ''])
+            continue
+        source = " ".join(rng.choice(vocab) for _ in range(rng.randint(1, 3))) + f" {i}"
+        target = f"nl {source}"
+        if rng.random() < 0.2:
+            source += f"|{rng.choice(vocab)} {i}"
+        if rng.random() < 0.1:
+            target += f"|[!{rng.choice(vocab)}]"
+        if rng.random() < 0.001:
+            target = ''
+        rows.append([source, target, rng.choice(['', '', 'tech', 'legal']), f"note {i}",
+                     'TRUE' if rng.random() < 0.02 else ''])
+    return rows
+
+
+def write_tsv(path, rows):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f, delimiter='\t')
+        writer.writerow(HEADER)
+        writer.writerows(rows)
+
+
+def legacy_import(tb_manager, termbase_id, rows):
+    """The former import_tsv() loop: dict lookup plus add_term() per row"""
+    existing = {term['source_term'].lower() for term in tb_manager.get_terms(termbase_id)}
+    for source_field, target_field, domain, notes, forbidden in rows:
+        sources = [s.strip() for s in source_field.split('|') if s.strip()]
+        targets = [s.strip() for s in target_field.split('|') if s.strip()]
+        if not sources or not targets or sources[0].lower() in existing:
+            continue
+        term_id = tb_manager.add_term(termbase_id, sources[0], targets[0], domain=domain, notes=notes,
+                                      forbidden=forbidden == 'TRUE')
+        for language, parts in (('source', sources[1:]), ('target', targets[1:])):
+            for order, part in enumerate(parts):
+                is_forbidden = part.startswith('[!') and part.endswith(']')
+                tb_manager.add_synonym(term_id, part[2:-1] if is_forbidden else part, language=language,
+                                       display_order=order, forbidden=is_forbidden)
+
+
+def snapshot(db, termbase_id):
+    db.cursor.execute("""
+        SELECT source_term, target_term, domain, notes, forbidden FROM termbase_terms
+        WHERE termbase_id = ? ORDER BY source_term, target_term
+    """, (termbase_id,))
+    terms = [tuple(row) for row in db.cursor.fetchall()]
+    db.cursor.execute("""
+        SELECT t.source_term, s.synonym_text, s.language, s.display_order, s.forbidden
+        FROM termbase_synonyms s JOIN termbase_terms t ON t.id = s.term_id
+        WHERE t.termbase_id = ? ORDER BY 1, 2, 3
+    """, (termbase_id,))
+    return terms, [tuple(row) for row in db.cursor.fetchall()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=300000)
+    parser.add_argument('--legacy-rows', type=int, default=5000,
+                        help="rows imported the old way (one commit per term)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocab = make_vocabulary(rng)
+    rows = make_rows(rng, vocab, args.rows)
+    sample = rows[:args.legacy_rows]
+    with tempfile.TemporaryDirectory() as tmp:
+        full_path = os.path.join(tmp, 'full.tsv')
+        sample_path = os.path.join(tmp, 'sample.tsv')
+        write_tsv(full_path, rows)
+        write_tsv(sample_path, sample)
+
+        db = DatabaseManager(os.path.join(tmp, 'bench.db'), log_callback=lambda msg: None)
+        db.connect()
+        tb_manager = TermbaseManager(db, lambda msg: None)
+        importer = TermbaseImporter(db, tb_manager)
+        print(f"=== {args.rows:,} rows, legacy sample {len(sample):,} rows ===")
+
+        termbase_id = tb_manager.create_termbase('bulk', 'en', 'nl')
+        t0 = time.perf_counter()
+        result = importer.import_file(full_path, termbase_id)
+        t_bulk = time.perf_counter() - t0
+        assert result.success, result.message
+        print(f"bulk import          {t_bulk:8.2f}s  {args.rows / t_bulk:10,.0f} rows/s  ({result.message})")
+        assert db.check_termbase_fts_index()['in_sync'], "FTS5 indexes out of sync after the bulk import"
+
+        sample_id = tb_manager.create_termbase('bulk sample', 'en', 'nl')
+        t0 = time.perf_counter()
+        importer.import_file(sample_path, sample_id)
+        t_sample = time.perf_counter() - t0
+
+        legacy_id = tb_manager.create_termbase('legacy', 'en', 'nl')
+        t0 = time.perf_counter()
+        legacy_import(tb_manager, legacy_id, sample)
+        t_legacy = time.perf_counter() - t0
+        print(f"row-by-row import    {t_legacy:8.2f}s  {len(sample) / t_legacy:10,.0f} rows/s  "
+              f"(speed-up {t_legacy / t_sample:,.0f}x on the sample)")
+
+        assert snapshot(db, sample_id) == snapshot(db, legacy_id), "Bulk and row-by-row imports differ"
+        print(f"same terms and synonyms on {len(sample):,} rows")
+
+        t0 = time.perf_counter()
+        result = importer.import_file(sample_path, sample_id, skip_duplicates=False, update_duplicates=True)
+        print(f"re-import (update)   {time.perf_counter() - t0:8.2f}s  ({result.message})")
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,204 @@
+"""
+Benchmark: memory of the editor's in-memory termbase index.
+
+Bulk-imports a synthetic termbase (500k terms by default), activates it for a
+project and loads the index rows the way the editor does, then measures with
+tracemalloc the memory each representation keeps alive:
+
+- the original index: a 13-key dict plus a compiled regex per term (on a
+  sample, as compiling the regexes is slow)
+- a TermMatcher over the same 13-key dicts
+- a TermMatcher over TermRef records (ids only), the current index
+
+and:
+
+- asserts the TermRef index stays under --max-bytes-per-term and that
+  TermMatcher.memory_usage() is within 25% of the traced size
+- times searching segments with the TermRef index plus the on-demand
+  get_termbase_match_details() query, and asserts the results equal those of
+  the dict index for every segment
+
+Usage:
+    python scripts/benchmarks/benchmark_termbase_index_memory.py --terms 500000 --segments 2000
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from modules.database_manager import DatabaseManager
+from modules.term_matcher import TermMatcher, TermRef
+from benchmark_fuzzy_batch import make_sentence, make_vocabulary
+from benchmark_term_matcher import build_legacy_index, make_term
+
+PROJECT_ID = 1
+
+# The editor's index query before and after TermRef entries
+DICT_QUERY = """
+    SELECT
+        t.id, t.source_term, t.target_term, t.termbase_id,
+        t.domain, t.notes, t.project, t.client, t.forbidden,
+        tb.is_project_termbase, tb.name as termbase_name,
+        CASE WHEN COALESCE(ta.priority, 0) = 1 OR tb.is_project_termbase = 1 THEN 1 ELSE 0 END as ranking
+    FROM termbase_terms t
+    LEFT JOIN termbases tb ON t.termbase_id = tb.id
+    LEFT JOIN termbase_activation ta ON ta.termbase_id = tb.id
+        AND ta.project_id = ? AND ta.is_active = 1
+    WHERE (ta.is_active = 1 OR tb.is_project_termbase = 1)
+"""
+REF_QUERY = """
+    SELECT t.id, t.source_term, t.termbase_id
+    FROM termbase_terms t
+    LEFT JOIN termbases tb ON t.termbase_id = tb.id
+    LEFT JOIN termbase_activation ta ON ta.termbase_id = tb.id
+        AND ta.project_id = ? AND ta.is_active = 1
+    WHERE (ta.is_active = 1 OR tb.is_project_termbase = 1)
+"""
+
+
+def term_rows(rng, vocab, count, sample):
+    """Import rows; every 500th source term is also appended to sample"""
+    for i in range(count):
+        source = make_term(rng, vocab, i)
+        if i % 500 == 0:
+            sample.append(source)
+        yield {'line': i + 2, 'source_term': source, 'target_term': f"nl {source}",
+               'domain': rng.choice(['', 'tech', 'legal']), 'notes': f"note {i}"}
+
+
+def dict_entries(rows):
+    """The former _load_termbase_index_entries() output"""
+    entries = []
+    for row in rows:
+        source_term_lower = (row[1] or '').lower().strip()
+        if len(source_term_lower) < 2:
+            continue
+        entries.append({
+            'term_id': row[0], 'source_term': row[1], 'source_term_lower': source_term_lower,
+            'target_term': row[2], 'termbase_id': row[3], 'domain': row[4], 'notes': row[5],
+            'project': row[6], 'client': row[7], 'forbidden': row[8],
+            'is_project_termbase': row[9], 'termbase_name': row[10], 'ranking': row[11],
+        })
+    return entries
+
+
+def ref_index(rows):
+    """The current _build_termbase_index()"""
+    index = TermMatcher()
+    termbase_id_objects = {}
+    for term_id, source_term, termbase_id in rows:
+        source_term_lower = (source_term or '').lower().strip()
+        if len(source_term_lower) < 2:
+            continue
+        termbase_id = termbase_id_objects.setdefault(termbase_id, termbase_id)
+        index.add(TermRef(term_id, termbase_id), source_term_lower)
+    return index
+
+
+def retained(build):
+    """Run build() and return (result, seconds, bytes still allocated afterwards)"""
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - t0
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, elapsed, size
+
+
+def fetch(db, query):
+    db.cursor.execute(query, (PROJECT_ID,))
+    return db.cursor.fetchall()
+
+
+def report(label, count, elapsed, size):
+    print(f"{label:28s} {size / 1048576:8.1f} MB  {size / count:6,.0f} bytes/term  (built in {elapsed:.2f}s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--terms', type=int, default=500000)
+    parser.add_argument('--legacy-terms', type=int, default=50000,
+                        help="terms in the regex-per-term sample")
+    parser.add_argument('--segments', type=int, default=2000)
+    parser.add_argument('--max-bytes-per-term', type=int, default=320)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocab = make_vocabulary(rng)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(os.path.join(tmp, 'bench.db'), log_callback=lambda msg: None)
+        db.connect()
+        db.cursor.execute("INSERT INTO termbases (name, source_lang, target_lang) VALUES ('bench', 'en', 'nl')")
+        termbase_id = db.cursor.lastrowid
+        db.cursor.execute("INSERT INTO termbase_activation (termbase_id, project_id, is_active, priority) "
+                          "VALUES (?, ?, 1, 1)", (termbase_id, PROJECT_ID))
+        db.connection.commit()
+        known_terms = []
+        db.bulk_import_termbase_terms(termbase_id, term_rows(rng, vocab, args.terms, known_terms),
+                                      skip_duplicates=False)
+        print(f"=== {args.terms:,} terms ===")
+
+        # Rows are fetched inside the measurement: the index keeps their strings alive
+        legacy, elapsed, size = retained(
+            lambda: build_legacy_index(dict_entries(fetch(db, DICT_QUERY)[:args.legacy_terms])))
+        report(f"dict + regex ({len(legacy):,} sample)", len(legacy), elapsed, size)
+        del legacy
+
+        dict_index, elapsed, size = retained(lambda: TermMatcher(dict_entries(fetch(db, DICT_QUERY))))
+        report("TermMatcher over dicts", len(dict_index), elapsed, size)
+        dict_size = size
+
+        index, elapsed, size = retained(lambda: ref_index(fetch(db, REF_QUERY)))
+        report("TermMatcher over TermRefs", len(index), elapsed, size)
+        usage = index.memory_usage()
+        print(f"memory_usage() estimate     {usage['bytes'] / 1048576:8.1f} MB  "
+              f"{usage['bytes_per_term']:6,} bytes/term  ({dict_size / size:.1f}x smaller than dicts)")
+        assert size / len(index) <= args.max_bytes_per_term, \
+            f"{size / len(index):.0f} bytes/term exceeds {args.max_bytes_per_term}"
+        assert abs(usage['bytes'] - size) <= 0.25 * size, (usage['bytes'], size)
+
+        segments = []
+        for _ in range(args.segments):
+            words = make_sentence(rng, vocab).split()
+            for _ in range(rng.randint(1, 3)):
+                words.insert(rng.randint(0, len(words)), rng.choice(known_terms))
+            segments.append(" ".join(words).capitalize() + ".")
+
+        t0 = time.perf_counter()
+        results = []
+        for segment in segments:
+            term_ids = [ref.term_id for ref in index.search(segment)]
+            details = db.get_termbase_match_details(term_ids, PROJECT_ID) if term_ids else {}
+            results.append({term_id: details[term_id] for term_id in term_ids if term_id in details})
+        elapsed = (time.perf_counter() - t0) * 1000 / len(segments)
+        hits = sum(len(matches) for matches in results)
+        print(f"search + details query      {elapsed:8.3f} ms/segment  ({hits:,} hits)")
+
+        for segment, matches in zip(segments, results):
+            expected = {term['term_id']: {
+                'source': term['source_term'], 'translation': term['target_term'],
+                'term_id': term['term_id'], 'termbase_id': term['termbase_id'],
+                'termbase_name': term['termbase_name'], 'ranking': term['ranking'],
+                'is_project_termbase': term['is_project_termbase'], 'forbidden': term['forbidden'],
+                'domain': term['domain'], 'notes': term['notes'],
+                'project': term['project'], 'client': term['client'],
+            } for term in dict_index.search(segment)}
+            assert list(matches.items()) == list(expected.items()), f"Different matches for {segment!r}"
+        print(f"same matches as the dict index on {len(segments):,} segments, "
+              f"under {args.max_bytes_per_term} bytes/term")
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""
+Benchmark: index-driven search_termbases() vs. the LOWER/LIKE table scan.
+
+Builds a synthetic activated termbase (single words, phrases, terms with
+trailing punctuation, mixed case), then:
+
+- asserts with EXPLAIN QUERY PLAN that the forward and reverse term queries
+  search indexes (normalized-term expression indexes, word suffixes, primary
+  keys) and never scan termbase_terms
+- times search_termbases() against the original seven LOWER/LIKE/RTRIM
+  conditions on the same queries and checks both return the same terms
+
+Usage:
+    python scripts/benchmarks/benchmark_termbase_search.py --terms 200000 --queries 500
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from modules.database_manager import DatabaseManager
+from benchmark_fuzzy_batch import make_vocabulary
+
+
+PROJECT_ID = 1
+
+
+def legacy_match_sql(column):
+    """The original search_termbases() conditions (reference)"""
+    return f"""(
+        LOWER(t.{column}) = LOWER(?) OR
+        LOWER(t.{column}) LIKE LOWER(?) OR
+        LOWER(t.{column}) LIKE LOWER(?) OR
+        LOWER(t.{column}) LIKE LOWER(?) OR
+        LOWER(RTRIM(t.{column}, '.!?,;:')) = LOWER(?) OR
+        LOWER(?) LIKE LOWER(t.{column}) || '%' OR
+        LOWER(?) = LOWER(RTRIM(t.{column}, '.!?,;:'))
+    )"""
+
+
+def legacy_search(db, search_term):
+    """search_termbases() with the original conditions"""
+    params = [search_term, f"{search_term} %", f"% {search_term}", f"% {search_term} %",
+              search_term, search_term, search_term]
+    queries, all_params = [], []
+    for reverse, column in ((False, 'source_term'), (True, 'target_term')):
+        filter_sql, filter_params = db._termbase_filter_sql(reverse, 'en', 'nl', PROJECT_ID, 2)
+        queries.append(db._termbase_select_sql(reverse) + f" WHERE {legacy_match_sql(column)}" + filter_sql)
+        all_params += [PROJECT_ID] + params + filter_params
+    db.cursor.execute(f"SELECT * FROM ({queries[0]} UNION ALL {queries[1]}) "
+                      f"ORDER BY ranking DESC, source_term ASC", all_params)
+    return db._termbase_results(db.cursor.fetchall())
+
+
+def term_pairs(results):
+    return {(r['source_term'].lower(), r['target_term'].lower(), r['termbase_id']) for r in results}
+
+
+def make_term(rng, vocab):
+    term = " ".join(rng.choice(vocab) for _ in range(rng.choice([1, 1, 2, 2, 3, 4])))
+    term += rng.choice(['', '', '', '.', ',', ':'])
+    return term.capitalize() if rng.random() < 0.2 else term
+
+
+def assert_no_scan(db, label, reverse):
+    match_sql, match_params = db._termbase_match_sql('target_term' if reverse else 'source_term', 'foo bar')
+    filter_sql, filter_params = db._termbase_filter_sql(reverse, 'en', 'nl', PROJECT_ID, 2)
+    db.cursor.execute("EXPLAIN QUERY PLAN " + db._termbase_select_sql(reverse) + f" WHERE {match_sql}" + filter_sql,
+                      [PROJECT_ID] + match_params + filter_params)
+    plan = [row[3] for row in db.cursor.fetchall()]
+    print(f"{label:8s} {' | '.join(step for step in plan if step.startswith('SEARCH'))}")
+    assert not any(step.startswith('SCAN') for step in plan), f"{label}: {plan}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--terms', type=int, default=200000)
+    parser.add_argument('--queries', type=int, default=500)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocab = make_vocabulary(rng)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(os.path.join(tmp, 'bench.db'), log_callback=lambda msg: None)
+        db.connect()
+        db.cursor.execute("INSERT INTO termbases (name, source_lang, target_lang) VALUES ('bench', 'en', 'nl')")
+        termbase_id = db.cursor.lastrowid
+        db.cursor.execute("INSERT INTO termbase_activation (termbase_id, project_id, is_active) VALUES (?, ?, 1)",
+                          (termbase_id, PROJECT_ID))
+        t0 = time.perf_counter()
+        terms = [(make_term(rng, vocab), make_term(rng, vocab)) for _ in range(args.terms)]
+        db.cursor.executemany("""
+            INSERT INTO termbase_terms (source_term, target_term, source_lang, target_lang, termbase_id)
+            VALUES (?, ?, 'en', 'nl', ?)
+        """, [(source, target, termbase_id) for source, target in terms])
+        db.connection.commit()
+        print(f"=== {args.terms:,} terms (inserted in {time.perf_counter() - t0:.1f}s), "
+              f"{args.queries:,} queries ===")
+
+        assert_no_scan(db, "forward", False)
+        assert_no_scan(db, "reverse", True)
+
+        queries = []
+        for _ in range(args.queries):
+            words = rng.choice(terms)[0].split()
+            start = rng.randrange(len(words))
+            queries.append(" ".join(words[start:start + rng.randint(1, 2)]))
+
+        t0 = time.perf_counter()
+        results = [db.search_termbases(q, 'en', 'nl', PROJECT_ID, min_length=2) for q in queries]
+        t_new = time.perf_counter() - t0
+
+        sample = queries[:max(1, args.queries // 10)]
+        t0 = time.perf_counter()
+        legacy = [legacy_search(db, q) for q in sample]
+        t_legacy = time.perf_counter() - t0
+
+        hits = sum(len(r) for r in results)
+        print(f"indexed      {t_new * 1000 / len(queries):8.2f} ms/query ({hits:,} hits)")
+        print(f"LIKE scan    {t_legacy * 1000 / len(sample):8.2f} ms/query "
+              f"(speed-up {(t_legacy / len(sample)) / (t_new / len(queries)):,.0f}x)")
+
+        for query, old, new in zip(sample, legacy, results):
+            assert term_pairs(old) == term_pairs(new), f"Different results for {query!r}"
+        print(f"same terms as the LIKE scan on {len(sample)} queries")
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+"""
+Benchmark: TermLens lookups - one indexed pass vs. a query per n-gram.
+
+Builds a synthetic activated termbase (100k terms by default, single words,
+phrases and terms with punctuation) and times, per segment:
+
+- the former TermLens lookup: search_termbases() for every token and every
+  2-8 word n-gram of the segment, then the word-boundary check per result
+- search_termbases_in_text(): one pass over the in-memory matcher plus one
+  query loading the matched terms by id
+
+and reports the one-off matcher build time, and the time to bring the
+matcher up to date after a term is added, edited and deleted (checked
+against a freshly built matcher). The legacy path is slow
+(hundreds of table scans per segment), so it runs on a sample only; the
+terms it finds must also be found by the new path.
+
+Usage:
+    python scripts/benchmarks/benchmark_termlens.py --terms 100000 --segments 1000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from modules.database_manager import DatabaseManager
+from modules.term_matcher import QUOTE_CHARS, TERMLENS_STRIP_CHARS
+from benchmark_fuzzy_batch import make_sentence, make_vocabulary
+
+
+PROJECT_ID = 1
+
+
+def make_term(rng, vocab, i):
+    kind = rng.random()
+    if kind < 0.4:
+        return f"{rng.choice(vocab)}{i}"
+    if kind < 0.85:
+        return " ".join(rng.choice(vocab) for _ in range(rng.randint(2, 4)))
+    return f"{rng.choice(vocab)}{i}{rng.choice(['.', '%', '-x'])}"
+
+
+def build_termbase(db, rng, vocab, size):
+    db.cursor.execute("INSERT INTO termbases (name, source_lang, target_lang) VALUES ('bench', 'en', 'nl')")
+    termbase_id = db.cursor.lastrowid
+    db.cursor.execute("INSERT INTO termbase_activation (termbase_id, project_id, is_active) VALUES (?, ?, 1)",
+                      (termbase_id, PROJECT_ID))
+    terms = [make_term(rng, vocab, i) for i in range(size)]
+    db.cursor.executemany("""
+        INSERT INTO termbase_terms (source_term, target_term, source_lang, target_lang, termbase_id)
+        VALUES (?, ?, 'en', 'nl', ?)
+    """, [(term, f"NL {i}", str(termbase_id)) for i, term in enumerate(terms)])
+    db.connection.commit()
+    return terms
+
+
+def legacy_lookup(db, text):
+    """The former TermLensWidget.get_all_termbase_matches() (keys only)"""
+    tokens = [m.group() for m in re.finditer(r'(?<!\w)[\w.,%-/]+(?!\w)', text)]
+    words = re.findall(r'\b[\w-]+\b', text)
+    phrases = [' '.join(words[i:i + n]) for n in range(2, min(9, len(words) + 1))
+               for i in range(len(words) - n + 1)]
+    text_lower = text.lower()
+    normalized_text = text_lower
+    for quote_char in QUOTE_CHARS:
+        normalized_text = normalized_text.replace(quote_char, ' ')
+
+    found = set()
+    for search_term in set(tokens + phrases):
+        search_term = search_term.rstrip('.,;:!?')
+        if len(search_term) < 2:
+            continue
+        for result in db.search_termbases(search_term, 'en', 'nl', PROJECT_ID, min_length=2):
+            source_lower = result['source_term'].lower()
+            pattern = r'\b' + re.escape(source_lower.strip(TERMLENS_STRIP_CHARS)) + r'\b'
+            if re.search(pattern, normalized_text) or re.search(pattern, text_lower):
+                found.add(source_lower)
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--terms', type=int, default=100000)
+    parser.add_argument('--segments', type=int, default=1000)
+    parser.add_argument('--legacy-segments', type=int, default=2,
+                        help="segments looked up the old way (minutes each at 100k terms)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocab = make_vocabulary(rng)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(os.path.join(tmp, 'bench.db'), log_callback=lambda msg: None)
+        db.connect()
+        terms = build_termbase(db, rng, vocab, args.terms)
+
+        segments = []
+        for _ in range(args.segments):
+            words = make_sentence(rng, vocab).split()
+            for _ in range(rng.randint(1, 3)):
+                words.insert(rng.randint(0, len(words)), rng.choice(terms))
+            segments.append('"' + " ".join(words) + '".')
+        print(f"=== {args.terms:,} terms, {args.segments:,} segments "
+              f"(avg {sum(len(s.split()) for s in segments) / len(segments):.0f} words) ===")
+
+        t0 = time.perf_counter()
+        db.get_termbase_matcher('en', 'nl', PROJECT_ID, min_length=2)
+        print(f"matcher build        {time.perf_counter() - t0:8.2f}s (once per language pair/project)")
+
+        t0 = time.perf_counter()
+        results = [db.search_termbases_in_text(s, 'en', 'nl', PROJECT_ID, min_length=2) for s in segments]
+        t_new = (time.perf_counter() - t0) / len(segments)
+        hits = sum(len(r) for r in results)
+        print(f"indexed lookup       {t_new * 1000:8.3f} ms/segment ({hits:,} hits)")
+
+        # Edit the termbase as the UI would, then look up again
+        termbase_id = db.cursor.execute("SELECT id FROM termbases").fetchone()[0]
+        db.cursor.execute("""
+            INSERT INTO termbase_terms (source_term, target_term, source_lang, target_lang, termbase_id)
+            VALUES (?, 'NL new', 'en', 'nl', ?)
+        """, (segments[0].strip('".').split()[0], termbase_id))
+        db.cursor.execute("UPDATE termbase_terms SET source_term = ? WHERE id = 5",
+                          (segments[1].strip('".').split()[-1],))
+        db.cursor.execute("DELETE FROM termbase_terms WHERE id = 7")
+        db.connection.commit()
+        t0 = time.perf_counter()
+        db.get_termbase_matcher('en', 'nl', PROJECT_ID, min_length=2)
+        print(f"matcher update       {(time.perf_counter() - t0) * 1000:8.2f} ms (after a term edit)")
+        updated = [db.search_termbases_in_text(s, 'en', 'nl', PROJECT_ID, min_length=2) for s in segments]
+        db._termbase_matchers.clear()
+        rebuilt = [db.search_termbases_in_text(s, 'en', 'nl', PROJECT_ID, min_length=2) for s in segments]
+        assert updated == rebuilt
+        print("updated matcher finds the same terms as a rebuilt one")
+
+        sample = segments[:args.legacy_segments]
+        t0 = time.perf_counter()
+        legacy = [legacy_lookup(db, s) for s in sample]
+        t_legacy = (time.perf_counter() - t0) / len(sample)
+        print(f"per-n-gram queries   {t_legacy * 1000:8.1f} ms/segment (speed-up {t_legacy / t_new:,.0f}x)")
+
+        for segment, old, new in zip(sample, legacy, updated):
+            new_keys = {r['source_term'].lower() for r in new}
+            assert old <= new_keys, f"Missed {old - new_keys} in {segment!r}"
+        print(f"all legacy matches found on {len(sample)} segments")
+        db.close()
+
+
+if __name__ == '__main__':
+    main()